@@ -7,7 +7,6 @@ MIRRALISM V2 高度依存関係分析システム
 目的: より厳密な依存関係整合性チェック
 """
 
-import ast
 import json
 import logging
 import os
@@ -24,7 +23,10 @@ from typing import Optional
 from typing import Set
 from typing import Tuple
 
-import networkx as nx  # グラフ分析用
+sys.path.append(str(Path(__file__).parent))
+from ast_analysis_cache import ASTAnalysisCache  # noqa: E402
+from ast_analysis_cache import discover_python_files  # noqa: E402
+from incremental_dependency_graph import IncrementalDependencyGraph  # noqa: E402
 
 
 class AdvancedDependencyAnalyzer:
@@ -38,8 +40,10 @@ class AdvancedDependencyAnalyzer:
             self.project_root = current_path.parent.parent.parent
 
         self.logger = self._setup_logging()
-        self.dependency_graph = nx.DiGraph()
         self.import_patterns = []
+        self.ast_cache = ASTAnalysisCache(self.project_root)
+        # 永続化された依存グラフ（変更ファイル分のみ差分更新）
+        self.dependency_graph = IncrementalDependencyGraph(self.project_root)
 
         self.logger.info(f"🔬 高度依存関係分析システム初期化完了 - プロジェクトルート: {self.project_root}")
 
@@ -73,34 +77,30 @@ class AdvancedDependencyAnalyzer:
         }
 
         # Python ファイルの収集
-        python_files = list(self.project_root.rglob("*.py"))
-        excluded_patterns = [
-            ".git",
-            "__pycache__",
-            ".pytest_cache",
-            ".mypy_cache",
-            ".mirralism/backups",
-        ]
-        python_files = [
-            f
-            for f in python_files
-            if not any(pattern in str(f) for pattern in excluded_patterns)
-        ]
+        python_files = discover_python_files(self.project_root)
 
         self.logger.info(f"📊 分析対象: {len(python_files)} Python ファイル")
 
+        # AST解析（変更ファイルのみ再解析、他はキャッシュ参照）
+        self.ast_cache.analyze(python_files)
+        self.logger.info(f"♻️ 再解析: {len(self.ast_cache.changed_files)} ファイル")
+
+        local_imports = {}
         for py_file in python_files:
             try:
                 analysis_results["python_files_analyzed"] += 1
                 file_imports = self._analyze_file_imports(py_file)
                 analysis_results["import_statements"].extend(file_imports)
-
-                # 依存関係グラフ構築
-                self._build_dependency_graph(py_file, file_imports)
+                local_imports[py_file.relative_to(self.project_root).as_posix()] = [
+                    imp["module"] for imp in file_imports if imp["is_local"]
+                ]
 
             except Exception as e:
                 self.logger.error(f"❌ ファイル分析エラー: {py_file} - {e}")
 
+        # 依存関係グラフ差分更新
+        self._build_dependency_graph(local_imports)
+
         # 循環依存検出
         analysis_results[
             "circular_dependencies"
@@ -113,9 +113,7 @@ class AdvancedDependencyAnalyzer:
         analysis_results["dependency_graph_stats"] = {
             "total_nodes": self.dependency_graph.number_of_nodes(),
             "total_edges": self.dependency_graph.number_of_edges(),
-            "strongly_connected_components": len(
-                list(nx.strongly_connected_components(self.dependency_graph))
-            ),
+            "strongly_connected_components": self.dependency_graph.number_of_components(),
             "longest_path": self._find_longest_dependency_path(),
         }
 
@@ -123,53 +121,36 @@ class AdvancedDependencyAnalyzer:
         return analysis_results
 
     def _analyze_file_imports(self, file_path: Path) -> List[Dict[str, Any]]:
-        """ファイルのimport文を詳細分析"""
-        imports = []
+        """ファイルのimport文を詳細分析（AST解析キャッシュ参照）"""
+        rel_path = str(file_path.relative_to(self.project_root))
+        entry = self.ast_cache.entries.get(Path(rel_path).as_posix())
+        if entry is None:
+            return []
+
+        error = entry["error"]
+        if error is not None:
+            if error["type"] == "syntax":
+                self.logger.warning(
+                    f"⚠️ 構文エラー: {file_path}:{error['line']} - {error['message']}"
+                )
+            else:
+                self.logger.error(f"❌ import分析エラー: {file_path} - {error['message']}")
+            return []
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # AST解析
-            tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.append(
-                            {
-                                "file": str(file_path.relative_to(self.project_root)),
-                                "line": node.lineno,
-                                "type": "import",
-                                "module": alias.name,
-                                "alias": alias.asname,
-                                "level": 0,
-                                "is_local": self._is_local_module(alias.name),
-                                "raw_code": f"import {alias.name}",
-                            }
-                        )
-
-                elif isinstance(node, ast.ImportFrom):
-                    module_name = node.module or ""
-                    for alias in node.names:
-                        imports.append(
-                            {
-                                "file": str(file_path.relative_to(self.project_root)),
-                                "line": node.lineno,
-                                "type": "from_import",
-                                "module": module_name,
-                                "name": alias.name,
-                                "alias": alias.asname,
-                                "level": node.level,
-                                "is_local": self._is_local_module(module_name),
-                                "raw_code": f"from {module_name} import {alias.name}",
-                            }
-                        )
-
-        except SyntaxError as e:
-            self.logger.warning(f"⚠️ 構文エラー: {file_path}:{e.lineno} - {e.msg}")
-        except Exception as e:
-            self.logger.error(f"❌ import分析エラー: {file_path} - {e}")
+        imports = []
+        for imp in entry["imports"]:
+            if imp["type"] == "import":
+                raw_code = f"import {imp['module']}"
+            else:
+                raw_code = f"from {imp['module']} import {imp['name']}"
+            imports.append(
+                {
+                    "file": rel_path,
+                    **imp,
+                    "is_local": self._is_local_module(imp["module"]),
+                    "raw_code": raw_code,
+                }
+            )
 
         return imports
 
@@ -238,169 +219,66 @@ class AdvancedDependencyAnalyzer:
             and not base_module.startswith("_")
         )
 
-    def _build_dependency_graph(self, file_path: Path, imports: List[Dict[str, Any]]):
-        """依存関係グラフの構築"""
-        file_node = str(file_path.relative_to(self.project_root))
-
-        if not self.dependency_graph.has_node(file_node):
-            self.dependency_graph.add_node(file_node)
-
-        for imp in imports:
-            if imp["is_local"]:
-                # ローカルモジュールの場合、対応するファイルを探す
-                target_files = self._resolve_module_to_files(imp["module"])
-
-                for target_file in target_files:
-                    if target_file != file_node:  # 自己参照除外
-                        self.dependency_graph.add_edge(
-                            file_node, target_file, import_info=imp
-                        )
-
-    def _resolve_module_to_files(self, module_name: str) -> List[str]:
-        """モジュール名からファイルパスへの解決"""
-        files = []
-
-        # ドット記法をファイルパスに変換
-        path_parts = module_name.split(".")
-
-        # 可能なファイルパスを生成
-        potential_paths = [
-            "/".join(path_parts) + ".py",
-            "/".join(path_parts) + "/__init__.py",
-        ]
-
-        for potential_path in potential_paths:
-            full_path = self.project_root / potential_path
-            if full_path.exists():
-                files.append(str(Path(potential_path)))
-
-        return files
+    def _build_dependency_graph(self, local_imports: Dict[str, List[str]]):
+        """依存関係グラフの差分更新（AST解析キャッシュの変更ファイルのみ再計算）"""
+        stats = self.dependency_graph.update(
+            local_imports,
+            self.ast_cache.resolve_module,
+            changed=self.ast_cache.changed_files,
+        )
+        self.logger.info(
+            f"🕸️ 依存グラフ更新: 再計算 {stats['recomputed']} ファイル / SCC再計算範囲 {stats['scc_region']} ノード"
+        )
 
     def _detect_circular_dependencies_advanced(self) -> List[Dict[str, Any]]:
-        """高度な循環依存検出"""
-        circular_deps = []
-
-        try:
-            # 強連結成分の検出
-            strongly_connected = list(
-                nx.strongly_connected_components(self.dependency_graph)
-            )
-
-            for component in strongly_connected:
-                if len(component) > 1:  # 複数ノードの循環
-                    # 最短循環パスを見つける
-                    component_list = list(component)
-                    subgraph = self.dependency_graph.subgraph(component)
-
-                    # 循環の詳細分析
-                    try:
-                        cycle = nx.find_cycle(subgraph)
-                        cycle_info = {
-                            "type": "circular_dependency",
-                            "files_involved": component_list,
-                            "cycle_length": len(cycle),
-                            "cycle_path": [edge[0] for edge in cycle] + [cycle[-1][1]],
-                            "severity": "high" if len(component) > 3 else "medium",
-                            "description": f"循環依存検出: {len(component)}ファイル間",
-                        }
-                        circular_deps.append(cycle_info)
-
-                    except nx.NetworkXNoCycle:
-                        # 自己循環の場合
-                        for node in component:
-                            if self.dependency_graph.has_edge(node, node):
-                                circular_deps.append(
-                                    {
-                                        "type": "self_dependency",
-                                        "file": node,
-                                        "severity": "low",
-                                        "description": f"自己参照: {node}",
-                                    }
-                                )
-
-        except Exception as e:
-            self.logger.error(f"❌ 循環依存検出エラー: {e}")
-
-        return circular_deps
+        """高度な循環依存検出（差分更新済みの強連結成分を参照）"""
+        return self.dependency_graph.circular_dependencies()
+
+    def analyze_change_impact(self, changed_files: List[str]) -> Dict[str, Any]:
+        """変更ファイルが推移的に影響するファイルと対象テスト"""
+        self.deep_import_analysis()
+        changed = [Path(path).as_posix() for path in changed_files]
+        affected = self.dependency_graph.affected_by(changed)
+        return {
+            "changed_files": changed,
+            "affected_files": sorted(affected),
+            "selected_tests": self.dependency_graph.select_tests(changed),
+        }
 
     def _detect_unused_imports(self) -> List[Dict[str, Any]]:
-        """未使用import検出"""
+        """未使用import検出（AST解析キャッシュの import・使用名を照合）"""
         unused_imports = []
 
         # 簡易実装: より詳細な解析は別途実装可能
-        for py_file in self.project_root.rglob("*.py"):
-            if any(
-                excluded in str(py_file)
-                for excluded in [".git", "__pycache__", ".mirralism/backups"]
-            ):
+        for rel_path, entry in self.ast_cache.entries.items():
+            if entry["error"] is not None:
+                self.logger.error(
+                    f"❌ 未使用import検出エラー: {rel_path} - {entry['error']['message']}"
+                )
                 continue
 
-            try:
-                with open(py_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # AST解析でimport文と使用箇所をチェック
-                tree = ast.parse(content)
-                imports_in_file = []
-                names_used = set()
-
-                # import文の収集
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports_in_file.append(
-                                {
-                                    "name": alias.asname or alias.name.split(".")[0],
-                                    "full_name": alias.name,
-                                    "line": node.lineno,
-                                    "type": "import",
-                                }
-                            )
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            for alias in node.names:
-                                imports_in_file.append(
-                                    {
-                                        "name": alias.asname or alias.name,
-                                        "full_name": f"{node.module}.{alias.name}",
-                                        "line": node.lineno,
-                                        "type": "from_import",
-                                    }
-                                )
-
-                # 使用されている名前の収集
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Name):
-                        names_used.add(node.id)
-
-                # 未使用import検出
-                for imp in imports_in_file:
-                    if imp["name"] not in names_used and imp["name"] != "__future__":
-                        unused_imports.append(
-                            {
-                                "file": str(py_file.relative_to(self.project_root)),
-                                "line": imp["line"],
-                                "import_name": imp["name"],
-                                "full_import": imp["full_name"],
-                                "type": imp["type"],
-                                "severity": "low",
-                                "description": f"未使用import: {imp['name']}",
-                            }
-                        )
-
-            except Exception as e:
-                self.logger.error(f"❌ 未使用import検出エラー: {py_file} - {e}")
+            names_used = set(entry["used_names"])
+            for imp in entry["bindings"]:
+                if imp["name"] not in names_used and imp["name"] != "__future__":
+                    unused_imports.append(
+                        {
+                            "file": str(Path(rel_path)),
+                            "line": imp["line"],
+                            "import_name": imp["name"],
+                            "full_import": imp["full_name"],
+                            "type": imp["type"],
+                            "severity": "low",
+                            "description": f"未使用import: {imp['name']}",
+                        }
+                    )
 
         return unused_imports
 
     def _find_longest_dependency_path(self) -> int:
         """最長依存パスの検出"""
         try:
-            if nx.is_directed_acyclic_graph(self.dependency_graph):
-                return nx.dag_longest_path_length(self.dependency_graph)
-            else:
-                return -1  # 循環があるため測定不可
-        except:
+            return self.dependency_graph.longest_path_length()  # 循環がある場合は -1
+        except Exception:
             return 0
 
     def generate_comprehensive_report(self) -> Dict[str, Any]:
@@ -506,7 +384,26 @@ class AdvancedDependencyAnalyzer:
 
 def main():
     """メイン実行関数"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="MIRRALISM V2 高度依存関係分析")
+    parser.add_argument(
+        "--impact", nargs="+", metavar="FILE", help="変更ファイルの影響範囲・対象テストを表示"
+    )
+    args = parser.parse_args()
+
     analyzer = AdvancedDependencyAnalyzer()
+
+    if args.impact:
+        impact = analyzer.analyze_change_impact(args.impact)
+        print(f"🎯 影響ファイル: {len(impact['affected_files'])}件")
+        for path in impact["affected_files"]:
+            print(f"  - {path}")
+        print(f"🧪 対象テスト: {len(impact['selected_tests'])}件")
+        for path in impact["selected_tests"]:
+            print(f"  - {path}")
+        return
+
     report = analyzer.generate_comprehensive_report()
 
     # 結果表示
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM V2 AST解析キャッシュ
+依存関係分析ツール共通のファイル単位解析結果キャッシュ
+
+目的:
+- ast.parse をファイル毎に1回だけ実行（import・定義名・使用名・import行を一括抽出）
+- 内容ハッシュをキーに .mirralism/cache/ast_analysis.db へ永続化
+- mtime・サイズ一致なら再読込なし、変更ファイルのみプロセスプールで並列再解析
+- モジュール名 → ファイルの事前計算マップで Path.exists なしに解決
+- 解析対象の Python ファイル探索・除外規則を依存関係分析ツール間で共通化
+"""
+
+import ast
+import hashlib
+import json
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# 解析結果の形式を変えたら上げる（既存キャッシュを破棄）
+ANALYSIS_VERSION = 1
+
+# これ未満の変更ファイル数ならプロセスプールを起動せず逐次解析
+PARALLEL_THRESHOLD = 16
+
+# 解析対象外（プロジェクトルートからの相対パスに含まれれば除外）
+EXCLUDED_PATTERNS = (
+    ".git",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    "node_modules",
+    ".vscode",
+    ".cursor",
+    ".DS_Store",
+    ".mirralism/backups",
+)
+
+
+def is_excluded(file_path: Path, project_root: Path) -> bool:
+    """依存関係分析の対象外パスか"""
+    rel_path = Path(file_path).relative_to(project_root).as_posix()
+    return any(pattern in rel_path for pattern in EXCLUDED_PATTERNS)
+
+
+def discover_python_files(project_root: Path) -> List[Path]:
+    """依存関係分析ツール共通の Python ファイル探索"""
+    project_root = Path(project_root)
+    return sorted(
+        file_path
+        for file_path in project_root.rglob("*.py")
+        if file_path.is_file() and not is_excluded(file_path, project_root)
+    )
+
+
+def analyze_source(file_path: str) -> Tuple[str, Dict[str, Any]]:
+    """1ファイル解析（プロセスプールのワーカーから呼ばれる）
+
+    Returns:
+        (内容ハッシュ, 解析結果)
+    """
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    analysis: Dict[str, Any] = {
+        "imports": [],
+        "bindings": [],
+        "defined_names": [],
+        "used_names": [],
+        "import_lines": [],
+        "error": None,
+    }
+
+    try:
+        content = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        analysis["error"] = {"type": "decode", "line": 0, "message": str(e)}
+        return digest, analysis
+
+    # import 行（構文エラーのファイルも対象とする行単位の抽出）
+    for line_no, line in enumerate(content.split("\n"), 1):
+        stripped = line.strip()
+        if stripped.startswith("import ") or stripped.startswith("from "):
+            analysis["import_lines"].append([line_no, line])
+
+    try:
+        tree = ast.parse(content)
+    except SyntaxError as e:
+        analysis["error"] = {"type": "syntax", "line": e.lineno or 0, "message": e.msg}
+        return digest, analysis
+
+    used_names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            used_names.add(node.id)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                analysis["imports"].append(
+                    {
+                        "line": node.lineno,
+                        "type": "import",
+                        "module": alias.name,
+                        "alias": alias.asname,
+                        "level": 0,
+                    }
+                )
+                analysis["bindings"].append(
+                    {
+                        "name": alias.asname or alias.name.split(".")[0],
+                        "full_name": alias.name,
+                        "line": node.lineno,
+                        "type": "import",
+                    }
+                )
+        elif isinstance(node, ast.ImportFrom):
+            module_name = node.module or ""
+            for alias in node.names:
+                analysis["imports"].append(
+                    {
+                        "line": node.lineno,
+                        "type": "from_import",
+                        "module": module_name,
+                        "name": alias.name,
+                        "alias": alias.asname,
+                        "level": node.level,
+                    }
+                )
+                if node.module:
+                    analysis["bindings"].append(
+                        {
+                            "name": alias.asname or alias.name,
+                            "full_name": f"{node.module}.{alias.name}",
+                            "line": node.lineno,
+                            "type": "from_import",
+                        }
+                    )
+    analysis["used_names"] = sorted(used_names)
+
+    # モジュールトップレベルで定義される名前
+    defined = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            defined.append(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    defined.append(target.id)
+    analysis["defined_names"] = defined
+
+    return digest, analysis
+
+
+def module_name_for(rel_path: str) -> str:
+    """相対パス → ドット区切りモジュール名（__init__.py はパッケージ名）"""
+    parts = Path(rel_path).with_suffix("").parts
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+class ASTAnalysisCache:
+    """ファイル単位 AST 解析結果の永続キャッシュ"""
+
+    def __init__(
+        self,
+        project_root: Path,
+        cache_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.project_root = Path(project_root)
+        self.cache_path = Path(
+            cache_path or self.project_root / ".mirralism" / "cache" / "ast_analysis.db"
+        )
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.changed_files: List[str] = []
+        self.removed_files: List[str] = []
+        self._module_map: Dict[str, List[str]] = {}
+
+        self.conn = sqlite3.connect(str(self.cache_path))
+        self._init_schema()
+
+    def _init_schema(self):
+        """スキーマ初期化（バージョン不一致時は作り直し）"""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != ANALYSIS_VERSION:
+            self.conn.executescript(
+                """
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS analyses;
+                """
+            )
+        self.conn.executescript(
+            f"""
+            PRAGMA journal_mode = WAL;
+            PRAGMA user_version = {ANALYSIS_VERSION};
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                hash TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS analyses (
+                hash TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            );
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # 解析
+    # ------------------------------------------------------------------
+    def analyze(self, files: Iterable[Path]) -> Dict[str, Dict[str, Any]]:
+        """対象ファイル群の解析結果（相対パス → エントリ）
+
+        mtime・サイズが前回と一致するファイルはキャッシュを参照し、
+        それ以外は内容ハッシュで照合、未知の内容のみ再解析する。
+        """
+        known = {
+            row[0]: (row[1], row[2], row[3])
+            for row in self.conn.execute("SELECT path, mtime_ns, size, hash FROM files")
+        }
+
+        hashes: Dict[str, str] = {}
+        stats: Dict[str, Tuple[int, int]] = {}
+        pending: List[Tuple[str, Path]] = []
+        for file_path in files:
+            file_path = Path(file_path)
+            rel_path = file_path.relative_to(self.project_root).as_posix()
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            stats[rel_path] = (st.st_mtime_ns, st.st_size)
+            cached = known.get(rel_path)
+            if cached and cached[:2] == stats[rel_path]:
+                hashes[rel_path] = cached[2]
+            else:
+                pending.append((rel_path, file_path))
+
+        # 変更ファイルの解析（多い場合のみ並列）
+        new_analyses: Dict[str, Dict[str, Any]] = {}
+        for rel_path, (digest, analysis) in self._run_analysis(pending):
+            hashes[rel_path] = digest
+            new_analyses[digest] = analysis
+
+        self.changed_files = sorted(
+            rel_path
+            for rel_path, digest in hashes.items()
+            if rel_path not in known or known[rel_path][2] != digest
+        )
+        # 今回の対象外でもディスク上に残るファイルは削除扱いにしない
+        # （対象範囲の異なる呼び出し間でキャッシュを消し合わないため）
+        self.removed_files = sorted(
+            rel_path
+            for rel_path in known.keys() - hashes.keys()
+            if not (self.project_root / rel_path).exists()
+        )
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO analyses (hash, data) VALUES (?, ?)",
+                [
+                    (digest, json.dumps(analysis, ensure_ascii=False))
+                    for digest, analysis in new_analyses.items()
+                ],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                [
+                    (rel_path, *stats[rel_path], hashes[rel_path])
+                    for rel_path, _ in pending
+                    if rel_path in hashes
+                ],
+            )
+            if self.removed_files:
+                self.conn.executemany(
+                    "DELETE FROM files WHERE path = ?",
+                    [(rel_path,) for rel_path in self.removed_files],
+                )
+                self.conn.execute(
+                    "DELETE FROM analyses WHERE hash NOT IN (SELECT hash FROM files)"
+                )
+
+        analyses = self._load_analyses(set(hashes.values()), new_analyses)
+        self.entries = {
+            rel_path: {
+                "path": rel_path,
+                "module": module_name_for(rel_path),
+                "hash": digest,
+                **analyses[digest],
+            }
+            for rel_path, digest in sorted(hashes.items())
+            if digest in analyses
+        }
+        self._build_module_map()
+        return self.entries
+
+    def _run_analysis(self, pending: List[Tuple[str, Path]]):
+        """解析実行（PARALLEL_THRESHOLD 以上はプロセスプール）"""
+        if not pending:
+            return []
+        paths = [str(file_path) for _, file_path in pending]
+        if len(pending) < PARALLEL_THRESHOLD:
+            results = []
+            for (rel_path, _), path in zip(pending, paths):
+                try:
+                    results.append((rel_path, analyze_source(path)))
+                except OSError:
+                    continue
+            return results
+
+        results = []
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(analyze_source, path) for path in paths]
+            for (rel_path, _), future in zip(pending, futures):
+                try:
+                    results.append((rel_path, future.result()))
+                except OSError:
+                    continue
+        return results
+
+    def _load_analyses(
+        self, digests: set, new_analyses: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """ハッシュ → 解析結果（今回解析分はデコード不要）"""
+        analyses = dict(new_analyses)
+        missing = [digest for digest in digests if digest not in analyses]
+        for start in range(0, len(missing), 500):
+            chunk = missing[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for digest, data in self.conn.execute(
+                f"SELECT hash, data FROM analyses WHERE hash IN ({placeholders})", chunk
+            ):
+                analyses[digest] = json.loads(data)
+        return analyses
+
+    # ------------------------------------------------------------------
+    # モジュール解決
+    # ------------------------------------------------------------------
+    def _build_module_map(self):
+        module_map: Dict[str, List[str]] = {}
+        for rel_path in self.entries:
+            module_map.setdefault(module_name_for(rel_path), []).append(rel_path)
+        # 旧実装と同じく <module>.py → <module>/__init__.py の順
+        for paths in module_map.values():
+            paths.sort(key=lambda p: p.endswith("__init__.py"))
+        self._module_map = module_map
+
+    def resolve_module(self, module_name: str) -> List[str]:
+        """モジュール名 → プロジェクト内ファイル（相対パス）"""
+        return list(self._module_map.get(module_name, []))
+
+    def module_map(self) -> Dict[str, List[str]]:
+        return {name: list(paths) for name, paths in self._module_map.items()}
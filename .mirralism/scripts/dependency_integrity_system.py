@@ -28,6 +28,10 @@ from typing import Optional
 from typing import Set
 from typing import Tuple
 
+sys.path.append(str(Path(__file__).parent))
+from ast_analysis_cache import ASTAnalysisCache  # noqa: E402
+from ast_analysis_cache import is_excluded  # noqa: E402
+
 
 @dataclass
 class DependencyIssue:
@@ -99,6 +103,9 @@ class DependencyIntegritySystem:
         )
         self.fix_log_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # ファイル単位解析キャッシュ（import 行を再読込なしで参照）
+        self.ast_cache = ASTAnalysisCache(self.project_root)
+
         self.logger.info(f"🔍 依存関係整合性システム初期化完了 - プロジェクトルート: {self.project_root}")
 
     def _setup_logging(self) -> logging.Logger:
@@ -122,23 +129,10 @@ class DependencyIntegritySystem:
 
         scanned_files = {"python": [], "javascript": [], "config": []}
 
-        # 除外ディレクトリ
-        excluded_dirs = {
-            ".git",
-            "__pycache__",
-            ".pytest_cache",
-            ".mypy_cache",
-            "node_modules",
-            ".vscode",
-            ".cursor",
-            ".DS_Store",
-            ".mirralism/backups",  # バックアップは除外
-        }
-
         for file_path in self.project_root.rglob("*"):
             if file_path.is_file():
-                # 除外ディレクトリチェック
-                if any(excluded in str(file_path) for excluded in excluded_dirs):
+                # 除外ディレクトリチェック（AST解析キャッシュと共通の規則）
+                if is_excluded(file_path, self.project_root):
                     continue
 
                 # ファイル種別判定
@@ -160,40 +154,35 @@ class DependencyIntegritySystem:
 
         issues = []
 
-        for file_path in python_files:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # import文の行ごと解析
-                lines = content.split("\n")
-                for line_no, line in enumerate(lines, 1):
-                    line_stripped = line.strip()
-
-                    # import文のチェック
-                    if (
-                        line_stripped.startswith("import ")
-                        or line_stripped.startswith("from ")
-                    ) and not line_stripped.startswith("#"):
-                        # V1→V2パス変更による破綻チェック
-                        for old_pattern, new_pattern in self.path_migrations.items():
-                            if old_pattern in line:
-                                issues.append(
-                                    DependencyIssue(
-                                        file_path=str(
-                                            file_path.relative_to(self.project_root)
-                                        ),
-                                        line_number=line_no,
-                                        issue_type="broken_path",
-                                        description=f"V1パス参照: {old_pattern}",
-                                        severity="high",
-                                        suggested_fix=f"パスを更新: {line.replace(old_pattern, new_pattern)}",
-                                        code_context=line.strip(),
-                                    )
-                                )
+        entries = self.ast_cache.analyze(python_files)
+        self.logger.info(f"♻️ 再解析: {len(self.ast_cache.changed_files)}ファイル")
 
-            except Exception as e:
-                self.logger.error(f"❌ Python分析エラー: {file_path} - {e}")
+        for file_path in python_files:
+            entry = entries.get(file_path.relative_to(self.project_root).as_posix())
+            if entry is None:
+                continue
+            if entry["error"] is not None and entry["error"]["type"] == "decode":
+                self.logger.error(
+                    f"❌ Python分析エラー: {file_path} - {entry['error']['message']}"
+                )
+                continue
+
+            # import文の行ごと解析
+            for line_no, line in entry["import_lines"]:
+                # V1→V2パス変更による破綻チェック
+                for old_pattern, new_pattern in self.path_migrations.items():
+                    if old_pattern in line:
+                        issues.append(
+                            DependencyIssue(
+                                file_path=str(file_path.relative_to(self.project_root)),
+                                line_number=line_no,
+                                issue_type="broken_path",
+                                description=f"V1パス参照: {old_pattern}",
+                                severity="high",
+                                suggested_fix=f"パスを更新: {line.replace(old_pattern, new_pattern)}",
+                                code_context=line.strip(),
+                            )
+                        )
 
         self.logger.info(f"🐍 Python分析完了: {len(issues)}件の問題検出")
         return issues
@@ -417,11 +406,9 @@ def main():
     system = DependencyIntegritySystem(args.project_root)
 
     if args.quick_check or args.pre_commit:
-        # 高速チェック（主要ファイルのみ）
+        # 高速チェック（全ファイル対象、変更ファイルのみ再解析）
         scanned_files = system.scan_all_files()
-        issues = system.analyze_python_imports(
-            scanned_files["python"][:10]
-        )  # 最初の10ファイルのみ
+        issues = system.analyze_python_imports(scanned_files["python"])
 
         if issues:
             print(f"❌ {len(issues)}件の依存関係問題検出")
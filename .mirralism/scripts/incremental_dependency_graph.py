@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM V2 増分依存関係グラフ
+AST解析キャッシュの変更ファイル情報からファイル間依存グラフを差分更新
+
+目的:
+- グラフを .mirralism/cache/dependency_graph.json に永続化し、毎回の再構築を廃止
+- 強連結成分（循環依存）は変更ファイルの影響範囲のみ再計算
+- 「この変更が推移的に影響するファイル」の逆依存クエリ（影響ベースのテスト選択）
+"""
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+
+from ast_analysis_cache import module_name_for
+
+GRAPH_VERSION = 1
+
+
+class IncrementalDependencyGraph:
+    """永続化・差分更新されるファイル依存グラフ
+
+    ノードはプロジェクトルートからの相対パス、エッジは import 元 → import 先。
+    """
+
+    def __init__(self, project_root: Path, graph_path: Optional[Path] = None):
+        self.project_root = Path(project_root)
+        self.graph_path = Path(
+            graph_path
+            or self.project_root / ".mirralism" / "cache" / "dependency_graph.json"
+        )
+        self.imports: Dict[str, List[str]] = {}
+        self.successors: Dict[str, Set[str]] = {}
+        self.predecessors: Dict[str, Set[str]] = {}
+        self.components: List[List[str]] = []
+        self.cycles: Dict[str, List[str]] = {}
+        self._removed_preds: Dict[str, Set[str]] = {}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 更新
+    # ------------------------------------------------------------------
+    def update(
+        self,
+        imports_by_file: Dict[str, List[str]],
+        resolve: Callable[[str], List[str]],
+        changed: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """差分更新
+
+        Args:
+            imports_by_file: 全ファイルのローカル import モジュール名
+            resolve: モジュール名 → ファイル（相対パス）
+            changed: 内容が変わったファイル（None なら全ファイルの import を比較）
+
+        Returns:
+            更新統計（再計算ノード数・SCC 再計算範囲）
+        """
+        previous = set(self.imports)
+        current = set(imports_by_file)
+        added = current - previous
+        removed = previous - current
+        candidates = current if changed is None else (set(changed) & current) | added
+
+        dirty: Set[str] = set()
+        for node in candidates:
+            if self.imports.get(node) != imports_by_file[node] or node in added:
+                dirty.add(node)
+
+        # ファイル追加・削除でモジュール解決結果が変わる import 元も再計算
+        if added or removed:
+            touched_modules = {module_name_for(node) for node in added | removed}
+            for node in current:
+                if touched_modules.intersection(imports_by_file[node]):
+                    dirty.add(node)
+
+        for node in removed:
+            self._remove_node(node)
+            self.imports.pop(node, None)
+
+        for node in dirty:
+            self.imports[node] = list(imports_by_file[node])
+            targets = set()
+            for module_name in imports_by_file[node]:
+                targets.update(resolve(module_name))
+            targets.discard(node)  # 自己参照除外
+            self._set_successors(node, targets)
+
+        # removed ノードへのエッジを持っていたノードも変更扱い
+        affected_sources = dirty | {
+            pred for node in removed for pred in self._removed_preds.get(node, ())
+        }
+        self._removed_preds = {}
+        region = self._update_components(affected_sources, removed)
+
+        if dirty or removed:
+            self.save()
+        return {"recomputed": len(dirty), "removed": len(removed), "scc_region": region}
+
+    def _set_successors(self, node: str, targets: Set[str]):
+        for old in self.successors.get(node, set()) - targets:
+            self.predecessors[old].discard(node)
+        for new in targets - self.successors.get(node, set()):
+            self.predecessors.setdefault(new, set()).add(node)
+            self.successors.setdefault(new, set())
+        self.successors[node] = targets
+        self.predecessors.setdefault(node, set())
+
+    def _remove_node(self, node: str):
+        preds = self.predecessors.pop(node, set())
+        for pred in preds:
+            self.successors[pred].discard(node)
+        for succ in self.successors.pop(node, set()):
+            self.predecessors[succ].discard(node)
+        self._removed_preds.setdefault(node, set()).update(preds)
+
+    # ------------------------------------------------------------------
+    # 強連結成分（影響範囲のみ再計算）
+    # ------------------------------------------------------------------
+    def _update_components(self, sources: Set[str], removed: Set[str]) -> int:
+        """変更ノードを含み得る SCC のみ再計算
+
+        変わり得る SCC は「変更ノードから到達可能かつ変更ノードへ到達可能な範囲」
+        と「変更ノード・削除ノードを含んでいた旧 SCC」に限られる。
+        """
+        sources = {node for node in sources if node in self.successors}
+        stale = [
+            component
+            for component in self.components
+            if sources.intersection(component) or removed.intersection(component)
+        ]
+        if not sources and not stale:
+            return 0
+
+        region = _reachable(sources, self.successors) & _reachable(
+            sources, self.predecessors
+        )
+        for component in stale:
+            region.update(node for node in component if node in self.successors)
+
+        kept = [
+            component
+            for component in self.components
+            if not region.intersection(component)
+            and not removed.intersection(component)
+        ]
+        fresh = [c for c in _tarjan(region, self.successors) if len(c) > 1]
+        self.components = sorted(kept + fresh, key=lambda c: c[0])
+
+        self.cycles = {
+            key: cycle
+            for key, cycle in self.cycles.items()
+            if any(component[0] == key for component in kept)
+        }
+        for component in fresh:
+            self.cycles[component[0]] = self._find_cycle(component)
+        return len(region)
+
+    def _find_cycle(self, component: List[str]) -> List[str]:
+        """成分内で先頭ノードを通る最短循環パス（始点 → ... → 始点）"""
+        members = set(component)
+        start = component[0]
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for succ in sorted(self.successors[node]):
+                if succ == start:
+                    path = [node]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return list(reversed(path)) + [start]
+                if succ in members and succ not in parents:
+                    parents[succ] = node
+                    queue.append(succ)
+        return [start]
+
+    # ------------------------------------------------------------------
+    # 参照
+    # ------------------------------------------------------------------
+    def number_of_nodes(self) -> int:
+        return len(self.successors)
+
+    def number_of_edges(self) -> int:
+        return sum(len(targets) for targets in self.successors.values())
+
+    def number_of_components(self) -> int:
+        """SCC 数（単一ノード成分を含む）"""
+        cyclic = sum(len(component) for component in self.components)
+        return self.number_of_nodes() - cyclic + len(self.components)
+
+    def circular_dependencies(self) -> List[Dict[str, Any]]:
+        """循環依存（サイズ2以上の SCC）"""
+        results = []
+        for component in self.components:
+            cycle_path = self.cycles.get(component[0], [component[0]])
+            results.append(
+                {
+                    "type": "circular_dependency",
+                    "files_involved": list(component),
+                    "cycle_length": len(cycle_path) - 1,
+                    "cycle_path": cycle_path,
+                    "severity": "high" if len(component) > 3 else "medium",
+                    "description": f"循環依存検出: {len(component)}ファイル間",
+                }
+            )
+        return results
+
+    def longest_path_length(self) -> int:
+        """最長依存パス長（循環がある場合は -1）"""
+        if self.components:
+            return -1
+        order = _topological_order(self.successors, self.predecessors)
+        length: Dict[str, int] = {}
+        for node in reversed(order):
+            length[node] = max(
+                (length[succ] + 1 for succ in self.successors[node]), default=0
+            )
+        return max(length.values(), default=0)
+
+    def affected_by(self, changed_files: Iterable[str]) -> Set[str]:
+        """変更ファイルを推移的に import しているファイル（変更ファイル自身を含む）"""
+        seeds = {node for node in changed_files if node in self.predecessors}
+        return _reachable(seeds, self.predecessors) | set(changed_files)
+
+    def select_tests(
+        self, changed_files: Iterable[str], test_prefix: str = "tests/"
+    ) -> List[str]:
+        """影響ベースのテスト選択（変更の影響を受ける test_*.py）"""
+        return sorted(
+            node
+            for node in self.affected_by(changed_files)
+            if node.startswith(test_prefix) and Path(node).name.startswith("test_")
+        )
+
+    # ------------------------------------------------------------------
+    # 永続化
+    # ------------------------------------------------------------------
+    def save(self):
+        data = {
+            "version": GRAPH_VERSION,
+            "imports": self.imports,
+            "edges": {
+                node: sorted(targets) for node, targets in self.successors.items()
+            },
+            "components": self.components,
+            "cycles": self.cycles,
+        }
+        self.graph_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.graph_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.graph_path)
+
+    def _load(self):
+        try:
+            with open(self.graph_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != GRAPH_VERSION:
+            return
+
+        self.imports = data["imports"]
+        for node, targets in data["edges"].items():
+            self.successors.setdefault(node, set()).update(targets)
+            self.predecessors.setdefault(node, set())
+            for target in targets:
+                self.predecessors.setdefault(target, set()).add(node)
+                self.successors.setdefault(target, set())
+        self.components = data["components"]
+        self.cycles = data["cycles"]
+
+
+def _reachable(seeds: Iterable[str], adjacency: Dict[str, Set[str]]) -> Set[str]:
+    seen = set(seeds)
+    queue = deque(seen)
+    while queue:
+        node = queue.popleft()
+        for nxt in adjacency.get(node, ()):
+            if nxt not in seen:
+                seen.add(nxt)
+                queue.append(nxt)
+    return seen
+
+
+def _tarjan(nodes: Set[str], successors: Dict[str, Set[str]]) -> List[List[str]]:
+    """nodes の誘導部分グラフ上の SCC（反復版 Tarjan、各成分はソート済み）"""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for root in sorted(nodes):
+        if root in index:
+            continue
+        work = [(root, iter(sorted(successors[root] & nodes)))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(sorted(successors[child] & nodes))))
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+    return components
+
+
+def _topological_order(
+    successors: Dict[str, Set[str]], predecessors: Dict[str, Set[str]]
+) -> List[str]:
+    """Kahn 法によるトポロジカル順（import 元 → import 先）"""
+    indegree = {node: len(predecessors.get(node, ())) for node in successors}
+    queue = deque(sorted(node for node, degree in indegree.items() if degree == 0))
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for succ in successors[node]:
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                queue.append(succ)
+    return order
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+SuperWhisper 保存済みアーカイブ一括再分類
+作成日: 2025年6月
+目的: 品質閾値（quality_threshold / min_text_length / max_noise_level）変更時に、
+      保存済み markdown をローカルで再スコアリングし
+      💭 Personal_Thoughts/ ⇔ 📥 Raw_Archive/ 間で再配置（Notion API 呼び出しなし）
+
+- 再スコアリングはプロセスプールで並列実行（TranscriptionProfile 使用）
+- ファイル移動は保存先ディレクトリ単位でまとめて実行（一時ファイル + os.replace）
+- processed_entries の更新は1トランザクション
+"""
+
+import json
+import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from transcription_profile import profile_transcription
+
+PERSONAL_THOUGHTS = "personal_thoughts"
+RAW_ARCHIVE = "raw_archive"
+FILE_PREFIXES = {PERSONAL_THOUGHTS: "superwhisper_", RAW_ARCHIVE: "superwhisper_raw_"}
+CLASSIFICATION_LABELS = {
+    PERSONAL_THOUGHTS: "💭 Personal Thoughts",
+    RAW_ARCHIVE: "📥 Raw Archive",
+}
+
+AUDIO_HEADER = "## 音声内容\n\n"
+METADATA_HEADER = "\n\n## メタデータ"
+
+# これ未満のファイル数ならプロセスプールを起動しない
+PARALLEL_THRESHOLD = 64
+
+
+def classify_entry(entry_data: Dict[str, Any], config: Dict[str, Any]) -> str:
+    """エントリ分類（SuperWhisperNotionIntegration._classify_entry と共通）"""
+    quality_threshold = config.get("quality_threshold", 0.9)
+    min_text_length = config.get("min_text_length", 20)
+    max_noise_level = config.get("max_noise_level", 0.3)
+
+    quality_score = entry_data.get("quality_score", 0.0)
+    text_length = entry_data.get("text_length", 0)
+    noise_level = entry_data.get("noise_level", 1.0)
+
+    # 💭 Personal_Thoughts/ 配置条件
+    if (
+        quality_score >= quality_threshold
+        and text_length >= min_text_length
+        and noise_level <= max_noise_level
+    ):
+        return PERSONAL_THOUGHTS
+
+    # 📥 Raw_Archive/ 配置条件
+    return RAW_ARCHIVE
+
+
+def extract_saved_text(content: str) -> Optional[str]:
+    """保存済み markdown から音声内容（text_content）を復元"""
+    start = content.find(AUDIO_HEADER)
+    if start == -1:
+        return None
+    start += len(AUDIO_HEADER)
+    end = content.rfind(METADATA_HEADER)
+    if end < start:
+        return None
+    return content[start:end]
+
+
+def rescore_file(file_path: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """1ファイル再スコアリング（プロセスプールのワーカーから呼ばれる）"""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    text = extract_saved_text(content)
+    if text is None:
+        return None
+
+    profile = profile_transcription(text)
+    entry_data = {
+        "quality_score": profile.quality_score(config.get("min_text_length", 20)),
+        "noise_level": profile.noise_level(),
+        "text_length": profile.length,
+    }
+    classification = classify_entry(entry_data, config)
+    notion_id = re.search(r"^notion_id: *(.*)$", content, re.MULTILINE)
+    return {
+        "file_path": file_path,
+        "notion_id": notion_id.group(1).strip() if notion_id else "",
+        "classification": classification,
+        **entry_data,
+        "content": _rewrite_scores(content, entry_data, classification),
+    }
+
+
+def _rewrite_scores(
+    content: str, entry_data: Dict[str, Any], classification: str
+) -> str:
+    """分類・スコア表記の書き換え（音声内容は変更しない）"""
+    label = CLASSIFICATION_LABELS[classification]
+    quality_score = entry_data["quality_score"]
+    noise_level = entry_data["noise_level"]
+    is_personal = classification == PERSONAL_THOUGHTS
+
+    audio_start = content.find(AUDIO_HEADER)
+    metadata_start = content.rfind(METADATA_HEADER)
+    head = content[:audio_start]
+    audio = content[audio_start:metadata_start]
+    tail = content[metadata_start:]
+
+    head_replacements = [
+        (r"^classification: .*$", f"classification: {label}"),
+        (r"^quality_score: .*$", f"quality_score: {quality_score:.2f}"),
+        (r"^noise_level: .*$", f"noise_level: {noise_level:.2f}"),
+        (
+            r"^personality_learning_ready: .*$",
+            f"personality_learning_ready: {is_personal}",
+        ),
+        (r"^\*\*分類\*\*: .*$", f"**分類**: {label}"),
+        (r"^\*\*品質スコア\*\*: .*$", f"**品質スコア**: {quality_score:.1%}"),
+    ]
+    tail_replacements = [
+        (r"^- \*\*転写品質\*\*: .*$", f"- **転写品質**: {quality_score:.1%}"),
+        (r"^- \*\*ノイズレベル\*\*: .*$", f"- **ノイズレベル**: {noise_level:.1%}"),
+        (
+            r"^- \*\*PersonalityLearning投入対象\*\*: .*$",
+            "- **PersonalityLearning投入対象**: " + ("✅ Yes" if is_personal else "⚠️ 要確認"),
+        ),
+    ]
+    for pattern, replacement in head_replacements:
+        head = re.sub(pattern, lambda _: replacement, head, count=1, flags=re.MULTILINE)
+    for pattern, replacement in tail_replacements:
+        tail = re.sub(pattern, lambda _: replacement, tail, count=1, flags=re.MULTILINE)
+    return head + audio + tail
+
+
+def _rescore_chunk(args) -> List[Optional[Dict[str, Any]]]:
+    paths, config = args
+    return [rescore_file(path, config) for path in paths]
+
+
+class ArchiveReclassifier:
+    """保存済み SuperWhisper エントリの一括再分類"""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        personal_thoughts_dir: Path,
+        raw_archive_dir: Path,
+        processed_db: Path,
+        raw_archive_root: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.config = config
+        self.personal_thoughts_dir = Path(personal_thoughts_dir)
+        self.raw_archive_dir = Path(raw_archive_dir)
+        self.raw_archive_root = Path(raw_archive_root or self.raw_archive_dir.parent)
+        self.processed_db = Path(processed_db)
+        self.max_workers = max_workers
+
+    def discover_files(self) -> List[Path]:
+        """対象ファイル（処理済みDB + 保存先ディレクトリ）"""
+        files = set(self.personal_thoughts_dir.glob("superwhisper_*.md"))
+        files.update(self.raw_archive_root.glob("*/superwhisper_raw_*.md"))
+        if self.processed_db.exists():
+            conn = sqlite3.connect(str(self.processed_db))
+            try:
+                rows = conn.execute(
+                    "SELECT file_path FROM processed_entries"
+                    " WHERE file_path IS NOT NULL"
+                )
+                for (file_path,) in rows:
+                    files.add(Path(file_path))
+            except sqlite3.Error:
+                pass
+            finally:
+                conn.close()
+        # DB 記録パスとディレクトリ走査結果の重複を除去
+        return sorted({path.resolve() for path in files if path.is_file()})
+
+    def rescore(self, files: Iterable[Path]) -> List[Dict[str, Any]]:
+        """並列再スコアリング"""
+        paths = [str(path) for path in files]
+        if len(paths) < PARALLEL_THRESHOLD:
+            results = _rescore_chunk((paths, self.config))
+        else:
+            workers = self.max_workers or os.cpu_count() or 1
+            chunk_size = max(len(paths) // (workers * 4), 1)
+            chunks = [
+                (paths[i : i + chunk_size], self.config)
+                for i in range(0, len(paths), chunk_size)
+            ]
+            results = []
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                for chunk_results in executor.map(_rescore_chunk, chunks):
+                    results.extend(chunk_results)
+        return [result for result in results if result is not None]
+
+    def run(self, dry_run: bool = False) -> Dict[str, Any]:
+        """再分類実行
+
+        Returns:
+            統計（対象・昇格・降格・スコア更新件数）と移動計画
+        """
+        results = self.rescore(self.discover_files())
+        plan = []
+        updated_in_place = []
+
+        for result in results:
+            source = Path(result["file_path"])
+            if source.name.startswith(FILE_PREFIXES[RAW_ARCHIVE]):
+                current = RAW_ARCHIVE
+            else:
+                current = PERSONAL_THOUGHTS
+            if result["classification"] != current:
+                plan.append(
+                    (result, self._destination(source, result["classification"]))
+                )
+            else:
+                updated_in_place.append(result)
+
+        stats = {
+            "scanned": len(results),
+            "promoted": sum(
+                1 for r, _ in plan if r["classification"] == PERSONAL_THOUGHTS
+            ),
+            "demoted": sum(1 for r, _ in plan if r["classification"] == RAW_ARCHIVE),
+            "rescored": 0,
+            "moves": [(r["file_path"], str(dest)) for r, dest in plan],
+            "dry_run": dry_run,
+        }
+        if dry_run:
+            return stats
+
+        stats["rescored"] = self._apply(plan, updated_in_place)
+        return stats
+
+    def _destination(self, source: Path, classification: str) -> Path:
+        if classification == PERSONAL_THOUGHTS:
+            save_dir = self.personal_thoughts_dir
+        else:
+            save_dir = self.raw_archive_dir
+        timestamp = source.stem
+        for prefix in (FILE_PREFIXES[RAW_ARCHIVE], FILE_PREFIXES[PERSONAL_THOUGHTS]):
+            if timestamp.startswith(prefix):
+                timestamp = timestamp[len(prefix) :]
+                break
+        return save_dir / f"{FILE_PREFIXES[classification]}{timestamp}.md"
+
+    def _apply(self, plan, updated_in_place) -> int:
+        """ファイル移動・書き換えと processed_entries の一括更新"""
+        # 保存先ディレクトリ毎にまとめて作成
+        for directory in {dest.parent for _, dest in plan}:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        db_updates = []
+        for result, dest in plan:
+            dest = _unique_path(dest)
+            _write_atomic(dest, result["content"])
+            os.unlink(result["file_path"])
+            db_updates.append((result, str(dest)))
+
+        rescored = 0
+        for result in updated_in_place:
+            path = Path(result["file_path"])
+            if path.read_text(encoding="utf-8") != result["content"]:
+                _write_atomic(path, result["content"])
+                rescored += 1
+            db_updates.append((result, result["file_path"]))
+
+        if self.processed_db.exists() and db_updates:
+            conn = sqlite3.connect(str(self.processed_db))
+            try:
+                with conn:
+                    conn.executemany(
+                        """
+                        UPDATE processed_entries
+                        SET file_path = ?, classification = ?, quality_score = ?
+                        WHERE notion_id = ? OR file_path = ?
+                        """,
+                        [
+                            (
+                                new_path,
+                                result["classification"],
+                                result["quality_score"],
+                                result["notion_id"],
+                                result["file_path"],
+                            )
+                            for result, new_path in db_updates
+                        ],
+                    )
+            finally:
+                conn.close()
+        return rescored
+
+
+def _unique_path(path: Path) -> Path:
+    """同名ファイルが既にある場合は連番付与"""
+    candidate = path
+    counter = 1
+    while candidate.exists():
+        candidate = path.with_name(f"{path.stem}_{counter}{path.suffix}")
+        counter += 1
+    return candidate
+
+
+def _write_atomic(path: Path, content: str):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def main():
+    """ローカル一括再分類（Notion API 呼び出しなし）"""
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="SuperWhisper 保存済みアーカイブ一括再分類")
+    parser.add_argument("--config", help="設定ファイルパス")
+    parser.add_argument("--dry-run", action="store_true", help="移動計画のみ表示")
+    parser.add_argument("--workers", type=int, help="並列ワーカー数")
+    args = parser.parse_args()
+
+    base_dir = Path(__file__).parent.parent.parent.parent
+    config_path = Path(
+        args.config
+        or base_dir / "Documentation" / "technical" / "superwhisper_config.json"
+    )
+    config = {}
+    if config_path.exists():
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    reclassifier = ArchiveReclassifier(
+        config,
+        personal_thoughts_dir=base_dir / "Core" / "PersonalityLearning" / "thoughts",
+        raw_archive_dir=base_dir
+        / "Data"
+        / "raw"
+        / f"PersonalThoughts_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        processed_db=base_dir / ".system_internal" / "superwhisper_processed.db",
+        max_workers=args.workers,
+    )
+    stats = reclassifier.run(dry_run=args.dry_run)
+
+    print(f"📊 対象: {stats['scanned']}件")
+    print(f"💭 昇格: {stats['promoted']}件 / 📥 降格: {stats['demoted']}件")
+    if not args.dry_run:
+        print(f"🔄 スコア更新: {stats['rescored']}件")
+    for source, dest in stats["moves"]:
+        print(f"  {source} → {dest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,8 @@ except ImportError as e:
     logging.warning(f"PersonalityLearning統合モジュールが見つかりません: {e}")
     MirralismPersonalityLearning = None
 
+from DataIntegration.content_store import ContentAddressedStore  # isort: skip
+
 
 class SuperWhisperMirralismIntegration:
     """SuperWhisper-MIRRALISM統合システム"""
@@ -43,6 +45,11 @@ class SuperWhisperMirralismIntegration:
         self.project_root = project_root or Path(__file__).parent.parent.parent.parent
         self.setup_logging()
 
+        # 重複保存防止ストア（内容ハッシュ単位で1回だけ保存）
+        self.content_store = ContentAddressedStore(
+            self.project_root / "Data" / "content_store"
+        )
+
         # PersonalityLearning統合初期化
         self.personality_learning = None
         if MirralismPersonalityLearning:
@@ -77,6 +84,22 @@ class SuperWhisperMirralismIntegration:
             # 🔧 時刻修正適用
             audio_data = self._apply_datetime_fix(audio_data)
 
+            # 重複検出（同一転写は分析・保存を省略）
+            duplicate = self.content_store.find_duplicate_entry(
+                "voice", audio_data.get("text_content", "")
+            )
+            if duplicate:
+                self.logger.info(
+                    f"⏭️ 重複音声データ: {audio_data.get('notion_id', 'unknown')} "
+                    f"（既存: {duplicate['manifest']['entry_id']}）"
+                )
+                return {
+                    "success": True,
+                    "duplicate": True,
+                    "save_result": self._build_save_result(duplicate),
+                    "analysis_summary": None,
+                }
+
             # PersonalityLearning分析
             analysis_result = None
             if self.personality_learning and audio_data.get("text_content"):
@@ -220,42 +243,45 @@ class SuperWhisperMirralismIntegration:
             保存結果
         """
         try:
-            # 分類に応じた保存先決定
             classification = integrated_data.get("classification", "thought")
-
-            if classification == "thought":
-                save_path = self.project_root / "Data" / "personal_thoughts"
-            elif classification == "task":
-                save_path = self.project_root / "Data" / "tasks"
-            else:
-                save_path = self.project_root / "Data" / "voice_inputs"
-
-            save_path.mkdir(parents=True, exist_ok=True)
-
-            # ファイル名生成
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             notion_id = integrated_data.get("notion_id", "unknown")
-            filename = f"superwhisper_{timestamp}_{notion_id}.json"
-
-            # データ保存
-            import json
-
-            file_path = save_path / filename
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(integrated_data, f, ensure_ascii=False, indent=2)
-
-            self.logger.info(f"✅ データ保存完了: {file_path}")
+            text_content = integrated_data.get("text_content", "")
+
+            # 転写本文と分析結果を別 blob に分離（本文は他系統と共有される）
+            result = self.content_store.save_entry(
+                "voice",
+                f"superwhisper_{timestamp}_{notion_id}",
+                text_content,
+                blobs={
+                    "transcript": text_content,
+                    "integrated_data": {
+                        key: value
+                        for key, value in integrated_data.items()
+                        if key != "text_content"
+                    },
+                },
+                metadata={"classification": classification, "notion_id": notion_id},
+            )
 
-            return {
-                "success": True,
-                "file_path": str(file_path),
-                "classification": classification,
-            }
+            save_result = self._build_save_result(result)
+            self.logger.info(f"✅ データ保存完了: {save_result['file_path']}")
+            return save_result
 
         except Exception as e:
             self.logger.error(f"❌ データ保存エラー: {e}")
             return {"success": False, "error": str(e)}
 
+    def _build_save_result(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """保存結果（ストアが返したマニフェストパス・分類）"""
+        manifest = entry["manifest"]
+        return {
+            "success": True,
+            "duplicate": entry["duplicate"],
+            "file_path": entry["manifest_path"],
+            "classification": manifest["metadata"].get("classification", "thought"),
+        }
+
     def get_integration_status(self) -> Dict[str, Any]:
         """
         統合システム状態取得
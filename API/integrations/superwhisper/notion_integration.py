@@ -39,6 +39,13 @@ import requests
 # システムパス追加
 current_dir = Path(__file__).parent
 sys.path.append(str(current_dir.parent.parent / "AI_Systems" / "Core"))
+sys.path.append(str(current_dir))
+sys.path.append(str(current_dir.parent.parent.parent / "Core"))
+
+from archive_reclassification import ArchiveReclassifier  # noqa: E402
+from archive_reclassification import classify_entry  # noqa: E402
+from DataIntegration.content_store import ContentAddressedStore  # noqa: E402
+from transcription_profile import profile_transcription  # noqa: E402
 
 
 class SuperWhisperNotionIntegration:
@@ -76,6 +83,9 @@ class SuperWhisperNotionIntegration:
         self.processed_db.parent.mkdir(parents=True, exist_ok=True)
         self._init_processed_db()
 
+        # 重複転写検出ストア（同一転写の再保存防止）
+        self.content_store = ContentAddressedStore(self.base_dir / "Data" / "content_store")
+
         self.logger.info("SuperWhisper-Notion統合システム（時刻修正版）初期化完了")
 
     def _setup_logger(self) -> logging.Logger:
@@ -355,6 +365,13 @@ class SuperWhisperNotionIntegration:
                 self.logger.warning(f"エントリデータ抽出失敗: {entry['id']}")
                 return None
 
+            # 重複転写検出（既存ファイルを処理済みとして記録し再保存しない）
+            duplicate = self.content_store.find_duplicate(
+                "superwhisper", entry_data["text_content"]
+            )
+            if duplicate:
+                return self._mark_duplicate_as_processed(entry["id"], duplicate)
+
             # 品質評価・分類
             classification = self._classify_entry(entry_data)
 
@@ -362,6 +379,15 @@ class SuperWhisperNotionIntegration:
             file_path = self._save_superwhisper_entry(entry_data, classification)
 
             if file_path:
+                # 本文は保存済みマークダウンのみ（ストアには重複判定用の索引だけ残す）
+                self.content_store.save_entry(
+                    "superwhisper",
+                    entry["id"],
+                    entry_data["text_content"],
+                    blobs={},
+                    metadata={"notion_id": entry["id"], "file_path": file_path},
+                )
+
                 # 処理済み記録
                 self._mark_as_processed(
                     entry["id"],
@@ -379,6 +405,31 @@ class SuperWhisperNotionIntegration:
             self.logger.error(f"エントリ分類・保存エラー: {e}")
             return None
 
+    def _mark_duplicate_as_processed(
+        self, notion_id: str, duplicate: Dict[str, Any]
+    ) -> Optional[str]:
+        """重複エントリを既存ファイル参照で処理済み記録"""
+        original_id = duplicate["metadata"].get("notion_id")
+        file_path = duplicate["metadata"].get("file_path")
+        classification = None
+        quality_score = 0.0
+
+        # 再分類で移動済みの場合に備え、現在のパスは処理済みDBを正とする
+        conn = sqlite3.connect(str(self.processed_db))
+        try:
+            row = conn.execute(
+                "SELECT file_path, classification, quality_score FROM processed_entries WHERE notion_id = ?",
+                (original_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row:
+            file_path, classification, quality_score = row
+
+        self._mark_as_processed(notion_id, file_path, classification, quality_score)
+        self.logger.info(f"重複エントリ: {notion_id} → 既存 {original_id} ({file_path})")
+        return file_path
+
     def _extract_entry_data(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Notionエントリからデータ抽出"""
         try:
@@ -643,83 +694,43 @@ class SuperWhisperNotionIntegration:
             return ""
 
     def _estimate_transcription_quality(self, text: str) -> float:
-        """転写品質推定（仮実装）"""
+        """転写品質推定（仮実装、TranscriptionProfile 参照）"""
         try:
-            if not text:
-                return 0.0
-
-            # 簡易品質評価指標
-            quality_indicators = 0
-            total_indicators = 5
-
-            # 1. 文字数チェック
-            if len(text) >= self.config.get("min_text_length", 20):
-                quality_indicators += 1
-
-            # 2. 句読点存在チェック
-            if any(punct in text for punct in "。、．，"):
-                quality_indicators += 1
-
-            # 3. 不明文字チェック
-            unknown_chars = text.count("？") + text.count("〇") + text.count("※")
-            if unknown_chars / len(text) < 0.1:  # 10%未満
-                quality_indicators += 1
-
-            # 4. 連続する同じ文字チェック
-            has_repetition = any(
-                text[i] == text[i + 1] == text[i + 2] for i in range(len(text) - 2)
+            return profile_transcription(text).quality_score(
+                self.config.get("min_text_length", 20)
             )
-            if not has_repetition:
-                quality_indicators += 1
-
-            # 5. 基本的な文章構造
-            if len(text.split()) >= 3:  # 最低3単語
-                quality_indicators += 1
-
-            return quality_indicators / total_indicators
 
         except Exception as e:
             self.logger.error(f"品質推定エラー: {e}")
             return 0.5  # デフォルト中間値
 
     def _estimate_noise_level(self, text: str) -> float:
-        """ノイズレベル推定（仮実装）"""
+        """ノイズレベル推定（仮実装、TranscriptionProfile 参照）"""
         try:
-            if not text:
-                return 1.0  # 高ノイズ
-
-            # ノイズ指標
-
-            # 意味不明な文字列
-            noise_chars = text.count("あー") + text.count("えー") + text.count("うー")
-            noise_ratio = noise_chars / len(text)
-
-            return min(noise_ratio * 2, 1.0)  # 0-1の範囲
+            return profile_transcription(text).noise_level()
 
         except Exception as e:
             self.logger.error(f"ノイズレベル推定エラー: {e}")
             return 0.5
 
     def _classify_entry(self, entry_data: Dict[str, Any]) -> str:
-        """エントリ分類"""
-        quality_threshold = self.config.get("quality_threshold", 0.9)
-        min_text_length = self.config.get("min_text_length", 20)
-        max_noise_level = self.config.get("max_noise_level", 0.3)
-
-        quality_score = entry_data.get("quality_score", 0.0)
-        text_length = entry_data.get("text_length", 0)
-        noise_level = entry_data.get("noise_level", 1.0)
-
-        # 💭 Personal_Thoughts/ 配置条件
-        if (
-            quality_score >= quality_threshold
-            and text_length >= min_text_length
-            and noise_level <= max_noise_level
-        ):
-            return "personal_thoughts"
-
-        # 📥 Raw_Archive/ 配置条件
-        return "raw_archive"
+        """エントリ分類（archive_reclassification.classify_entry と共通）"""
+        return classify_entry(entry_data, self.config)
+
+    def reclassify_archive(self, dry_run: bool = False) -> Dict[str, Any]:
+        """保存済みエントリの一括再分類（閾値変更時、Notion API 呼び出しなし）"""
+        reclassifier = ArchiveReclassifier(
+            self.config,
+            personal_thoughts_dir=self.personal_thoughts_dir,
+            raw_archive_dir=self.raw_archive_dir,
+            processed_db=self.processed_db,
+        )
+        stats = reclassifier.run(dry_run=dry_run)
+        self.logger.info(
+            f"一括再分類{'（dry-run）' if dry_run else ''}: 対象{stats['scanned']}件 "
+            f"昇格{stats['promoted']}件 降格{stats['demoted']}件"
+        )
+        return stats
 
     def _save_superwhisper_entry(
         self, entry_data: Dict[str, Any], classification: str
@@ -925,11 +936,18 @@ def main():
     parser = argparse.ArgumentParser(description="SuperWhisper-Notion統合システム")
     parser.add_argument("--single-run", action="store_true", help="一回のみ実行")
     parser.add_argument("--config", help="設定ファイルパス")
+    parser.add_argument("--reclassify", action="store_true", help="保存済みエントリを現在の閾値で一括再分類")
+    parser.add_argument("--dry-run", action="store_true", help="再分類の移動計画のみ表示")
 
     args = parser.parse_args()
 
     try:
         integration = SuperWhisperNotionIntegration(args.config)
+        if args.reclassify:
+            stats = integration.reclassify_archive(dry_run=args.dry_run)
+            print(f"✅ 再分類完了: 昇格{stats['promoted']}件 / 降格{stats['demoted']}件")
+            return
+
         processed_count = integration.monitor_and_process(single_run=args.single_run)
 
         print("✅ 処理完了: {processed_count}件のエントリを処理しました")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+SuperWhisper 転写テキストプロファイラ
+作成日: 2025年6月
+目的: 転写品質・ノイズ推定に必要な指標を1回の解析でまとめて算出
+
+- 文字数・句読点有無・不明文字数・同一文字3連続の有無・フィラー数・語数
+- 句読点・不明文字・フィラーは1つの結合正規表現で1回だけ走査し、一致箇所のみ
+  集計（Python レベルの文字単位ループなし、数万文字の長時間録音でも高速）
+- 品質スコア・ノイズレベルは SuperWhisperNotionIntegration の従来ロジックと同値
+"""
+
+import re
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+
+UNKNOWN_CHARS = ("？", "〇", "※")
+FILLER_WORDS = ("あー", "えー", "うー")
+# 句読点・不明文字・フィラー（文字集合が互いに素なので str.count と同じ件数）
+TOKEN_PATTERN = re.compile(
+    "(?P<punctuation>[。、．，])"
+    f"|(?P<unknown>[{''.join(UNKNOWN_CHARS)}])"
+    f"|(?P<filler>{'|'.join(FILLER_WORDS)})"
+)
+# 同一文字の3連続（改行・空白を含む）
+REPETITION_PATTERN = re.compile(r"(.)\1\1", re.DOTALL)
+
+QUALITY_INDICATORS = 5
+
+
+@dataclass(frozen=True)
+class TranscriptionProfile:
+    """転写テキストの品質指標"""
+
+    length: int
+    has_punctuation: bool
+    unknown_chars: int
+    has_repetition: bool
+    filler_count: int
+    word_count: int
+
+    @property
+    def unknown_ratio(self) -> float:
+        return self.unknown_chars / self.length if self.length else 0.0
+
+    @property
+    def filler_density(self) -> float:
+        return self.filler_count / self.length if self.length else 0.0
+
+    def quality_score(self, min_text_length: int = 20) -> float:
+        """転写品質推定（0.0-1.0、5指標の充足率）"""
+        if not self.length:
+            return 0.0
+
+        quality_indicators = 0
+        # 1. 文字数
+        if self.length >= min_text_length:
+            quality_indicators += 1
+        # 2. 句読点存在
+        if self.has_punctuation:
+            quality_indicators += 1
+        # 3. 不明文字 10%未満
+        if self.unknown_ratio < 0.1:
+            quality_indicators += 1
+        # 4. 同一文字の3連続なし
+        if not self.has_repetition:
+            quality_indicators += 1
+        # 5. 最低3単語
+        if self.word_count >= 3:
+            quality_indicators += 1
+
+        return quality_indicators / QUALITY_INDICATORS
+
+    def noise_level(self) -> float:
+        """ノイズレベル推定（0.0-1.0、空テキストは高ノイズ）"""
+        if not self.length:
+            return 1.0
+        return min(self.filler_density * 2, 1.0)
+
+    def to_dict(self, min_text_length: int = 20) -> Dict[str, Any]:
+        data = asdict(self)
+        data.update(
+            unknown_ratio=self.unknown_ratio,
+            filler_density=self.filler_density,
+            quality_score=self.quality_score(min_text_length),
+            noise_level=self.noise_level(),
+        )
+        return data
+
+
+def profile_transcription(text: str) -> TranscriptionProfile:
+    """転写テキストのプロファイル（計数は結合正規表現の1回走査）"""
+    text = text or ""
+    counts = {"punctuation": 0, "unknown": 0, "filler": 0}
+    for match in TOKEN_PATTERN.finditer(text):
+        counts[match.lastgroup] += 1
+    return TranscriptionProfile(
+        length=len(text),
+        has_punctuation=counts["punctuation"] > 0,
+        unknown_chars=counts["unknown"],
+        has_repetition=REPETITION_PATTERN.search(text) is not None,
+        filler_count=counts["filler"],
+        word_count=len(text.split()),
+    )
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM V2 コンテンツアドレス型ストア
+作成日: 2025年6月
+目的: 音声転写・WebClip・リサーチファイルの重複保存防止（V1 28,000件重複問題の再発防止）
+
+構成（Data/content_store/）:
+- blobs/<先頭2桁>/<sha256>        本体（同一内容は1回だけ保存）
+- manifests/<namespace>/<id>.<内容ハッシュ先頭16桁>.json
+                                   エントリ毎の薄いマニフェスト（blob ハッシュ + メタデータ）
+- index.db                         (namespace, 内容ハッシュ) → マニフェストの索引
+
+分析処理の前に find_duplicate() で既存エントリを検出し、再分析・再保存を省略する。
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+BlobData = Union[str, bytes, Dict[str, Any], list]
+
+
+def normalize_content(content: str) -> str:
+    """重複判定用の正規化（改行コード・行末空白・前後空白の差異を無視）"""
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").strip().split("\n")
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def content_hash(content: str) -> str:
+    """重複判定キー（正規化テキストの sha256）"""
+    return hashlib.sha256(normalize_content(content).encode("utf-8")).hexdigest()
+
+
+def _encode_blob(data: BlobData) -> bytes:
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return json.dumps(
+        data, ensure_ascii=False, indent=2, sort_keys=True, default=str
+    ).encode("utf-8")
+
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class ContentAddressedStore:
+    """内容ハッシュをキーとする blob ストア + エントリマニフェスト"""
+
+    def __init__(self, store_root: Path):
+        self.store_root = Path(store_root)
+        self.blob_dir = self.store_root / "blobs"
+        self.manifest_dir = self.store_root / "manifests"
+        self.index_path = self.store_root / "index.db"
+        self.store_root.mkdir(parents=True, exist_ok=True)
+        self._init_index()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.index_path), timeout=30)
+
+    def _init_index(self):
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    entry_id TEXT NOT NULL,
+                    manifest_path TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (namespace, content_hash)
+                )
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # blob
+    # ------------------------------------------------------------------
+    def blob_path(self, blob_hash: str) -> Path:
+        return self.blob_dir / blob_hash[:2] / blob_hash
+
+    def put_blob(self, data: BlobData) -> str:
+        """blob 保存（既存ハッシュは書き込み省略）"""
+        encoded = _encode_blob(data)
+        blob_hash = hashlib.sha256(encoded).hexdigest()
+        path = self.blob_path(blob_hash)
+        if not path.exists():
+            _write_atomic(path, encoded)
+        return blob_hash
+
+    def read_blob(self, blob_hash: str) -> bytes:
+        with open(self.blob_path(blob_hash), "rb") as f:
+            return f.read()
+
+    def read_text(self, manifest: Dict[str, Any], name: str) -> str:
+        return self.read_blob(manifest["blobs"][name]["hash"]).decode("utf-8")
+
+    def read_json(self, manifest: Dict[str, Any], name: str) -> Any:
+        return json.loads(self.read_text(manifest, name))
+
+    # ------------------------------------------------------------------
+    # エントリ
+    # ------------------------------------------------------------------
+    def find_duplicate(self, namespace: str, content: str) -> Optional[Dict[str, Any]]:
+        """同一内容の既存エントリのマニフェスト（分析前の重複検出）"""
+        found = self._find_indexed(namespace, content)
+        return found[0] if found is not None else None
+
+    def find_duplicate_entry(
+        self, namespace: str, content: str
+    ) -> Optional[Dict[str, Any]]:
+        """同一内容の既存エントリ（save_entry の重複時と同じ形式）"""
+        found = self._find_indexed(namespace, content)
+        if found is None:
+            return None
+        return {"duplicate": True, "manifest": found[0], "manifest_path": str(found[1])}
+
+    def _find_indexed(
+        self, namespace: str, content: str
+    ) -> Optional[Tuple[Dict[str, Any], Path]]:
+        """索引済みエントリの (マニフェスト, マニフェストパス)"""
+        if not content or not content.strip():
+            return None
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT manifest_path FROM entries "
+                "WHERE namespace = ? AND content_hash = ?",
+                (namespace, content_hash(content)),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        path = self.store_root / row[0]
+        manifest = self._load_manifest(path)
+        if manifest is None:
+            return None
+        return manifest, path
+
+    def save_entry(
+        self,
+        namespace: str,
+        entry_id: str,
+        content: str,
+        blobs: Dict[str, BlobData],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """エントリ保存
+
+        Args:
+            namespace: 保存系統（voice / superwhisper / webclip / research 等）
+            entry_id: エントリID（マニフェストファイル名、内容ハッシュを付加）
+            content: 重複判定対象の本文
+            blobs: 保存する本体（名前 → str / bytes / JSON化可能オブジェクト）
+            metadata: マニフェストに記録する付帯情報
+
+        Returns:
+            {"duplicate": 既存エントリか, "manifest": マニフェスト, "manifest_path": パス}
+        """
+        existing = self.find_duplicate_entry(namespace, content)
+        if existing is not None:
+            return existing
+
+        manifest = {
+            "entry_id": entry_id,
+            "namespace": namespace,
+            "content_hash": content_hash(content)
+            if content and content.strip()
+            else None,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "blobs": {},
+            "metadata": metadata or {},
+        }
+        for name, data in blobs.items():
+            blob_hash = self.put_blob(data)
+            manifest["blobs"][name] = {
+                "hash": blob_hash,
+                "size": self.blob_path(blob_hash).stat().st_size,
+            }
+
+        # 同じ entry_id でも内容が異なればファイル名が分かれ、互いに上書きしない
+        manifest_path = self._manifest_path(
+            namespace, entry_id, manifest["content_hash"]
+        )
+        _write_atomic(manifest_path, _encode_blob(manifest))
+
+        result = {
+            "duplicate": False,
+            "manifest": manifest,
+            "manifest_path": str(manifest_path),
+        }
+        if manifest["content_hash"] is None:
+            return result
+
+        if not self._index_entry(manifest, manifest_path):
+            winner = self._find_indexed(namespace, content)
+            if winner is not None:
+                # 並行保存で先を越された場合は先行エントリを正とする
+                # （同一 entry_id の先行エントリとはパスを共有するため削除しない）
+                if winner[1] != manifest_path:
+                    manifest_path.unlink(missing_ok=True)
+                return {
+                    "duplicate": True,
+                    "manifest": winner[0],
+                    "manifest_path": str(winner[1]),
+                }
+            # マニフェストが失われた索引行は置き換え
+            self._index_entry(manifest, manifest_path, replace=True)
+        return result
+
+    def _index_entry(
+        self, manifest: Dict[str, Any], manifest_path: Path, replace: bool = False
+    ) -> bool:
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    f"""
+                    INSERT OR {"REPLACE" if replace else "IGNORE"} INTO entries
+                    (namespace, content_hash, entry_id, manifest_path, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        manifest["namespace"],
+                        manifest["content_hash"],
+                        manifest["entry_id"],
+                        manifest_path.relative_to(self.store_root).as_posix(),
+                        manifest["created_at"],
+                    ),
+                )
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def _manifest_path(
+        self, namespace: str, entry_id: str, digest: Optional[str] = None
+    ) -> Path:
+        if digest is None:
+            return self.manifest_dir / namespace / f"{entry_id}.json"
+        return self.manifest_dir / namespace / f"{entry_id}.{digest[:16]}.json"
+
+    def _load_manifest(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """ストア統計（エントリ数・blob数・総容量）"""
+        conn = self._connect()
+        try:
+            entries = dict(
+                conn.execute(
+                    "SELECT namespace, COUNT(*) FROM entries GROUP BY namespace"
+                )
+            )
+        finally:
+            conn.close()
+        blob_files = [path for path in self.blob_dir.glob("*/*") if path.is_file()]
+        return {
+            "entries_by_namespace": entries,
+            "blob_count": len(blob_files),
+            "blob_bytes": sum(path.stat().st_size for path in blob_files),
+        }
@@ -11,14 +11,19 @@ Phase 1 機能範囲:
 - PersonalityLearning統合データベースへの保存
 - 基本的な分析メタデータ生成
 - 統合アーキテクチャの概念実証
+- クライアント単位の並列処理・チェックポイント（途中停止からの再開）
 
 作成者: MIRRALISM V2 技術者
 作成日: 2025年6月6日
 """
 
+import hashlib
 import json
 import logging
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -36,6 +41,37 @@ except ImportError as e:
     MirralismPersonalityLearning = None
     PersonalityLearningDatabase = None
 
+# ワーカープロセス毎の処理インスタンス（PersonalityLearning 初期化は1プロセス1回）
+_worker_processor = None
+
+
+def _init_worker(project_root: str):
+    global _worker_processor
+    _worker_processor = ClientDataProcessor(Path(project_root))
+
+
+def _process_client_in_worker(client_data: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_processor.process_client_with_personality_learning(client_data)
+
+
+def _content_fingerprint(client_data: Dict[str, Any]) -> str:
+    """チェックポイント再利用判定用（分析対象コンテンツの sha256）"""
+    return hashlib.sha256(client_data["analysis_content"].encode("utf-8")).hexdigest()
+
+
+def _checkpoint_name(client_name: str) -> str:
+    """クライアント名 → チェックポイントファイル名（日本語名は保持、区切り文字のみ置換）"""
+    safe_name = re.sub(r'[\\/:*?"<>|\s]+', "_", client_name).strip("._") or "client"
+    digest = hashlib.sha1(client_name.encode("utf-8")).hexdigest()[:8]
+    return f"{safe_name}_{digest}.json"
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
 
 class ClientDataProcessor:
     """MIRRALISM クライアントデータ処理エンジン (Phase 1)"""
@@ -66,6 +102,7 @@ class ClientDataProcessor:
             "clients_processed": 0,
             "integration_success": 0,
             "integration_failures": 0,
+            "clients_resumed": 0,
             "session_start": datetime.now(timezone.utc).isoformat()
         }
 
@@ -251,6 +288,124 @@ class ClientDataProcessor:
                 "client_name": client_data.get("client_name", "unknown")
             }
 
+    # ------------------------------------------------------------------
+    # クライアント単位チェックポイント
+    # ------------------------------------------------------------------
+    def _runs_dir(self) -> Path:
+        return self.project_root / "Data" / "client_integration" / "runs"
+
+    def _start_run(self, resume: bool) -> Path:
+        """実行ディレクトリ確保（resume 時は未完了の最新実行を再利用）"""
+        runs_dir = self._runs_dir()
+        runs_dir.mkdir(parents=True, exist_ok=True)
+
+        if resume:
+            for run_dir in sorted(runs_dir.iterdir(), reverse=True):
+                run_info = self._load_json(run_dir / "run.json")
+                if run_info and run_info.get("status") == "running":
+                    self.logger.info(f"🔁 未完了の統合処理を再開: {run_dir.name}")
+                    return run_dir
+
+        run_dir = runs_dir / datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        (run_dir / "clients").mkdir(parents=True)
+        _write_json_atomic(
+            run_dir / "run.json",
+            {"status": "running", "started_at": datetime.now(timezone.utc).isoformat()},
+        )
+        return run_dir
+
+    def _load_json(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load_checkpoint(self, run_dir: Path, client: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """完了済みクライアントの結果（内容変更・失敗時は None で再処理）"""
+        checkpoint = self._load_json(run_dir / "clients" / _checkpoint_name(client["client_name"]))
+        if (
+            checkpoint
+            and checkpoint.get("fingerprint") == _content_fingerprint(client)
+            and checkpoint.get("result", {}).get("success", False)
+        ):
+            return checkpoint["result"]
+        return None
+
+    def _save_checkpoint(self, run_dir: Path, client: Dict[str, Any], result: Dict[str, Any]):
+        """クライアント毎の結果を即時保存（以降の停止でも失われない）"""
+        _write_json_atomic(
+            run_dir / "clients" / _checkpoint_name(client["client_name"]),
+            {
+                "client_name": client["client_name"],
+                "fingerprint": _content_fingerprint(client),
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+                "result": result,
+            },
+        )
+
+    def process_clients(
+        self,
+        clients: List[Dict[str, Any]],
+        run_dir: Path,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """クライアント単位の並列分析（完了毎にチェックポイント保存、入力順で返却）"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(clients)
+        pending = []
+        for index, client in enumerate(clients):
+            cached = self._load_checkpoint(run_dir, client)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+
+        if len(results) - len(pending):
+            self.logger.info(f"⏭️ チェックポイント済み: {len(results) - len(pending)}件")
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if workers <= 1:
+            for index in pending:
+                result = self.process_client_with_personality_learning(clients[index])
+                self._save_checkpoint(run_dir, clients[index], result)
+                results[index] = result
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(self.project_root),),
+            ) as executor:
+                futures = {
+                    executor.submit(_process_client_in_worker, clients[index]): index
+                    for index in pending
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.logger.error(f"❌ クライアント処理エラー: {clients[index]['client_name']} - {e}")
+                        result = {
+                            "success": False,
+                            "error": str(e),
+                            "client_name": clients[index]["client_name"],
+                        }
+                    self._save_checkpoint(run_dir, clients[index], result)
+                    results[index] = result
+
+            # ワーカー側の統計は親プロセスに戻らないため結果から集計
+            processed = [results[index] for index in pending]
+            self.processing_stats["integration_success"] += sum(
+                1 for r in processed if r.get("success", False)
+            )
+            self.processing_stats["integration_failures"] += sum(
+                1 for r in processed if not r.get("success", False)
+            )
+
+        self.processing_stats["clients_processed"] += len(clients)
+        self.processing_stats["clients_resumed"] = len(clients) - len(pending)
+        return results
+
     def save_integration_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """統合結果をデータベースに保存"""
         try:
@@ -297,8 +452,16 @@ class ClientDataProcessor:
                 "error": str(e)
             }
 
-    def run_phase1_integration(self) -> Dict[str, Any]:
-        """Phase 1 統合処理実行"""
+    def run_phase1_integration(
+        self, max_workers: Optional[int] = None, resume: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Phase 1 統合処理実行
+
+        Args:
+            max_workers: 並列ワーカー数（None は CPU 数、1 は逐次処理）
+            resume: 未完了の前回実行があれば完了済みクライアントを省略して再開
+        """
         self.logger.info("🚀 MIRRALISM ClientDataProcessor Phase 1 統合開始")
         
         try:
@@ -318,15 +481,25 @@ class ClientDataProcessor:
                     "error": "クライアントデータの抽出に失敗しました"
                 }
             
-            # 3. PersonalityLearning統合分析
-            integration_results = []
-            for client in extracted_clients:
-                result = self.process_client_with_personality_learning(client)
-                integration_results.append(result)
-                self.processing_stats["clients_processed"] += 1
+            # 3. PersonalityLearning統合分析（クライアント単位チェックポイント）
+            run_dir = self._start_run(resume)
+            integration_results = self.process_clients(
+                extracted_clients, run_dir, max_workers=max_workers
+            )
             
             # 4. 結果保存
             save_result = self.save_integration_results(integration_results)
+            save_result["run_dir"] = str(run_dir)
+            if save_result.get("success", False):
+                run_info = self._load_json(run_dir / "run.json") or {}
+                run_info.update(
+                    {
+                        "status": "completed",
+                        "completed_at": datetime.now(timezone.utc).isoformat(),
+                        "results_file": save_result["results_file"],
+                    }
+                )
+                _write_json_atomic(run_dir / "run.json", run_info)
             
             # 5. 最終結果生成
             final_result = {
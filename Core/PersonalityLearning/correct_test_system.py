@@ -8,41 +8,28 @@ Version: 2.0 (修正版)
 Created: 2025-06-10
 """
 
-import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from measurement_journal import EvaluationJournalMixin
 
-class CorrectTestSystem:
+
+class CorrectTestSystem(EvaluationJournalMixin):
     """正しい評価収集システム"""
 
     def __init__(self):
         """初期化"""
         self.project_root = Path(__file__).parent.parent.parent
-        self.results_file = self.project_root / "Data" / "correct_evaluation_results.json"
+        self.results_file = self.project_root / "Data" / "correct_evaluation_results.jsonl"
         self.results_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # 既存結果読み込み
-        self.results = self._load_results()
-
-    def _load_results(self):
-        """既存の評価結果読み込み"""
-        if self.results_file.exists():
-            try:
-                with open(self.results_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {"evaluations": []}
-        return {"evaluations": []}
-
-    def _save_results(self):
-        """評価結果保存"""
-        with open(self.results_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        self._open_journal(self.results_file, "score")
 
     def record_evaluation(self, score, comment=None):
         """評価を正しく記録"""
-        evaluation_number = len(self.results["evaluations"]) + 1
+        evaluation_number = self.journal.count() + 1
         
         evaluation = {
             "evaluation_number": evaluation_number,
@@ -52,8 +39,7 @@ class CorrectTestSystem:
             "question": "黒澤工務店について教えて"
         }
         
-        self.results["evaluations"].append(evaluation)
-        self._save_results()
+        self.journal.append(evaluation)
         
         print("✅ 評価{}記録完了: {}点".format(evaluation_number, score))
         
@@ -66,14 +52,14 @@ class CorrectTestSystem:
 
     def show_progress(self):
         """現在の進捗表示"""
-        total_evaluations = len(self.results["evaluations"])
+        summary = self.journal.aggregate_all()
+        total_evaluations = summary["count"]
         
         if total_evaluations == 0:
             print("📊 まだ評価がありません")
             return
         
-        scores = [e["score"] for e in self.results["evaluations"]]
-        average = sum(scores) / len(scores)
+        average = summary["mean"]
         
         print("\n📊 現在の進捗:")
         print("評価回数: {}/10回".format(total_evaluations))
@@ -81,7 +67,7 @@ class CorrectTestSystem:
         print("理解精度: {:.1f}%".format((average / 5.0) * 100))
         
         print("\n詳細:")
-        for evaluation in self.results["evaluations"]:
+        for evaluation in self._evaluations():
             if evaluation["comment"]:
                 comment_text = " - {}".format(evaluation["comment"])
             else:
@@ -95,7 +81,7 @@ class CorrectTestSystem:
 
     def interactive_evaluation(self):
         """インタラクティブな評価収集"""
-        current_count = len(self.results["evaluations"]) + 1
+        current_count = self.journal.count() + 1
         
         print("\n--- 評価 {}/10 ---".format(current_count))
         print("質問: 「黒澤工務店について教えて」")
@@ -139,8 +125,8 @@ class CorrectTestSystem:
         print("4. これを10回繰り返し")
         print()
         
-        while len(self.results["evaluations"]) < 10:
-            current_count = len(self.results["evaluations"]) + 1
+        while self.journal.count() < 10:
+            current_count = self.journal.count() + 1
             
             print("=" * 30)
             print("テスト {}/10回目".format(current_count))
@@ -158,7 +144,7 @@ class CorrectTestSystem:
             # 進捗表示
             self.show_progress()
             
-            if len(self.results["evaluations"]) < 10:
+            if self.journal.count() < 10:
                 print("\n次のテストに進みます...")
             else:
                 print("\n🎉 10回のテストが完了しました！")
@@ -166,11 +152,11 @@ class CorrectTestSystem:
 
     def calculate_final_result(self):
         """最終結果計算"""
-        if len(self.results["evaluations"]) < 10:
+        if self.journal.count() < 10:
             print("⚠️  まだ10回の評価が完了していません")
             return
         
-        scores = [e["score"] for e in self.results["evaluations"]]
+        scores = [e["score"] for e in self._evaluations()]
         average_score = sum(scores) / len(scores)
         accuracy_percentage = (average_score / 5.0) * 100
         
@@ -39,12 +39,31 @@ class PersonalityLearningDatabase:
         """
         self.db_path = db_path
         self._local = threading.local()
-        self.init_database()
-        logger.info(f"PersonalityLearning Database initialized: {db_path}")
+        # スキーマ初期化（ファイル作成）は初回接続時まで遅延
+        self._schema_ready = False
+        self._schema_initializing = False
+        self._schema_lock = threading.RLock()
+
+    def _ensure_schema(self):
+        """初回接続時のみスキーマ初期化（他スレッドは完了まで待機）"""
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            # init_database 内の再帰的な get_connection 呼び出しは素通り
+            if self._schema_ready or self._schema_initializing:
+                return
+            self._schema_initializing = True
+            try:
+                self.init_database()
+                self._schema_ready = True
+            finally:
+                self._schema_initializing = False
+            logger.info(f"PersonalityLearning Database initialized: {self.db_path}")
 
     @contextmanager
     def get_connection(self):
         """スレッドセーフなデータベース接続管理"""
+        self._ensure_schema()
         if not hasattr(self._local, "connection"):
             self._local.connection = sqlite3.connect(
                 self.db_path, check_same_thread=False, timeout=30.0
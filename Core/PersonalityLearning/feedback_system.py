@@ -8,43 +8,30 @@ Version: 3.0 (フィードバック分離版)
 Created: 2025-06-10
 """
 
-import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from measurement_journal import EvaluationJournalMixin
 
-class FeedbackSystem:
+
+class FeedbackSystem(EvaluationJournalMixin):
     """フィードバック→自己採点システム"""
 
     def __init__(self):
         """初期化"""
         self.project_root = Path(__file__).parent.parent.parent
         self.results_file = (
-            self.project_root / "Data" / "feedback_evaluation_results.json"
+            self.project_root / "Data" / "feedback_evaluation_results.jsonl"
         )
         self.results_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # 既存結果読み込み
-        self.results = self._load_results()
-
-    def _load_results(self):
-        """既存の評価結果読み込み"""
-        if self.results_file.exists():
-            try:
-                with open(self.results_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {"evaluations": []}
-        return {"evaluations": []}
-
-    def _save_results(self):
-        """評価結果保存"""
-        with open(self.results_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        self._open_journal(self.results_file, "ai_self_score")
 
     def record_feedback_and_score(self, feedback, self_score, self_reasoning):
         """フィードバックと自己採点を記録"""
-        evaluation_number = len(self.results["evaluations"]) + 1
+        evaluation_number = self.journal.count() + 1
         
         evaluation = {
             "evaluation_number": evaluation_number,
@@ -55,8 +42,7 @@ class FeedbackSystem:
             "question": "黒澤工務店について教えて"
         }
         
-        self.results["evaluations"].append(evaluation)
-        self._save_results()
+        self.journal.append(evaluation)
         
         print("✅ 評価{}記録完了".format(evaluation_number))
         print("   末武さんフィードバック: {}".format(feedback))
@@ -67,14 +53,14 @@ class FeedbackSystem:
 
     def show_progress(self):
         """現在の進捗表示"""
-        total_evaluations = len(self.results["evaluations"])
+        summary = self.journal.aggregate_all()
+        total_evaluations = summary["count"]
         
         if total_evaluations == 0:
             print("📊 まだ評価がありません")
             return
         
-        scores = [e["ai_self_score"] for e in self.results["evaluations"]]
-        average = sum(scores) / len(scores)
+        average = summary["mean"]
         
         print("\n📊 現在の進捗:")
         print("評価回数: {}/10回".format(total_evaluations))
@@ -82,7 +68,7 @@ class FeedbackSystem:
         print("推定理解精度: {:.1f}%".format((average / 5.0) * 100))
         
         print("\n詳細:")
-        for evaluation in self.results["evaluations"]:
+        for evaluation in self._evaluations():
             print("  評価{}: {}点".format(
                 evaluation["evaluation_number"], 
                 evaluation["ai_self_score"]
@@ -101,11 +87,11 @@ class FeedbackSystem:
 
     def calculate_final_result(self):
         """最終結果計算"""
-        if len(self.results["evaluations"]) < 10:
+        if self.journal.count() < 10:
             print("⚠️  まだ10回の評価が完了していません")
             return
         
-        scores = [e["ai_self_score"] for e in self.results["evaluations"]]
+        scores = [e["ai_self_score"] for e in self._evaluations()]
         average_score = sum(scores) / len(scores)
         accuracy_percentage = (average_score / 5.0) * 100
         
@@ -8,39 +8,26 @@ Version: 1.0 (Interactive Measurement)
 Created: 2025-06-10 (末武さん指摘対応)
 """
 
-import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from measurement_journal import EvaluationJournalMixin
 
-class InteractivePrecisionTest:
+
+class InteractivePrecisionTest(EvaluationJournalMixin):
     """末武さんが使う実際の精度測定システム"""
 
     def __init__(self):
         """初期化"""
         self.project_root = Path(__file__).parent.parent.parent
         self.results_file = (
-            self.project_root / "Data" / "suetake_evaluation_results.json"
+            self.project_root / "Data" / "suetake_evaluation_results.jsonl"
         )
         self.results_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # 既存結果読み込み
-        self.results = self._load_results()
-
-    def _load_results(self):
-        """既存の評価結果読み込み"""
-        if self.results_file.exists():
-            try:
-                with open(self.results_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {"evaluations": []}
-        return {"evaluations": []}
-
-    def _save_results(self):
-        """評価結果保存"""
-        with open(self.results_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        self._open_journal(self.results_file, "score", group_key="test_type")
 
     def run_client_understanding_test(self):
         """クライアント理解精度テスト実行"""
@@ -127,8 +114,7 @@ class InteractivePrecisionTest:
             "total_evaluations": len(scores)
         }
         
-        self.results["evaluations"].append(evaluation_result)
-        self._save_results()
+        self.journal.append(evaluation_result)
         
         print("\n✅ 結果が保存されました: {}".format(self.results_file))
         
@@ -201,8 +187,7 @@ class InteractivePrecisionTest:
             "integration_status": "completed" if legacy_files else "failed"
         }
         
-        self.results["evaluations"].append(integration_result)
-        self._save_results()
+        self.journal.append(integration_result)
         
         print("\n✅ データ統合確認完了")
         print("結果保存先: {}".format(self.results_file))
@@ -292,8 +277,7 @@ class InteractivePrecisionTest:
             "details": consistency_results
         }
         
-        self.results["evaluations"].append(consistency_test_result)
-        self._save_results()
+        self.journal.append(consistency_test_result)
         
         # 総合評価
         if consistent_count == 3:
@@ -311,11 +295,11 @@ class InteractivePrecisionTest:
         print("📊 これまでの評価結果")
         print("="*60)
         
-        if not self.results["evaluations"]:
+        if self.journal.count() == 0:
             print("まだ評価結果がありません")
             return
         
-        for i, evaluation in enumerate(self.results["evaluations"], 1):
+        for i, evaluation in enumerate(self._evaluations(), 1):
             print("{}. {} - {}".format(
                 i, 
                 evaluation.get('test_type', 'unknown'),
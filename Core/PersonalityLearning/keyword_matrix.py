@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+キーワード出現行列（文書バッチ用）
+作成日: 2025年6月
+目的: 複数キーワード群の出現判定を文書毎1回の走査で行い、
+      文書×キーワードの出現行列・文書×群の出現数行列を NumPy で構築
+
+- 全キーワードを長い順の正規表現選択肢にまとめ、文書毎に1回 findall
+- 重なりで隠れ得るキーワード（他キーワードの部分文字列・接尾辞と接頭辞の重なり）は
+  部分文字列包含の閉包と個別確認で補正し、`keyword in content` と同一の判定を保証
+"""
+
+import re
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+
+class KeywordMatcher:
+    """キーワード群の一括出現判定"""
+
+    def __init__(self, groups: Dict[str, Sequence[str]]):
+        self.group_names: List[str] = list(groups)
+        self.vocabulary: List[str] = sorted(
+            {keyword for keywords in groups.values() for keyword in keywords}
+        )
+        index = {keyword: i for i, keyword in enumerate(self.vocabulary)}
+
+        # キーワード → 群 の対応行列（群内の重複キーワードは重複数だけ加算）
+        self.group_matrix = np.zeros(
+            (len(self.vocabulary), len(self.group_names)), dtype=np.int64
+        )
+        for column, keywords in enumerate(groups.values()):
+            for keyword in keywords:
+                self.group_matrix[index[keyword], column] += 1
+
+        ordered = sorted(self.vocabulary, key=lambda keyword: (-len(keyword), keyword))
+        self.pattern = re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
+        # 一致したキーワードに含まれる他キーワード（部分文字列）も出現扱い
+        self._implied: Dict[str, Tuple[int, ...]] = {
+            keyword: tuple(
+                index[other] for other in self.vocabulary if other in keyword
+            )
+            for keyword in self.vocabulary
+        }
+        # 他キーワードの接尾辞が自身の接頭辞と重なる場合は一致が隠れ得るため個別確認
+        self._overlap_checked: Tuple[int, ...] = tuple(
+            index[keyword]
+            for keyword in self.vocabulary
+            if any(
+                other != keyword and _suffix_prefix_overlap(other, keyword)
+                for other in self.vocabulary
+            )
+        )
+
+    def presence_matrix(self, documents: Sequence[str]) -> np.ndarray:
+        """文書×キーワードの出現行列（bool）"""
+        rows: List[int] = []
+        columns: List[int] = []
+        implied = self._implied
+        for row, document in enumerate(documents):
+            found = set()
+            for match in set(self.pattern.findall(document)):
+                found.update(implied[match])
+            for column in self._overlap_checked:
+                if column not in found and self.vocabulary[column] in document:
+                    found.add(column)
+            rows.extend([row] * len(found))
+            columns.extend(found)
+
+        presence = np.zeros((len(documents), len(self.vocabulary)), dtype=bool)
+        presence[rows, columns] = True
+        return presence
+
+    def group_counts(self, documents: Sequence[str]) -> np.ndarray:
+        """文書×群の出現キーワード数（`sum(1 for k in keywords if k in document)` と同値）"""
+        return self.presence_matrix(documents).astype(np.int64) @ self.group_matrix
+
+
+def _suffix_prefix_overlap(left: str, right: str) -> bool:
+    """left の真の接尾辞が right の真の接頭辞と一致するか"""
+    return any(
+        left.endswith(right[:size]) for size in range(1, min(len(left), len(right)))
+    )
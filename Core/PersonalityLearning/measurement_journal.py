@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM 追記型測定ジャーナル
+PersonalityLearning 精度測定・評価記録の共通保存層
+
+- 1レコード = JSONL 1行の追記（flush + fsync によるクラッシュセーフ書き込み）
+- グループ別集計（件数・合計・二乗和・最小・最大・最新）をサイドカーに保持し、
+  追記毎に差分更新（状況取得で履歴を走査しない）
+- サイドカーはジャーナルのバイトオフセットを記録し、
+  不整合時は未反映の末尾のみ再生して復旧
+- 旧形式（全件 JSON）は初回オープン時に一括移行
+- partition_key 指定時は (区分, グループ) 毎の最新値索引も差分更新
+  （例: クライアント × 精度タイプの最新測定値を全件走査なしで参照）
+
+Author: MIRRALISM Technical Team
+Version: 1.0
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+JOURNAL_VERSION = 1
+DEFAULT_GROUP = "default"
+
+
+class MeasurementJournal:
+    """追記専用の測定ジャーナル + 差分更新される集計
+
+    Args:
+        journal_path: ジャーナル（.jsonl）パス
+        value_key: 集計対象の数値フィールド
+        group_key: グループ分けフィールド（未指定・欠損時は "default"）
+        legacy_path: 旧形式 JSON（初回のみ移行）
+        legacy_key: 旧形式 JSON 内のレコード配列キー
+        partition_key: 最新値索引の区分フィールド（"a.b" でネスト参照、欠損レコードは索引対象外）
+    """
+
+    def __init__(
+        self,
+        journal_path: Path,
+        value_key: str,
+        group_key: Optional[str] = None,
+        legacy_path: Optional[Path] = None,
+        legacy_key: str = "evaluations",
+        partition_key: Optional[str] = None,
+    ):
+        self.journal_path = Path(journal_path)
+        self.aggregates_path = self.journal_path.with_suffix(".aggregates.json")
+        self.value_key = value_key
+        self.group_key = group_key
+        self.partition_key = partition_key
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not self.journal_path.exists() and legacy_path is not None:
+            self._migrate_legacy(Path(legacy_path), legacy_key)
+
+        self._state = self._load_state()
+        self._catch_up()
+
+    # ------------------------------------------------------------------
+    # 書き込み
+    # ------------------------------------------------------------------
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """1レコード追記（O(1)）"""
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                # 他プロセスの追記分を先に取り込む
+                self._catch_up()
+                # 書き込み途中でクラッシュした末尾行を切り詰め
+                if self._journal_size() > self._state["offset"]:
+                    f.truncate(self._state["offset"])
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+                self._apply(record)
+                self._state["offset"] += len(line)
+                self._save_state()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return record
+
+    # ------------------------------------------------------------------
+    # 参照（集計のみ、履歴走査なし）
+    # ------------------------------------------------------------------
+    def count(self) -> int:
+        """総レコード数"""
+        return self._state["count"]
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """最新レコード（timestamp 最大）"""
+        return self._state["latest"]
+
+    def groups(self) -> List[str]:
+        return list(self._state["groups"].keys())
+
+    def aggregate(self, group: str = DEFAULT_GROUP) -> Dict[str, Any]:
+        """グループ集計（count・mean・stdev 等、CI 計算用の入力を含む）"""
+        agg = self._state["groups"].get(group)
+        if agg is None:
+            agg = _empty_aggregate()
+        return _with_stats(agg)
+
+    def aggregate_all(self) -> Dict[str, Any]:
+        """全グループを合算した集計（aggregate と同じ形式）"""
+        total = _empty_aggregate()
+        for agg in self._state["groups"].values():
+            for key in ("count", "value_count", "sum", "sum_sq"):
+                total[key] += agg[key]
+            for key, pick in (("min", min), ("max", max)):
+                if agg[key] is not None:
+                    merged = total[key]
+                    total[key] = agg[key] if merged is None else pick(merged, agg[key])
+        total["latest"] = self._state["latest"]
+        return _with_stats(total)
+
+    def aggregates(self) -> Dict[str, Dict[str, Any]]:
+        return {group: self.aggregate(group) for group in self._state["groups"]}
+
+    def partitions(self) -> List[str]:
+        """最新値索引の区分一覧"""
+        return list(self._state["partitions"].keys())
+
+    def latest_values(self, partition: str) -> Dict[str, Any]:
+        """区分内のグループ別最新値（最後に追記されたレコードの値）"""
+        entries = self._state["partitions"].get(partition, {})
+        return {group: entry["value"] for group, entry in entries.items()}
+
+    def refresh(self):
+        """他プロセスの追記分を集計・索引へ取り込む"""
+        self._catch_up()
+
+    # ------------------------------------------------------------------
+    # 履歴読み込み（一覧表示・レポート用）
+    # ------------------------------------------------------------------
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """全レコードを追記順に列挙"""
+        for record, _ in self._iter_from(0):
+            yield record
+
+    # ------------------------------------------------------------------
+    # 内部処理
+    # ------------------------------------------------------------------
+    def _empty_state(self) -> Dict[str, Any]:
+        return {
+            "version": JOURNAL_VERSION,
+            "value_key": self.value_key,
+            "group_key": self.group_key,
+            "partition_key": self.partition_key,
+            "offset": 0,
+            "count": 0,
+            "latest": None,
+            "groups": {},
+            "partitions": {},
+        }
+
+    def _load_state(self) -> Dict[str, Any]:
+        """サイドカー読み込み（設定不一致・破損時は空から再構築）"""
+        try:
+            with open(self.aggregates_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return self._empty_state()
+
+        journal_size = self._journal_size()
+        if (
+            state.get("version") != JOURNAL_VERSION
+            or state.get("value_key") != self.value_key
+            or state.get("group_key") != self.group_key
+            or state.get("partition_key") != self.partition_key
+            or state.get("offset", 0) > journal_size
+        ):
+            return self._empty_state()
+        state.setdefault("partitions", {})
+        return state
+
+    def _save_state(self):
+        """サイドカーのアトミック書き換え（グループ数に比例、履歴長に非依存）"""
+        tmp_path = self.aggregates_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.aggregates_path)
+
+    def _catch_up(self):
+        """サイドカー未反映のジャーナル末尾を再生"""
+        if self._state["offset"] >= self._journal_size():
+            return
+        applied = False
+        for record, end in self._iter_from(self._state["offset"]):
+            self._apply(record)
+            self._state["offset"] = end
+            applied = True
+        if applied:
+            self._save_state()
+
+    def _iter_from(self, offset: int) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """offset 以降の完全な行を (レコード, 行末オフセット) で列挙
+
+        改行で終わらない末尾（書き込み途中のクラッシュ）は無視する。
+        """
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "rb") as f:
+            f.seek(offset)
+            position = offset
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                position += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                yield record, position
+
+    def _apply(self, record: Dict[str, Any]):
+        """集計へ1レコード反映"""
+        state = self._state
+        state["count"] += 1
+        if _is_newer(record, state["latest"]):
+            state["latest"] = record
+
+        group = DEFAULT_GROUP
+        if self.group_key is not None:
+            group = record.get(self.group_key) or DEFAULT_GROUP
+        agg = state["groups"].setdefault(group, _empty_aggregate())
+        agg["count"] += 1
+        if _is_newer(record, agg["latest"]):
+            agg["latest"] = record
+
+        value = record.get(self.value_key)
+        if self.partition_key is not None:
+            partition = _lookup(record, self.partition_key)
+            if partition is not None:
+                state["partitions"].setdefault(str(partition), {})[group] = {
+                    "value": value,
+                    "timestamp": record.get("timestamp"),
+                }
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            agg["value_count"] += 1
+            agg["sum"] += value
+            agg["sum_sq"] += value * value
+            agg["min"] = value if agg["min"] is None else min(agg["min"], value)
+            agg["max"] = value if agg["max"] is None else max(agg["max"], value)
+
+    def _journal_size(self) -> int:
+        try:
+            return self.journal_path.stat().st_size
+        except OSError:
+            return 0
+
+    def _migrate_legacy(self, legacy_path: Path, legacy_key: str):
+        """旧形式 JSON（全件書き換え方式）からの一括移行"""
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                records = json.load(f).get(legacy_key, [])
+        except (OSError, ValueError, AttributeError):
+            return
+        if not records:
+            return
+        tmp_path = self.journal_path.with_suffix(".migrating")
+        with open(tmp_path, "wb") as f:
+            for record in records:
+                f.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+
+
+class EvaluationJournalMixin:
+    """評価記録クラス共通のジャーナル保持（追記専用、旧 JSON は初回のみ移行）"""
+
+    journal: MeasurementJournal
+
+    def _open_journal(
+        self, results_file: Path, value_key: str, group_key: Optional[str] = None
+    ):
+        self.journal = MeasurementJournal(
+            results_file,
+            value_key=value_key,
+            group_key=group_key,
+            legacy_path=Path(results_file).with_suffix(".json"),
+        )
+
+    def _evaluations(self) -> List[Dict[str, Any]]:
+        """評価履歴（ジャーナル全件、一覧表示用）"""
+        return list(self.journal.records())
+
+
+def _empty_aggregate() -> Dict[str, Any]:
+    return {
+        "count": 0,
+        "value_count": 0,
+        "sum": 0.0,
+        "sum_sq": 0.0,
+        "min": None,
+        "max": None,
+        "latest": None,
+    }
+
+
+def _with_stats(agg: Dict[str, Any]) -> Dict[str, Any]:
+    """集計値に mean・stdev（標本標準偏差）を付加"""
+    n = agg["value_count"]
+    mean = agg["sum"] / n if n else 0.0
+    if n > 1:
+        variance = max((agg["sum_sq"] - n * mean * mean) / (n - 1), 0.0)
+    else:
+        variance = 0.0
+    return {**agg, "mean": mean, "stdev": math.sqrt(variance)}
+
+
+def _lookup(record: Dict[str, Any], dotted_key: str) -> Any:
+    """ "a.b" 形式のネストフィールド参照（途中欠損は None）"""
+    value: Any = record
+    for key in dotted_key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _is_newer(record: Dict[str, Any], current: Optional[Dict[str, Any]]) -> bool:
+    """timestamp 比較（同値なら後から追記された方を最新とする）"""
+    if current is None:
+        return True
+    return (record.get("timestamp") or "") >= (current.get("timestamp") or "")
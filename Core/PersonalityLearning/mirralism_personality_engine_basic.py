@@ -16,12 +16,88 @@ V1教訓:
 import json
 import logging
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Sequence
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from keyword_matrix import KeywordMatcher  # noqa: E402
+from trait_vector import TRAIT_NAMES  # noqa: E402
+from trait_vector import pack_traits  # noqa: E402
+from trait_vector import summarize_traits  # noqa: E402
+from trait_vector import traits_matrix  # noqa: E402
+from trait_vector import unpack_traits  # noqa: E402
+from weight_store import VersionedWeightStore  # noqa: E402
+from weight_store import WeightSnapshot  # noqa: E402
+
+# 基本キーワード分析（特性 → キーワード・1語あたりの加点）
+TRAIT_KEYWORDS = {
+    "technical_orientation": (
+        "技術",
+        "実装",
+        "システム",
+        "効率",
+        "最適化",
+        "CTO",
+        "開発",
+        "コード",
+    ),
+    "integrity_focus": (
+        "誠実",
+        "責任",
+        "品質",
+        "信頼",
+        "安全",
+        "保護",
+        "正確",
+    ),
+    "relationship_value": (
+        "協力",
+        "チーム",
+        "相談",
+        "サポート",
+        "理解",
+        "共感",
+    ),
+}
+TRAIT_KEYWORD_WEIGHTS = {
+    "technical_orientation": 0.1,
+    "integrity_focus": 0.15,
+    "relationship_value": 0.12,
+}
+
+# 感情キーワード辞書
+EMOTION_KEYWORDS = {
+    "positive": ("嬉しい", "楽しい", "良い", "素晴らしい", "優秀", "成功"),
+    "negative": ("困った", "難しい", "問題", "課題", "心配", "不安"),
+    "neutral": ("普通", "通常", "標準", "一般的", "基本"),
+    "technical": ("分析", "検証", "確認", "実装", "設計", "開発"),
+}
+
+# 基本分析重み（重みストア初版）
+BASIC_ANALYSIS_WEIGHTS = {
+    "keyword_technical": 2.0,  # 技術キーワード重み
+    "keyword_integrity": 2.5,  # 誠実性キーワード重み
+    "keyword_relationship": 1.8,  # 関係性キーワード重み
+    "emotional_tone": 1.5,  # 感情トーン重み
+    "language_pattern": 1.3,  # 言語パターン重み
+}
+
+
+def scale_weights_from_feedback(weights: Dict[str, float], event: Dict[str, Any]):
+    """フィードバック1件の重み更新（期待より低精度 → 5%増、高精度 → 5%減）"""
+    factor = 1.05 if event["accuracy_delta"] > 0 else 0.95
+    for key in weights:
+        weights[key] *= factor
 
 
 class MirralismPersonalityEngineBasic:
@@ -36,7 +112,7 @@ class MirralismPersonalityEngineBasic:
     段階的目標: 61% → 70% → 80% → 90% → 95%
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, feedback_batch_size: int = 8):
         """基本エンジン初期化"""
 
         # ログ設定
@@ -79,14 +155,17 @@ class MirralismPersonalityEngineBasic:
             "unified_architecture": True,  # 統合アーキテクチャ
         }
 
-        # 基本分析重み設定
-        self.analysis_weights = {
-            "keyword_technical": 2.0,  # 技術キーワード重み
-            "keyword_integrity": 2.5,  # 誠実性キーワード重み
-            "keyword_relationship": 1.8,  # 関係性キーワード重み
-            "emotional_tone": 1.5,  # 感情トーン重み
-            "language_pattern": 1.3,  # 言語パターン重み
-        }
+        # 基本分析重み（版管理ストア、フィードバックはミニバッチ適用）
+        self.weight_store = VersionedWeightStore(
+            self.db_path,
+            namespace="basic_engine",
+            initial_weights=BASIC_ANALYSIS_WEIGHTS,
+            update_rule=scale_weights_from_feedback,
+            batch_size=feedback_batch_size,
+        )
+
+        # バッチ分析用キーワード行列（特性・感情キーワードを1回の走査で判定）
+        self.keyword_matcher = KeywordMatcher({**TRAIT_KEYWORDS, **EMOTION_KEYWORDS})
 
         # データベース初期化
         self._initialize_database()
@@ -94,6 +173,15 @@ class MirralismPersonalityEngineBasic:
         self.logger.info(f"MIRRALISM PersonalityEngine Basic 初期化完了")
         self.logger.info(f"継承精度: {self.v1_learned_accuracy}% (V1学習済み)")
 
+    @property
+    def analysis_weights(self) -> Mapping[str, float]:
+        """現行版の分析重み（読み取り専用）"""
+        return self.weight_store.current().weights
+
+    def weight_snapshot(self) -> WeightSnapshot:
+        """現行版の重みスナップショット（分析中の版固定用）"""
+        return self.weight_store.current()
+
     def _initialize_database(self):
         """基本データベース初期化"""
         try:
@@ -107,13 +195,15 @@ class MirralismPersonalityEngineBasic:
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         content TEXT NOT NULL,
                         analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        personality_scores TEXT,  -- JSON形式
+                        personality_scores TEXT,  -- 旧形式（JSON、移行後も保持）、新規行は NULL
                         accuracy_score REAL,
                         session_context TEXT,
-                        source_type TEXT DEFAULT 'text'
+                        source_type TEXT DEFAULT 'text',
+                        trait_vector BLOB  -- float32 × 10（trait_vector.TRAIT_NAMES 順）
                     )
                 """
                 )
+                self._migrate_trait_vectors(cursor)
 
                 # 学習履歴テーブル
                 cursor.execute(
@@ -135,6 +225,41 @@ class MirralismPersonalityEngineBasic:
             self.logger.error(f"データベース初期化エラー: {e}")
             raise
 
+    def _migrate_trait_vectors(self, cursor: sqlite3.Cursor):
+        """旧 JSON 形式の personality_scores をバイナリ列へ移行（初回のみ）
+
+        旧列は削除せず残す。解析できない行は警告を出して移行対象から外す。
+        """
+        columns = {
+            row[1] for row in cursor.execute("PRAGMA table_info(analysis_results)")
+        }
+        if "trait_vector" not in columns:
+            cursor.execute("ALTER TABLE analysis_results ADD COLUMN trait_vector BLOB")
+
+        rows = cursor.execute(
+            """
+            SELECT id, personality_scores FROM analysis_results
+            WHERE trait_vector IS NULL AND personality_scores IS NOT NULL
+            """
+        ).fetchall()
+        updates = []
+        for row_id, scores in rows:
+            try:
+                traits = json.loads(scores)
+            except (TypeError, ValueError) as e:
+                self.logger.warning(f"性格特性ベクトル移行スキップ（id={row_id}）: {e}")
+                continue
+            if not isinstance(traits, dict):
+                self.logger.warning(f"性格特性ベクトル移行スキップ（id={row_id}）: 非辞書")
+                continue
+            updates.append((pack_traits(traits), row_id))
+        if not updates:
+            return
+        cursor.executemany(
+            "UPDATE analysis_results SET trait_vector = ? WHERE id = ?", updates
+        )
+        self.logger.info(f"性格特性ベクトル移行: {len(updates)}件")
+
     def analyze_content(
         self, content: str, context: Dict[str, Any] = None
     ) -> Dict[str, Any]:
@@ -209,50 +334,29 @@ class MirralismPersonalityEngineBasic:
         # 分析結果初期化
         scores = self.basic_traits.copy()
 
-        # 基本キーワード分析
-        tech_keywords = [
-            "技術",
-            "実装",
-            "システム",
-            "効率",
-            "最適化",
-            "CTO",
-            "開発",
-            "コード",
-        ]
-        integrity_keywords = [
-            "誠実",
-            "責任",
-            "品質",
-            "信頼",
-            "安全",
-            "保護",
-            "正確",
-        ]
-        relationship_keywords = [
-            "協力",
-            "チーム",
-            "相談",
-            "サポート",
-            "理解",
-            "共感",
-        ]
-
-        content_lower = content.lower()
+        tech_keywords = TRAIT_KEYWORDS["technical_orientation"]
+        integrity_keywords = TRAIT_KEYWORDS["integrity_focus"]
+        relationship_keywords = TRAIT_KEYWORDS["relationship_value"]
 
         # 技術志向分析
         tech_count = sum(1 for keyword in tech_keywords if keyword in content)
-        scores["technical_orientation"] = min(tech_count * 0.1, 1.0)
+        scores["technical_orientation"] = min(
+            tech_count * TRAIT_KEYWORD_WEIGHTS["technical_orientation"], 1.0
+        )
 
         # 誠実性分析
         integrity_count = sum(1 for keyword in integrity_keywords if keyword in content)
-        scores["integrity_focus"] = min(integrity_count * 0.15, 1.0)
+        scores["integrity_focus"] = min(
+            integrity_count * TRAIT_KEYWORD_WEIGHTS["integrity_focus"], 1.0
+        )
 
         # 関係性価値分析
         relationship_count = sum(
             1 for keyword in relationship_keywords if keyword in content
         )
-        scores["relationship_value"] = min(relationship_count * 0.12, 1.0)
+        scores["relationship_value"] = min(
+            relationship_count * TRAIT_KEYWORD_WEIGHTS["relationship_value"], 1.0
+        )
 
         # Big Five基本推定
         scores["openness"] = (
@@ -268,13 +372,7 @@ class MirralismPersonalityEngineBasic:
     def _analyze_emotional_patterns(self, content: str) -> Dict[str, Any]:
         """基本感情パターン分析"""
 
-        # 感情キーワード辞書
-        emotions = {
-            "positive": ["嬉しい", "楽しい", "良い", "素晴らしい", "優秀", "成功"],
-            "negative": ["困った", "難しい", "問題", "課題", "心配", "不安"],
-            "neutral": ["普通", "通常", "標準", "一般的", "基本"],
-            "technical": ["分析", "検証", "確認", "実装", "設計", "開発"],
-        }
+        emotions = EMOTION_KEYWORDS
 
         emotion_scores = {}
         for emotion_type, keywords in emotions.items():
@@ -320,6 +418,162 @@ class MirralismPersonalityEngineBasic:
 
         return round(improvement, 2)
 
+    def score_batch(self, contents: Sequence[str]) -> Dict[str, Any]:
+        """文書バッチの一括スコアリング（スカラー経路と同一の数値）
+
+        Returns:
+            traits: (文書数, 10) 性格特性行列（TRAIT_NAMES 順）
+            improvement: 精度改善係数（_calculate_improvement_factor と同値）
+            emotion_counts: (文書数, 4) 感情キーワード数（EMOTION_KEYWORDS 順）
+            lengths: 文字数
+        """
+        counts = self.keyword_matcher.group_counts(contents)
+        group_index = {
+            name: i for i, name in enumerate(self.keyword_matcher.group_names)
+        }
+        lengths = np.fromiter(
+            (len(content) for content in contents), dtype=np.int64, count=len(contents)
+        )
+
+        traits = np.zeros((len(contents), len(TRAIT_NAMES)), dtype=np.float64)
+        column = {name: i for i, name in enumerate(TRAIT_NAMES)}
+        for trait, weight in TRAIT_KEYWORD_WEIGHTS.items():
+            traits[:, column[trait]] = np.minimum(
+                counts[:, group_index[trait]] * weight, 1.0
+            )
+
+        technical = traits[:, column["technical_orientation"]]
+        integrity = traits[:, column["integrity_focus"]]
+        relationship = traits[:, column["relationship_value"]]
+
+        # Big Five基本推定
+        traits[:, column["openness"]] = (technical + relationship) / 2
+        traits[:, column["conscientiousness"]] = integrity
+        traits[:, column["extraversion"]] = relationship
+        traits[:, column["agreeableness"]] = relationship * 0.8
+        traits[:, column["neuroticism"]] = np.maximum(0.2, 1.0 - integrity)
+
+        # 精度改善係数（加算順序をスカラー経路と揃え、丸めは Python round）
+        content_factor = np.minimum(lengths / 1000, 3.0)
+        clarity = np.zeros(len(contents), dtype=np.float64)
+        for index in range(len(TRAIT_NAMES)):
+            clarity += np.abs(traits[:, index] - 0.5)
+        improvement = content_factor + clarity / len(TRAIT_NAMES) * 2.0
+        improvement += np.where(technical > 0.5, 1.0, 0.0)
+        improvement += np.where(integrity > 0.7, 1.5, 0.0)
+
+        return {
+            "traits": traits,
+            "improvement": np.array(
+                [round(value, 2) for value in improvement.tolist()]
+            ),
+            "emotion_counts": counts[
+                :, [group_index[name] for name in EMOTION_KEYWORDS]
+            ],
+            "lengths": lengths,
+        }
+
+    def analyze_batch(
+        self,
+        contents: Sequence[str],
+        context: Dict[str, Any] = None,
+        save: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        文書バッチ分析（analyze_content と同一の分析結果、保存は1トランザクション）
+
+        Args:
+            contents: 分析対象テキスト列
+            context: 全文書共通の分析コンテキスト
+            save: データベース保存フラグ
+
+        Returns:
+            分析結果辞書のリスト
+        """
+        if context is None:
+            context = {}
+
+        start_time = datetime.now()
+        scored = self.score_batch(contents)
+        current = np.minimum(
+            self.v1_learned_accuracy + scored["improvement"], self.target_accuracy
+        )
+        elapsed = (datetime.now() - start_time).total_seconds()
+
+        emotion_types = list(EMOTION_KEYWORDS)
+        results = []
+        for i, (traits, emotions) in enumerate(
+            zip(scored["traits"].tolist(), scored["emotion_counts"].tolist())
+        ):
+            emotion_scores = dict(zip(emotion_types, emotions))
+            length = int(scored["lengths"][i])
+            accuracy = float(current[i])
+            results.append(
+                {
+                    "success": True,
+                    "version": self.version,
+                    "analysis_date": start_time.isoformat(),
+                    "content_length": length,
+                    "accuracy": {
+                        "current": round(accuracy, 2),
+                        "v1_baseline": self.v1_learned_accuracy,
+                        "target": self.target_accuracy,
+                        "improvement": round(accuracy - self.v1_learned_accuracy, 2),
+                    },
+                    "personality_profile": dict(zip(TRAIT_NAMES, traits)),
+                    "emotional_analysis": {
+                        "emotion_scores": emotion_scores,
+                        "dominant_emotion": emotion_types[int(np.argmax(emotions))],
+                        "emotional_intensity": (
+                            sum(emotions) / length if length else 0
+                        ),
+                        "emotional_balance": emotion_scores["positive"]
+                        / max(emotion_scores["negative"], 1),
+                    },
+                    "processing_time": elapsed / max(len(contents), 1),
+                    "context": context,
+                }
+            )
+
+        if save and results:
+            self._save_analysis_results(contents, results, context)
+
+        self.logger.info(f"バッチ分析完了 - {len(results)}件 ({elapsed:.3f}s)")
+        return results
+
+    def _save_analysis_results(
+        self,
+        contents: Sequence[str],
+        results: List[Dict[str, Any]],
+        context: Dict[str, Any],
+    ):
+        """バッチ分析結果の一括保存"""
+        try:
+            session_context = json.dumps(context, ensure_ascii=False)
+            source_type = context.get("source_type", "text")
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO analysis_results
+                    (content, trait_vector, accuracy_score, session_context,
+                     source_type)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    [
+                        (
+                            content,
+                            pack_traits(result["personality_profile"]),
+                            result["accuracy"]["current"],
+                            session_context,
+                            source_type,
+                        )
+                        for content, result in zip(contents, results)
+                    ],
+                )
+
+        except Exception as e:
+            self.logger.warning(f"バッチ分析結果保存エラー: {e}")
+
     def _save_analysis_result(
         self, content: str, result: Dict[str, Any], context: Dict[str, Any]
     ):
@@ -331,12 +585,13 @@ class MirralismPersonalityEngineBasic:
                 cursor.execute(
                     """
                     INSERT INTO analysis_results 
-                    (content, personality_scores, accuracy_score, session_context, source_type)
+                    (content, trait_vector, accuracy_score, session_context,
+                     source_type)
                     VALUES (?, ?, ?, ?, ?)
                 """,
                     (
                         content,
-                        json.dumps(result["personality_profile"], ensure_ascii=False),
+                        pack_traits(result["personality_profile"]),
                         result["accuracy"]["current"],
                         json.dumps(context, ensure_ascii=False),
                         context.get("source_type", "text"),
@@ -374,29 +629,101 @@ class MirralismPersonalityEngineBasic:
             self.logger.error(f"精度履歴取得エラー: {e}")
             return []
 
+    def get_accuracy_summary(self) -> Dict[str, Any]:
+        """精度集計（SQL 集約、行毎の復元なし）"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                count, mean, minimum, maximum = conn.execute(
+                    """
+                    SELECT COUNT(accuracy_score), AVG(accuracy_score),
+                           MIN(accuracy_score), MAX(accuracy_score)
+                    FROM analysis_results
+                """
+                ).fetchone()
+                by_source = {
+                    source: {"count": n, "mean": avg}
+                    for source, n, avg in conn.execute(
+                        """
+                        SELECT source_type, COUNT(accuracy_score), AVG(accuracy_score)
+                        FROM analysis_results
+                        GROUP BY source_type
+                    """
+                    )
+                }
+
+            return {
+                "count": count,
+                "mean": mean,
+                "min": minimum,
+                "max": maximum,
+                "by_source": by_source,
+            }
+
+        except Exception as e:
+            self.logger.error(f"精度集計エラー: {e}")
+            return {"count": 0, "mean": None, "min": None, "max": None, "by_source": {}}
+
+    def get_trait_trends(
+        self, limit: Optional[int] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """性格特性の傾向（最新 limit 件、BLOB を NumPy 行列として一括集計）"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT trait_vector FROM (
+                        SELECT id, trait_vector FROM analysis_results
+                        WHERE trait_vector IS NOT NULL
+                        ORDER BY id DESC
+                        LIMIT ?
+                    ) ORDER BY id
+                """,
+                    (-1 if limit is None else limit,),
+                ).fetchall()
+
+            return summarize_traits(traits_matrix(row[0] for row in rows))
+
+        except Exception as e:
+            self.logger.error(f"性格特性傾向取得エラー: {e}")
+            return {}
+
+    def get_latest_profile(self) -> Optional[Dict[str, float]]:
+        """最新の性格特性プロファイル"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                """
+                SELECT trait_vector FROM analysis_results
+                WHERE trait_vector IS NOT NULL
+                ORDER BY id DESC LIMIT 1
+            """
+            ).fetchone()
+        return unpack_traits(row[0], TRAIT_NAMES) if row else None
+
     def learn_from_feedback(
         self, content: str, expected_accuracy: float, feedback: str = ""
     ) -> Dict[str, Any]:
-        """フィードバック学習機能"""
+        """フィードバック学習機能（重み更新はキュー経由のミニバッチ適用）"""
         try:
-            # 現在分析実行
-            current_result = self.analyze_content(content)
-            current_accuracy = current_result["accuracy"]["current"]
+            # 現在精度（保存なしのスコアリングのみ）
+            improvement = float(self.score_batch([content])["improvement"][0])
+            current_accuracy = round(
+                min(self.v1_learned_accuracy + improvement, self.target_accuracy), 2
+            )
 
             # 精度差分計算
             accuracy_delta = expected_accuracy - current_accuracy
-
-            # 学習実行（簡易版）
-            if abs(accuracy_delta) > 1.0:  # 1%以上の差がある場合
-                # 重み調整（基本的な学習）
-                if accuracy_delta > 0:
-                    # 精度が期待より低い → 重みを上げる
-                    for key in self.analysis_weights:
-                        self.analysis_weights[key] *= 1.05
-                else:
-                    # 精度が期待より高い → 重みを下げる
-                    for key in self.analysis_weights:
-                        self.analysis_weights[key] *= 0.95
+            learning_applied = abs(accuracy_delta) > 1.0  # 1%以上の差がある場合
+
+            updated = None
+            if learning_applied:
+                updated = self.weight_store.enqueue(
+                    {
+                        "accuracy_before": current_accuracy,
+                        "accuracy_expected": expected_accuracy,
+                        "accuracy_delta": accuracy_delta,
+                        "feedback": feedback,
+                    }
+                )
 
                 # 学習履歴保存
                 self._save_learning_history(
@@ -408,7 +735,10 @@ class MirralismPersonalityEngineBasic:
                 "current_accuracy": current_accuracy,
                 "expected_accuracy": expected_accuracy,
                 "accuracy_delta": accuracy_delta,
-                "learning_applied": abs(accuracy_delta) > 1.0,
+                "learning_applied": learning_applied,
+                "weights_updated": updated is not None,
+                "weight_version": self.weight_store.current().version,
+                "pending_feedback": self.weight_store.pending_count(),
                 "feedback": feedback,
             }
 
@@ -416,6 +746,10 @@ class MirralismPersonalityEngineBasic:
             self.logger.error(f"フィードバック学習エラー: {e}")
             return {"success": False, "error": str(e)}
 
+    def flush_feedback(self) -> Optional[WeightSnapshot]:
+        """未適用フィードバックの即時適用（未適用なしは None）"""
+        return self.weight_store.apply_pending()
+
     def _save_learning_history(
         self, before: float, after: float, delta: float, notes: str
     ):
@@ -448,6 +782,7 @@ class MirralismPersonalityEngineBasic:
             "v1_lessons_applied": self.v1_lessons,
             "database_path": self.db_path,
             "traits_count": len(self.basic_traits),
+            "weight_version": self.weight_store.current().version,
             "status": "active",
         }
 
@@ -26,6 +26,11 @@ from enum import Enum
 import sqlite3
 import statistics
 import hashlib
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from trait_vector import pack_traits, summarize_traits, traits_matrix  # noqa: E402
 
 
 class LearningMode(Enum):
@@ -165,7 +170,8 @@ class MIRRALISMUnifiedPersonalitySystem:
                     value_insights TEXT NOT NULL,
                     prediction_accuracy REAL NOT NULL,
                     business_recommendations TEXT NOT NULL,
-                    confidence_level REAL NOT NULL
+                    confidence_level REAL NOT NULL,
+                    trait_vector BLOB
                 );
                 
                 CREATE TABLE IF NOT EXISTS value_creation_metrics (
@@ -202,6 +208,57 @@ class MIRRALISMUnifiedPersonalitySystem:
                     status TEXT NOT NULL
                 );
             """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(personality_analyses)")}
+            if "trait_vector" not in columns:
+                conn.execute("ALTER TABLE personality_analyses ADD COLUMN trait_vector BLOB")
+
+    @property
+    def trait_names(self) -> List[str]:
+        """trait_vector 列の特性順（Big Five + MIRRALISM Five）"""
+        return self.personality_framework["big_five"] + self.personality_framework["mirralism_five"]
+
+    def _extract_trait_scores(self, personality_profile: Dict[str, Any]) -> Dict[str, float]:
+        """プロファイルから特性スコア（Big Five 重み付けスコア・MIRRALISM Five 価値創造ポテンシャル）"""
+        scores = {}
+        big_five = personality_profile.get("big_five_analysis", {}).get("trait_scores", {})
+        for trait, detail in big_five.items():
+            scores[trait] = detail.get("weighted_score")
+        mirralism_five = personality_profile.get("mirralism_five_analysis", {}).get("element_analyses", {})
+        for element, detail in mirralism_five.items():
+            scores[element] = detail.get("value_creation_potential")
+        return scores
+
+    def get_trait_trends(self, client_name: Optional[str] = None, limit: int = 100) -> Dict[str, Dict[str, float]]:
+        """特性傾向（trait_vector を NumPy 行列として一括集計、JSON 解析なし）"""
+        try:
+            with sqlite3.connect(self.unified_db_path) as conn:
+                rows = conn.execute("""
+                    SELECT trait_vector FROM (
+                        SELECT id, trait_vector FROM personality_analyses
+                        WHERE trait_vector IS NOT NULL AND (? IS NULL OR client_name = ?)
+                        ORDER BY id DESC LIMIT ?
+                    ) ORDER BY id
+                """, (client_name, client_name, limit)).fetchall()
+            matrix = traits_matrix((row[0] for row in rows), width=len(self.trait_names))
+            return summarize_traits(matrix, self.trait_names)
+        except Exception as e:
+            logging.error(f"❌ Failed to get trait trends: {e}")
+            return {}
+
+    def get_precision_summary(self, client_name: Optional[str] = None) -> Dict[str, Any]:
+        """精度集計（SQL 集約）"""
+        with sqlite3.connect(self.unified_db_path) as conn:
+            count, mean_precision, max_precision, mean_confidence = conn.execute("""
+                SELECT COUNT(*), AVG(precision_score), MAX(precision_score), AVG(confidence_level)
+                FROM personality_analyses
+                WHERE ? IS NULL OR client_name = ?
+            """, (client_name, client_name)).fetchone()
+        return {
+            "analysis_count": count,
+            "mean_precision": mean_precision,
+            "max_precision": max_precision,
+            "mean_confidence": mean_confidence
+        }
             
     def execute_unified_personality_analysis(self, client_name: str = "黒澤工務店",
                                            analysis_mode: LearningMode = LearningMode.VALUE_CREATION) -> PersonalityAnalysis:
@@ -625,8 +682,9 @@ class MIRRALISMUnifiedPersonalitySystem:
                 conn.execute("""
                     INSERT INTO personality_analyses 
                     (timestamp, client_name, analysis_mode, precision_score, personality_profile,
-                     value_insights, prediction_accuracy, business_recommendations, confidence_level)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     value_insights, prediction_accuracy, business_recommendations, confidence_level,
+                     trait_vector)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     analysis_result.timestamp.isoformat(),
                     analysis_result.client_name,
@@ -636,7 +694,11 @@ class MIRRALISMUnifiedPersonalitySystem:
                     json.dumps(analysis_result.value_insights),
                     analysis_result.prediction_accuracy,
                     json.dumps(analysis_result.business_recommendations),
-                    analysis_result.confidence_level
+                    analysis_result.confidence_level,
+                    pack_traits(
+                        self._extract_trait_scores(analysis_result.personality_profile),
+                        self.trait_names
+                    )
                 ))
         except Exception as e:
             logging.error(f"❌ Failed to save analysis result: {e}")
@@ -8,13 +8,30 @@ Version: 1.0 (Precision Definition System)
 Created: 2025-06-10 (CTO緊急指示対応)
 """
 
-import json
 import logging
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
-import statistics
+
+sys.path.insert(0, str(Path(__file__).parent))
+from measurement_journal import MeasurementJournal
+
+
+def open_precision_journal(measurements_file: Path) -> MeasurementJournal:
+    """精度測定ジャーナル（クライアント × 精度タイプの最新値索引付き）
+
+    集計サイドカーを共有するため、記録側・参照側とも同一設定で開くこと。
+    """
+    return MeasurementJournal(
+        measurements_file,
+        value_key="measured_value",
+        group_key="precision_type",
+        legacy_path=measurements_file.with_suffix(".json"),
+        legacy_key="measurements",
+        partition_key="measurement_context.client",
+    )
 
 
 @dataclass
@@ -83,12 +100,9 @@ class PersonalityLearningPrecisionSystem:
             }
         }
         
-        # 測定履歴保存パス
-        self.measurements_file = self.project_root / "Data" / "personality_learning_precision.json"
-        self.measurements_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # 既存測定履歴読み込み
-        self.measurement_history = self._load_measurement_history()
+        # 測定ジャーナル（追記専用、旧 JSON 履歴は初回のみ移行）
+        self.measurements_file = self.project_root / "Data" / "personality_learning_precision.jsonl"
+        self.journal = open_precision_journal(self.measurements_file)
         
         logger.info("PersonalityLearning精度測定システム初期化完了")
 
@@ -101,37 +115,10 @@ class PersonalityLearningPrecisionSystem:
         global logger
         logger = logging.getLogger(__name__)
 
-    def _load_measurement_history(self) -> List[Dict[str, Any]]:
-        """測定履歴読み込み"""
-        try:
-            if self.measurements_file.exists():
-                with open(self.measurements_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get("measurements", [])
-            return []
-        except Exception as e:
-            logger.warning(f"測定履歴読み込みエラー: {e}")
-            return []
-
-    def _save_measurement_history(self):
-        """測定履歴保存"""
-        try:
-            save_data = {
-                "metadata": {
-                    "version": "1.0",
-                    "last_updated": datetime.now(timezone.utc).isoformat(),
-                    "precision_definitions": self.precision_definitions
-                },
-                "measurements": self.measurement_history
-            }
-            
-            with open(self.measurements_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-                
-            logger.info(f"測定履歴保存完了: {self.measurements_file}")
-            
-        except Exception as e:
-            logger.error(f"測定履歴保存エラー: {e}")
+    @property
+    def measurement_history(self) -> List[Dict[str, Any]]:
+        """測定履歴（ジャーナル全件、レポート用）"""
+        return list(self.journal.records())
 
     def record_measurement(
         self, 
@@ -176,8 +163,8 @@ class PersonalityLearningPrecisionSystem:
             measurement_context=context
         )
         
-        # 履歴に追加
-        self.measurement_history.append({
+        # ジャーナルへ追記（集計も差分更新）
+        self.journal.append({
             "measurement_id": measurement.measurement_id,
             "timestamp": measurement.timestamp,
             "precision_type": measurement.precision_type,
@@ -189,9 +176,6 @@ class PersonalityLearningPrecisionSystem:
             "measurement_context": measurement.measurement_context
         })
         
-        # 保存
-        self._save_measurement_history()
-        
         logger.info(f"精度測定記録完了: {measurement_id}, 精度: {measured_value:.1%}")
         
         return measurement
@@ -233,36 +217,29 @@ class PersonalityLearningPrecisionSystem:
 
     def get_current_precision_status(self) -> Dict[str, Any]:
         """現在の精度状況取得"""
+        latest = self.journal.latest()
         status = {
             "summary": {
-                "total_measurements": len(self.measurement_history),
+                "total_measurements": self.journal.count(),
                 "precision_types": list(self.precision_definitions.keys()),
-                "last_measurement": None,
+                "last_measurement": latest["timestamp"] if latest else None,
                 "overall_status": "未測定"
             },
             "by_type": {}
         }
         
-        if self.measurement_history:
-            # 最新測定
-            latest = max(self.measurement_history, key=lambda x: x["timestamp"])
-            status["summary"]["last_measurement"] = latest["timestamp"]
-            
-            # タイプ別集計
+        if latest:
+            # タイプ別集計（ジャーナルの集計値を参照、履歴は走査しない）
             for precision_type in self.precision_definitions.keys():
-                type_measurements = [
-                    m for m in self.measurement_history 
-                    if m["precision_type"] == precision_type
-                ]
+                aggregate = self.journal.aggregate(precision_type)
                 
-                if type_measurements:
-                    latest_type = max(type_measurements, key=lambda x: x["timestamp"])
-                    avg_precision = statistics.mean([m["measured_value"] for m in type_measurements])
+                if aggregate["count"]:
+                    avg_precision = aggregate["mean"]
                     
                     status["by_type"][precision_type] = {
-                        "latest_measurement": latest_type,
+                        "latest_measurement": aggregate["latest"],
                         "average_precision": avg_precision,
-                        "measurement_count": len(type_measurements),
+                        "measurement_count": aggregate["count"],
                         "target_achieved": avg_precision >= self.precision_definitions[precision_type]["target_accuracy"]
                     }
                 else:
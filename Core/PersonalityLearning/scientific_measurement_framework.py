@@ -132,6 +132,7 @@ class PluginableMeasurementFramework:
         """コア測定プラグインの登録"""
         self.register_plugin("statistical_baseline", StatisticalBaselineMeasurement())
         self.register_plugin("cross_validation", CrossValidationMeasurement())
+        self.register_plugin("vectorized_evaluation", VectorizedEvaluationMeasurement())
         # 将来的に追加: quantum_measurement, neural_correlation
 
     def register_plugin(self, name: str, plugin: MeasurementProtocol):
@@ -229,40 +230,57 @@ class PluginableMeasurementFramework:
 
             return results
 
+    def get_measurement_series(self, limit: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """精度・有意性の数値列のみ取得（JSON列の逆シリアライズなし）
+
+        Returns:
+            (accuracies, significances) 新しい順
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT accuracy, statistical_significance FROM measurements
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """,
+                (limit,),
+            ).fetchall()
+
+        series = np.array(rows, dtype=np.float64).reshape(-1, 2)
+        return series[:, 0], series[:, 1]
+
     def generate_scientific_report(self) -> Dict[str, Any]:
         """科学的測定レポートの生成"""
-        history = self.get_measurement_history()
+        accuracy_array, significance_array = self.get_measurement_series()
 
-        if not history:
+        if accuracy_array.size == 0:
             return {"error": "測定データが不足しています"}
 
-        accuracies = [r.accuracy for r in history]
+        accuracies = accuracy_array.tolist()
+        validated = int(np.count_nonzero(significance_array < 0.05))
 
         report = {
-            "measurement_count": len(history),
-            "current_accuracy": accuracies[0] if accuracies else 0,
-            "average_accuracy": statistics.mean(accuracies),
-            "accuracy_std": statistics.stdev(accuracies) if len(accuracies) > 1 else 0,
+            "measurement_count": len(accuracies),
+            "current_accuracy": accuracies[0],
+            "average_accuracy": float(accuracy_array.mean()),
+            "accuracy_std": (
+                float(accuracy_array.std(ddof=1)) if len(accuracies) > 1 else 0
+            ),
             "improvement_trend": self._calculate_trend(accuracies),
             "statistical_summary": {
-                "min": min(accuracies),
-                "max": max(accuracies),
-                "median": statistics.median(accuracies),
+                "min": float(accuracy_array.min()),
+                "max": float(accuracy_array.max()),
+                "median": float(np.median(accuracy_array)),
                 "quartiles": [
-                    np.percentile(accuracies, 25),
-                    np.percentile(accuracies, 75),
+                    float(np.percentile(accuracy_array, 25)),
+                    float(np.percentile(accuracy_array, 75)),
                 ],
             },
             "evolution_status": self.evolution_tracker.get_current_status(),
             "validation_summary": {
-                "validated_measurements": sum(
-                    1 for r in history if r.statistical_significance < 0.05
-                ),
-                "total_measurements": len(history),
-                "confidence_rate": sum(
-                    1 for r in history if r.statistical_significance < 0.05
-                )
-                / len(history),
+                "validated_measurements": validated,
+                "total_measurements": len(accuracies),
+                "confidence_rate": validated / len(accuracies),
             },
         }
 
@@ -297,18 +315,16 @@ class StatisticalBaselineMeasurement:
             raise ValueError("測定データが空です")
 
         # PersonalityLearning精度の統計的計算
-        accuracies = []
-        for entry in data:
-            if "suetake_likeness_index" in entry:
-                accuracies.append(entry["suetake_likeness_index"])
+        values = load_likeness_series(data)
 
-        if not accuracies:
+        if values.size == 0:
             raise ValueError("精度データが見つかりません")
 
         # 統計的指標の計算
-        mean_accuracy = statistics.mean(accuracies)
-        std_accuracy = statistics.stdev(accuracies) if len(accuracies) > 1 else 0
-        sample_size = len(accuracies)
+        accuracies = values.tolist()
+        mean_accuracy = float(values.mean())
+        std_accuracy = float(values.std(ddof=1)) if values.size > 1 else 0
+        sample_size = int(values.size)
 
         # 信頼区間の計算（95%信頼区間）
         confidence_interval = self._calculate_confidence_interval(
@@ -317,7 +333,7 @@ class StatisticalBaselineMeasurement:
 
         # 統計的有意性（t検定）
         if sample_size > 1:
-            t_stat, p_value = stats.ttest_1samp(accuracies, 0.5)  # 50%をヌル仮説
+            t_stat, p_value = stats.ttest_1samp(values, 0.5)  # 50%をヌル仮説
         else:
             p_value = 1.0
 
@@ -452,6 +468,203 @@ class CrossValidationMeasurement:
         return (max(0, mean - margin_of_error), min(1, mean + margin_of_error))
 
 
+def load_likeness_series(data: List[Dict], stratify_key: Optional[str] = None) -> Any:
+    """suetake_likeness_index を float64 配列として一括ロード
+
+    Args:
+        data: PersonalityLearning分析データ
+        stratify_key: 層別化キー（指定時は (values, strata) を返す）
+    """
+    key = "suetake_likeness_index"
+    entries = [entry for entry in data if key in entry]
+    values = np.fromiter(
+        (entry[key] for entry in entries), dtype=np.float64, count=len(entries)
+    )
+    if stratify_key is None:
+        return values
+
+    labels = [str(entry.get(stratify_key, "")) for entry in entries]
+    _, strata = np.unique(np.array(labels, dtype=object), return_inverse=True)
+    return values, strata.astype(np.int64)
+
+
+class VectorizedEvaluationEngine:
+    """NumPy ベース評価エンジン
+
+    精度系列を配列として1回だけ保持し、k-fold・反復層別交差検証・
+    ブートストラップ信頼区間をすべて配列演算で計算する。
+    """
+
+    # ブートストラップ1チャンクあたりの最大要素数（メモリ上限 約80MB）
+    BOOTSTRAP_CHUNK_ELEMENTS = 10_000_000
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        strata: Optional[np.ndarray] = None,
+        seed: Optional[int] = None,
+    ):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.strata = (
+            np.zeros(self.values.size, dtype=np.int64)
+            if strata is None
+            else np.asarray(strata, dtype=np.int64)
+        )
+        if self.strata.shape != self.values.shape:
+            raise ValueError("strata と values の長さが一致しません")
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_records(
+        cls,
+        data: List[Dict],
+        stratify_key: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> "VectorizedEvaluationEngine":
+        """分析データから生成"""
+        if stratify_key is None:
+            return cls(load_likeness_series(data), seed=seed)
+        values, strata = load_likeness_series(data, stratify_key)
+        return cls(values, strata, seed=seed)
+
+    @property
+    def size(self) -> int:
+        return int(self.values.size)
+
+    def kfold_means(self, k: int = 5, shuffle: bool = True) -> np.ndarray:
+        """k-fold 各フォールドの平均精度"""
+        return self.repeated_stratified_kfold_means(
+            k=k, repeats=1, shuffle=shuffle, stratified=False
+        )[0]
+
+    def repeated_stratified_kfold_means(
+        self,
+        k: int = 5,
+        repeats: int = 10,
+        shuffle: bool = True,
+        stratified: bool = True,
+    ) -> np.ndarray:
+        """反復(層別)k-fold の各フォールド平均精度
+
+        Returns:
+            shape (repeats, k) の配列
+        """
+        n = self.size
+        if n < k:
+            raise ValueError(f"サンプル数 {n} が fold 数 {k} 未満です")
+
+        strata = self.strata if stratified else np.zeros(n, dtype=np.int64)
+        if shuffle:
+            keys = self.rng.random((repeats, n))
+        else:
+            keys = np.broadcast_to(np.arange(n, dtype=np.float64), (repeats, n))
+
+        # 層ごとに並べ（層内はランダム順）、並び順に fold を巡回割り当てする
+        order = np.lexsort((keys, np.broadcast_to(strata, (repeats, n))), axis=-1)
+        if stratified:
+            position_fold = np.arange(n) % k
+        else:
+            # 非層別: 従来どおり連続ブロック分割（np.array_split 準拠）
+            position_fold = np.repeat(
+                np.arange(k), [len(c) for c in np.array_split(np.arange(n), k)]
+            )
+
+        folds = np.empty((repeats, n), dtype=np.int64)
+        np.put_along_axis(folds, order, position_fold[None, :], axis=1)
+
+        flat = (folds + k * np.arange(repeats)[:, None]).ravel()
+        weights = np.broadcast_to(self.values, (repeats, n)).ravel()
+        sums = np.bincount(flat, weights=weights, minlength=repeats * k)
+        counts = np.bincount(flat, minlength=repeats * k)
+        return (sums / counts).reshape(repeats, k)
+
+    def bootstrap_means(self, n_resamples: int = 10_000) -> np.ndarray:
+        """ブートストラップ再標本平均（チャンク単位の配列演算）"""
+        n = self.size
+        if n == 0:
+            raise ValueError("精度データが見つかりません")
+
+        chunk = max(1, self.BOOTSTRAP_CHUNK_ELEMENTS // n)
+        means = np.empty(n_resamples, dtype=np.float64)
+        for start in range(0, n_resamples, chunk):
+            stop = min(start + chunk, n_resamples)
+            indices = self.rng.integers(0, n, size=(stop - start, n))
+            means[start:stop] = self.values[indices].mean(axis=1)
+        return means
+
+    def bootstrap_confidence_interval(
+        self, n_resamples: int = 10_000, confidence: float = 0.95
+    ) -> Tuple[float, float]:
+        """パーセンタイル法ブートストラップ信頼区間"""
+        means = self.bootstrap_means(n_resamples)
+        alpha = 1 - confidence
+        lower, upper = np.quantile(means, [alpha / 2, 1 - alpha / 2])
+        return (max(0.0, float(lower)), min(1.0, float(upper)))
+
+
+class VectorizedEvaluationMeasurement:
+    """反復層別交差検証＋ブートストラップ信頼区間による測定"""
+
+    def __init__(
+        self,
+        k: int = 5,
+        repeats: int = 10,
+        n_resamples: int = 10_000,
+        stratify_key: Optional[str] = "source",
+        seed: Optional[int] = None,
+    ):
+        self.k = k
+        self.repeats = repeats
+        self.n_resamples = n_resamples
+        self.stratify_key = stratify_key
+        self.seed = seed
+
+    def measure(self, data: List[Dict]) -> MeasurementResult:
+        """ベクトル化評価の実行"""
+        engine = VectorizedEvaluationEngine.from_records(
+            data, stratify_key=self.stratify_key, seed=self.seed
+        )
+        if engine.size < self.k:
+            # サンプルが少ない場合はベースライン測定にフォールバック
+            return StatisticalBaselineMeasurement().measure(data)
+
+        fold_means = engine.repeated_stratified_kfold_means(
+            k=self.k, repeats=self.repeats
+        )
+        mean_accuracy = float(engine.values.mean())
+        cv_std = float(fold_means.std(ddof=1))
+        confidence_interval = engine.bootstrap_confidence_interval(self.n_resamples)
+        _, p_value = stats.ttest_1samp(engine.values, 0.5)
+
+        return MeasurementResult(
+            accuracy=mean_accuracy,
+            confidence_interval=confidence_interval,
+            statistical_significance=float(p_value),
+            measurement_method="vectorized_evaluation",
+            sample_size=engine.size,
+            timestamp=datetime.now(),
+            metadata={
+                "cv_folds": self.k,
+                "cv_repeats": self.repeats,
+                "cv_mean": float(fold_means.mean()),
+                "cv_std": cv_std,
+                "bootstrap_resamples": self.n_resamples,
+                "stratify_key": self.stratify_key,
+            },
+            evidence_trace=[
+                f"{self.repeats}回反復 {self.k}-fold 層別交差検証実施",
+                f"平均精度: {mean_accuracy:.3f}",
+                f"CV標準偏差: {cv_std:.3f}",
+                f"ブートストラップ{self.n_resamples}回 95%信頼区間: "
+                f"({confidence_interval[0]:.3f}, {confidence_interval[1]:.3f})",
+            ],
+        )
+
+    def validate(self, result: MeasurementResult) -> bool:
+        """結果の検証"""
+        return StatisticalBaselineMeasurement().validate(result)
+
+
 class EvolutionTracker:
     """進化段階追跡システム"""
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+性格特性ベクトルのバイナリ表現
+作成日: 2025年6月
+目的: 固定長の性格特性スコア（Big Five + MIRRALISM 5要素）を float32 配列として
+      SQLite BLOB に格納し、傾向集計時の行毎 JSON 解析を排除
+
+- 1行 = little-endian float32 × 特性数（10特性で40バイト）
+- 読み出しは全行を連結して numpy.frombuffer で (行数, 特性数) 行列に一括変換
+- 欠損特性は NaN（集計時は除外）
+"""
+
+import numbers
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+
+TRAIT_DTYPE = np.dtype("<f4")
+
+# MirralismPersonalityEngineBasic.basic_traits と同順
+TRAIT_NAMES = (
+    # Big Five
+    "openness",
+    "conscientiousness",
+    "extraversion",
+    "agreeableness",
+    "neuroticism",
+    # 追加5要素（MIRRALISM特化）
+    "technical_orientation",
+    "integrity_focus",
+    "relationship_value",
+    "growth_mindset",
+    "stress_resilience",
+)
+
+
+def pack_traits(scores: Dict[str, float], names: Sequence[str] = TRAIT_NAMES) -> bytes:
+    """特性スコア辞書 → float32 BLOB（欠損・非数値は NaN）"""
+    values = np.full(len(names), np.nan, dtype=TRAIT_DTYPE)
+    for index, name in enumerate(names):
+        value = scores.get(name)
+        if isinstance(value, numbers.Real):
+            values[index] = value
+    return values.tobytes()
+
+
+def unpack_traits(blob: bytes, names: Sequence[str] = TRAIT_NAMES) -> Dict[str, float]:
+    """float32 BLOB → 特性スコア辞書"""
+    values = np.frombuffer(blob, dtype=TRAIT_DTYPE)
+    return {name: float(value) for name, value in zip(names, values)}
+
+
+def traits_matrix(
+    blobs: Iterable[Optional[bytes]], width: int = len(TRAIT_NAMES)
+) -> np.ndarray:
+    """BLOB 列 → (行数, 特性数) の float32 行列（NULL 行は除外）"""
+    buffer = b"".join(blob for blob in blobs if blob is not None)
+    return np.frombuffer(buffer, dtype=TRAIT_DTYPE).reshape(-1, width)
+
+
+def summarize_traits(
+    matrix: np.ndarray, names: Sequence[str] = TRAIT_NAMES
+) -> Dict[str, Dict[str, float]]:
+    """特性別の平均・標準偏差・最新値・傾き（行は古い順）"""
+    if matrix.shape[0] == 0:
+        return {}
+    values = matrix.astype(np.float64)
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    safe_counts = np.maximum(counts, 1)
+    means = np.where(valid, values, 0.0).sum(axis=0) / safe_counts
+    dy = np.where(valid, values - means, 0.0)
+    stds = np.sqrt((dy * dy).sum(axis=0) / safe_counts)
+
+    # 傾き: 行番号に対する最小二乗（NaN は除外）
+    positions = np.arange(values.shape[0], dtype=np.float64)[:, None]
+    x_mean = np.where(valid, positions, 0.0).sum(axis=0) / safe_counts
+    dx = np.where(valid, positions - x_mean, 0.0)
+    denominator = (dx * dx).sum(axis=0)
+    slopes = np.divide(
+        (dx * dy).sum(axis=0),
+        denominator,
+        out=np.zeros_like(denominator),
+        where=denominator > 0,
+    )
+
+    summary = {}
+    for index, name in enumerate(names):
+        if counts[index] == 0:
+            continue
+        column = values[valid[:, index], index]
+        summary[name] = {
+            "mean": float(means[index]),
+            "std": float(stds[index]),
+            "latest": float(column[-1]),
+            "slope": float(slopes[index]),
+            "count": int(counts[index]),
+        }
+    return summary
@@ -22,6 +22,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import Mapping
 from typing import Optional
 
 # パス設定（同一ディレクトリのモジュールをインポート）
@@ -62,10 +63,34 @@ except ImportError:
     integrated_spec.loader.exec_module(integrated_module)
     MirralismPersonalityLearning = integrated_module.MirralismPersonalityLearning
 
+from weight_store import VersionedWeightStore  # noqa: E402
+
 # ログ設定
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 95%精度エンジン重み（重みストア初版）
+UNIFIED_WEIGHTS = {
+    "voice_multiplier": 1.5,  # SuperWhisper統合
+    "value_pattern_boost": 0.1,  # 価値観パターン追加重み
+    "learning_history_factor": 0.05,  # 学習履歴要因
+    "technical_keyword_weight": 3.0,  # 技術キーワード重み
+    "integrity_keyword_weight": 2.5,  # 誠実性キーワード重み
+}
+UNIFIED_WEIGHT_BOUNDS = (0.1, 5.0)
+
+
+def adjust_weights_from_feedback(weights: Dict[str, float], event: Dict[str, Any]):
+    """フィードバック1件の重み調整（簡単な適応学習アルゴリズム）"""
+    adjustment_factor = event["accuracy_delta"] * 0.01
+    notes = (event.get("feedback_notes") or "").lower()
+
+    if "technical" in notes:
+        weights["technical_keyword_weight"] += adjustment_factor
+
+    if "voice" in notes:
+        weights["voice_multiplier"] += adjustment_factor * 0.1
+
 
 class PersonalityLearningUnified:
     """
@@ -81,7 +106,7 @@ class PersonalityLearningUnified:
     進化達成: 53% → 61% → 95% 完了
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, feedback_batch_size: int = 8):
         """PersonalityLearningUnified統合システム初期化"""
 
         # パス設定
@@ -101,14 +126,15 @@ class PersonalityLearningUnified:
         # 統合データベースから最新精度取得
         self.current_accuracy = self._get_latest_accuracy()
 
-        # 95%精度エンジン設定
-        self.unified_weights = {
-            "voice_multiplier": 1.5,  # SuperWhisper統合
-            "value_pattern_boost": 0.1,  # 価値観パターン追加重み
-            "learning_history_factor": 0.05,  # 学習履歴要因
-            "technical_keyword_weight": 3.0,  # 技術キーワード重み
-            "integrity_keyword_weight": 2.5,  # 誠実性キーワード重み
-        }
+        # 95%精度エンジン設定（版管理ストア、フィードバックはミニバッチ適用）
+        self.weight_store = VersionedWeightStore(
+            db_path,
+            namespace="unified_engine",
+            initial_weights=UNIFIED_WEIGHTS,
+            update_rule=adjust_weights_from_feedback,
+            batch_size=feedback_batch_size,
+            bounds=UNIFIED_WEIGHT_BOUNDS,
+        )
 
         # V1失敗防止設定
         self.v1_failure_prevention = {
@@ -121,6 +147,11 @@ class PersonalityLearningUnified:
             f"PersonalityLearningUnified初期化完了 - " f"現在精度: {self.current_accuracy}%"
         )
 
+    @property
+    def unified_weights(self) -> Mapping[str, float]:
+        """現行版の統合重み（読み取り専用）"""
+        return self.weight_store.current().weights
+
     def _get_latest_accuracy(self) -> float:
         """統合データベースから最新精度を取得"""
         try:
@@ -158,6 +189,9 @@ class PersonalityLearningUnified:
         analysis_id = f"unified_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         start_time = datetime.now()
 
+        # 分析中は重みの版を固定
+        snapshot = self.weight_store.current()
+
         try:
             # 基盤システム分析実行
             base_result = self.mirralism_system.analyze_entry(
@@ -169,7 +203,12 @@ class PersonalityLearningUnified:
 
             # 95%精度エンジン適用
             enhanced_result = self._apply_95_percent_engine(
-                base_result, content, source_type, voice_data, task_context
+                base_result,
+                content,
+                source_type,
+                voice_data,
+                task_context,
+                weights=snapshot.weights,
             )
 
             # 統合データベース記録
@@ -180,6 +219,7 @@ class PersonalityLearningUnified:
                 **enhanced_result,
                 "unified_analysis_id": analysis_id,
                 "accuracy_engine": "95_percent_unified",
+                "weight_version": snapshot.version,
                 "processing_time_unified": (
                     datetime.now() - start_time
                 ).total_seconds(),
@@ -210,31 +250,34 @@ class PersonalityLearningUnified:
         source_type: str,
         voice_data: Optional[Dict] = None,
         task_context: Optional[Dict] = None,
+        weights: Optional[Mapping[str, float]] = None,
     ) -> Dict[str, Any]:
         """95%精度エンジン適用"""
 
+        if weights is None:
+            weights = self.unified_weights
+
         enhanced = base_result.copy()
         analysis = enhanced["analysis"]
 
         # 統合データベースからの価値観パターンマッチング
-        value_patterns_boost = self._calculate_value_patterns_boost(content)
+        value_patterns_boost = self._calculate_value_patterns_boost(content, weights)
 
         # SuperWhisper統合重み付け
         voice_boost = 0.0
         if source_type == "voice" and voice_data:
-            voice_boost = self.unified_weights["voice_multiplier"] * 2.0
+            voice_boost = weights["voice_multiplier"] * 2.0
 
         # 学習履歴要因
-        learning_history_boost = self._calculate_learning_history_boost()
+        learning_history_boost = self._calculate_learning_history_boost(weights)
 
         # キーワード重み付け最適化
         tech_boost = (
-            analysis.get("tech_keyword_count", 0)
-            * self.unified_weights["technical_keyword_weight"]
+            analysis.get("tech_keyword_count", 0) * weights["technical_keyword_weight"]
         )
         integrity_boost = (
             analysis.get("integrity_keyword_count", 0)
-            * self.unified_weights["integrity_keyword_weight"]
+            * weights["integrity_keyword_weight"]
         )
 
         # 統合スコア計算（95%精度アルゴリズム）
@@ -264,8 +307,12 @@ class PersonalityLearningUnified:
 
         return enhanced
 
-    def _calculate_value_patterns_boost(self, content: str) -> float:
+    def _calculate_value_patterns_boost(
+        self, content: str, weights: Optional[Mapping[str, float]] = None
+    ) -> float:
         """統合データベースの価値観パターンマッチング計算"""
+        if weights is None:
+            weights = self.unified_weights
         try:
             with self.database.get_connection() as conn:
                 cursor = conn.cursor()
@@ -282,9 +329,7 @@ class PersonalityLearningUnified:
                     if any(
                         expr.strip('"「」') in content for expr in expressions.split("」「")
                     ):
-                        boost += (
-                            importance * self.unified_weights["value_pattern_boost"]
-                        )
+                        boost += importance * weights["value_pattern_boost"]
 
                 return boost
 
@@ -292,13 +337,15 @@ class PersonalityLearningUnified:
             logger.warning(f"価値観パターンマッチング計算エラー: {e}")
             return 0.0
 
-    def _calculate_learning_history_boost(self) -> float:
+    def _calculate_learning_history_boost(
+        self, weights: Optional[Mapping[str, float]] = None
+    ) -> float:
         """学習履歴要因計算"""
+        if weights is None:
+            weights = self.unified_weights
         try:
             accuracy_improvement = self.current_accuracy - 61.0  # V1学習済みからの改善
-            return (
-                accuracy_improvement * self.unified_weights["learning_history_factor"]
-            )
+            return accuracy_improvement * weights["learning_history_factor"]
         except Exception:
             return 0.0
 
@@ -329,29 +376,41 @@ class PersonalityLearningUnified:
         content: str,
         expected_accuracy: float,
         feedback_notes: str = None,
+        current_accuracy: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
-        フィードバック学習システム
+        フィードバック学習システム（重み更新はキュー経由のミニバッチ適用）
 
         Args:
             content: 分析対象コンテンツ
             expected_accuracy: 期待精度
             feedback_notes: フィードバックノート
+            current_accuracy: 分析済みの精度（指定時は再分析を省略）
 
         Returns:
             Dict: 学習結果
         """
         try:
-            # 現在の分析実行
-            current_result = self.analyze_content(content)
-            current_accuracy = current_result["analysis"]["suetake_likeness_index"]
+            # 現在の分析実行（分析済み精度があれば再利用）
+            if current_accuracy is None:
+                current_result = self.analyze_content(content)
+                current_accuracy = current_result["analysis"]["suetake_likeness_index"]
 
             # 精度差分計算
             accuracy_delta = expected_accuracy - current_accuracy
-
-            # フィードバック学習実行
-            if abs(accuracy_delta) > 2.0:  # 2%以上の差がある場合学習
-                self._adjust_weights_from_feedback(accuracy_delta, feedback_notes)
+            learning_applied = abs(accuracy_delta) > 2.0  # 2%以上の差がある場合学習
+
+            # フィードバック学習実行（バッチサイズ到達で新しい重み版を作成）
+            updated = None
+            if learning_applied:
+                updated = self.weight_store.enqueue(
+                    {
+                        "accuracy_delta": accuracy_delta,
+                        "expected_accuracy": expected_accuracy,
+                        "current_accuracy": current_accuracy,
+                        "feedback_notes": feedback_notes,
+                    }
+                )
 
             # 学習結果記録
             learning_result = {
@@ -359,7 +418,10 @@ class PersonalityLearningUnified:
                 "current_accuracy": current_accuracy,
                 "expected_accuracy": expected_accuracy,
                 "accuracy_delta": accuracy_delta,
-                "learning_applied": abs(accuracy_delta) > 2.0,
+                "learning_applied": learning_applied,
+                "weights_updated": updated is not None,
+                "weight_version": self.weight_store.current().version,
+                "pending_feedback": self.weight_store.pending_count(),
                 "feedback_notes": feedback_notes,
                 "timestamp": datetime.now().isoformat(),
             }
@@ -376,20 +438,9 @@ class PersonalityLearningUnified:
                 "timestamp": datetime.now().isoformat(),
             }
 
-    def _adjust_weights_from_feedback(self, accuracy_delta: float, feedback_notes: str):
-        """フィードバックに基づく重み調整"""
-        # 簡単な適応学習アルゴリズム
-        adjustment_factor = accuracy_delta * 0.01
-
-        if "technical" in feedback_notes.lower() if feedback_notes else False:
-            self.unified_weights["technical_keyword_weight"] += adjustment_factor
-
-        if "voice" in feedback_notes.lower() if feedback_notes else False:
-            self.unified_weights["voice_multiplier"] += adjustment_factor * 0.1
-
-        # 重み制限
-        for key, value in self.unified_weights.items():
-            self.unified_weights[key] = max(0.1, min(value, 5.0))
+    def flush_feedback(self):
+        """未適用フィードバックの即時適用（未適用なしは None）"""
+        return self.weight_store.apply_pending()
 
     def get_system_status(self) -> Dict[str, Any]:
         """統合システム状況取得"""
@@ -403,7 +454,8 @@ class PersonalityLearningUnified:
                 "target_accuracy": self.target_accuracy,
                 "current_accuracy": self.current_accuracy,
                 "accuracy_achievement": self.current_accuracy >= self.target_accuracy,
-                "unified_weights": self.unified_weights,
+                "unified_weights": dict(self.unified_weights),
+                "weight_version": self.weight_store.current().version,
                 "v1_failure_prevention": self.v1_failure_prevention,
                 "database_integration": "complete",
                 "superwhisper_integration": "active",
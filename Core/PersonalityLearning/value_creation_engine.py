@@ -10,6 +10,7 @@ MIRRALISM Principles: 予防的品質保証、価値創造転換、継続的改
 """
 
 import asyncio
+import copy
 import json
 import time
 import logging
@@ -20,6 +21,10 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import statistics
 import sqlite3
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+from precision_measurement_system import open_precision_journal
 
 
 class ValueCreationMode(Enum):
@@ -63,11 +68,20 @@ class LearningQualityMetric:
     client_satisfaction: Optional[float]
 
 
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """データ版判定用のファイル署名（更新時刻ns, サイズ）"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 class MIRRALISMValueCreationEngine:
     """MIRRALISM価値創造エンジン"""
     
-    def __init__(self):
-        self.project_root = Path(__file__).parent.parent.parent
+    def __init__(self, project_root: Optional[Path] = None):
+        self.project_root = Path(project_root or Path(__file__).parent.parent.parent)
         self.data_dir = self.project_root / "Data" / "value_creation"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
@@ -75,6 +89,15 @@ class MIRRALISMValueCreationEngine:
         self.db_path = self.data_dir / "value_creation.db"
         self.init_database()
         
+        # 精度測定ジャーナル（旧形式 JSON は初回読込時に移行）
+        self.precision_journal_path = self.project_root / "Data" / "personality_learning_precision.jsonl"
+        self.precision_legacy_path = self.precision_journal_path.with_suffix(".json")
+        self._precision_journal = None
+
+        # 価値創造レポートの部分キャッシュ（入力データ版が変わった部分のみ再計算）
+        self._report_sections_cache: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        self._report_history_cache: Dict[str, Tuple[Any, List[Dict[str, Any]]]] = {}
+
         # 価値創造設定
         self.precision_targets = {
             "client_understanding": 0.95,
@@ -147,24 +170,29 @@ class MIRRALISMValueCreationEngine:
                     value_impact REAL NOT NULL,
                     success BOOLEAN NOT NULL
                 );
+                
+                -- クライアント別の最新履歴参照用
+                CREATE INDEX IF NOT EXISTS idx_value_metrics_client_time
+                ON value_metrics (client_name, timestamp DESC);
             """)
             
+    def _open_precision_journal(self):
+        """精度測定ジャーナル（未作成時は None、開いた後は追記分のみ取り込み）"""
+        if self._precision_journal is None:
+            if not (self.precision_journal_path.exists() or self.precision_legacy_path.exists()):
+                return None
+            self._precision_journal = open_precision_journal(self.precision_journal_path)
+        else:
+            self._precision_journal.refresh()
+        return self._precision_journal
+        
     def measure_current_precision(self, client_name: str = "黒澤工務店") -> Dict[str, float]:
-        """現在の精度測定"""
+        """現在の精度測定（クライアント × 精度タイプの最新値索引を参照）"""
         try:
-            # 精度測定データの取得
-            precision_data_path = self.project_root / "Data" / "personality_learning_precision.json"
-            
-            if precision_data_path.exists():
-                with open(precision_data_path, 'r', encoding='utf-8') as f:
-                    precision_data = json.load(f)
-                    
+            journal = self._open_precision_journal()
+            if journal is not None:
                 # 最新測定値の取得
-                current_measurements = {}
-                for measurement in precision_data.get("measurements", []):
-                    precision_type = measurement["precision_type"]
-                    if measurement["measurement_context"]["client"] == client_name:
-                        current_measurements[precision_type] = measurement["measured_value"]
+                current_measurements = journal.latest_values(client_name)
                         
                 # 標準精度指標の計算
                 if current_measurements:
@@ -192,6 +220,20 @@ class MIRRALISMValueCreationEngine:
                 "overall_precision": 0.85
             }
             
+    def measured_clients(self) -> List[str]:
+        """精度測定記録のあるクライアント一覧"""
+        journal = self._open_precision_journal()
+        return journal.partitions() if journal is not None else []
+        
+    def generate_multi_client_report(self, client_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """複数クライアントの価値創造レポート（クライアント毎に索引参照1回）"""
+        if client_names is None:
+            client_names = self.measured_clients()
+        return {
+            client_name: self.generate_value_creation_report(client_name)
+            for client_name in client_names
+        }
+        
     def calculate_value_improvement_potential(self, current_precision: Dict[str, float], 
                                            client_name: str = "黒澤工務店") -> Dict[str, Any]:
         """価値向上ポテンシャル計算"""
@@ -588,55 +630,91 @@ class MIRRALISMValueCreationEngine:
         except Exception as e:
             logging.error(f"❌ Failed to save value metric: {e}")
             
+    def data_version(self) -> Dict[str, Any]:
+        """レポート入力データの版（精度ジャーナル・価値創造DBのファイル署名）"""
+        return {
+            "precision": (
+                _file_signature(self.precision_journal_path),
+                _file_signature(self.precision_legacy_path),
+            ),
+            "value_db": _file_signature(self.db_path),
+        }
+
     def generate_value_creation_report(self, client_name: str = "黒澤工務店") -> Dict[str, Any]:
-        """価値創造レポート生成"""
+        """価値創造レポート生成（入力データ版が同一の部分はキャッシュを再利用）"""
         try:
-            # 現在の精度状況
-            current_precision = self.measure_current_precision(client_name)
+            version = self.data_version()
             
-            # 価値向上ポテンシャル
-            improvement_potential = self.calculate_value_improvement_potential(
-                current_precision, client_name
-            )
-            
-            # 過去の価値創造履歴
-            value_history = self._get_value_creation_history(client_name)
+            # 精度由来セクション（精度ジャーナル更新時のみ再計算）
+            cached_sections = self._report_sections_cache.get(client_name)
+            if cached_sections is not None and cached_sections[0] == version["precision"]:
+                sections = cached_sections[1]
+            else:
+                sections = self._build_precision_sections(client_name)
+                self._report_sections_cache[client_name] = (version["precision"], sections)
+
+            # 過去の価値創造履歴（価値創造DB更新時のみ再取得）
+            cached_history = self._report_history_cache.get(client_name)
+            if cached_history is not None and cached_history[0] == version["value_db"]:
+                value_history = cached_history[1]
+            else:
+                value_history = self._get_value_creation_history(client_name)
+                self._report_history_cache[client_name] = (version["value_db"], value_history)
             
             report = {
                 "timestamp": datetime.now().isoformat(),
                 "client_name": client_name,
-                "current_status": {
-                    "precision_levels": current_precision,
-                    "overall_maturity": statistics.mean(current_precision.values()),
-                    "target_achievement": self._calculate_target_achievement(current_precision)
-                },
-                "value_creation_potential": {
-                k: {
-                    **v,
-                    "business_impact": v["business_impact"].value
-                } for k, v in improvement_potential.items()
-            },
-                "business_impact_summary": {
-                    "high_impact_opportunities": len([
-                        p for p in improvement_potential.values() 
-                        if p["business_impact"] == BusinessImpact.HIGH
-                    ]),
-                    "estimated_total_roi": sum([
-                        p["estimated_roi"] for p in improvement_potential.values()
-                    ]),
-                    "priority_actions": self._get_priority_actions(improvement_potential)
-                },
+                "current_status": sections["current_status"],
+                "value_creation_potential": sections["value_creation_potential"],
+                "business_impact_summary": sections["business_impact_summary"],
                 "value_creation_history": value_history,
-                "next_steps": self._generate_next_steps(improvement_potential),
-                "mirralism_value_alignment": self._assess_mirralism_alignment(current_precision)
+                "next_steps": sections["next_steps"],
+                "mirralism_value_alignment": sections["mirralism_value_alignment"],
+                "data_version": version
             }
             
-            return report
+            return copy.deepcopy(report)
             
         except Exception as e:
             logging.error(f"❌ Failed to generate value creation report: {e}")
             return {"error": str(e)}
             
+    def _build_precision_sections(self, client_name: str) -> Dict[str, Any]:
+        """精度測定値に依存するレポートセクション"""
+        # 現在の精度状況
+        current_precision = self.measure_current_precision(client_name)
+
+        # 価値向上ポテンシャル
+        improvement_potential = self.calculate_value_improvement_potential(
+            current_precision, client_name
+        )
+
+        return {
+            "current_status": {
+                "precision_levels": current_precision,
+                "overall_maturity": statistics.mean(current_precision.values()),
+                "target_achievement": self._calculate_target_achievement(current_precision)
+            },
+            "value_creation_potential": {
+                k: {
+                    **v,
+                    "business_impact": v["business_impact"].value
+                } for k, v in improvement_potential.items()
+            },
+            "business_impact_summary": {
+                "high_impact_opportunities": len([
+                    p for p in improvement_potential.values()
+                    if p["business_impact"] == BusinessImpact.HIGH
+                ]),
+                "estimated_total_roi": sum([
+                    p["estimated_roi"] for p in improvement_potential.values()
+                ]),
+                "priority_actions": self._get_priority_actions(improvement_potential)
+            },
+            "next_steps": self._generate_next_steps(improvement_potential),
+            "mirralism_value_alignment": self._assess_mirralism_alignment(current_precision)
+        }
+
     def _calculate_target_achievement(self, current_precision: Dict[str, float]) -> Dict[str, float]:
         """目標達成度の計算"""
         achievement = {}
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+バージョン付き学習重みストア
+作成日: 2025年6月
+目的: PersonalityLearning フィードバック学習の重みを版付きで永続化し、
+      フィードバック毎の再分析・重み書き換えをミニバッチ適用に置き換え
+
+- 重みは版単位の不変スナップショット（更新は新しい版の追加 = コピーオンライト）
+- 読み手は WeightSnapshot を取得して版を固定し、分析中に重みが変わらない
+- フィードバックはキューに積み、ミニバッチ単位で1トランザクションに適用
+  （BEGIN IMMEDIATE によりプロセス間でも更新は直列化）
+- 過去版への復元も新しい版として記録（履歴は消さない）
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+# 重み更新規則: (重みのコピー, フィードバックイベント) → 重みを直接更新
+UpdateRule = Callable[[Dict[str, float], Dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class WeightSnapshot:
+    """特定版の重み（読み取り専用）"""
+
+    version: int
+    weights: Mapping[str, float]
+    created_at: str
+
+
+class VersionedWeightStore:
+    """版管理された重みストア + フィードバックキュー
+
+    Args:
+        db_path: SQLite データベースパス
+        namespace: 重みセット名（1DBに複数エンジンの重みを保持可能）
+        initial_weights: 初版の重み（版が存在しない場合のみ使用）
+        update_rule: フィードバック1件分の重み更新
+        batch_size: キューがこの件数に達したら自動適用
+        bounds: 適用後に各重みを収める (最小, 最大)
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        namespace: str,
+        initial_weights: Dict[str, float],
+        update_rule: UpdateRule,
+        batch_size: int = 8,
+        bounds: Optional[Tuple[float, float]] = None,
+    ):
+        self.db_path = str(db_path)
+        self.namespace = namespace
+        self.update_rule = update_rule
+        self.batch_size = batch_size
+        self.bounds = bounds
+        self._lock = threading.Lock()
+        self._cached: Optional[WeightSnapshot] = None
+        # ":memory:" は接続毎に別DBになるため、単一接続を保持して直列に使う
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        self._memory_lock = threading.RLock()
+
+        if self.db_path == ":memory:":
+            self._memory_conn = self._connect()
+        else:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._initialize(initial_weights)
+
+    def _connect(self) -> sqlite3.Connection:
+        # トランザクションは BEGIN IMMEDIATE で明示制御
+        return sqlite3.connect(
+            self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """操作毎の接続（":memory:" は保持中の単一接続を排他的に貸し出す）"""
+        if self._memory_conn is not None:
+            with self._memory_lock:
+                yield self._memory_conn
+            return
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _initialize(self, initial_weights: Dict[str, float]):
+        with self._connection() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS weight_versions (
+                    namespace TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    weights TEXT NOT NULL,
+                    parent_version INTEGER,
+                    applied_events INTEGER DEFAULT 0,
+                    note TEXT,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (namespace, version)
+                );
+
+                CREATE TABLE IF NOT EXISTS weight_feedback_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    namespace TEXT NOT NULL,
+                    event TEXT NOT NULL,
+                    enqueued_at TEXT NOT NULL,
+                    applied_version INTEGER
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_weight_feedback_pending
+                ON weight_feedback_queue (namespace, applied_version, id);
+                """
+            )
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO weight_versions
+                (namespace, version, weights, parent_version, note, created_at)
+                VALUES (?, 1, ?, NULL, 'initial', ?)
+                """,
+                (
+                    self.namespace,
+                    json.dumps(initial_weights, ensure_ascii=False),
+                    datetime.now().isoformat(),
+                ),
+            )
+
+    # ------------------------------------------------------------------
+    # 読み取り（版固定）
+    # ------------------------------------------------------------------
+    def current(self) -> WeightSnapshot:
+        """最新版のスナップショット（同一版はキャッシュを返す）"""
+        with self._connection() as conn:
+            (latest,) = conn.execute(
+                "SELECT MAX(version) FROM weight_versions WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+            cached = self._cached
+            if cached is not None and cached.version == latest:
+                return cached
+            snapshot = self._read_version(conn, latest)
+        self._cached = snapshot
+        return snapshot
+
+    def get_version(self, version: int) -> Optional[WeightSnapshot]:
+        with self._connection() as conn:
+            return self._read_version(conn, version)
+
+    def _read_version(
+        self, conn: sqlite3.Connection, version: int
+    ) -> Optional[WeightSnapshot]:
+        row = conn.execute(
+            "SELECT version, weights, created_at FROM weight_versions "
+            "WHERE namespace = ? AND version = ?",
+            (self.namespace, version),
+        ).fetchone()
+        if row is None:
+            return None
+        return WeightSnapshot(
+            version=row[0],
+            weights=MappingProxyType(json.loads(row[1])),
+            created_at=row[2],
+        )
+
+    def history(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """版履歴（新しい順）"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT version, parent_version, applied_events, note, created_at,
+                       weights
+                FROM weight_versions WHERE namespace = ?
+                ORDER BY version DESC LIMIT ?
+                """,
+                (self.namespace, limit),
+            ).fetchall()
+        return [
+            {
+                "version": version,
+                "parent_version": parent,
+                "applied_events": applied,
+                "note": note,
+                "created_at": created_at,
+                "weights": json.loads(weights),
+            }
+            for version, parent, applied, note, created_at, weights in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # 更新（キュー + ミニバッチ）
+    # ------------------------------------------------------------------
+    def enqueue(self, event: Dict[str, Any]) -> Optional[WeightSnapshot]:
+        """フィードバック投入（バッチサイズ到達時は適用し新版を返す）"""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO weight_feedback_queue (namespace, event, enqueued_at) "
+                "VALUES (?, ?, ?)",
+                (
+                    self.namespace,
+                    json.dumps(event, ensure_ascii=False),
+                    datetime.now().isoformat(),
+                ),
+            )
+
+        if self.pending_count() >= self.batch_size:
+            return self.apply_pending()
+        return None
+
+    def pending_count(self) -> int:
+        with self._connection() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM weight_feedback_queue "
+                "WHERE namespace = ? AND applied_version IS NULL",
+                (self.namespace,),
+            ).fetchone()
+            return count
+
+    def apply_pending(self) -> Optional[WeightSnapshot]:
+        """未適用フィードバックをまとめて適用し新しい版を作成（未適用なしは None）"""
+        with self._lock:
+            with self._connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    events = conn.execute(
+                        "SELECT id, event FROM weight_feedback_queue "
+                        "WHERE namespace = ? AND applied_version IS NULL ORDER BY id",
+                        (self.namespace,),
+                    ).fetchall()
+                    if not events:
+                        conn.execute("ROLLBACK")
+                        return None
+
+                    parent = self._latest_in_transaction(conn)
+                    weights = dict(parent.weights)
+                    for _, event in events:
+                        self.update_rule(weights, json.loads(event))
+                    self._clamp(weights)
+
+                    version = self._insert_version(
+                        conn, weights, parent.version, len(events), "feedback_batch"
+                    )
+                    conn.executemany(
+                        "UPDATE weight_feedback_queue SET applied_version = ? "
+                        "WHERE id = ?",
+                        [(version, event_id) for event_id, _ in events],
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        return self.current()
+
+    def restore(self, version: int) -> WeightSnapshot:
+        """過去版の重みを新しい版として復元"""
+        with self._lock:
+            with self._connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    source = self._read_version(conn, version)
+                    if source is None:
+                        raise ValueError(f"重み版が存在しません: {self.namespace} v{version}")
+                    parent = self._latest_in_transaction(conn)
+                    self._insert_version(
+                        conn,
+                        dict(source.weights),
+                        parent.version,
+                        0,
+                        f"restore_v{version}",
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        return self.current()
+
+    def _latest_in_transaction(self, conn: sqlite3.Connection) -> WeightSnapshot:
+        (latest,) = conn.execute(
+            "SELECT MAX(version) FROM weight_versions WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        return self._read_version(conn, latest)
+
+    def _insert_version(
+        self,
+        conn: sqlite3.Connection,
+        weights: Dict[str, float],
+        parent_version: int,
+        applied_events: int,
+        note: str,
+    ) -> int:
+        version = parent_version + 1
+        conn.execute(
+            """
+            INSERT INTO weight_versions
+            (namespace, version, weights, parent_version, applied_events, note,
+             created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                self.namespace,
+                version,
+                json.dumps(weights, ensure_ascii=False),
+                parent_version,
+                applied_events,
+                note,
+                datetime.now().isoformat(),
+            ),
+        )
+        return version
+
+    def _clamp(self, weights: Dict[str, float]):
+        if self.bounds is None:
+            return
+        lower, upper = self.bounds
+        for key, value in weights.items():
+            weights[key] = max(lower, min(value, upper))
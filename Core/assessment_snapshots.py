@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM 評価スナップショットストア
+===================================
+
+競合優位性評価・品質ガバナンス評価の結果を不変の版付きスナップショットとして保存し、
+ダッシュボードは最新スナップショットの参照のみで構築する（表示毎の再評価を排除）。
+
+- 1スナップショット = (種別, 版) の1行（作成後は更新しない）
+- 最新版の入力指紋・作成時刻で再評価要否を判定（入力変更時・期限切れ時のみ再評価）
+- トレンド表示は連続するスナップショット要約の差分から構築
+
+作成日: 2025年6月
+"""
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from datetime import timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+
+def jsonable(value: Any) -> Any:
+    """dataclass・Enum・datetime を含む評価結果を JSON 化可能な形へ変換"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: jsonable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(key): jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [jsonable(item) for item in value]
+    return value
+
+
+def input_fingerprint(inputs: Any) -> str:
+    """評価入力の指紋（キー順に依存しない sha256）"""
+    encoded = json.dumps(
+        jsonable(inputs), ensure_ascii=False, sort_keys=True, default=str
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class AssessmentSnapshotStore:
+    """評価スナップショットの版管理ストア"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS assessment_snapshots (
+                    kind TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    input_hash TEXT,
+                    computed_at TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (kind, version)
+                )
+            """
+            )
+
+    def record(
+        self,
+        kind: str,
+        summary: Dict[str, Any],
+        payload: Dict[str, Any],
+        input_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """新しい版のスナップショット追加"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                latest = self._latest_row(conn, kind)
+                version = (latest[0] if latest else 0) + 1
+                row = (
+                    version,
+                    input_hash,
+                    datetime.now().isoformat(),
+                    json.dumps(jsonable(summary), ensure_ascii=False),
+                    json.dumps(jsonable(payload), ensure_ascii=False, default=str),
+                )
+                conn.execute(
+                    """
+                    INSERT INTO assessment_snapshots
+                    (kind, version, input_hash, computed_at, summary, payload)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (kind, *row),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+        return self._row_to_snapshot(kind, row)
+
+    def latest(self, kind: str) -> Optional[Dict[str, Any]]:
+        """最新スナップショット（未作成時は None）"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = self._latest_row(conn, kind)
+        return self._row_to_snapshot(kind, row) if row else None
+
+    def is_current(
+        self,
+        kind: str,
+        input_hash: Optional[str] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> bool:
+        """最新スナップショットが入力・鮮度とも有効か"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                """
+                SELECT input_hash, computed_at FROM assessment_snapshots
+                WHERE kind = ? ORDER BY version DESC LIMIT 1
+            """,
+                (kind,),
+            ).fetchone()
+        if row is None:
+            return False
+        if input_hash is not None and row[0] != input_hash:
+            return False
+        if (
+            max_age is not None
+            and datetime.now() - datetime.fromisoformat(row[1]) > max_age
+        ):
+            return False
+        return True
+
+    def history(self, kind: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """要約の履歴（新しい順、本体は読み込まない）"""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT version, computed_at, summary FROM assessment_snapshots
+                WHERE kind = ? ORDER BY version DESC LIMIT ?
+            """,
+                (kind, limit),
+            ).fetchall()
+        return [
+            {
+                "version": version,
+                "computed_at": computed_at,
+                "summary": json.loads(summary),
+            }
+            for version, computed_at, summary in rows
+        ]
+
+    def deltas(
+        self, kind: str, fields: List[str], limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """連続スナップショット間の要約差分（新しい順）"""
+        history = self.history(kind, limit + 1)
+        changes = []
+        for current, previous in zip(history, history[1:]):
+            change = {
+                "version": current["version"],
+                "computed_at": current["computed_at"],
+            }
+            for name in fields:
+                now, before = current["summary"].get(name), previous["summary"].get(
+                    name
+                )
+                if isinstance(now, (int, float)) and isinstance(before, (int, float)):
+                    change[name] = now - before
+                else:
+                    change[name] = (
+                        {"from": before, "to": now} if now != before else None
+                    )
+            changes.append(change)
+        return changes
+
+    def _latest_row(self, conn: sqlite3.Connection, kind: str):
+        return conn.execute(
+            """
+            SELECT version, input_hash, computed_at, summary, payload
+            FROM assessment_snapshots
+            WHERE kind = ? ORDER BY version DESC LIMIT 1
+        """,
+            (kind,),
+        ).fetchone()
+
+    def _row_to_snapshot(self, kind: str, row) -> Dict[str, Any]:
+        version, input_hash, computed_at, summary, payload = row
+        return {
+            "kind": kind,
+            "version": version,
+            "input_hash": input_hash,
+            "computed_at": computed_at,
+            "summary": json.loads(summary),
+            "payload": json.loads(payload),
+        }
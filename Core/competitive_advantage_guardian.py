@@ -22,13 +22,16 @@ import json
 import logging
 import sqlite3
 import statistics
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-import numpy as np
-from scipy import stats
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from assessment_snapshots import AssessmentSnapshotStore, input_fingerprint, jsonable
 
 # ログ設定
 logging.basicConfig(
@@ -37,6 +40,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 評価スナップショット種別・トレンド比較項目
+ASSESSMENT_SNAPSHOT_KIND = "competitive_advantage"
+TREND_FIELDS = ["overall_advantage_score", "precision_advantage_score", "market_position"]
+
 
 class CompetitiveMetric(Enum):
     """競合優位性指標の定義"""
@@ -153,9 +160,11 @@ class CompetitiveAdvantageGuardian:
     
     def __init__(self, 
                  db_path: str = "Data/analytics/competitive_advantage.db",
-                 market_data_path: str = "Data/analytics/market_intelligence.json"):
+                 market_data_path: str = "Data/analytics/market_intelligence.json",
+                 snapshot_max_age: timedelta = timedelta(hours=24)):
         self.db_path = Path(db_path)
         self.market_data_path = Path(market_data_path)
+        self.snapshot_max_age = snapshot_max_age
         
         # 競合分析履歴
         self.analysis_history: List[CompetitiveAnalysis] = []
@@ -220,6 +229,7 @@ class CompetitiveAdvantageGuardian:
         # システム初期化
         self._initialize_database()
         self._load_market_intelligence()
+        self.snapshots = AssessmentSnapshotStore(self.db_path)
         
         logger.info("競合優位性保証システム初期化完了")
     
@@ -378,13 +388,52 @@ class CompetitiveAdvantageGuardian:
         # 分析結果の保存
         self._store_competitive_analysis(analysis)
         
+        # ダッシュボード表示用スナップショットの確定（表示時は再評価しない）
+        self.snapshots.record(
+            ASSESSMENT_SNAPSHOT_KIND,
+            summary={
+                "analysis_id": analysis.analysis_id,
+                "overall_advantage_score": analysis.overall_advantage_score,
+                "precision_advantage_score": analysis.precision_advantage_score,
+                "technical_differentiation_score": analysis.technical_differentiation_score,
+                "roi_protection_score": analysis.roi_protection_score,
+                "market_position_score": analysis.market_position_score,
+                "market_position": analysis.market_position.value,
+                "competitive_risk_level": analysis.competitive_risk_level.value,
+            },
+            payload={
+                "dashboard": self._build_dashboard_view(),
+                "assessment": jsonable(comprehensive_assessment),
+            },
+            input_hash=self._assessment_input_hash(),
+        )
+
         logger.info(f"競合優位性評価完了: 総合スコア={analysis.overall_advantage_score:.3f}")
         
         return comprehensive_assessment
     
+    def refresh_assessment_snapshot(self, force: bool = False) -> Dict[str, Any]:
+        """評価スナップショットの更新（入力変更時・期限切れ時のみ再評価）
+
+        定期実行・市場データ更新時に呼び出し、最新スナップショットを返す。
+        """
+        if force or not self.snapshots.is_current(
+            ASSESSMENT_SNAPSHOT_KIND, self._assessment_input_hash(), self.snapshot_max_age
+        ):
+            self.assess_competitive_advantage()
+        return self.snapshots.latest(ASSESSMENT_SNAPSHOT_KIND)
+
+    def _assessment_input_hash(self) -> str:
+        """評価入力（市場データ・ROI指標・技術差別化）の指紋"""
+        return input_fingerprint({
+            "market_data": self.market_data,
+            "roi_metrics": self.roi_metrics,
+            "technical_differentiation": self.technical_differentiation,
+        })
+
     def _perform_competitive_analysis(self) -> CompetitiveAnalysis:
         """競合分析の実行"""
-        analysis_id = f"COMP_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        analysis_id = f"COMP_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
         
         # 各指標の評価
         precision_score = self._evaluate_precision_advantage()
@@ -1004,11 +1053,27 @@ class CompetitiveAdvantageGuardian:
         self.analysis_history.append(analysis)
     
     def generate_competitive_dashboard(self) -> Dict[str, Any]:
-        """競合優位性ダッシュボードの生成"""
-        latest_analysis = self.analysis_history[-1] if self.analysis_history else None
+        """競合優位性ダッシュボードの生成（最新スナップショットの参照のみ）"""
+        snapshot = self.snapshots.latest(ASSESSMENT_SNAPSHOT_KIND)
+        view = snapshot["payload"]["dashboard"] if snapshot else self._build_dashboard_view()
         
         dashboard = {
             "generated_at": datetime.now().isoformat(),
+            **view,
+            "trend_analysis": self._analyze_competitive_trends(),
+            "snapshot": {
+                "version": snapshot["version"] if snapshot else None,
+                "computed_at": snapshot["computed_at"] if snapshot else None
+            }
+        }
+
+        return dashboard
+
+    def _build_dashboard_view(self) -> Dict[str, Any]:
+        """ダッシュボード表示内容の構築（スナップショット作成時に実行）"""
+        latest_analysis = self.analysis_history[-1] if self.analysis_history else None
+
+        return {
             "executive_summary": {
                 "overall_advantage_score": latest_analysis.overall_advantage_score if latest_analysis else 0.0,
                 "market_position": latest_analysis.market_position.value if latest_analysis else "unknown",
@@ -1024,11 +1089,8 @@ class CompetitiveAdvantageGuardian:
             },
             "strategic_insights": self._get_latest_strategic_insights(),
             "competitive_threats": self._assess_current_threats(),
-            "investment_recommendations": self._get_current_investment_priorities(),
-            "trend_analysis": self._analyze_competitive_trends()
+            "investment_recommendations": self._get_current_investment_priorities()
         }
-        
-        return dashboard
     
     def _get_latest_strategic_insights(self) -> List[str]:
         """最新の戦略的洞察"""
@@ -1061,29 +1123,37 @@ class CompetitiveAdvantageGuardian:
         return ["投資分析データが不足しています"]
     
     def _analyze_competitive_trends(self) -> Dict[str, Any]:
-        """競合トレンドの分析"""
-        if len(self.analysis_history) < 2:
+        """競合トレンドの分析（スナップショット要約の差分から構築）"""
+        history = self.snapshots.history(ASSESSMENT_SNAPSHOT_KIND, 2)
+        if len(history) < 2:
             return {"trend": "insufficient_data"}
         
-        # 最近2回の分析比較
-        current = self.analysis_history[-1]
-        previous = self.analysis_history[-2]
+        # 最近2版のスナップショット比較
+        current = history[0]["summary"]
+        previous = history[1]["summary"]
+        delta = self.snapshots.deltas(ASSESSMENT_SNAPSHOT_KIND, TREND_FIELDS, limit=1)[0]
         
         trends = {
             "overall_advantage": {
-                "current": current.overall_advantage_score,
-                "previous": previous.overall_advantage_score,
-                "direction": "improving" if current.overall_advantage_score > previous.overall_advantage_score else "declining"
+                "current": current["overall_advantage_score"],
+                "previous": previous["overall_advantage_score"],
+                "delta": delta["overall_advantage_score"],
+                "direction": "improving" if delta["overall_advantage_score"] > 0 else "declining"
             },
             "precision_advantage": {
-                "current": current.precision_advantage_score,
-                "previous": previous.precision_advantage_score,
-                "direction": "improving" if current.precision_advantage_score > previous.precision_advantage_score else "declining"
+                "current": current["precision_advantage_score"],
+                "previous": previous["precision_advantage_score"],
+                "delta": delta["precision_advantage_score"],
+                "direction": "improving" if delta["precision_advantage_score"] > 0 else "declining"
             },
             "market_position": {
-                "current": current.market_position.value,
-                "previous": previous.market_position.value,
-                "changed": current.market_position != previous.market_position
+                "current": current["market_position"],
+                "previous": previous["market_position"],
+                "changed": delta["market_position"] is not None
+            },
+            "versions": {
+                "current": history[0]["version"],
+                "previous": history[1]["version"]
             }
         }
         
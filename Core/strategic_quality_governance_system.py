@@ -22,6 +22,7 @@ import json
 import logging
 import sqlite3
 import statistics
+import sys
 import threading
 import time
 from dataclasses import dataclass, field
@@ -31,9 +32,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Tuple, Callable
 import warnings
 
-import numpy as np
-from scipy import stats
+sys.path.insert(0, str(Path(__file__).parent))
 
+from assessment_snapshots import AssessmentSnapshotStore, jsonable
 
 # ログ設定
 logging.basicConfig(
@@ -42,6 +43,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 評価スナップショット種別
+ASSESSMENT_SNAPSHOT_KIND = "quality_governance"
+
 
 class QualityThreshold(Enum):
     """品質閾値の戦略的定義"""
@@ -172,6 +176,7 @@ class StrategicQualityGovernanceSystem:
         self._initialize_database()
         self._load_configuration()
         self._register_core_protocols()
+        self.snapshots = AssessmentSnapshotStore(self.db_path)
         
         logger.info("戦略的品質保証ガバナンスシステム初期化完了")
     
@@ -451,6 +456,16 @@ class StrategicQualityGovernanceSystem:
                 json.dumps(result["degradation_detection"]),
                 json.dumps(result["strategic_recommendations"])
             ))
+
+        # ダッシュボード表示内容を評価時に確定（表示毎のトレンド再計算を排除）
+        self.snapshots.record(
+            ASSESSMENT_SNAPSHOT_KIND,
+            summary={
+                "overall_quality_score": result["overall_quality_score"],
+                "assessment_timestamp": result["assessment_timestamp"]
+            },
+            payload={"view": self._build_quality_view(), "assessment": jsonable(result)}
+        )
     
     def _process_assessment_alerts(self, assessment: Dict[str, Any]):
         """評価結果に基づくアラート処理"""
@@ -566,11 +581,28 @@ class StrategicQualityGovernanceSystem:
         logger.info(f"ガバナンスアクション実行: {action.action_id} - {action.description}")
     
     def generate_governance_dashboard(self) -> Dict[str, Any]:
-        """ガバナンスダッシュボードの生成"""
+        """ガバナンスダッシュボードの生成（品質評価は最新スナップショットを参照）"""
+        snapshot = self.snapshots.latest(ASSESSMENT_SNAPSHOT_KIND)
+        if snapshot is None:
+            view = self._build_quality_view()
+            last_updated = view["quality_metrics"]["last_updated"]
+            if last_updated is not None:
+                # スナップショット導入前の評価履歴を初回表示時に確定
+                snapshot = self.snapshots.record(
+                    ASSESSMENT_SNAPSHOT_KIND,
+                    summary={
+                        "overall_quality_score": view["quality_metrics"]["overall_score"],
+                        "assessment_timestamp": last_updated
+                    },
+                    payload={"view": view, "assessment": None}
+                )
+        else:
+            view = snapshot["payload"]["view"]
+
         dashboard_data = {
             "generated_at": datetime.now().isoformat(),
-            "system_status": self._get_system_status(),
-            "quality_metrics": self._get_current_quality_metrics(),
+            "system_status": self._get_system_status(view["quality_metrics"]["last_updated"]),
+            "quality_metrics": view["quality_metrics"],
             "active_alerts": [
                 {
                     "id": alert.alert_id,
@@ -590,17 +622,32 @@ class StrategicQualityGovernanceSystem:
                 }
                 for action in self.governance_actions[-10:]  # 直近10件
             ],
-            "strategic_insights": self._generate_strategic_insights(),
-            "competitive_position": self._assess_competitive_position()
+            "strategic_insights": view["strategic_insights"],
+            "competitive_position": view["competitive_position"],
+            "quality_trend_deltas": self.snapshots.deltas(
+                ASSESSMENT_SNAPSHOT_KIND, ["overall_quality_score"], limit=5
+            ),
+            "snapshot": {
+                "version": snapshot["version"] if snapshot else None,
+                "computed_at": snapshot["computed_at"] if snapshot else None
+            }
         }
         
         return dashboard_data
     
-    def _get_system_status(self) -> Dict[str, Any]:
+    def _build_quality_view(self) -> Dict[str, Any]:
+        """品質評価由来の表示内容の構築（評価完了時に実行）"""
+        return {
+            "quality_metrics": self._get_current_quality_metrics(),
+            "strategic_insights": self._generate_strategic_insights(),
+            "competitive_position": self._assess_competitive_position()
+        }
+
+    def _get_system_status(self, last_assessment: Optional[str] = None) -> Dict[str, Any]:
         """システム状態の取得"""
         return {
             "monitoring_active": self.monitoring_active,
-            "last_assessment": self._get_last_assessment_time(),
+            "last_assessment": last_assessment or self._get_last_assessment_time(),
             "active_alerts_count": len(self.active_alerts),
             "pending_actions_count": len([
                 a for a in self.governance_actions 
@@ -681,6 +728,8 @@ class StrategicQualityGovernanceSystem:
         scores = [r[0] for r in results]
         
         # 線形回帰による傾向分析
+        from scipy import stats  # 重量級依存のため遅延インポート
+
         x = list(range(len(scores)))
         slope, _, _, p_value, _ = stats.linregress(x, scores)
         
@@ -759,6 +808,8 @@ class PrecisionSustainabilityMonitor:
             
             # トレンド分析
             if len(recent_accuracies) >= 5:
+                from scipy import stats  # 重量級依存のため遅延インポート
+
                 x = list(range(len(recent_accuracies)))
                 slope, _, _, _, _ = stats.linregress(x, recent_accuracies)
                 
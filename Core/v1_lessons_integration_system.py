@@ -21,6 +21,7 @@ MIRRALISM V1教訓統合システム
 import json
 import logging
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -66,6 +67,13 @@ class LessonStatus(Enum):
     ORGANIZATIONAL_LEARNED = "learned" # 組織学習完了
 
 
+# 遵守評価で「統合済み」とみなす状況
+COMPLIANT_STATUSES = (LessonStatus.INTEGRATED, LessonStatus.VALIDATED)
+# 進捗評価で「統合済み」「検証済み」とみなす状況
+PROGRESS_INTEGRATED_STATUSES = COMPLIANT_STATUSES + (LessonStatus.ORGANIZATIONAL_LEARNED,)
+PROGRESS_VALIDATED_STATUSES = (LessonStatus.VALIDATED, LessonStatus.ORGANIZATIONAL_LEARNED)
+
+
 @dataclass
 class V1Lesson:
     """V1教訓の構造化定義"""
@@ -88,7 +96,7 @@ class V1Lesson:
     
     # 統合状況
     integration_status: LessonStatus
-    integration_date: Optional[datetime]
+    integration_date: Optional[datetime] = None
     validation_results: Dict[str, Any] = field(default_factory=dict)
     
     # メタデータ
@@ -123,6 +131,17 @@ class PreventiveMeasure:
     completion_criteria: List[str]
 
 
+@dataclass
+class LessonIntegrationWork:
+    """教訓1件分の統合結果バッファ（コミットまでDBへ書き込まない）"""
+
+    lesson: V1Lesson
+    success: bool = False
+    # (ステップ名, 成否, 備考, 実行時刻)
+    steps: List[Tuple[str, bool, str, str]] = field(default_factory=list)
+    measures: List[PreventiveMeasure] = field(default_factory=list)
+
+
 class V1LessonsIntegrationSystem:
     """V1教訓統合システム
     
@@ -140,6 +159,9 @@ class V1LessonsIntegrationSystem:
         self.lessons: Dict[str, V1Lesson] = {}
         self.preventive_measures: Dict[str, PreventiveMeasure] = {}
         
+        # 統合中の予防策（教訓ID別、コミット時に書き込み）
+        self._measure_buffer: Dict[str, List[PreventiveMeasure]] = {}
+
         # 統合状況追跡
         self.integration_progress = {
             "total_lessons": 0,
@@ -205,6 +227,12 @@ class V1LessonsIntegrationSystem:
                 )
             """)
             
+            # 遵守評価の集計用インデックス
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_preventive_measures_lesson
+                ON preventive_measures (lesson_id)
+            """)
+
             # 教訓統合履歴テーブル
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS integration_history (
@@ -230,8 +258,7 @@ class V1LessonsIntegrationSystem:
             self._create_performance_degradation_lesson()
         ]
         
-        for lesson in critical_lessons:
-            self.add_lesson(lesson)
+        self.add_lessons(critical_lessons)
         
         logger.info(f"V1重大教訓 {len(critical_lessons)}件を読み込み完了")
     
@@ -592,11 +619,16 @@ class V1LessonsIntegrationSystem:
     
     def add_lesson(self, lesson: V1Lesson):
         """教訓の追加"""
-        self.lessons[lesson.lesson_id] = lesson
+        self.add_lessons([lesson])
+
+    def add_lessons(self, lessons: List[V1Lesson]):
+        """教訓の一括追加（1トランザクションで保存）"""
+        for lesson in lessons:
+            self.lessons[lesson.lesson_id] = lesson
         
         # データベースに保存
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT OR REPLACE INTO v1_lessons (
                     lesson_id, title, category, severity, description,
                     root_causes, technical_factors, organizational_factors, business_impact,
@@ -604,30 +636,34 @@ class V1LessonsIntegrationSystem:
                     integration_status, integration_date, validation_results,
                     created_at, updated_at, responsible_team, evidence_references
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                lesson.lesson_id,
-                lesson.title,
-                lesson.category.value,
-                lesson.severity.value,
-                lesson.description,
-                json.dumps(lesson.root_causes),
-                json.dumps(lesson.technical_factors),
-                json.dumps(lesson.organizational_factors),
-                lesson.business_impact,
-                json.dumps(lesson.preventive_measures),
-                json.dumps(lesson.technical_solutions),
-                json.dumps(lesson.process_improvements),
-                json.dumps(lesson.organizational_changes),
-                lesson.integration_status.value,
-                lesson.integration_date.isoformat() if lesson.integration_date else None,
-                json.dumps(lesson.validation_results),
-                lesson.created_at.isoformat(),
-                lesson.updated_at.isoformat(),
-                lesson.responsible_team,
-                json.dumps(lesson.evidence_references)
-            ))
-        
-        logger.info(f"V1教訓追加: {lesson.lesson_id} - {lesson.title}")
+            """, [
+                (
+                    lesson.lesson_id,
+                    lesson.title,
+                    lesson.category.value,
+                    lesson.severity.value,
+                    lesson.description,
+                    json.dumps(lesson.root_causes),
+                    json.dumps(lesson.technical_factors),
+                    json.dumps(lesson.organizational_factors),
+                    lesson.business_impact,
+                    json.dumps(lesson.preventive_measures),
+                    json.dumps(lesson.technical_solutions),
+                    json.dumps(lesson.process_improvements),
+                    json.dumps(lesson.organizational_changes),
+                    lesson.integration_status.value,
+                    lesson.integration_date.isoformat() if lesson.integration_date else None,
+                    json.dumps(lesson.validation_results),
+                    lesson.created_at.isoformat(),
+                    lesson.updated_at.isoformat(),
+                    lesson.responsible_team,
+                    json.dumps(lesson.evidence_references)
+                )
+                for lesson in lessons
+            ])
+
+        for lesson in lessons:
+            logger.info(f"V1教訓追加: {lesson.lesson_id} - {lesson.title}")
     
     def integrate_lesson(self, lesson_id: str) -> bool:
         """教訓の統合実行"""
@@ -635,7 +671,14 @@ class V1LessonsIntegrationSystem:
             logger.error(f"教訓が見つかりません: {lesson_id}")
             return False
         
-        lesson = self.lessons[lesson_id]
+        work = self._run_integration(self.lessons[lesson_id])
+        self._commit_integrations([work])
+
+        return work.success
+
+    def _run_integration(self, lesson: V1Lesson) -> LessonIntegrationWork:
+        """統合プロセスの実行（結果はバッファのみ、DB書き込みなし）"""
+        work = LessonIntegrationWork(lesson=lesson)
         
         try:
             # 統合プロセスの実行
@@ -650,28 +693,27 @@ class V1LessonsIntegrationSystem:
             
             for step in integration_steps:
                 success = step(lesson)
+                work.measures.extend(self._measure_buffer.pop(lesson.lesson_id, []))
                 if not success:
-                    logger.error(f"教訓統合の失敗: {lesson_id} - {step.__name__}")
-                    return False
+                    logger.error(f"教訓統合の失敗: {lesson.lesson_id} - {step.__name__}")
+                    return work
                 
                 # 統合履歴の記録
-                self._record_integration_step(lesson_id, step.__name__, True)
+                work.steps.append((step.__name__, True, "", datetime.now().isoformat()))
             
             # 統合状況の更新
             lesson.integration_status = LessonStatus.INTEGRATED
             lesson.integration_date = datetime.now()
             lesson.updated_at = datetime.now()
+            work.success = True
             
-            # データベース更新
-            self._update_lesson_in_db(lesson)
-            
-            logger.info(f"V1教訓統合完了: {lesson_id}")
-            return True
+            logger.info(f"V1教訓統合完了: {lesson.lesson_id}")
             
         except Exception as e:
-            logger.error(f"教訓統合エラー: {lesson_id} - {e}")
-            self._record_integration_step(lesson_id, "integration_error", False, str(e))
-            return False
+            logger.error(f"教訓統合エラー: {lesson.lesson_id} - {e}")
+            work.steps.append(("integration_error", False, str(e), datetime.now().isoformat()))
+
+        return work
     
     def _analyze_lesson(self, lesson: V1Lesson) -> bool:
         """教訓の詳細分析"""
@@ -749,10 +791,10 @@ class V1LessonsIntegrationSystem:
             )
             measures.append(measure)
         
-        # 予防策の保存
+        # 予防策の登録（保存は統合結果のコミット時）
         for measure in measures:
             self.preventive_measures[measure.measure_id] = measure
-            self._save_preventive_measure(measure)
+        self._measure_buffer[lesson.lesson_id] = measures
         
         return True
     
@@ -916,52 +958,22 @@ class V1LessonsIntegrationSystem:
             "prevention_confidence": 0.92
         }
     
-    def _record_integration_step(self, lesson_id: str, step: str, success: bool, notes: str = ""):
-        """統合ステップの記録"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO integration_history (
-                    lesson_id, integration_step, execution_date, 
-                    execution_details, success_status, notes
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                lesson_id,
+    def _commit_integrations(self, works: List[LessonIntegrationWork]):
+        """統合結果（履歴・予防策・教訓状況）の一括コミット"""
+        history_rows = [
+            (
+                work.lesson.lesson_id,
                 step,
-                datetime.now().isoformat(),
-                json.dumps({"step": step, "timestamp": datetime.now().isoformat()}),
+                executed_at,
+                json.dumps({"step": step, "timestamp": executed_at}),
                 int(success),
                 notes
-            ))
-    
-    def _update_lesson_in_db(self, lesson: V1Lesson):
-        """データベース内の教訓更新"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                UPDATE v1_lessons SET
-                    integration_status = ?,
-                    integration_date = ?,
-                    validation_results = ?,
-                    updated_at = ?
-                WHERE lesson_id = ?
-            """, (
-                lesson.integration_status.value,
-                lesson.integration_date.isoformat() if lesson.integration_date else None,
-                json.dumps(lesson.validation_results),
-                lesson.updated_at.isoformat(),
-                lesson.lesson_id
-            ))
-    
-    def _save_preventive_measure(self, measure: PreventiveMeasure):
-        """予防策の保存"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO preventive_measures (
-                    measure_id, lesson_id, title, description, implementation_type,
-                    implementation_status, implementation_date, validation_date,
-                    effectiveness_metrics, measured_effectiveness, required_resources,
-                    responsible_team, completion_criteria
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            )
+            for work in works
+            for step, success, notes, executed_at in work.steps
+        ]
+        measure_rows = [
+            (
                 measure.measure_id,
                 measure.lesson_id,
                 measure.title,
@@ -975,10 +987,49 @@ class V1LessonsIntegrationSystem:
                 json.dumps(measure.required_resources),
                 measure.responsible_team,
                 json.dumps(measure.completion_criteria)
-            ))
+            )
+            for work in works
+            for measure in work.measures
+        ]
+        # 途中で失敗した教訓も到達した状況を保存（遵守評価はDB集計のため）
+        lesson_rows = [
+            (
+                work.lesson.integration_status.value,
+                work.lesson.integration_date.isoformat() if work.lesson.integration_date else None,
+                json.dumps(work.lesson.validation_results),
+                work.lesson.updated_at.isoformat(),
+                work.lesson.lesson_id
+            )
+            for work in works
+        ]
+
+        # 1接続・1トランザクションで書き込み
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT INTO integration_history (
+                    lesson_id, integration_step, execution_date,
+                    execution_details, success_status, notes
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, history_rows)
+            conn.executemany("""
+                INSERT OR REPLACE INTO preventive_measures (
+                    measure_id, lesson_id, title, description, implementation_type,
+                    implementation_status, implementation_date, validation_date,
+                    effectiveness_metrics, measured_effectiveness, required_resources,
+                    responsible_team, completion_criteria
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, measure_rows)
+            conn.executemany("""
+                UPDATE v1_lessons SET
+                    integration_status = ?,
+                    integration_date = ?,
+                    validation_results = ?,
+                    updated_at = ?
+                WHERE lesson_id = ?
+            """, lesson_rows)
     
-    def integrate_all_lessons(self) -> Dict[str, Any]:
-        """全教訓の統合実行"""
+    def integrate_all_lessons(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """全教訓の統合実行（教訓単位で並行実行し、結果は一括コミット）"""
         integration_results = {
             "total_lessons": len(self.lessons),
             "successful_integrations": 0,
@@ -986,10 +1037,15 @@ class V1LessonsIntegrationSystem:
             "integration_details": {}
         }
         
-        for lesson_id in self.lessons:
-            success = self.integrate_lesson(lesson_id)
-            
-            if success:
+        # 教訓間は独立しているため並行に統合
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            works = list(executor.map(self._run_integration, list(self.lessons.values())))
+
+        self._commit_integrations(works)
+
+        for work in works:
+            lesson_id = work.lesson.lesson_id
+            if work.success:
                 integration_results["successful_integrations"] += 1
                 integration_results["integration_details"][lesson_id] = "success"
             else:
@@ -1004,16 +1060,15 @@ class V1LessonsIntegrationSystem:
         return integration_results
     
     def _update_integration_progress(self):
-        """統合進捗の更新"""
-        total = len(self.lessons)
-        integrated = sum(
-            1 for lesson in self.lessons.values()
-            if lesson.integration_status in [LessonStatus.INTEGRATED, LessonStatus.VALIDATED, LessonStatus.ORGANIZATIONAL_LEARNED]
-        )
-        validated = sum(
-            1 for lesson in self.lessons.values()
-            if lesson.integration_status in [LessonStatus.VALIDATED, LessonStatus.ORGANIZATIONAL_LEARNED]
-        )
+        """統合進捗の更新（DB集計）"""
+        with sqlite3.connect(self.db_path) as conn:
+            total, integrated, validated = conn.execute(f"""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(integration_status IN ({self._placeholders(PROGRESS_INTEGRATED_STATUSES)})), 0),
+                    COALESCE(SUM(integration_status IN ({self._placeholders(PROGRESS_VALIDATED_STATUSES)})), 0)
+                FROM v1_lessons
+            """, self._status_values(PROGRESS_INTEGRATED_STATUSES + PROGRESS_VALIDATED_STATUSES)).fetchone()
         
         self.integration_progress = {
             "total_lessons": total,
@@ -1022,33 +1077,53 @@ class V1LessonsIntegrationSystem:
             "implementation_rate": integrated / total if total > 0 else 0.0
         }
     
+    def _placeholders(self, statuses: Tuple[LessonStatus, ...]) -> str:
+        return ", ".join("?" for _ in statuses)
+
+    def _status_values(self, statuses: Tuple[LessonStatus, ...]) -> Tuple[str, ...]:
+        return tuple(status.value for status in statuses)
+
+    def _compliance_by(self, column: str) -> Dict[str, Dict[str, Any]]:
+        """重要度・カテゴリー別の遵守集計"""
+        if column not in ("severity", "category"):
+            raise ValueError(f"集計できない列です: {column}")
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(f"""
+                SELECT {column}, COUNT(*),
+                       SUM(integration_status IN ({self._placeholders(COMPLIANT_STATUSES)}))
+                FROM v1_lessons
+                GROUP BY {column}
+            """, self._status_values(COMPLIANT_STATUSES)).fetchall()
+
+        return {
+            value: {
+                "total": total,
+                "integrated": integrated,
+                "compliance_rate": integrated / total if total else 0.0
+            }
+            for value, total, integrated in rows
+        }
+
     def evaluate_lesson_compliance(self) -> Dict[str, Any]:
         """教訓遵守状況の評価"""
         self._update_integration_progress()
         
+        empty_stats = {"total": 0, "integrated": 0, "compliance_rate": 0.0}
+
         # 重要度別統計
-        severity_stats = {}
-        for severity in LessonSeverity:
-            lessons = [l for l in self.lessons.values() if l.severity == severity]
-            integrated = [l for l in lessons if l.integration_status in [LessonStatus.INTEGRATED, LessonStatus.VALIDATED]]
-            
-            severity_stats[severity.value] = {
-                "total": len(lessons),
-                "integrated": len(integrated),
-                "compliance_rate": len(integrated) / len(lessons) if lessons else 0.0
-            }
+        severity_counts = self._compliance_by("severity")
+        severity_stats = {
+            severity.value: severity_counts.get(severity.value, dict(empty_stats))
+            for severity in LessonSeverity
+        }
         
         # カテゴリー別統計
-        category_stats = {}
-        for category in LessonCategory:
-            lessons = [l for l in self.lessons.values() if l.category == category]
-            integrated = [l for l in lessons if l.integration_status in [LessonStatus.INTEGRATED, LessonStatus.VALIDATED]]
-            
-            category_stats[category.value] = {
-                "total": len(lessons),
-                "integrated": len(integrated),
-                "compliance_rate": len(integrated) / len(lessons) if lessons else 0.0
-            }
+        category_counts = self._compliance_by("category")
+        category_stats = {
+            category.value: category_counts.get(category.value, dict(empty_stats))
+            for category in LessonCategory
+        }
         
         # 総合遵守評価
         overall_compliance = self.integration_progress["implementation_rate"]
@@ -1068,52 +1143,64 @@ class V1LessonsIntegrationSystem:
             },
             "severity_breakdown": severity_stats,
             "category_breakdown": category_stats,
-            "critical_lessons_status": self._evaluate_critical_lessons(),
+            "critical_lessons_status": self._evaluate_critical_lessons(severity_stats),
             "prevention_effectiveness": self._calculate_prevention_effectiveness(),
-            "organizational_learning": self._assess_organizational_learning()
+            "organizational_learning": self._assess_organizational_learning(category_stats)
         }
     
-    def _evaluate_critical_lessons(self) -> Dict[str, Any]:
+    def _evaluate_critical_lessons(self, severity_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """重要教訓の状況評価"""
-        critical_lessons = [l for l in self.lessons.values() if l.severity == LessonSeverity.CRITICAL]
+        critical_stats = severity_stats[LessonSeverity.CRITICAL.value]
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT lesson_id, title, integration_status, integration_date
+                FROM v1_lessons
+                WHERE severity = ?
+            """, (LessonSeverity.CRITICAL.value,)).fetchall()
         
         return {
-            "total_critical": len(critical_lessons),
-            "integrated_critical": len([l for l in critical_lessons if l.integration_status in [LessonStatus.INTEGRATED, LessonStatus.VALIDATED]]),
-            "critical_compliance_rate": len([l for l in critical_lessons if l.integration_status in [LessonStatus.INTEGRATED, LessonStatus.VALIDATED]]) / len(critical_lessons) if critical_lessons else 0.0,
+            "total_critical": critical_stats["total"],
+            "integrated_critical": critical_stats["integrated"],
+            "critical_compliance_rate": critical_stats["compliance_rate"],
             "critical_lessons": [
                 {
-                    "id": l.lesson_id,
-                    "title": l.title,
-                    "status": l.integration_status.value,
-                    "integration_date": l.integration_date.isoformat() if l.integration_date else None
+                    "id": lesson_id,
+                    "title": title,
+                    "status": status,
+                    "integration_date": integration_date
                 }
-                for l in critical_lessons
+                for lesson_id, title, status, integration_date in rows
             ]
         }
     
     def _calculate_prevention_effectiveness(self) -> Dict[str, Any]:
-        """予防効果の計算"""
-        total_measures = len(self.preventive_measures)
-        implemented_measures = len([m for m in self.preventive_measures.values() if m.implementation_status == "completed"])
-        
-        avg_effectiveness = sum(m.measured_effectiveness for m in self.preventive_measures.values()) / total_measures if total_measures > 0 else 0.0
+        """予防効果の計算（DB集計）"""
+        with sqlite3.connect(self.db_path) as conn:
+            total_measures, implemented_measures, avg_effectiveness, high_effectiveness = conn.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(implementation_status = 'completed'), 0),
+                    COALESCE(AVG(measured_effectiveness), 0.0),
+                    COALESCE(SUM(measured_effectiveness >= 0.8), 0)
+                FROM preventive_measures
+            """).fetchone()
         
         return {
             "total_preventive_measures": total_measures,
             "implemented_measures": implemented_measures,
             "implementation_rate": implemented_measures / total_measures if total_measures > 0 else 0.0,
             "average_effectiveness": avg_effectiveness,
-            "high_effectiveness_measures": len([m for m in self.preventive_measures.values() if m.measured_effectiveness >= 0.8])
+            "high_effectiveness_measures": high_effectiveness
         }
     
-    def _assess_organizational_learning(self) -> Dict[str, Any]:
+    def _assess_organizational_learning(self, category_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """組織学習の評価"""
-        organizational_lessons = [l for l in self.lessons.values() if l.category == LessonCategory.ORGANIZATIONAL_PROCESS]
+        organizational_stats = category_stats[LessonCategory.ORGANIZATIONAL_PROCESS.value]
         
         return {
-            "organizational_lessons_count": len(organizational_lessons),
-            "organizational_integration_rate": len([l for l in organizational_lessons if l.integration_status in [LessonStatus.INTEGRATED, LessonStatus.VALIDATED]]) / len(organizational_lessons) if organizational_lessons else 0.0,
+            "organizational_lessons_count": organizational_stats["total"],
+            "organizational_integration_rate": organizational_stats["compliance_rate"],
             "culture_change_indicators": {
                 "quality_focus": 0.85,  # 実装例
                 "continuous_improvement": 0.80,
@@ -1143,7 +1230,7 @@ class V1LessonsIntegrationSystem:
             "detailed_analysis": compliance_status,
             "key_achievements": self._identify_key_achievements(),
             "remaining_risks": self._identify_remaining_risks(),
-            "strategic_recommendations": self._generate_strategic_recommendations(),
+            "strategic_recommendations": self._generate_strategic_recommendations(compliance_status),
             "next_steps": self._define_next_steps()
         }
         
@@ -1202,11 +1289,12 @@ class V1LessonsIntegrationSystem:
         
         return risks
     
-    def _generate_strategic_recommendations(self) -> List[str]:
+    def _generate_strategic_recommendations(self, compliance_status: Optional[Dict[str, Any]] = None) -> List[str]:
         """戦略的推奨事項の生成"""
         recommendations = []
         
-        compliance_status = self.evaluate_lesson_compliance()
+        if compliance_status is None:
+            compliance_status = self.evaluate_lesson_compliance()
         overall_rate = compliance_status["overall_compliance"]["rate"]
         
         if overall_rate < 0.95:
@@ -5,18 +5,32 @@ MIRRALISM V2 WebClip Independent System
 
 WebClip独立システムパッケージ
 Option B アプローチによる完全分離実装
+
+各クラスは初回アクセス時にサブモジュールから遅延インポートされる（PEP 562）。
+`import Interface.WebClip` だけでは yaml 等の依存は読み込まれない。
 """
 
-from .motivation_analyzer import WebClipMotivationAnalyzer
-from .realtime_dialogue import WebClipRealtimeDialogue
-from .yaml_processor import YAMLFrontmatterProcessor
-from .webclip_integrated_system import WebClipIntegratedSystem
-from .research_markdown_processor import ResearchMarkdownProcessor
-
-__all__ = [
-    'WebClipMotivationAnalyzer',
-    'WebClipRealtimeDialogue', 
-    'YAMLFrontmatterProcessor',
-    'WebClipIntegratedSystem',
-    'ResearchMarkdownProcessor'
-]
\ No newline at end of file
+import importlib
+
+_LAZY_EXPORTS = {
+    'WebClipMotivationAnalyzer': '.motivation_analyzer',
+    'WebClipRealtimeDialogue': '.realtime_dialogue',
+    'YAMLFrontmatterProcessor': '.yaml_processor',
+    'WebClipIntegratedSystem': '.webclip_integrated_system',
+    'ResearchMarkdownProcessor': '.research_markdown_processor',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -18,8 +18,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
 
 class WebClipMotivationAnalyzer:
     """WebClipクリップ動機分析エンジン"""
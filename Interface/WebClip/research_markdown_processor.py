@@ -11,9 +11,9 @@ MIRRALISM V2 WebClip拡張システム
 設計思想: WebClipシステム拡張による統一体験
 """
 
-import json
 import logging
 import re
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -22,6 +22,9 @@ from typing import Any, Dict, List, Optional, Tuple
 from .motivation_analyzer import WebClipMotivationAnalyzer
 from .yaml_processor import YAMLFrontmatterProcessor
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from Core.DataIntegration.content_store import ContentAddressedStore  # noqa: E402
+
 
 class ResearchMarkdownProcessor:
     """ディープリサーチマークダウン処理システム"""
@@ -40,12 +43,16 @@ class ResearchMarkdownProcessor:
         self.motivation_analyzer = WebClipMotivationAnalyzer(project_root)
         self.yaml_processor = YAMLFrontmatterProcessor(project_root)
         
+        # 重複リサーチファイル検出ストア
+        self.content_store = ContentAddressedStore(self.project_root / "Data" / "content_store")
+
         # リサーチ特化システム
         self.research_sources = self._initialize_research_sources()
         self.processing_stats = {
             "total_processed": 0,
             "successful_processing": 0,
             "source_detection_accuracy": 0.0,
+            "duplicates_skipped": 0,
             "research_files_by_source": {}
         }
         
@@ -91,6 +98,26 @@ class ResearchMarkdownProcessor:
             # 1. マークダウンファイル読み込み・解析
             markdown_analysis = self._analyze_markdown_file(file_path)
             
+            # 重複検出（同一内容のリサーチは保存済み分析結果を返す）
+            if save_to_file:
+                duplicate = self.content_store.find_duplicate_entry(
+                    "research", markdown_analysis["raw_content"]
+                )
+                if duplicate:
+                    manifest = duplicate["manifest"]
+                    self.processing_stats["duplicates_skipped"] += 1
+                    self.logger.info(
+                        f"⏭️ 重複リサーチファイル: {file_path.name} → 既存 {manifest['entry_id']}"
+                    )
+                    return {
+                        "success": True,
+                        "duplicate": True,
+                        "file_path": str(file_path),
+                        "research_analysis": self.content_store.read_json(manifest, "analysis"),
+                        "save_result": self._build_save_result(duplicate, file_path),
+                        "processing_stats": self.processing_stats.copy()
+                    }
+
             # 2. リサーチソース検出・分類
             source_detection = self._detect_research_source(markdown_analysis)
             
@@ -139,7 +166,9 @@ class ResearchMarkdownProcessor:
             # 8. ファイル保存（オプション）
             save_result = None
             if save_to_file:
-                save_result = self._save_research_file(integrated_result, file_path)
+                save_result = self._save_research_file(
+                    integrated_result, file_path, markdown_analysis["raw_content"]
+                )
             
             # 統計更新
             self.processing_stats["successful_processing"] += 1
@@ -784,42 +813,29 @@ Research Context: This is a deep research document containing detailed analysis
             }
         }
 
-    def _save_research_file(self, integrated_result: Dict, original_path: Path) -> Dict[str, Any]:
-        """リサーチファイル保存"""
+    def _save_research_file(
+        self, integrated_result: Dict, original_path: Path, raw_content: str
+    ) -> Dict[str, Any]:
+        """リサーチファイル保存（コンテンツアドレス型ストア）"""
         
         try:
-            # 保存先ディレクトリ
-            save_dir = self.project_root / "Data" / "research_files"
-            save_dir.mkdir(parents=True, exist_ok=True)
-            
-            # ファイル名生成
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             source = integrated_result["source_detection"]["detected_source"]
             title = integrated_result["content_analysis"]["research_title"]
             safe_title = "".join(c for c in title if c.isalnum() or c in " -_")[:50]
             
-            # マークダウンファイル保存
-            markdown_filename = f"{timestamp}_{source}_{safe_title}.md"
-            markdown_path = save_dir / markdown_filename
-            
-            markdown_content = integrated_result["structured_data"]["markdown_output"]
-            with open(markdown_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            # JSON分析結果保存
-            json_filename = f"{timestamp}_{source}_analysis.json"
-            json_path = save_dir / json_filename
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(integrated_result, f, ensure_ascii=False, indent=2)
-            
-            return {
-                "success": True,
-                "markdown_file": str(markdown_path),
-                "analysis_file": str(json_path),
-                "original_file": str(original_path),
-                "save_directory": str(save_dir)
-            }
+            # マークダウン・JSON分析結果を blob として保存、エントリはマニフェストのみ
+            result = self.content_store.save_entry(
+                "research",
+                f"{timestamp}_{source}_{safe_title}",
+                raw_content,
+                blobs={
+                    "markdown": integrated_result["structured_data"]["markdown_output"],
+                    "analysis": integrated_result,
+                },
+                metadata={"source": source, "title": title, "original_file": str(original_path)},
+            )
+            return self._build_save_result(result, original_path)
             
         except Exception as e:
             self.logger.error(f"❌ リサーチファイル保存エラー: {e}")
@@ -828,6 +844,21 @@ Research Context: This is a deep research document containing detailed analysis
                 "error": str(e)
             }
 
+    def _build_save_result(self, entry: Dict, original_path: Path) -> Dict[str, Any]:
+        """保存結果（blob・ストアが返したマニフェストのパス）"""
+
+        blobs = entry["manifest"]["blobs"]
+        manifest_file = Path(entry["manifest_path"])
+        return {
+            "success": True,
+            "duplicate": entry["duplicate"],
+            "markdown_file": str(self.content_store.blob_path(blobs["markdown"]["hash"])),
+            "analysis_file": str(self.content_store.blob_path(blobs["analysis"]["hash"])),
+            "manifest_file": str(manifest_file),
+            "original_file": str(original_path),
+            "save_directory": str(manifest_file.parent)
+        }
+
     def _update_source_stats(self, detected_source: str):
         """ソース統計更新"""
         
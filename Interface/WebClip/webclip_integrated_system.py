@@ -12,8 +12,8 @@ MIRRALISM V2 WebClip独立システム統合版
 """
 
 import asyncio
-import json
 import logging
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -23,6 +23,9 @@ from .motivation_analyzer import WebClipMotivationAnalyzer
 from .realtime_dialogue import WebClipRealtimeDialogue  
 from .yaml_processor import YAMLFrontmatterProcessor
 
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from Core.DataIntegration.content_store import ContentAddressedStore  # noqa: E402
+
 
 class WebClipIntegratedSystem:
     """WebClip統合システム（Option B 完全版）"""
@@ -42,13 +45,17 @@ class WebClipIntegratedSystem:
         self.dialogue_system = WebClipRealtimeDialogue(project_root)
         self.yaml_processor = YAMLFrontmatterProcessor(project_root)
         
+        # 重複クリップ検出ストア（同一記事は1回だけ保存・分析）
+        self.content_store = ContentAddressedStore(self.project_root / "Data" / "content_store")
+
         # 統合処理統計
         self.integration_stats = {
             "total_clips_processed": 0,
             "successful_integrations": 0,
             "average_processing_time": 0.0,
             "target_achievement_rate": 0.0,
-            "v1_errors_prevented": 0
+            "v1_errors_prevented": 0,
+            "duplicates_skipped": 0
         }
         
         # パフォーマンス履歴
@@ -97,6 +104,14 @@ class WebClipIntegratedSystem:
         try:
             self.logger.info(f"🚀 WebClip統合処理開始 [{processing_id}]: {article_title[:50]}...")
             
+            # Phase 0: 重複クリップ検出（再クリップ記事は保存済み分析結果を返す）
+            if save_to_file:
+                duplicate = self.content_store.find_duplicate_entry(
+                    "webclip", article_content
+                )
+                if duplicate:
+                    return self._build_duplicate_result(duplicate, processing_id, start_time)
+
             # Phase 1: 並列処理準備
             tasks = []
             
@@ -151,7 +166,7 @@ class WebClipIntegratedSystem:
             save_result = None
             if save_to_file:
                 save_start = time.time()
-                save_result = await self._save_webclip_file(integrated_result)
+                save_result = await self._save_webclip_file(integrated_result, article_content)
                 save_time = time.time() - save_start
             else:
                 save_time = 0.0
@@ -311,40 +326,25 @@ class WebClipIntegratedSystem:
         
         return integrated
 
-    async def _save_webclip_file(self, integrated_result: Dict) -> Dict[str, Any]:
-        """WebClipファイル保存"""
+    async def _save_webclip_file(self, integrated_result: Dict, article_content: str) -> Dict[str, Any]:
+        """WebClipファイル保存（コンテンツアドレス型ストア）"""
         
         try:
-            # 保存先ディレクトリ
-            save_dir = self.project_root / "Data" / "webclips"
-            save_dir.mkdir(parents=True, exist_ok=True)
-            
-            # ファイル名生成
             processing_id = integrated_result["processing_id"]
-            article_title = integrated_result["instant_display"].get("article_summary", {}).get("title", "untitled")
-            safe_title = "".join(c for c in article_title if c.isalnum() or c in " -_")[:50]
-            
-            filename = f"{processing_id}_{safe_title}.md"
-            file_path = save_dir / filename
-            
-            # マークダウンファイル保存
-            markdown_content = integrated_result["structured_data"].get("markdown", "")
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            # JSON保存（詳細分析結果）
-            json_filename = f"{processing_id}_analysis.json"
-            json_path = save_dir / json_filename
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(integrated_result, f, ensure_ascii=False, indent=2)
-            
-            return {
-                "success": True,
-                "markdown_file": str(file_path),
-                "analysis_file": str(json_path),
-                "file_size": file_path.stat().st_size if file_path.exists() else 0
-            }
+            article_summary = integrated_result["instant_display"].get("article_summary", {})
+
+            # マークダウン・詳細分析結果を blob として保存、エントリはマニフェストのみ
+            result = self.content_store.save_entry(
+                "webclip",
+                processing_id,
+                article_content,
+                blobs={
+                    "markdown": integrated_result["structured_data"].get("markdown", ""),
+                    "analysis": integrated_result,
+                },
+                metadata={"title": article_summary.get("title", "untitled")},
+            )
+            return self._build_save_result(result)
             
         except Exception as e:
             self.logger.error(f"❌ ファイル保存エラー: {e}")
@@ -353,6 +353,50 @@ class WebClipIntegratedSystem:
                 "error": str(e)
             }
 
+    def _build_save_result(self, entry: Dict) -> Dict[str, Any]:
+        """保存結果（blob・ストアが返したマニフェストのパス）"""
+
+        blobs = entry["manifest"]["blobs"]
+        return {
+            "success": True,
+            "duplicate": entry["duplicate"],
+            "markdown_file": str(self.content_store.blob_path(blobs["markdown"]["hash"])),
+            "analysis_file": str(self.content_store.blob_path(blobs["analysis"]["hash"])),
+            "manifest_file": entry["manifest_path"],
+            "file_size": blobs["markdown"]["size"]
+        }
+
+    def _build_duplicate_result(
+        self, entry: Dict, processing_id: str, start_time: float
+    ) -> Dict[str, Any]:
+        """重複クリップの応答（保存済み分析結果を再利用）"""
+
+        manifest = entry["manifest"]
+        analysis = self.content_store.read_json(manifest, "analysis")
+        total_time = time.time() - start_time
+        self.integration_stats["total_clips_processed"] += 1
+        self.integration_stats["duplicates_skipped"] += 1
+
+        self.logger.info(
+            f"⏭️ 重複クリップ [{processing_id}] → 既存 {manifest['entry_id']} ({total_time:.3f}s)"
+        )
+
+        return {
+            "success": True,
+            "duplicate": True,
+            "processing_id": processing_id,
+            "instant_display": analysis["instant_display"],
+            "full_analysis": analysis,
+            "performance": {
+                "processing_id": processing_id,
+                "total_time": total_time,
+                "target_achieved": True,
+                "duplicate": True
+            },
+            "save_result": self._build_save_result(entry),
+            "integration_stats": self.integration_stats.copy()
+        }
+
     def _create_error_display(self, title: str, error: str) -> Dict[str, Any]:
         """エラー時表示データ作成"""
         
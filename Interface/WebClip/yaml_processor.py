@@ -18,12 +18,34 @@ V1問題分析結果:
 
 import logging
 import re
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+# libyaml（C実装）が利用可能なら高速版、無ければ純Python版の安全なダンパー・ローダー
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as YAMLDumper
+    from yaml import SafeLoader as YAMLLoader
+
+# Frontmatterスキーマ（モジュール読み込み時に1回だけ構築）
+REQUIRED_FIELDS = ("title", "url", "clipped_at", "type")
+DATETIME_FIELDS = ("clipped_at", "created_at", "updated_at", "published_at")
+VALIDATED_DATETIME_FIELDS = ("clipped_at", "created_at", "updated_at")
+NESTED_FIELDS = ("mirralism", "webclip", "user_context")
+LIST_FIELDS = ("tags", "categories", "themes")
+ESCAPED_STRING_FIELDS = ("title", "description", "notes", "tags")
+YAML_SCALAR_TYPES = (str, int, float, bool, type(None), date)
+
+DATE_ONLY_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+SPACE_SEPARATED_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+NAIVE_DATETIME_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$')
+ISO_DATETIME_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}$')
+
 
 class YAMLFrontmatterProcessor:
     """標準YAML Frontmatter処理システム（V1問題解決）"""
@@ -88,7 +110,7 @@ class YAMLFrontmatterProcessor:
         try:
             self.processing_stats["total_processed"] += 1
             
-            self.logger.info(f"🔧 YAML Frontmatter処理開始: {article_title[:50]}...")
+            self.logger.debug(f"🔧 YAML Frontmatter処理開始: {article_title[:50]}...")
             
             # 1. 基本frontmatter構造生成
             base_frontmatter = self._generate_base_frontmatter(
@@ -101,8 +123,8 @@ class YAMLFrontmatterProcessor:
             # 3. 標準YAML形式での出力生成
             yaml_output = self._generate_yaml_output(validated_frontmatter)
             
-            # 4. エラー検証（V1問題の再発防止）
-            validation_result = self._validate_yaml_output(yaml_output)
+            # 4. エラー検証（V1問題の再発防止、出力元の辞書を直接検証し再解析しない）
+            validation_result = self._validate_frontmatter(validated_frontmatter, yaml_output)
             
             if not validation_result["valid"]:
                 raise Exception(f"YAML検証失敗: {validation_result['errors']}")
@@ -126,7 +148,7 @@ class YAMLFrontmatterProcessor:
                 "processing_stats": self.processing_stats.copy()
             }
             
-            self.logger.info(
+            self.logger.debug(
                 f"✅ YAML処理完了 - V1エラー{len(v1_comparison['prevented_errors'])}件防止"
             )
             
@@ -248,9 +270,7 @@ class YAMLFrontmatterProcessor:
         # 6. null/None値
         # 7. 文字列ではない値
         
-        datetime_fields = ["clipped_at", "created_at", "updated_at", "published_at"]
-        
-        for field in datetime_fields:
+        for field in DATETIME_FIELDS:
             if field in frontmatter:
                 original_value = frontmatter[field]
                 fixed_value = self._standardize_datetime(original_value)
@@ -273,19 +293,19 @@ class YAMLFrontmatterProcessor:
         # V1パターン修正
         try:
             # パターン1: "2025-05-31" → "2025-05-31T00:00:00+00:00"
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+            if DATE_ONLY_PATTERN.match(value):
                 return f"{value}T00:00:00+00:00"
             
             # パターン2: "2025-05-31 00:00:00" → "2025-05-31T00:00:00+00:00"  
-            if re.match(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$', value):
+            if SPACE_SEPARATED_PATTERN.match(value):
                 return value.replace(' ', 'T') + '+00:00'
             
             # パターン3: "2025-05-31T00:00:00" → "2025-05-31T00:00:00+00:00"
-            if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$', value):
+            if NAIVE_DATETIME_PATTERN.match(value):
                 return value + '+00:00'
             
             # 既に正しい形式の場合はそのまま
-            if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}$', value):
+            if ISO_DATETIME_PATTERN.match(value):
                 return value
             
             # ISO形式の検証試行
@@ -327,8 +347,7 @@ class YAMLFrontmatterProcessor:
             return value
         
         # 文字列フィールドの修正
-        string_fields = ["title", "description", "notes", "tags"]
-        for field in string_fields:
+        for field in ESCAPED_STRING_FIELDS:
             if field in frontmatter:
                 frontmatter[field] = fix_string_field(field, frontmatter[field])
         
@@ -340,18 +359,14 @@ class YAMLFrontmatterProcessor:
         fixes = []
         
         # ネストした辞書の検証
-        nested_fields = ["mirralism", "webclip", "user_context"]
-        
-        for field in nested_fields:
+        for field in NESTED_FIELDS:
             if field in frontmatter:
                 if not isinstance(frontmatter[field], dict):
                     frontmatter[field] = {"value": frontmatter[field]}
                     fixes.append(f"構造修正 {field}: 辞書形式に変換")
         
         # リスト形式の検証
-        list_fields = ["tags", "categories", "themes"]
-        
-        for field in list_fields:
+        for field in LIST_FIELDS:
             if field in frontmatter:
                 if not isinstance(frontmatter[field], list):
                     if isinstance(frontmatter[field], str):
@@ -367,28 +382,29 @@ class YAMLFrontmatterProcessor:
         
         fixes = []
         
-        # 必須フィールド
-        required_fields = {
-            "title": "Untitled WebClip",
-            "url": "",
-            "clipped_at": datetime.now(timezone.utc).isoformat(),
-            "type": "webclip"
-        }
-        
-        for field, default_value in required_fields.items():
+        for field in REQUIRED_FIELDS:
             if field not in frontmatter or frontmatter[field] is None:
+                default_value = self._default_field_value(field)
                 frontmatter[field] = default_value
                 fixes.append(f"必須フィールド追加 {field}: {default_value}")
         
         return fixes
 
+    def _default_field_value(self, field: str) -> str:
+        """必須フィールドの既定値（clipped_at は欠損時のみ現在時刻を生成）"""
+
+        if field == "clipped_at":
+            return datetime.now(timezone.utc).isoformat()
+        return {"title": "Untitled WebClip", "url": "", "type": "webclip"}[field]
+
     def _generate_yaml_output(self, frontmatter: Dict[str, Any]) -> str:
         """標準YAMLライブラリでの出力生成"""
         
         try:
-            # 標準yaml.dump使用（V1手動解析の排除）
+            # 標準yaml.dump使用（V1手動解析の排除、安全な型のみ・libyaml優先）
             yaml_content = yaml.dump(
                 frontmatter,
+                Dumper=YAMLDumper,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=False,
@@ -403,49 +419,91 @@ class YAMLFrontmatterProcessor:
             # フォールバック: 基本的なYAML出力
             return self._generate_fallback_yaml(frontmatter)
 
-    def _validate_yaml_output(self, yaml_output: str) -> Dict[str, Any]:
-        """YAML出力の検証（V1問題再発防止）"""
+    def _validate_frontmatter(self, frontmatter: Dict[str, Any], yaml_output: str) -> Dict[str, Any]:
+        """生成元の辞書によるYAML出力検証（出力テキストの再解析を省略）
+
+        安全なダンパーで出力できた辞書は safe_load で同値に復元されるため、
+        型がYAMLの基本型に収まることを確認した上で辞書を直接検証する。
+        """
+
+        validation_result = self._new_validation_result()
+        unsupported = self._find_unsupported_value(frontmatter)
+        if unsupported is not None:
+            validation_result["errors"].append(f"YAML非対応の値: {unsupported}")
+            validation_result["valid"] = False
+            return validation_result
         
-        validation_result = {
+        self._check_parsed_frontmatter(self._extract_yaml_content(yaml_output), frontmatter, validation_result)
+        return validation_result
+
+    def _find_unsupported_value(self, value: Any, path: str = "") -> Optional[str]:
+        """YAML基本型以外の値の位置（無ければ None）"""
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                found = self._find_unsupported_value(item, f"{path}.{key}" if path else str(key))
+                if found is not None:
+                    return found
+            return None
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                found = self._find_unsupported_value(item, f"{path}[{index}]")
+                if found is not None:
+                    return found
+            return None
+        return None if isinstance(value, YAML_SCALAR_TYPES) else f"{path} ({type(value).__name__})"
+
+    def _new_validation_result(self) -> Dict[str, Any]:
+        return {
             "valid": True,
             "errors": [],
             "warnings": [],
             "v1_patterns_checked": 0
         }
+
+    def _check_parsed_frontmatter(
+        self, yaml_content: str, parsed: Dict[str, Any], validation_result: Dict[str, Any]
+    ):
+        """V1エラーパターン・必須フィールド・DateTime形式の検証"""
+
+        # V1エラーパターンの検証
+        v1_checks = self._check_v1_error_patterns(yaml_content, parsed)
+        validation_result["v1_patterns_checked"] = len(v1_checks)
+
+        for check in v1_checks:
+            if not check["passed"]:
+                validation_result["errors"].append(f"V1問題検出: {check['pattern']}")
+                validation_result["valid"] = False
+
+        # 必須フィールドの検証
+        for field in REQUIRED_FIELDS:
+            if field not in parsed:
+                validation_result["errors"].append(f"必須フィールド欠損: {field}")
+                validation_result["valid"] = False
+
+        # DateTime形式の検証
+        for field in VALIDATED_DATETIME_FIELDS:
+            if field in parsed:
+                if not self._is_valid_datetime(parsed[field]):
+                    validation_result["errors"].append(f"不正なDateTime形式: {field}")
+                    validation_result["valid"] = False
+
+    def _validate_yaml_output(self, yaml_output: str) -> Dict[str, Any]:
+        """YAML出力テキストの検証（外部由来のfrontmatter向け、V1問題再発防止）"""
+
+        validation_result = self._new_validation_result()
         
         try:
-            # 1. 標準YAMLパーサーでの検証
+            # 標準YAMLパーサーでの検証
             yaml_content = self._extract_yaml_content(yaml_output)
-            parsed = yaml.safe_load(yaml_content)
+            parsed = yaml.load(yaml_content, Loader=YAMLLoader)
             
             if not isinstance(parsed, dict):
                 validation_result["errors"].append("YAML構造が辞書形式ではありません")
                 validation_result["valid"] = False
                 return validation_result
             
-            # 2. V1エラーパターンの検証
-            v1_checks = self._check_v1_error_patterns(yaml_content, parsed)
-            validation_result["v1_patterns_checked"] = len(v1_checks)
-            
-            for check in v1_checks:
-                if not check["passed"]:
-                    validation_result["errors"].append(f"V1問題検出: {check['pattern']}")
-                    validation_result["valid"] = False
-            
-            # 3. 必須フィールドの検証
-            required_fields = ["title", "url", "clipped_at", "type"]
-            for field in required_fields:
-                if field not in parsed:
-                    validation_result["errors"].append(f"必須フィールド欠損: {field}")
-                    validation_result["valid"] = False
-            
-            # 4. DateTime形式の検証
-            datetime_fields = ["clipped_at", "created_at", "updated_at"]
-            for field in datetime_fields:
-                if field in parsed:
-                    if not self._is_valid_datetime(parsed[field]):
-                        validation_result["errors"].append(f"不正なDateTime形式: {field}")
-                        validation_result["valid"] = False
+            self._check_parsed_frontmatter(yaml_content, parsed, validation_result)
             
         except yaml.YAMLError as e:
             validation_result["errors"].append(f"YAML解析エラー: {e}")
@@ -470,7 +528,7 @@ class YAMLFrontmatterProcessor:
         
         # V1パターン2: DateTime形式問題  
         datetime_check = True
-        for field in ["clipped_at", "created_at", "updated_at"]:
+        for field in VALIDATED_DATETIME_FIELDS:
             if field in parsed_data:
                 if not self._is_valid_datetime(parsed_data[field]):
                     datetime_check = False
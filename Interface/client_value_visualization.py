@@ -10,6 +10,7 @@ MIRRALISM Principles: 透明性、価値創造、ユーザー中心設計
 """
 
 import asyncio
+import copy
 import json
 import time
 import logging
@@ -51,13 +52,16 @@ class ValueVisualization:
 class ClientValueVisualizationSystem:
     """クライアント価値可視化システム"""
     
-    def __init__(self):
-        self.project_root = Path(__file__).parent.parent
+    def __init__(self, project_root: Optional[Path] = None):
+        self.project_root = Path(project_root or Path(__file__).parent.parent)
         self.data_dir = self.project_root / "Data" / "value_visualization"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         # 価値創造エンジン統合
-        self.value_engine = MIRRALISMValueCreationEngine()
+        self.value_engine = MIRRALISMValueCreationEngine(self.project_root)
+
+        # ダッシュボードのマテリアライズ（(モード, クライアント) → (データ版, ダッシュボード)）
+        self._dashboard_cache: Dict[Tuple[str, str], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
         
         # 可視化設定
         self.visualization_templates = {
@@ -166,9 +170,36 @@ class ClientValueVisualizationSystem:
             ]
         }
         
+    def _cached_dashboard(self, mode: str, client_name: str,
+                          data_version: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """同一データ版で生成済みのダッシュボード"""
+        cached = self._dashboard_cache.get((mode, client_name))
+        if cached is not None and cached[0] == data_version:
+            return copy.deepcopy(cached[1])
+        return None
+
+    def _store_dashboard(self, mode: str, client_name: str,
+                         data_version: Dict[str, Any], dashboard: Dict[str, Any]) -> Dict[str, Any]:
+        """生成済みダッシュボードをデータ版付きで保持"""
+        self._dashboard_cache[(mode, client_name)] = (data_version, copy.deepcopy(dashboard))
+        return dashboard
+
+    def generate_all_dashboards(self, client_name: str = "黒澤工務店") -> Dict[str, Dict[str, Any]]:
+        """全ダッシュボード生成（価値創造レポートは1回のみ計算して共有）"""
+        return {
+            "executive_summary": self.generate_executive_dashboard(client_name),
+            "detailed_analytics": self.generate_detailed_analytics_dashboard(client_name),
+            "roi_analysis": self.generate_roi_analysis_dashboard(client_name)
+        }
+
     def generate_executive_dashboard(self, client_name: str = "黒澤工務店") -> Dict[str, Any]:
         """経営ダッシュボード生成"""
         try:
+            data_version = self.value_engine.data_version()
+            cached = self._cached_dashboard("executive_summary", client_name, data_version)
+            if cached is not None:
+                return cached
+
             # 価値創造レポート取得
             value_report = self.value_engine.generate_value_creation_report(client_name)
             
@@ -250,7 +281,8 @@ class ClientValueVisualizationSystem:
                 ]
             }
             
-            return executive_dashboard
+            return self._store_dashboard("executive_summary", client_name,
+                                         data_version, executive_dashboard)
             
         except Exception as e:
             logging.error(f"❌ Failed to generate executive dashboard: {e}")
@@ -381,6 +413,11 @@ class ClientValueVisualizationSystem:
     def generate_detailed_analytics_dashboard(self, client_name: str = "黒澤工務店") -> Dict[str, Any]:
         """詳細分析ダッシュボード生成"""
         try:
+            data_version = self.value_engine.data_version()
+            cached = self._cached_dashboard("detailed_analytics", client_name, data_version)
+            if cached is not None:
+                return cached
+
             # 価値創造レポート取得
             value_report = self.value_engine.generate_value_creation_report(client_name)
             
@@ -419,7 +456,8 @@ class ClientValueVisualizationSystem:
                 }
             }
             
-            return detailed_analytics
+            return self._store_dashboard("detailed_analytics", client_name,
+                                         data_version, detailed_analytics)
             
         except Exception as e:
             logging.error(f"❌ Failed to generate detailed analytics: {e}")
@@ -572,6 +610,11 @@ class ClientValueVisualizationSystem:
     def generate_roi_analysis_dashboard(self, client_name: str = "黒澤工務店") -> Dict[str, Any]:
         """ROI分析ダッシュボード生成"""
         try:
+            data_version = self.value_engine.data_version()
+            cached = self._cached_dashboard("roi_analysis", client_name, data_version)
+            if cached is not None:
+                return cached
+
             # 価値創造レポート取得
             value_report = self.value_engine.generate_value_creation_report(client_name)
             
@@ -614,7 +657,8 @@ class ClientValueVisualizationSystem:
                 "profitability_index": total_returns / total_investment
             }
             
-            return roi_analysis
+            return self._store_dashboard("roi_analysis", client_name,
+                                         data_version, roi_analysis)
             
         except Exception as e:
             logging.error(f"❌ Failed to generate ROI analysis: {e}")
@@ -10,21 +10,83 @@ MIRRALISM Enhanced Transparency System
 - ユーザー体験の質的差別化
 - 判断プロセスの完全透明化
 - フィードバック学習の可視化
+
+性能方針:
+- フィードバックログは索引化してプロセス内で共有（ファイル更新時のみ再読み込み）
+- 判断説明は分析結果ハッシュ単位でメモ化
+- チャート画像の描画（matplotlib）は任意機能として初回描画時のみ読み込み
 """
 
+import copy
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 from dataclasses import dataclass
 
 # ログ設定
 logger = logging.getLogger(__name__)
 
+# 判断説明メモ化の保持件数
+EXPLANATION_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class FeedbackIndex:
+    """フィードバックログの索引"""
+
+    signature: Optional[Tuple[int, int]]  # (mtime_ns, サイズ)、ファイルなしは None
+    data: Dict[str, Any]
+
+
+# フィードバックログ索引のプロセス内キャッシュ（パス単位）
+_feedback_index_cache: Dict[Path, FeedbackIndex] = {}
+_feedback_index_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _build_feedback_index(feedback_log_path: Path, signature: Optional[Tuple[int, int]]) -> FeedbackIndex:
+    """フィードバックログの読み込み・索引化"""
+    data = {"reviews": [], "learned_rules": {}}
+    try:
+        if signature is not None:
+            with open(feedback_log_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            logger.info(f"既存フィードバックデータ読み込み完了: {len(data.get('reviews', []))}件")
+        else:
+            logger.info("新規フィードバックデータ初期化")
+    except Exception as e:
+        logger.error(f"フィードバックデータ読み込みエラー: {e}")
+        data = {"reviews": [], "learned_rules": {}}
+
+    return FeedbackIndex(signature=signature, data=data)
+
+
+def load_feedback_index(feedback_log_path: Path) -> FeedbackIndex:
+    """フィードバックログ索引の取得（ファイル未更新時はキャッシュを返す）"""
+    signature = _file_signature(feedback_log_path)
+    with _feedback_index_lock:
+        cached = _feedback_index_cache.get(feedback_log_path)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    index = _build_feedback_index(feedback_log_path, signature)
+    with _feedback_index_lock:
+        _feedback_index_cache[feedback_log_path] = index
+    return index
+
 
 @dataclass
 class TransparencyReport:
@@ -61,24 +123,22 @@ class EnhancedTransparencySystem:
             "confidence_threshold": 0.7,  # 信頼度閾値
         }
         
+        # 判断説明のメモ化（分析結果ハッシュ → 説明内容）
+        self._explanation_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._explanation_lock = threading.Lock()
+
+        # チャート描画バックエンド（初回描画時に読み込み）
+        self._chart_figure_class = None
+
         # 既存フィードバックデータ読み込み
         self.load_existing_feedback()
         
         logger.info("強化透明性システム初期化完了")
     
     def load_existing_feedback(self):
-        """既存フィードバックデータ読み込み"""
-        try:
-            if self.feedback_log_path.exists():
-                with open(self.feedback_log_path, 'r', encoding='utf-8') as f:
-                    self.feedback_data = json.load(f)
-                logger.info(f"既存フィードバックデータ読み込み完了: {len(self.feedback_data.get('reviews', []))}件")
-            else:
-                self.feedback_data = {"reviews": [], "learned_rules": {}}
-                logger.info("新規フィードバックデータ初期化")
-        except Exception as e:
-            logger.error(f"フィードバックデータ読み込みエラー: {e}")
-            self.feedback_data = {"reviews": [], "learned_rules": {}}
+        """既存フィードバックデータ読み込み（索引キャッシュ経由）"""
+        self.feedback_index = load_feedback_index(self.feedback_log_path)
+        self.feedback_data = self.feedback_index.data
     
     def generate_enhanced_explanation(self, analysis_result: Dict[str, Any]) -> TransparencyReport:
         """強化された判断説明生成
@@ -89,33 +149,56 @@ class EnhancedTransparencySystem:
         Returns:
             透明性レポート
         """
-        analysis_id = f"transparency_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        # 判断根拠の詳細分析
-        decision_rationale = self._analyze_decision_rationale(analysis_result)
-        
-        # 信頼度の要素分解
-        confidence_breakdown = self._breakdown_confidence_factors(analysis_result)
-        
-        # エビデンス追跡
-        evidence_trail = self._build_evidence_trail(analysis_result)
-        
-        # 学習インパクト分析
-        learning_impact = self._analyze_learning_impact(analysis_result)
-        
-        # ユーザー向けアクション可能洞察
-        actionable_insights = self._generate_actionable_insights(analysis_result)
+        self.load_existing_feedback()
+        return self._explain(analysis_result)
+
+    def generate_enhanced_explanations(self, analysis_results: List[Dict[str, Any]]) -> List[TransparencyReport]:
+        """複数分析結果の判断説明一括生成（フィードバック索引の確認は1回のみ）"""
+        self.load_existing_feedback()
+        return [self._explain(analysis_result) for analysis_result in analysis_results]
+
+    def _explain(self, analysis_result: Dict[str, Any]) -> TransparencyReport:
+        """判断説明の生成（同一分析結果・同一フィードバック版はメモ化結果を再利用）"""
+        cache_key = self._explanation_key(analysis_result)
+        with self._explanation_lock:
+            sections = self._explanation_cache.get(cache_key)
+            if sections is not None:
+                self._explanation_cache.move_to_end(cache_key)
+
+        if sections is None:
+            sections = {
+                # 判断根拠の詳細分析
+                "decision_rationale": self._analyze_decision_rationale(analysis_result),
+                # 信頼度の要素分解
+                "confidence_breakdown": self._breakdown_confidence_factors(analysis_result),
+                # エビデンス追跡
+                "evidence_trail": self._build_evidence_trail(analysis_result),
+                # 学習インパクト分析
+                "learning_impact": self._analyze_learning_impact(analysis_result),
+                # ユーザー向けアクション可能洞察
+                "user_actionable_insights": self._generate_actionable_insights(analysis_result)
+            }
+            with self._explanation_lock:
+                self._explanation_cache[cache_key] = sections
+                while len(self._explanation_cache) > EXPLANATION_CACHE_SIZE:
+                    self._explanation_cache.popitem(last=False)
         
         return TransparencyReport(
-            analysis_id=analysis_id,
+            analysis_id=f"transparency_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             timestamp=datetime.now(),
-            decision_rationale=decision_rationale,
-            confidence_breakdown=confidence_breakdown,
-            evidence_trail=evidence_trail,
-            learning_impact=learning_impact,
-            user_actionable_insights=actionable_insights
+            **copy.deepcopy(sections)
         )
     
+    def _explanation_key(self, analysis_result: Dict[str, Any]) -> str:
+        """分析結果とフィードバック版によるメモ化キー"""
+        payload = json.dumps(
+            {"analysis_result": analysis_result, "feedback": self.feedback_index.signature},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def _analyze_decision_rationale(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         """判断根拠の詳細分析"""
         
@@ -303,6 +386,40 @@ class EnhancedTransparencySystem:
         
         return chart_data
     
+    def render_confidence_chart(self, confidence_breakdown: Dict[str, float], output_path: Path) -> Path:
+        """信頼度レーダーチャートの画像出力（任意機能、matplotlib が必要）"""
+        import math
+
+        chart_data = self._create_confidence_chart(confidence_breakdown)
+        figure_class = self._load_chart_backend()
+
+        angles = [2 * math.pi * i / len(chart_data["factors"]) for i in range(len(chart_data["factors"]))]
+        values = chart_data["values"]
+
+        figure = figure_class(figsize=(6, 6))
+        axes = figure.add_subplot(projection="polar")
+        axes.plot(angles + angles[:1], values + values[:1])
+        axes.fill(angles + angles[:1], values + values[:1], alpha=0.25)
+        axes.set_xticks(angles)
+        axes.set_xticklabels(chart_data["factors"])
+        axes.set_ylim(0, 1)
+        axes.set_title(f"overall_confidence: {chart_data['overall_score']:.1%}")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        figure.savefig(output_path)
+        return output_path
+
+    def _load_chart_backend(self):
+        """描画バックエンドの遅延読み込み（pyplot を使わず Figure を直接生成）"""
+        if self._chart_figure_class is None:
+            try:
+                from matplotlib.figure import Figure
+            except ImportError as e:
+                raise RuntimeError("チャート画像の出力には matplotlib が必要です") from e
+            self._chart_figure_class = Figure
+        return self._chart_figure_class
+
     def _interpret_confidence_pattern(self, factors: Dict[str, float]) -> str:
         """信頼度パターンの解釈"""
         
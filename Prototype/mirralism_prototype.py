@@ -14,13 +14,129 @@ CTOのPhase 1評価用プロトタイプ：
 評価実施: 段階的検証
 """
 
+import heapq
+import itertools
 import json
 import logging
+import os
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from search_index import SearchIndex  # noqa: E402
+
+# V1知見の分類パターン
+V1_PATTERNS = {
+    "meeting": ["会議", "ミーティング", "discussion", "打ち合わせ"],
+    "personal": ["個人", "プライベート", "日記", "思考"],
+    "work": ["作業", "タスク", "プロジェクト", "仕事"],
+    "idea": ["アイデア", "発想", "創作", "ひらめき"],
+    "learning": ["学習", "勉強", "リサーチ", "調査"],
+}
+
+# バックログ処理: 1チャンクのファイル数・処理中チャンク数上限（ワーカー数比）・進捗ログ間隔
+PIPELINE_CHUNK_SIZE = 64
+PIPELINE_PENDING_PER_WORKER = 2
+PIPELINE_LOG_EVERY = 1000
+
+
+def classify_text(
+    audio_content: str, patterns: Dict[str, List[str]] = V1_PATTERNS
+) -> Dict[str, Any]:
+    """音声コンテンツ分類（ログなし・プロセス間で共有可能な純関数）"""
+    content = audio_content.lower()
+    scores = {
+        category: sum(1 for pattern in category_patterns if pattern.lower() in content)
+        for category, category_patterns in patterns.items()
+    }
+
+    # 最高スコアカテゴリを決定
+    if not any(scores.values()):
+        category = "uncategorized"
+        confidence = 0.3
+    else:
+        category = max(scores.keys(), key=lambda k: scores[k])
+        total_patterns = sum(
+            len(category_patterns) for category_patterns in patterns.values()
+        )
+        confidence = min(0.95, max(0.6, scores[category] / total_patterns * 4))
+
+    return {
+        "category": category,
+        "confidence": confidence,
+        "detailed_scores": scores,
+        "processing_time": datetime.now().isoformat(),
+        "mirralism_version": "V2_PROTOTYPE",
+        "improvement_over_v1": f"{confidence * 100:.1f}% vs 53% (V1)",
+    }
+
+
+def _classify_chunk(contents: List[str]) -> List[Dict[str, Any]]:
+    """ワーカープロセスでのチャンク分類"""
+    return [classify_text(content) for content in contents]
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def classify_stream(
+    items: Iterable[Tuple[str, Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = PIPELINE_CHUNK_SIZE,
+) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+    """(内容, メタデータ) → (内容, メタデータ, 分類結果) を入力順に生成
+
+    複数コアでチャンク単位に並列分類する。処理中チャンク数を
+    ワーカー数 × PIPELINE_PENDING_PER_WORKER までに制限し、
+    下流が消費するまで読み込みを進めない（背圧）。
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        for content, metadata in items:
+            yield content, metadata, classify_text(content)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunked(items, chunk_size):
+            pending.append(
+                (chunk, pool.submit(_classify_chunk, [content for content, _ in chunk]))
+            )
+            if len(pending) >= workers * PIPELINE_PENDING_PER_WORKER:
+                chunk, future = pending.popleft()
+                for (content, metadata), classification in zip(chunk, future.result()):
+                    yield content, metadata, classification
+        while pending:
+            chunk, future = pending.popleft()
+            for (content, metadata), classification in zip(chunk, future.result()):
+                yield content, metadata, classification
+
+
+def read_transcripts(paths: Iterable[Path]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """音声書き起こしファイルを1件ずつ読み込み"""
+    for path in paths:
+        path = Path(path)
+        yield path.read_text(encoding="utf-8"), {
+            "source": str(path),
+            "size": path.stat().st_size,
+        }
 
 
 class MirralismLogger:
@@ -59,13 +175,7 @@ class AudioClassifier:
 
     def __init__(self, logger: MirralismLogger):
         self.logger = logger
-        self.v1_patterns = {
-            "meeting": ["会議", "ミーティング", "discussion", "打ち合わせ"],
-            "personal": ["個人", "プライベート", "日記", "思考"],
-            "work": ["作業", "タスク", "プロジェクト", "仕事"],
-            "idea": ["アイデア", "発想", "創作", "ひらめき"],
-            "learning": ["学習", "勉強", "リサーチ", "調査"],
-        }
+        self.v1_patterns = V1_PATTERNS
         self.logger.log_step("AudioClassifier初期化", f"パターン数: {len(self.v1_patterns)}")
 
     def classify_content(self, audio_content: str) -> Dict[str, Any]:
@@ -75,35 +185,11 @@ class AudioClassifier:
         """
         self.logger.log_step("音声分類開始", f"コンテンツ長: {len(audio_content)}")
 
-        # V1パターンマッチング改良版
-        scores = {}
-        for category, patterns in self.v1_patterns.items():
-            score = sum(
-                1 for pattern in patterns if pattern.lower() in audio_content.lower()
-            )
-            scores[category] = score
-
-        # 最高スコアカテゴリを決定
-        if not any(scores.values()):
-            category = "uncategorized"
-            confidence = 0.3
-        else:
-            category = max(scores.keys(), key=lambda k: scores[k])
-            total_patterns = sum(
-                len(patterns) for patterns in self.v1_patterns.values()
-            )
-            confidence = min(0.95, max(0.6, scores[category] / total_patterns * 4))
-
-        result = {
-            "category": category,
-            "confidence": confidence,
-            "detailed_scores": scores,
-            "processing_time": datetime.now().isoformat(),
-            "mirralism_version": "V2_PROTOTYPE",
-            "improvement_over_v1": f"{confidence * 100:.1f}% vs 53% (V1)",
-        }
+        result = classify_text(audio_content, self.v1_patterns)
 
-        self.logger.log_success(f"分類完了: {category} (信頼度: {confidence:.2f})")
+        self.logger.log_success(
+            f"分類完了: {result['category']} (信頼度: {result['confidence']:.2f})"
+        )
         return result
 
 
@@ -115,10 +201,18 @@ class FileManager:
         self.max_files = 500
         self.logger.log_step("FileManager初期化", f"最大ファイル数: {self.max_files}")
 
+    @staticmethod
+    def _classification(file_data: Dict[str, Any]) -> Dict[str, Any]:
+        """分類結果（process_audio_file 形式は classification 配下）"""
+        return file_data.get("classification", file_data)
+
+    def _confidence(self, file_data: Dict[str, Any]) -> float:
+        return self._classification(file_data).get("confidence", 0)
+
     def should_keep_file(self, file_data: Dict[str, Any]) -> bool:
         """ファイル保持判定 - 99%削減アルゴリズム"""
-        confidence = file_data.get("confidence", 0)
-        category = file_data.get("category", "")
+        confidence = self._confidence(file_data)
+        category = self._classification(file_data).get("category", "")
 
         # 高信頼度またはクリティカルカテゴリは保持
         if confidence > 0.8 or category in ["meeting", "work"]:
@@ -137,9 +231,9 @@ class FileManager:
 
         # 500ファイル制限適用
         if len(kept_files) > self.max_files:
-            kept_files = sorted(
-                kept_files, key=lambda x: x.get("confidence", 0), reverse=True
-            )[: self.max_files]
+            kept_files = sorted(kept_files, key=self._confidence, reverse=True)[
+                : self.max_files
+            ]
 
         reduction_rate = (
             (len(classified_files) - len(kept_files)) / len(classified_files) * 100
@@ -150,50 +244,78 @@ class FileManager:
         )
         return kept_files
 
+    def select_stream(
+        self, classified_files: Iterable[Dict[str, Any]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """ストリーム上のファイル管理: ("keep" | "evict" | "discard", ファイル) を生成
+
+        保持ファイルは信頼度の最小ヒープで max_files 件に制限し、
+        上限超過時は信頼度最小（同値は先着）のファイルを evict する。
+        """
+        heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        for sequence, file_data in enumerate(classified_files):
+            if not self.should_keep_file(file_data):
+                yield "discard", file_data
+                continue
+            entry = (self._confidence(file_data), -sequence, file_data)
+            if len(heap) < self.max_files:
+                heapq.heappush(heap, entry)
+                yield "keep", file_data
+            elif entry[:2] > heap[0][:2]:
+                evicted = heapq.heapreplace(heap, entry)[2]
+                yield "keep", file_data
+                yield "evict", evicted
+            else:
+                yield "discard", file_data
+
 
 class SearchEngine:
-    """瞬時検索システム - プロトタイプ版"""
+    """瞬時検索システム - プロトタイプ版（search_index の転置インデックス・BM25 を利用）"""
 
     def __init__(self, logger: MirralismLogger):
         self.logger = logger
-        self.index = {}
+        self._index_dir = tempfile.TemporaryDirectory(prefix="mirralism_search_")
+        self.index = SearchIndex(Path(self._index_dir.name))
         self.logger.log_step("SearchEngine初期化")
 
     def build_index(self, files: List[Dict[str, Any]]):
-        """検索インデックス構築"""
+        """検索インデックス構築（file_id、無ければ並び順をキーとして登録）"""
         self.logger.log_step("インデックス構築開始", f"対象ファイル数: {len(files)}")
 
         for i, file_data in enumerate(files):
-            content = file_data.get("content", "")
-            category = file_data.get("category", "")
+            self.add_file(self._file_key(i, file_data), file_data)
+        self.commit()
+
+        self.logger.log_success(f"インデックス構築完了: {len(self.index)}文書")
 
-            # 簡易インデックス作成
-            words = content.lower().split()
-            for word in words:
-                if word not in self.index:
-                    self.index[word] = []
-                self.index[word].append(i)
+    @staticmethod
+    def _file_key(position: int, file_data: Dict[str, Any]) -> str:
+        return file_data.get("file_id") or str(position)
+
+    def add_file(self, key: str, file_data: Dict[str, Any]):
+        """ファイルの追加（commit 後に検索対象）"""
+        content = file_data.get("content", "")
+        category = file_data.get("category") or file_data.get("classification", {}).get(
+            "category", ""
+        )
+        self.index.add_document(key, f"{content}\n{category}")
 
-            # カテゴリインデックス
-            if category not in self.index:
-                self.index[category] = []
-            self.index[category].append(i)
+    def remove_file(self, key: str):
+        self.index.delete_document(key)
 
-        self.logger.log_success(f"インデックス構築完了: {len(self.index)}語彙")
+    def commit(self):
+        self.index.flush()
 
     def search(self, query: str, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """瞬時検索実行 - 5秒以内目標"""
+        """瞬時検索実行 - 5秒以内目標（いずれかの語を含むファイルを関連度順に返す）"""
         start_time = datetime.now()
         self.logger.log_step("検索開始", f"クエリ: {query}")
 
-        query_words = query.lower().split()
-        result_indices = set()
-
-        for word in query_words:
-            if word in self.index:
-                result_indices.update(self.index[word])
-
-        results = [files[i] for i in result_indices if i < len(files)]
+        files_by_key = {
+            self._file_key(i, file_data): file_data for i, file_data in enumerate(files)
+        }
+        hits = self.index.search(query, limit=max(len(files), 1), mode="or")
+        results = [files_by_key[hit.key] for hit in hits if hit.key in files_by_key]
 
         # 検索時間測定
         search_time = (datetime.now() - start_time).total_seconds()
@@ -205,8 +327,9 @@ class SearchEngine:
 class MirralismPrototype:
     """MIRRALISM V2 プロトタイプメインクラス"""
 
-    def __init__(self):
-        self.logger = MirralismLogger()
+    def __init__(self, logger: Optional[MirralismLogger] = None):
+        self.logger = logger or MirralismLogger()
+        self._file_sequence = itertools.count(1)
         self.classifier = AudioClassifier(self.logger)
         self.file_manager = FileManager(self.logger)
         self.search_engine = SearchEngine(self.logger)
@@ -227,13 +350,7 @@ class MirralismPrototype:
             classification = self.classifier.classify_content(audio_content)
 
             # Step 2: ファイルデータ作成
-            file_data = {
-                "content": audio_content,
-                "classification": classification,
-                "metadata": metadata,
-                "processing_timestamp": datetime.now().isoformat(),
-                "file_id": f"prototype_{int(datetime.now().timestamp())}",
-            }
+            file_data = self._build_file_data(audio_content, metadata, classification)
 
             self.logger.log_success("音声ファイル処理完了")
             return file_data
@@ -242,6 +359,75 @@ class MirralismPrototype:
             self.logger.log_error("音声ファイル処理失敗", e)
             raise
 
+    def _build_file_data(
+        self,
+        audio_content: str,
+        metadata: Dict[str, Any],
+        classification: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        now = datetime.now()
+        return {
+            "content": audio_content,
+            "classification": classification,
+            "metadata": metadata,
+            "processing_timestamp": now.isoformat(),
+            "file_id": f"prototype_{int(now.timestamp())}_{next(self._file_sequence)}",
+        }
+
+    def process_backlog(
+        self,
+        audio_items: Iterable[Tuple[str, Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        log_every: int = PIPELINE_LOG_EVERY,
+    ) -> Dict[str, Any]:
+        """音声バックログのストリーム処理: 読み込み → 分類 → 保持判定 → 索引
+
+        各段はジェネレータで連結され、メモリ上には処理中チャンクと
+        保持ファイル（最大 max_files 件）のみを持つ。進捗ログは log_every 件毎。
+        """
+        self.logger.log_step("バックログ処理開始", f"ワーカー数: {max_workers or os.cpu_count()}")
+        started = datetime.now()
+        stats = {"processed": 0, "kept": 0, "discarded": 0, "evicted": 0}
+        confidence_total = 0.0
+        kept: Dict[str, Dict[str, Any]] = {}
+
+        def classified_files() -> Iterator[Dict[str, Any]]:
+            nonlocal confidence_total
+            for content, metadata, classification in classify_stream(
+                audio_items, max_workers
+            ):
+                stats["processed"] += 1
+                confidence_total += classification["confidence"]
+                if stats["processed"] % log_every == 0:
+                    self.logger.log_step("バックログ処理中", dict(stats))
+                yield self._build_file_data(content, metadata, classification)
+
+        for action, file_data in self.file_manager.select_stream(classified_files()):
+            if action == "keep":
+                kept[file_data["file_id"]] = file_data
+                self.search_engine.add_file(file_data["file_id"], file_data)
+                stats["kept"] += 1
+            elif action == "evict":
+                del kept[file_data["file_id"]]
+                self.search_engine.remove_file(file_data["file_id"])
+                stats["evicted"] += 1
+            else:
+                stats["discarded"] += 1
+        self.search_engine.commit()
+
+        elapsed = (datetime.now() - started).total_seconds()
+        summary = {
+            **stats,
+            "files_kept": len(kept),
+            "classification_accuracy": confidence_total / stats["processed"]
+            if stats["processed"]
+            else 0.0,
+            "elapsed_seconds": elapsed,
+            "files_per_second": stats["processed"] / elapsed if elapsed else 0.0,
+        }
+        self.logger.log_success(f"バックログ処理完了: {summary}")
+        return {**summary, "kept_files": list(kept.values())}
+
     def demonstrate_full_flow(self) -> Dict[str, Any]:
         """完全フロー実証 - CTOデモ用"""
         self.logger.log_step("=== MIRRALISM V2 フルフローデモ開始 ===")
@@ -266,34 +452,27 @@ class MirralismPrototype:
             },
         ]
 
-        # Step 1: 全ファイル処理
-        processed_files = []
-        for audio_data in sample_audio_data:
-            file_result = self.process_audio_file(
-                audio_data["content"], audio_data["metadata"]
-            )
-            processed_files.append(file_result)
-
-        # Step 2: ファイル管理
-        managed_files = self.file_manager.manage_files(processed_files)
-
-        # Step 3: 検索システム構築
-        self.search_engine.build_index(managed_files)
+        # Step 1-3: 分類・ファイル管理・検索インデックス構築（ストリーム処理）
+        backlog = self.process_backlog(
+            (
+                (audio_data["content"], audio_data["metadata"])
+                for audio_data in sample_audio_data
+            ),
+            max_workers=1,
+        )
+        managed_files = backlog["kept_files"]
 
         # Step 4: 検索デモ
         search_results = self.search_engine.search("会議 プロジェクト", managed_files)
 
         # Step 5: 結果サマリー
         demo_results = {
-            "total_processed": len(processed_files),
-            "files_kept": len(managed_files),
+            "total_processed": backlog["processed"],
+            "files_kept": backlog["files_kept"],
             "search_results": len(search_results),
-            "classification_accuracy": sum(
-                f["classification"]["confidence"] for f in processed_files
-            )
-            / len(processed_files),
+            "classification_accuracy": backlog["classification_accuracy"],
             "v1_improvement": "95% vs 53% (79% improvement)",
-            "file_reduction": f"{(len(sample_audio_data) - len(managed_files)) / len(sample_audio_data) * 100:.1f}% reduction",
+            "file_reduction": f"{(backlog['processed'] - backlog['files_kept']) / backlog['processed'] * 100:.1f}% reduction",
             "timestamp": datetime.now().isoformat(),
             "status": "SUCCESS",
         }
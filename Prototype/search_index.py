@@ -0,0 +1,1003 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM 全文検索インデックス
+============================
+
+プロトタイプ SearchEngine（空白分割・メモリ内辞書）を置き換える検索サブシステム。
+音声書き起こし・WebClip・リサーチ・クライアント資料を対象とする。
+
+- 日本語対応トークナイズ: NFKC 正規化後、かな・漢字の連続部は文字 bigram
+  （連続部末尾の1文字も単独語として登録）、それ以外は小文字化した単語
+- 転置リストは位置情報付き・可変長整数の差分符号化、128文書ブロック単位のスキップ表
+- BM25 ランキング（既定は全語 AND、3文字以上の日本語語句は位置の連続で語句一致）
+- 追加文書はメモリ上に蓄積し flush() で不変セグメントとして書き出し（増分インデックス）
+- セグメントは mmap で参照する単一ファイル形式、構成と削除文書はマニフェストで管理
+
+作成者: MIRRALISM自律技術者
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import unicodedata
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+# かな・漢字（bigram 対象）
+_CJK_CHARS = "々぀-ヿ㐀-䶿一-鿿豈-﫿"
+_TOKEN_RE = re.compile(f"[{_CJK_CHARS}]+|[^\\W_{_CJK_CHARS}]+")
+_CJK_RE = re.compile(f"[{_CJK_CHARS}]")
+
+# 単語の最大長（異常に長い英数字列の切り詰め）
+MAX_TERM_CHARS = 64
+
+# BM25 パラメータ
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 転置リストのブロック長（スキップ表の粒度）
+BLOCK_SIZE = 128
+
+# 候補数×この値が文書頻度未満ならスキップ表で参照、以上なら転置リストを全復号
+SEEK_RATIO = 8
+
+# 索引対象の拡張子
+INDEXED_SUFFIXES = (".md", ".txt")
+
+# セグメントファイル形式
+SEGMENT_MAGIC = b"MRSX"
+SEGMENT_VERSION = 1
+# magic, 版, 文書数, 語数, 総語長, 文書表, メタ情報, 転置リスト, 語表, 語文字列 の各オフセット
+_HEADER = struct.Struct("<4sIIIQQQQQQ")
+# 文書長, メタ情報オフセット, メタ情報長
+_DOC_ENTRY = struct.Struct("<IQI")
+# 語文字列オフセット, 語文字列長, 文書頻度, 転置リストオフセット, 転置リスト長
+_TERM_ENTRY = struct.Struct("<QIIQQ")
+
+MANIFEST_NAME = "manifest.json"
+
+
+# ----------------------------------------------------------------------
+# トークナイズ
+# ----------------------------------------------------------------------
+def normalize(text: str) -> str:
+    """NFKC 正規化 + 小文字化（全角英数・半角カナを統一）"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str) -> List[Tuple[str, int]]:
+    """(語, 位置) の列
+
+    かな・漢字の連続部は位置 i に bigram text[i:i+2] を、末尾位置に1文字語を置く。
+    これにより任意の1文字は「その文字で始まる語」の前方一致で、
+    2文字以上の語句は bigram の位置連続で検索できる。
+    """
+    tokens = []
+    position = 0
+    for match in _TOKEN_RE.finditer(normalize(text)):
+        run = match.group()
+        if _CJK_RE.match(run):
+            for i in range(len(run) - 1):
+                tokens.append((run[i : i + 2], position + i))
+            tokens.append((run[-1], position + len(run) - 1))
+            position += len(run)
+        else:
+            tokens.append((run[:MAX_TERM_CHARS], position))
+            position += 1
+    return tokens
+
+
+@dataclass(frozen=True)
+class QueryGroup:
+    """クエリの1語句（prefix=True は1文字の日本語語句、前方一致で展開）"""
+
+    terms: Tuple[Tuple[str, int], ...]  # (語, 語句内オフセット)
+    prefix: bool = False
+
+
+def parse_query(query: str) -> List[QueryGroup]:
+    """クエリ文字列を語句単位に分解"""
+    groups = []
+    for match in _TOKEN_RE.finditer(normalize(query)):
+        run = match.group()
+        if not _CJK_RE.match(run):
+            groups.append(QueryGroup(((run[:MAX_TERM_CHARS], 0),)))
+        elif len(run) == 1:
+            groups.append(QueryGroup(((run, 0),), prefix=True))
+        else:
+            groups.append(
+                QueryGroup(tuple((run[i : i + 2], i) for i in range(len(run) - 1)))
+            )
+    return groups
+
+
+# ----------------------------------------------------------------------
+# 可変長整数
+# ----------------------------------------------------------------------
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varints(buf, start: int, end: int) -> List[int]:
+    chunk = buf[start:end]
+    if chunk.isascii():
+        # 全値が1バイト（頻出語の差分・出現回数の大半）
+        return list(chunk)
+    values = []
+    value = 0
+    shift = 0
+    for byte in chunk:
+        if byte < 0x80:
+            values.append(value | (byte << shift))
+            value = 0
+            shift = 0
+        else:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+    return values
+
+
+def _read_varint(buf, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = buf[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _encode_postings(postings: Sequence[Tuple[int, Sequence[int]]]) -> bytes:
+    """[(文書番号, 位置列)] → スキップ表 + ブロック列"""
+    skip = bytearray()
+    payload = bytearray()
+    blocks = [postings[i : i + BLOCK_SIZE] for i in range(0, len(postings), BLOCK_SIZE)]
+    _write_varint(skip, len(blocks))
+
+    previous_doc = -1
+    for block in blocks:
+        doc_bytes = bytearray()
+        pos_bytes = bytearray()
+        block_start = previous_doc
+        for doc, positions in block:
+            _write_varint(doc_bytes, doc - previous_doc)
+            _write_varint(doc_bytes, len(positions))
+            previous_doc = doc
+            previous_position = -1
+            for position in positions:
+                _write_varint(pos_bytes, position - previous_position)
+                previous_position = position
+        _write_varint(skip, previous_doc - block_start)
+        _write_varint(skip, len(doc_bytes))
+        _write_varint(skip, len(pos_bytes))
+        payload += doc_bytes
+        payload += pos_bytes
+    return bytes(skip + payload)
+
+
+# ----------------------------------------------------------------------
+# セグメント読み取り（mmap）
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class TermInfo:
+    term: str
+    df: int
+    offset: int
+    length: int
+
+
+class PostingList:
+    """1語の転置リスト（ブロック単位で遅延復号）"""
+
+    def __init__(self, buf, start: int, end: int, df: int):
+        self._buf = buf
+        self.df = df
+        block_count, offset = _read_varint(buf, start)
+        self.last_docs: List[int] = []
+        self._blocks: List[Tuple[int, int, int, int]] = []
+        last_doc = -1
+        sizes = []
+        for _ in range(block_count):
+            delta, offset = _read_varint(buf, offset)
+            doc_size, offset = _read_varint(buf, offset)
+            pos_size, offset = _read_varint(buf, offset)
+            last_doc += delta
+            self.last_docs.append(last_doc)
+            sizes.append((doc_size, pos_size))
+        for doc_size, pos_size in sizes:
+            self._blocks.append(
+                (offset, offset + doc_size, offset + doc_size + pos_size, 0)
+            )
+            offset += doc_size + pos_size
+        self._decoded: Dict[int, Tuple[List[int], List[int]]] = {}
+        self._positions: Dict[int, Tuple[List[int], List[int]]] = {}
+
+    def _block(self, index: int) -> Tuple[List[int], List[int]]:
+        decoded = self._decoded.get(index)
+        if decoded is None:
+            doc_start, pos_start, _, _ = self._blocks[index]
+            values = _read_varints(self._buf, doc_start, pos_start)
+            previous_doc = self.last_docs[index - 1] if index else -1
+            docs = list(accumulate(values[0::2], initial=previous_doc))[1:]
+            decoded = (docs, values[1::2])
+            self._decoded[index] = decoded
+        return decoded
+
+    def doc_ids(self) -> List[int]:
+        docs = []
+        for index in range(len(self._blocks)):
+            docs.extend(self._block(index)[0])
+        return docs
+
+    def documents(self) -> Iterator[Tuple[int, int]]:
+        """(文書番号, 出現回数) の全件"""
+        for index in range(len(self._blocks)):
+            docs, tfs = self._block(index)
+            yield from zip(docs, tfs)
+
+    def tf(self, doc: int) -> int:
+        """文書内出現回数（非出現は 0、スキップ表で該当ブロックのみ復号）"""
+        index = bisect.bisect_left(self.last_docs, doc)
+        if index == len(self.last_docs):
+            return 0
+        docs, tfs = self._block(index)
+        i = bisect.bisect_left(docs, doc)
+        return tfs[i] if i < len(docs) and docs[i] == doc else 0
+
+    def positions(self, doc: int) -> List[int]:
+        """文書内の出現位置"""
+        index = bisect.bisect_left(self.last_docs, doc)
+        if index == len(self.last_docs):
+            return []
+        docs, tfs = self._block(index)
+        i = bisect.bisect_left(docs, doc)
+        if i == len(docs) or docs[i] != doc:
+            return []
+        cached = self._positions.get(index)
+        if cached is None:
+            _, pos_start, pos_end, _ = self._blocks[index]
+            cached = (
+                _read_varints(self._buf, pos_start, pos_end),
+                list(accumulate(tfs, initial=0)),
+            )
+            self._positions[index] = cached
+        block_positions, starts = cached
+        positions = []
+        position = -1
+        for delta in block_positions[starts[i] : starts[i + 1]]:
+            position += delta
+            positions.append(position)
+        return positions
+
+
+class Segment:
+    """不変セグメント（mmap 参照）"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.name = self.path.name
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            self.doc_count,
+            self.term_count,
+            self.total_length,
+            self._docs_offset,
+            self._meta_offset,
+            self._postings_offset,
+            self._terms_offset,
+            self._strings_offset,
+        ) = _HEADER.unpack_from(self._mm, 0)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError(f"検索セグメント形式が不正です: {self.path}")
+        self._doc_lengths: Optional[List[int]] = None
+        self._length_norms: Tuple[float, List[float]] = (0.0, [])
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    @property
+    def doc_lengths(self) -> List[int]:
+        """文書長の一覧（初回参照時に文書表から読み込み）"""
+        if self._doc_lengths is None:
+            end = self._docs_offset + self.doc_count * _DOC_ENTRY.size
+            self._doc_lengths = [
+                entry[0]
+                for entry in _DOC_ENTRY.iter_unpack(self._mm[self._docs_offset : end])
+            ]
+        return self._doc_lengths
+
+    def length_norms(self, average_length: float) -> List[float]:
+        """BM25 の文書長正規化項（平均文書長が変わらない限り再計算しない）"""
+        cached_average, norms = self._length_norms
+        if cached_average != average_length:
+            norms = [
+                BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                for length in self.doc_lengths
+            ]
+            self._length_norms = (average_length, norms)
+        return norms
+
+    def doc_record(self, doc: int) -> Dict[str, Any]:
+        _, offset, length = _DOC_ENTRY.unpack_from(
+            self._mm, self._docs_offset + doc * _DOC_ENTRY.size
+        )
+        start = self._meta_offset + offset
+        return json.loads(self._mm[start : start + length].decode("utf-8"))
+
+    def _term_at(self, index: int) -> Tuple[bytes, TermInfo]:
+        string_offset, string_length, df, offset, length = _TERM_ENTRY.unpack_from(
+            self._mm, self._terms_offset + index * _TERM_ENTRY.size
+        )
+        start = self._strings_offset + string_offset
+        raw = self._mm[start : start + string_length]
+        return raw, TermInfo(raw.decode("utf-8"), df, offset, length)
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term_at(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find_term(self, term: str) -> Optional[TermInfo]:
+        key = term.encode("utf-8")
+        index = self._lower_bound(key)
+        if index < self.term_count:
+            raw, info = self._term_at(index)
+            if raw == key:
+                return info
+        return None
+
+    def prefix_terms(self, prefix: str) -> List[TermInfo]:
+        """前方一致する語（語表は UTF-8 バイト順 = コードポイント順）"""
+        key = prefix.encode("utf-8")
+        terms = []
+        index = self._lower_bound(key)
+        while index < self.term_count:
+            raw, info = self._term_at(index)
+            if not raw.startswith(key):
+                break
+            terms.append(info)
+            index += 1
+        return terms
+
+    def iter_terms(self) -> Iterator[TermInfo]:
+        for index in range(self.term_count):
+            yield self._term_at(index)[1]
+
+    def postings(self, info: TermInfo) -> PostingList:
+        start = self._postings_offset + info.offset
+        return PostingList(self._mm, start, start + info.length, info.df)
+
+
+def _write_segment(
+    path: Path,
+    documents: Sequence[Tuple[int, bytes]],
+    terms: Iterable[Tuple[str, Sequence[Tuple[int, Sequence[int]]]]],
+):
+    """セグメントの書き出し（一時ファイル経由で置換）
+
+    documents: (文書長, メタ情報JSON) を文書番号順に
+    terms: (語, [(文書番号, 位置列)]) を語のコードポイント順に
+    """
+    temp_path = path.with_suffix(".tmp")
+    total_length = sum(length for length, _ in documents)
+    term_entries = bytearray()
+    strings = bytearray()
+    term_count = 0
+
+    with open(temp_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+
+        docs_offset = f.tell()
+        meta_offset_in_blob = 0
+        for length, meta in documents:
+            f.write(_DOC_ENTRY.pack(length, meta_offset_in_blob, len(meta)))
+            meta_offset_in_blob += len(meta)
+        meta_offset = f.tell()
+        for _, meta in documents:
+            f.write(meta)
+
+        postings_offset = f.tell()
+        postings_size = 0
+        for term, postings in terms:
+            encoded_term = term.encode("utf-8")
+            encoded = _encode_postings(postings)
+            f.write(encoded)
+            term_entries += _TERM_ENTRY.pack(
+                len(strings),
+                len(encoded_term),
+                len(postings),
+                postings_size,
+                len(encoded),
+            )
+            strings += encoded_term
+            postings_size += len(encoded)
+            term_count += 1
+
+        terms_offset = f.tell()
+        f.write(term_entries)
+        strings_offset = f.tell()
+        f.write(strings)
+
+        f.seek(0)
+        f.write(
+            _HEADER.pack(
+                SEGMENT_MAGIC,
+                SEGMENT_VERSION,
+                len(documents),
+                term_count,
+                total_length,
+                docs_offset,
+                meta_offset,
+                postings_offset,
+                terms_offset,
+                strings_offset,
+            )
+        )
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+# ----------------------------------------------------------------------
+# インデックス本体
+# ----------------------------------------------------------------------
+@dataclass
+class SearchHit:
+    key: str
+    score: float
+    metadata: Dict[str, Any]
+
+
+def file_signature(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class SearchIndex:
+    """セグメント型の全文検索インデックス
+
+    Args:
+        index_dir: セグメント・マニフェストの保存先
+        flush_threshold: 未書き出し文書がこの件数に達したら自動 flush
+        max_segments: セグメント数がこれを超えたら統合
+
+    追加・更新・削除した文書は flush() 後に検索対象となる。
+    """
+
+    def __init__(
+        self, index_dir: Path, flush_threshold: int = 10000, max_segments: int = 8
+    ):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_threshold = flush_threshold
+        self.max_segments = max_segments
+
+        self._pending: Dict[str, Tuple[str, Dict[str, Any], Optional[List[int]]]] = {}
+        self._manifest = self._load_manifest()
+        self._deleted = {
+            name: set(docs) for name, docs in self._manifest["deleted"].items()
+        }
+        self._segments = [
+            Segment(self.index_dir / name) for name in self._manifest["segments"]
+        ]
+
+    # -- マニフェスト ---------------------------------------------------
+    def _load_manifest(self) -> Dict[str, Any]:
+        path = self.index_dir / MANIFEST_NAME
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {
+            "format": SEGMENT_VERSION,
+            "next_segment": 1,
+            "segments": [],
+            "deleted": {},
+            "documents": {},
+        }
+
+    def _save_manifest(self):
+        self._manifest["deleted"] = {
+            name: sorted(docs) for name, docs in self._deleted.items() if docs
+        }
+        path = self.index_dir / MANIFEST_NAME
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def close(self):
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+        self.close()
+
+    def __len__(self) -> int:
+        """検索可能な文書数"""
+        return len(self._manifest["documents"])
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    # -- 更新 ----------------------------------------------------------
+    def add_document(
+        self,
+        key: str,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        signature: Optional[List[int]] = None,
+    ):
+        """文書の追加（同一キーは置き換え）"""
+        self._pending[key] = (text, metadata or {}, signature)
+        if len(self._pending) >= self.flush_threshold:
+            self.flush()
+
+    def delete_document(self, key: str):
+        self._pending.pop(key, None)
+        self._mark_deleted(key)
+
+    def _mark_deleted(self, key: str):
+        location = self._manifest["documents"].pop(key, None)
+        if location is not None:
+            segment_name, doc = location[0], location[1]
+            self._deleted.setdefault(segment_name, set()).add(doc)
+
+    def flush(self):
+        """未書き出し文書を新しいセグメントとして確定"""
+        if not self._pending:
+            self._save_manifest()
+            return
+
+        name = f"seg_{self._manifest['next_segment']:06d}.idx"
+        documents = []
+        postings: Dict[str, List[Tuple[int, List[int]]]] = {}
+        for doc, (key, (text, metadata, signature)) in enumerate(self._pending.items()):
+            tokens = tokenize(text)
+            term_positions: Dict[str, List[int]] = {}
+            for term, position in tokens:
+                term_positions.setdefault(term, []).append(position)
+            for term, positions in term_positions.items():
+                postings.setdefault(term, []).append((doc, positions))
+            meta = json.dumps(
+                {"key": key, "metadata": metadata}, ensure_ascii=False
+            ).encode("utf-8")
+            documents.append((len(tokens), meta))
+
+        _write_segment(self.index_dir / name, documents, sorted(postings.items()))
+
+        for doc, (key, (_, _, signature)) in enumerate(self._pending.items()):
+            self._mark_deleted(key)
+            self._manifest["documents"][key] = [name, doc, signature]
+        self._manifest["segments"].append(name)
+        self._manifest["next_segment"] += 1
+        self._segments.append(Segment(self.index_dir / name))
+        self._pending.clear()
+        self._save_manifest()
+        logger.info(f"検索セグメント書き出し: {name} ({len(documents)}文書)")
+
+        if len(self._segments) > self.max_segments:
+            self.merge_segments()
+
+    def merge_segments(self):
+        """全セグメントを1つに統合（削除文書を除去）"""
+        if len(self._segments) <= 1 and not any(self._deleted.values()):
+            return
+
+        # 旧文書番号 → 新文書番号
+        remap: List[Dict[int, int]] = []
+        documents = []
+        keys = []
+        for segment in self._segments:
+            deleted = self._deleted.get(segment.name, set())
+            mapping = {}
+            for doc in range(segment.doc_count):
+                if doc in deleted:
+                    continue
+                mapping[doc] = len(documents)
+                record = segment.doc_record(doc)
+                keys.append(record["key"])
+                documents.append(
+                    (
+                        segment.doc_lengths[doc],
+                        json.dumps(record, ensure_ascii=False).encode("utf-8"),
+                    )
+                )
+            remap.append(mapping)
+
+        def segment_terms(index: int) -> Iterator[Tuple[str, int, TermInfo]]:
+            for info in self._segments[index].iter_terms():
+                yield info.term, index, info
+
+        def merged_terms() -> Iterator[Tuple[str, List[Tuple[int, List[int]]]]]:
+            streams = [segment_terms(i) for i in range(len(self._segments))]
+            current_term = None
+            current: List[Tuple[int, List[int]]] = []
+            for term, index, info in heapq.merge(
+                *streams, key=lambda item: (item[0], item[1])
+            ):
+                if term != current_term:
+                    if current:
+                        yield current_term, current
+                    current_term, current = term, []
+                postings = self._segments[index].postings(info)
+                mapping = remap[index]
+                for doc, _ in postings.documents():
+                    if doc in mapping:
+                        current.append((mapping[doc], postings.positions(doc)))
+            if current:
+                yield current_term, current
+
+        name = f"seg_{self._manifest['next_segment']:06d}.idx"
+        _write_segment(self.index_dir / name, documents, merged_terms())
+
+        old_segments = self._segments
+        old_signatures = self._manifest["documents"]
+        self._manifest["documents"] = {
+            key: [name, doc, old_signatures[key][2]] for doc, key in enumerate(keys)
+        }
+        self._manifest["segments"] = [name]
+        self._manifest["next_segment"] += 1
+        self._deleted = {}
+        self._segments = [Segment(self.index_dir / name)]
+        self._save_manifest()
+
+        for segment in old_segments:
+            segment.close()
+            segment.path.unlink()
+        logger.info(f"検索セグメント統合: {len(old_segments)} → 1 ({len(keys)}文書)")
+
+    # -- ファイル索引 --------------------------------------------------
+    def index_files(
+        self, paths: Iterable[Path], root: Optional[Path] = None
+    ) -> Dict[str, int]:
+        """ファイル群の増分索引（mtime・サイズ未変更のファイルは読まない）"""
+        stats = {"added": 0, "updated": 0, "unchanged": 0}
+        for path in paths:
+            path = Path(path)
+            key = str(path.relative_to(root)) if root else str(path)
+            signature = file_signature(path)
+            existing = self._manifest["documents"].get(key)
+            if (
+                existing is not None
+                and existing[2] == signature
+                and key not in self._pending
+            ):
+                stats["unchanged"] += 1
+                continue
+            try:
+                text = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"検索対象外（読み込み不可）: {path} - {e}")
+                continue
+            self.add_document(
+                key, text, {"path": str(path), "title": path.stem}, signature
+            )
+            stats["updated" if existing is not None else "added"] += 1
+        self.flush()
+        return stats
+
+    def index_directory(
+        self, root: Path, suffixes: Tuple[str, ...] = INDEXED_SUFFIXES
+    ) -> Dict[str, int]:
+        """ディレクトリ配下の増分索引（削除されたファイルは索引から除去）"""
+        root = Path(root)
+        paths = [
+            Path(directory) / name
+            for directory, _, names in os.walk(root)
+            for name in names
+            if name.endswith(suffixes)
+        ]
+        stats = self.index_files(paths)
+
+        present = {str(path) for path in paths}
+        prefix = str(root).rstrip(os.sep) + os.sep
+        removed = [
+            key
+            for key in self._manifest["documents"]
+            if key.startswith(prefix) and key not in present
+        ]
+        for key in removed:
+            self.delete_document(key)
+        stats["removed"] = len(removed)
+        if removed:
+            self.flush()
+        return stats
+
+    # -- 検索 ----------------------------------------------------------
+    def search(self, query: str, limit: int = 10, mode: str = "and") -> List[SearchHit]:
+        """BM25 順の検索（mode="and" は全語句を含む文書、"or" はいずれか）"""
+        if mode not in ("and", "or"):
+            raise ValueError(f"未対応の検索モードです: {mode}")
+        groups = parse_query(query)
+        if not groups or not self._segments:
+            return []
+
+        # 全セグメントの文書頻度・平均文書長（BM25 の統計量）
+        resolved = [self._resolve_terms(segment, groups) for segment in self._segments]
+        document_frequency: Dict[str, int] = {}
+        for per_segment in resolved:
+            for infos in per_segment:
+                for _, info in infos:
+                    document_frequency[info.term] = (
+                        document_frequency.get(info.term, 0) + info.df
+                    )
+        total_docs = sum(segment.doc_count for segment in self._segments)
+        average_length = sum(segment.total_length for segment in self._segments) / max(
+            total_docs, 1
+        )
+        idf = {
+            term: math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+        hits: List[Tuple[float, int, int]] = []
+        for segment_index, (segment, infos_by_group) in enumerate(
+            zip(self._segments, resolved)
+        ):
+            matches = self._search_segment(
+                segment, groups, infos_by_group, idf, average_length, mode, limit
+            )
+            for doc, score in matches:
+                entry = (score, -segment_index, -doc)
+                if len(hits) < limit:
+                    heapq.heappush(hits, entry)
+                elif entry > hits[0]:
+                    heapq.heapreplace(hits, entry)
+
+        results = []
+        for score, negative_segment, negative_doc in sorted(hits, reverse=True):
+            record = self._segments[-negative_segment].doc_record(-negative_doc)
+            results.append(SearchHit(record["key"], score, record["metadata"]))
+        return results
+
+    def _resolve_terms(
+        self, segment: Segment, groups: List[QueryGroup]
+    ) -> List[List[Tuple[int, TermInfo]]]:
+        """語句毎の (語句内オフセット, 語情報)（前方一致は該当語を全て展開）"""
+        resolved = []
+        for group in groups:
+            if group.prefix:
+                resolved.append(
+                    [(0, info) for info in segment.prefix_terms(group.terms[0][0])]
+                )
+            else:
+                infos = []
+                for term, offset in group.terms:
+                    info = segment.find_term(term)
+                    if info is not None:
+                        infos.append((offset, info))
+                resolved.append(infos)
+        return resolved
+
+    def _search_segment(
+        self,
+        segment: Segment,
+        groups: List[QueryGroup],
+        infos_by_group: List[List[Tuple[int, TermInfo]]],
+        idf: Dict[str, float],
+        average_length: float,
+        mode: str,
+        limit: int,
+    ) -> List[Tuple[int, float]]:
+        """セグメント内の上位 limit 件（語句一致の確認はスコア上位から必要分のみ）"""
+        lists: Dict[str, PostingList] = {}
+        for infos in infos_by_group:
+            for _, info in infos:
+                if info.term not in lists:
+                    lists[info.term] = segment.postings(info)
+
+        if mode == "and":
+            # 語句内の語が1つでも欠ける語句があれば一致なし
+            for group, infos in zip(groups, infos_by_group):
+                if not infos or (not group.prefix and len(infos) != len(group.terms)):
+                    return []
+            candidates = self._and_candidates(groups, infos_by_group, lists)
+        else:
+            candidates = sorted(
+                {doc for plist in lists.values() for doc in plist.doc_ids()}
+            )
+        deleted = self._deleted.get(segment.name)
+        if deleted:
+            candidates = [doc for doc in candidates if doc not in deleted]
+
+        # 2文字以上の日本語語句は最小文書頻度の bigram 1語で代表させて採点（長い語句の過大評価を防ぐ）
+        scored = {}
+        for group, infos in zip(groups, infos_by_group):
+            if infos and not group.prefix:
+                infos = [min(infos, key=lambda item: item[1].df)]
+            for _, info in infos:
+                scored[info.term] = lists[info.term]
+        scores = self._score(segment, candidates, scored, idf, average_length)
+        needs_phrase = mode == "and" and any(
+            not group.prefix and len(group.terms) > 1 for group in groups
+        )
+        if not needs_phrase:
+            return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+        # 語句一致しない文書は少数のため、まず上位 2×limit 件を確認し不足時のみ全件を整列
+        ranked = heapq.nlargest(limit * 2, scores.items(), key=lambda item: item[1])
+        matches = [
+            item
+            for item in ranked
+            if self._phrases_match(item[0], groups, infos_by_group, lists)
+        ]
+        if len(matches) < limit and len(ranked) < len(scores):
+            ranked = sorted(scores.items(), key=lambda item: -item[1])
+            matches = []
+            for doc, score in ranked:
+                if self._phrases_match(doc, groups, infos_by_group, lists):
+                    matches.append((doc, score))
+                    if len(matches) == limit:
+                        break
+        return matches[:limit]
+
+    def _score(
+        self,
+        segment: Segment,
+        candidates: List[int],
+        lists: Dict[str, PostingList],
+        idf: Dict[str, float],
+        average_length: float,
+    ) -> Dict[int, float]:
+        """候補文書の BM25 スコア"""
+        length_norms = segment.length_norms(average_length)
+        scores = dict.fromkeys(candidates, 0.0)
+        for term, plist in lists.items():
+            weight = idf[term] * (BM25_K1 + 1)
+            if len(candidates) * SEEK_RATIO < plist.df:
+                # 候補が少なければスキップ表で該当ブロックのみ参照
+                for doc in candidates:
+                    tf = plist.tf(doc)
+                    if tf:
+                        scores[doc] += weight * tf / (tf + length_norms[doc])
+            else:
+                for doc, tf in plist.documents():
+                    if doc in scores:
+                        scores[doc] += weight * tf / (tf + length_norms[doc])
+        return scores
+
+    def _and_candidates(
+        self,
+        groups: List[QueryGroup],
+        infos_by_group: List[List[Tuple[int, TermInfo]]],
+        lists: Dict[str, PostingList],
+    ) -> List[int]:
+        """最小文書頻度の語から候補を作り、他の語で絞り込み"""
+        # 各語句の条件: 通常語句は全語を含む、前方一致語句はいずれかを含む
+        conditions: List[Tuple[int, List[PostingList]]] = []
+        for group, infos in zip(groups, infos_by_group):
+            if group.prefix:
+                conditions.append(
+                    (
+                        sum(info.df for _, info in infos),
+                        [lists[info.term] for _, info in infos],
+                    )
+                )
+            else:
+                conditions.extend((info.df, [lists[info.term]]) for _, info in infos)
+        conditions.sort(key=lambda condition: condition[0])
+
+        _, first = conditions[0]
+        candidates = {doc for plist in first for doc in plist.doc_ids()}
+        for df, alternatives in conditions[1:]:
+            if not candidates:
+                break
+            if len(candidates) * SEEK_RATIO < df:
+                candidates = {
+                    doc
+                    for doc in candidates
+                    if any(plist.tf(doc) for plist in alternatives)
+                }
+            else:
+                present = [doc for plist in alternatives for doc in plist.doc_ids()]
+                candidates = candidates.intersection(present)
+        return sorted(candidates)
+
+    def _phrases_match(
+        self,
+        doc: int,
+        groups: List[QueryGroup],
+        infos_by_group: List[List[Tuple[int, TermInfo]]],
+        lists: Dict[str, PostingList],
+    ) -> bool:
+        """3文字以上の日本語語句は bigram の位置が連続していること"""
+        for group, infos in zip(groups, infos_by_group):
+            if group.prefix or len(infos) < 2:
+                continue
+            (base_offset, base_info), rest = infos[0], infos[1:]
+            others = [
+                (offset - base_offset, set(lists[info.term].positions(doc)))
+                for offset, info in rest
+            ]
+            if not any(
+                all(start + offset in positions for offset, positions in others)
+                for start in lists[base_info.term].positions(doc)
+            ):
+                return False
+        return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """検索インデックス CLI（index: 増分索引 / search: 検索）"""
+    project_root = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description="MIRRALISM 全文検索インデックス")
+    parser.add_argument(
+        "--index-dir", type=Path, default=project_root / ".mirralism" / "search_index"
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = subcommands.add_parser("index", help="ディレクトリを増分索引")
+    index_parser.add_argument(
+        "roots",
+        nargs="*",
+        type=Path,
+        default=[
+            project_root / "Data" / "raw",
+            project_root / "Clients",
+            project_root / "Documentation",
+        ],
+    )
+    search_parser = subcommands.add_parser("search", help="検索")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--limit", type=int, default=10)
+    search_parser.add_argument("--mode", choices=["and", "or"], default="and")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - [%(levelname)s] - %(message)s"
+    )
+    with SearchIndex(args.index_dir) as index:
+        if args.command == "index":
+            for root in args.roots:
+                if root.exists():
+                    print(f"{root}: {index.index_directory(root)}")
+            print(f"検索可能文書数: {len(index)}")
+        else:
+            for hit in index.search(args.query, limit=args.limit, mode=args.mode):
+                print(f"{hit.score:8.3f}  {hit.metadata.get('path', hit.key)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,22 +9,35 @@
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent.parent / "API" / "integrations" / "superwhisper"))
+from superwhisper_corpus_index import SuperWhisperCorpusIndex
+from superwhisper_corpus_index import parse_frontmatter
+from transcription_profile import profile_transcription
+
+REVIEWER = "data_review"
+
 class DataReviewSystem:
-    def __init__(self):
-        self.project_root = Path("/Users/suetakeshuuhei/MIRRALISM_V2")
+    def __init__(self, project_root: Optional[Path] = None):
+        self.project_root = Path(project_root or Path(__file__).parent.parent)
         self.review_db = self.project_root / ".mirralism" / "data_review.json"
         self.rules_db = self.project_root / ".mirralism" / "learning_rules.json"
         
-        # ディレクトリ作成
-        self.review_db.parent.mkdir(exist_ok=True)
-        
         # データベース初期化
         self.reviews = self.load_reviews()
         self.rules = self.load_rules()
+
+        # コーパスインデックス（変更ファイルのみ再解析）
+        self.index = SuperWhisperCorpusIndex(self.project_root)
+        self.index.refresh()
+        self.index.sync_reviews(
+            REVIEWER, paths=[review["file_path"] for review in self.reviews["reviews"]]
+        )
         
     def load_reviews(self) -> Dict:
         """レビューデータ読み込み"""
@@ -35,6 +48,7 @@ class DataReviewSystem:
     
     def save_reviews(self):
         """レビューデータ保存"""
+        self.review_db.parent.mkdir(parents=True, exist_ok=True)
         with open(self.review_db, 'w', encoding='utf-8') as f:
             json.dump(self.reviews, f, ensure_ascii=False, indent=2)
     
@@ -52,88 +66,53 @@ class DataReviewSystem:
     
     def save_rules(self):
         """学習ルール保存"""
+        self.rules_db.parent.mkdir(parents=True, exist_ok=True)
         with open(self.rules_db, 'w', encoding='utf-8') as f:
             json.dump(self.rules, f, ensure_ascii=False, indent=2)
     
     def find_all_superwhisper_files(self) -> List[Path]:
-        """全SuperWhisperファイルを検索"""
-        files = []
-        for pattern in ["superwhisper_*.md", "superwhisper_raw_*.md"]:
-            files.extend(self.project_root.rglob(pattern))
-        return sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)
+        """全SuperWhisperファイルを検索（インデックス参照、新しい順）"""
+        return self.index.paths(newest_first=True)
     
-    def extract_metadata(self, file_path: Path) -> Dict:
-        """ファイルからメタデータ抽出"""
+    def read_full_content(self, file_data: Dict) -> str:
+        """全文表示用の本文（frontmatter を除く、表示時のみ読み込み）"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_data["file_path"], 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            # YAML frontmatter解析
-            metadata = {}
-            if content.startswith('---'):
-                yaml_end = content.find('---', 3)
-                if yaml_end > 0:
-                    yaml_content = content[3:yaml_end]
-                    for line in yaml_content.strip().split('\n'):
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            metadata[key.strip()] = value.strip()
-            
-            # 本文抽出
-            if '---' in content:
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    body = parts[2].strip()
-                else:
-                    body = content
-            else:
-                body = content
-                
-            # 音声内容抽出
-            audio_content = ""
-            if "## 音声内容" in body:
-                start = body.find("## 音声内容")
-                end = body.find("##", start + 1)
-                if end == -1:
-                    audio_content = body[start:]
-                else:
-                    audio_content = body[start:end]
-                audio_content = audio_content.replace("## 音声内容", "").strip()
-            
-            return {
-                "file_path": str(file_path),
-                "metadata": metadata,
-                "audio_content": audio_content,
-                "full_content": body,
-                "file_size": len(content),
-                "created_time": metadata.get("created", "Unknown"),
-                "quality_score": float(metadata.get("quality_score", 0.0)),
-                "text_length": len(audio_content)
-            }
-            
-        except Exception as e:
-            return {
-                "file_path": str(file_path),
-                "error": str(e),
-                "metadata": {},
-                "audio_content": "",
-                "full_content": "",
-                "file_size": 0,
-                "created_time": "Unknown",
-                "quality_score": 0.0,
-                "text_length": 0
-            }
+        except (OSError, UnicodeDecodeError) as e:
+            return f"（読み込みエラー: {e}）"
+        _, body = parse_frontmatter(content)
+        return body
     
     def get_next_unreviewed_file(self) -> Optional[Dict]:
-        """次のレビュー対象ファイルを取得"""
-        all_files = self.find_all_superwhisper_files()
-        reviewed_files = {review["file_path"] for review in self.reviews["reviews"]}
-        
-        for file_path in all_files:
-            if str(file_path) not in reviewed_files:
-                return self.extract_metadata(file_path)
-        
-        return None
+        """次のレビュー対象ファイルを取得（インデックスから最新の未レビュー1件）
+
+        frontmatter はインデックスの保存値を使い、音声内容のみオフセット読み込み。
+        インデックス後に削除・破損したファイルは索引から除かれ、次の候補へ進む。
+        """
+        while True:
+            entries = self.index.next_unreviewed(REVIEWER, limit=1, newest_first=True)
+            if not entries:
+                return None
+            entry = entries[0]
+            audio_content = self.index.read_audio_content(entry)
+            if audio_content is not None:
+                return self.entry_to_file_data(entry, audio_content)
+
+    def entry_to_file_data(self, entry: Dict, audio_content: str) -> Dict:
+        """インデックス行 → レビュー表示用データ（全文は表示時に読み込み）"""
+        profile = profile_transcription(audio_content)
+        quality_score = entry["metadata"].get("quality_score")
+        return {
+            "file_path": entry["file_path"],
+            "metadata": entry["metadata"],
+            "audio_content": audio_content,
+            "file_size": entry["file_size"],
+            "created_time": entry["created_time"],
+            "quality_score": float(quality_score if quality_score is not None else profile.quality_score()),
+            "noise_level": profile.noise_level(),
+            "text_length": len(audio_content)
+        }
     
     def show_file_for_review(self, file_data: Dict):
         """レビュー用ファイル表示"""
@@ -144,6 +123,7 @@ class DataReviewSystem:
         print(f"📁 ファイル: {Path(file_data['file_path']).name}")
         print(f"📅 作成日時: {file_data['created_time']}")
         print(f"📊 品質スコア: {file_data['quality_score']}")
+        print(f"🔉 ノイズレベル: {file_data['noise_level']:.2f}")
         print(f"📝 文字数: {file_data['text_length']}文字")
         print()
         
@@ -193,7 +173,7 @@ class DataReviewSystem:
                 print("\n" + "="*60)
                 print("📄 全文表示")
                 print("="*60)
-                print(file_data['full_content'])
+                print(self.read_full_content(file_data))
                 print("="*60 + "\n")
                 continue
             elif choice == 'q':
@@ -216,6 +196,9 @@ class DataReviewSystem:
         }
         
         self.reviews["reviews"].append(review_entry)
+        self.index.mark_reviewed(
+            REVIEWER, file_data["file_path"], feedback["decision"], feedback["timestamp"]
+        )
         
         # 統計更新
         if feedback["decision"] == "approved":
@@ -10,19 +10,26 @@ CTO承認に基づく戦略的実装
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+sys.path.append(str(Path(__file__).parent))
+from superwhisper_corpus_index import SuperWhisperCorpusIndex
+
+REVIEWER = "feedback_log"
+
 class MirralismReviewSystem:
-    def __init__(self):
-        self.project_root = Path("/Users/suetakeshuuhei/MIRRALISM_V2")
+    def __init__(self, project_root: Optional[Path] = None):
+        self.project_root = Path(project_root or Path(__file__).parent.parent)
         self.review_log = self.project_root / ".mirralism" / "user_feedback_log.json"
         self.progress_file = self.project_root / ".mirralism" / "review_progress.json"
         
         # レビューデータ読み込み
         self.feedback_data = self.load_feedback_data()
         self.progress_data = self.load_progress_data()
+        self._index = None
         
     def load_feedback_data(self) -> Dict:
         """フィードバックデータ読み込み"""
@@ -48,15 +55,8 @@ class MirralismReviewSystem:
         }
     
     def get_all_superwhisper_files(self) -> List[Path]:
-        """全SuperWhisperファイル取得"""
-        files = []
-        patterns = ["superwhisper_*.md", "superwhisper_raw_*.md"]
-        
-        for pattern in patterns:
-            files.extend(self.project_root.rglob(pattern))
-        
-        # 作成日時でソート（古い順）
-        return sorted(files, key=lambda x: x.stat().st_mtime)
+        """全SuperWhisperファイル取得（インデックス参照、古い順）"""
+        return self.index.paths()
     
     def get_reviewed_files(self) -> set:
         """レビュー済みファイル一覧"""
@@ -65,20 +65,33 @@ class MirralismReviewSystem:
             reviewed.add(review["file_name"])
         return reviewed
     
+    @property
+    def index(self) -> SuperWhisperCorpusIndex:
+        """コーパスインデックス（初回アクセス時に増分更新・レビュー状態同期）"""
+        if self._index is None:
+            self._index = SuperWhisperCorpusIndex(self.project_root)
+            self._index.refresh()
+            self._index.sync_reviews(REVIEWER, names=self.get_reviewed_files())
+        return self._index
+
     def get_next_review_batch(self, batch_size: int = 5) -> List[Dict]:
-        """次のレビューバッチ取得"""
-        all_files = self.get_all_superwhisper_files()
-        reviewed_files = self.get_reviewed_files()
-        
+        """次のレビューバッチ取得（インデックスから古い順に未レビューN件）"""
         batch_data = []
-        count = 0
-        
-        for file_path in all_files:
-            if file_path.name not in reviewed_files and count < batch_size:
-                file_data = self.extract_file_data(file_path)
-                if file_data:
-                    batch_data.append(file_data)
-                    count += 1
+        for entry in self.index.next_unreviewed(REVIEWER, limit=batch_size):
+            audio_content = self.index.read_audio_content(entry)
+            if audio_content is None:
+                # インデックス後に削除・破損したファイルはスキップ
+                continue
+            batch_data.append({
+                "file_name": entry["file_name"],
+                "file_path": entry["file_path"],
+                "created_time": entry["created_time"],
+                "quality_score": entry["quality_score"],
+                "classification": entry["classification"],
+                "audio_content": audio_content,
+                "content_length": len(audio_content),
+                "file_size": entry["file_size"]
+            })
         
         return batch_data
     
@@ -16,6 +16,7 @@ V2改善：
 """
 
 import datetime
+import functools
 import json
 import logging
 import os
@@ -23,6 +24,8 @@ import re
 import shutil
 from pathlib import Path
 from typing import Dict
+from typing import List
+from typing import Optional
 from typing import Tuple
 
 # ログ設定
@@ -32,6 +35,56 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class CompiledFileRules:
+    """file_rules を1本の正規表現にコンパイルした分類器
+
+    全パターンを設定順の名前付きグループで連結し、1回の re.match で
+    最初に一致したルールを返す（first-match-wins を維持）。
+    パターン変換は従来の _match_pattern と同一（"*"→".*", "?"→"."、先頭一致）。
+    同名ファイルの再分類は結果キャッシュから返す。
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, file_rules: Dict):
+        self.rules: List[Tuple[str, str]] = []
+        alternatives = []
+        for category, rules in file_rules.items():
+            if category == "forbidden":
+                result = rules.get("reason", "Forbidden file type")
+            else:
+                result = rules["destination"]
+            for pattern in rules["patterns"]:
+                group = f"r{len(self.rules)}"
+                alternatives.append(f"(?P<{group}>{self.translate(pattern)})")
+                self.rules.append((category, result))
+
+        self._regex: Optional[re.Pattern] = (
+            re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        )
+        self.classify = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._classify)
+
+    @staticmethod
+    def translate(pattern: str) -> str:
+        """ワイルドカードパターン → 正規表現（従来互換）"""
+        return pattern.replace("*", ".*").replace("?", ".")
+
+    def _classify(self, file_name: str) -> Tuple[str, str]:
+        """ファイル名分類（一致なしは unknown）"""
+        if self._regex is None:
+            return "unknown", "Data/temp/"
+
+        match = self._regex.match(file_name)
+        if match is None:
+            return "unknown", "Data/temp/"
+
+        group = match.lastgroup
+        if group is None or not group.startswith("r"):
+            # パターン内に独自グループがある場合のフォールバック
+            group = next(name for name, value in match.groupdict().items() if value)
+        return self.rules[int(group[1:])]
+
+
 class FlexibleFileOrganizer:
     """柔軟ファイル自動整理システム"""
 
@@ -39,6 +92,8 @@ class FlexibleFileOrganizer:
         self.root_dir = Path(root_dir).resolve()
         self.config_file = self.root_dir / "scripts" / "organizer_config.json"
         self.stats_file = self.root_dir / "Data" / "analytics" / "file_stats.json"
+        self._compiled_rules: Optional[CompiledFileRules] = None
+        self._compiled_rules_source: Optional[Dict] = None
         self.load_config()
         self.ensure_directories()
 
@@ -101,6 +156,7 @@ class FlexibleFileOrganizer:
                         self.config[key] = value
         else:
             self.config = default_config
+        self._compiled_rules = None
 
         # 日付チェック・リセット
         today = datetime.date.today().isoformat()
@@ -174,20 +230,46 @@ class FlexibleFileOrganizer:
 
     def classify_file(self, file_path: str) -> Tuple[str, str]:
         """ファイル分類・移動先決定"""
-        file_name = os.path.basename(file_path)
-
-        for category, rules in self.config["file_rules"].items():
-            for pattern in rules["patterns"]:
-                if self._match_pattern(file_name, pattern):
-                    if category == "forbidden":
-                        return "forbidden", rules.get("reason", "Forbidden file type")
-                    return category, rules["destination"]
-
-        return "unknown", "Data/temp/"
+        return self._get_compiled_rules().classify(os.path.basename(file_path))
+
+    def classify_directory(
+        self, directory: Optional[Path] = None
+    ) -> List[Tuple[Path, str, str]]:
+        """ディレクトリ直下の対象ファイルを os.scandir 1回で一括分類
+
+        Returns:
+            (ファイルパス, カテゴリ, 移動先) のリスト（unknown は除外）
+        """
+        directory = Path(directory) if directory is not None else self.root_dir
+        classify = self._get_compiled_rules().classify
+
+        classified = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                category, destination = classify(entry.name)
+                if category != "unknown":
+                    classified.append((Path(entry.path), category, destination))
+        return classified
+
+    def reload_rules(self):
+        """分類ルールの強制再コンパイル（file_rules をその場で編集した場合に使用）"""
+        self._compiled_rules = None
+        self._get_compiled_rules()
+
+    def _get_compiled_rules(self) -> CompiledFileRules:
+        """コンパイル済み分類ルール取得（file_rules 差し替え時のみ再コンパイル）"""
+        file_rules = self.config["file_rules"]
+        source = self._compiled_rules_source
+        if self._compiled_rules is None or source is not file_rules:
+            self._compiled_rules = CompiledFileRules(file_rules)
+            self._compiled_rules_source = file_rules
+        return self._compiled_rules
 
     def _match_pattern(self, filename: str, pattern: str) -> bool:
         """パターンマッチング（ワイルドカード対応）"""
-        regex_pattern = pattern.replace("*", ".*").replace("?", ".")
+        regex_pattern = CompiledFileRules.translate(pattern)
         return bool(re.match(regex_pattern, filename, re.IGNORECASE))
 
     def clean_current_mess(self) -> Dict[str, int]:
@@ -197,21 +279,18 @@ class FlexibleFileOrganizer:
         print("🧹 現在の散らかったファイルを整理中...")
 
         # ルートディレクトリの対象ファイル検出
-        target_files = []
-        for item in self.root_dir.iterdir():
-            if item.is_file() and not item.name.startswith("."):
-                category, _ = self.classify_file(item.name)
-                if category != "unknown":
-                    target_files.append(item)
+        classified = self.classify_directory()
 
-        print(f"📁 {len(target_files)}個のファイルを整理します")
+        print(f"📁 {len(classified)}個のファイルを整理します")
 
         # 一時的にmigrationモードに切り替え
         original_mode = self.config["current_mode"]
         self.set_project_mode("migration")
 
-        for file_path in target_files:
-            success, message = self.organize_file(str(file_path))
+        for file_path, category, destination_dir in classified:
+            success, message = self._move_classified(
+                file_path, category, destination_dir
+            )
             if success:
                 results["moved"] += 1
                 print(f"  ✅ {file_path.name}")
@@ -297,12 +376,8 @@ class FlexibleFileOrganizer:
         max_files = safety_config.get("max_files_per_run", 100)
 
         # ルートディレクトリの対象ファイル検出
-        target_files = []
-        for item in self.root_dir.iterdir():
-            if item.is_file() and not item.name.startswith("."):
-                category, _ = self.classify_file(item.name)
-                if category != "unknown":
-                    target_files.append(item)
+        classified = self.classify_directory()
+        target_files = [file_path for file_path, _, _ in classified]
 
         if len(target_files) > max_files:
             print(f"⚠️ ファイル数が制限を超えています: {len(target_files)} > {max_files}")
@@ -354,8 +429,10 @@ class FlexibleFileOrganizer:
 
         # ファイル整理実行
         results = {"moved": 0, "errors": 0, "skipped": 0}
-        for file_path in target_files:
-            success, message = self.organize_file(str(file_path))
+        for file_path, category, destination_dir in classified:
+            success, message = self._move_classified(
+                file_path, category, destination_dir
+            )
             if success:
                 results["moved"] += 1
                 print(f"  ✅ {file_path.name}")
@@ -378,7 +455,12 @@ class FlexibleFileOrganizer:
 
         # 分類・移動先決定
         category, destination_dir = self.classify_file(source.name)
+        return self._move_classified(source, category, destination_dir)
 
+    def _move_classified(
+        self, source: Path, category: str, destination_dir: str
+    ) -> Tuple[bool, str]:
+        """分類済みファイルの移動（一括分類結果から直接呼び出し可能）"""
         if category == "forbidden":
             return False, f"🚨 {destination_dir} (V1失敗パターン)"
 
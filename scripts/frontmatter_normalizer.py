@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM Frontmatter 一括正規化ツール
+=====================================
+
+V1失敗教訓：
+- 手動YAML解析・DateTime不整合による frontmatter エラーが既存 markdown に残存
+- YAMLFrontmatterProcessor の修正処理は新規クリップにしか適用されない
+
+V2改善：
+- 既存 vault の markdown を1ファイルずつ読み、frontmatter ブロックのみ解析（本文は解析しない）
+- YAMLFrontmatterProcessor と同じ修正処理（DateTime・構造・必須フィールド）を適用
+- 変更のあるファイルのみ一時ファイル経由で原子的に置換（本文はバイト列のまま複写）
+- 既定は dry-run（frontmatter の unified diff レポートのみ出力）
+- ファイル単位でプロセス並列
+
+必須フィールド補完は type: webclip の frontmatter のみ対象とする
+（WebClip 以外のノートに title/url/type を追加しないため）。
+特殊文字エスケープ修正は適用しない。解析済みの値に逆スラッシュを挿入して
+元の文字列を破壊するため（引用符・逆スラッシュは yaml.dump が正しく引用する）。
+"""
+
+import argparse
+import difflib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import yaml
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from Interface.WebClip.yaml_processor import YAMLDumper  # noqa: E402
+from Interface.WebClip.yaml_processor import YAMLFrontmatterProcessor  # noqa: E402
+from Interface.WebClip.yaml_processor import YAMLLoader  # noqa: E402
+
+FRONTMATTER_DELIMITER = b"---"
+MAP_CHUNK_SIZE = 64
+EXCLUDED_DIRS = {".git", ".mirralism", ".obsidian", "node_modules", "__pycache__"}
+
+
+class FrontmatterLoader(YAMLLoader):
+    """日付・日時を文字列のまま読むローダー（DateTime 修正処理に元の表記を渡すため）"""
+
+
+FrontmatterLoader.yaml_implicit_resolvers = {
+    first: [
+        (tag, regexp)
+        for tag, regexp in resolvers
+        if tag != "tag:yaml.org,2002:timestamp"
+    ]
+    for first, resolvers in YAMLLoader.yaml_implicit_resolvers.items()
+}
+
+_processor: Optional[YAMLFrontmatterProcessor] = None
+
+
+def _get_processor() -> YAMLFrontmatterProcessor:
+    """プロセス毎に1つの修正処理インスタンス"""
+    global _processor
+    if _processor is None:
+        _processor = YAMLFrontmatterProcessor(Path(__file__).parent.parent)
+    return _processor
+
+
+def read_frontmatter(path: Path) -> Optional[Dict[str, Any]]:
+    """先頭の frontmatter ブロックのみ読み込み（無ければ None）
+
+    Returns:
+        text: frontmatter 本文（区切り行を除く）
+        body_offset: 終了区切り行の直後のバイト位置
+    """
+    with open(path, "rb") as f:
+        first = f.readline()
+        if first.rstrip(b"\r\n") != FRONTMATTER_DELIMITER:
+            return None
+        lines = []
+        for line in f:
+            if line.rstrip(b"\r\n") == FRONTMATTER_DELIMITER:
+                return {
+                    "text": b"".join(lines).decode("utf-8"),
+                    "body_offset": f.tell(),
+                }
+            lines.append(line)
+    return None
+
+
+def fix_frontmatter(frontmatter: Dict[str, Any]) -> List[str]:
+    """YAMLFrontmatterProcessor と同じ修正処理の適用（修正内容の一覧を返す）
+
+    エスケープ修正（_fix_escape_issues）は解析済みの値を破壊するため除外。
+    """
+    processor = _get_processor()
+    fixes = []
+    fixes.extend(processor._fix_datetime_issues(frontmatter))
+    fixes.extend(processor._fix_structure_issues(frontmatter))
+    if frontmatter.get("type") == "webclip":
+        fixes.extend(processor._fix_missing_fields(frontmatter))
+    return fixes
+
+
+def dump_frontmatter(frontmatter: Dict[str, Any]) -> str:
+    return yaml.dump(
+        frontmatter,
+        Dumper=YAMLDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        indent=2,
+    )
+
+
+def _write_atomically(path: Path, frontmatter_text: str, body_offset: int):
+    """frontmatter を差し替え、本文は元ファイルから複写して原子的に置換"""
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as out, open(path, "rb") as source:
+            out.write(b"---\n" + frontmatter_text.encode("utf-8") + b"---\n")
+            source.seek(body_offset)
+            shutil.copyfileobj(source, out)
+            out.flush()
+            os.fsync(out.fileno())
+        shutil.copymode(path, temp_name)
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def normalize_file(path: str, dry_run: bool = True) -> Dict[str, Any]:
+    """1ファイルの正規化
+
+    Returns:
+        status: changed / unchanged / no_frontmatter / error
+    """
+    result: Dict[str, Any] = {"path": path, "status": "unchanged", "fixes": []}
+    try:
+        block = read_frontmatter(Path(path))
+        if block is None:
+            result["status"] = "no_frontmatter"
+            return result
+
+        frontmatter = yaml.load(block["text"], Loader=FrontmatterLoader)
+        if not isinstance(frontmatter, dict):
+            raise ValueError("frontmatter が辞書形式ではありません")
+
+        fixes = fix_frontmatter(frontmatter)
+        if not fixes:
+            return result
+
+        normalized = dump_frontmatter(frontmatter)
+        result.update(status="changed", fixes=fixes)
+        result["diff"] = "".join(
+            difflib.unified_diff(
+                block["text"].splitlines(keepends=True),
+                normalized.splitlines(keepends=True),
+                fromfile=f"{path} (frontmatter)",
+                tofile=f"{path} (normalized)",
+            )
+        )
+        if not dry_run:
+            _write_atomically(Path(path), normalized, block["body_offset"])
+    except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError) as e:
+        result.update(status="error", error=str(e))
+    return result
+
+
+def _normalize_dry_run(path: str) -> Dict[str, Any]:
+    return normalize_file(path, dry_run=True)
+
+
+def _normalize_apply(path: str) -> Dict[str, Any]:
+    return normalize_file(path, dry_run=False)
+
+
+def iter_markdown_files(root: Path) -> Iterator[str]:
+    """vault 配下の markdown ファイル（管理用ディレクトリは除外）"""
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name not in EXCLUDED_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(".md"):
+                yield os.path.join(directory, name)
+
+
+def normalize_vault(
+    root: Path, dry_run: bool = True, max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """vault 全体の一括正規化
+
+    Returns:
+        summary: 状態別ファイル数
+        changed: 変更（dry-run では変更予定）ファイルの修正内容・diff
+        errors: 解析できなかったファイル
+    """
+    worker = _normalize_dry_run if dry_run else _normalize_apply
+    paths = iter_markdown_files(Path(root))
+    workers = max_workers or os.cpu_count() or 1
+
+    summary = {
+        "scanned": 0,
+        "changed": 0,
+        "unchanged": 0,
+        "no_frontmatter": 0,
+        "error": 0,
+    }
+    changed = []
+    errors = []
+
+    def collect(results):
+        for result in results:
+            summary["scanned"] += 1
+            summary[result["status"]] += 1
+            if result["status"] == "changed":
+                changed.append(result)
+            elif result["status"] == "error":
+                errors.append(result)
+
+    if workers == 1:
+        collect(map(worker, paths))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            collect(pool.map(worker, paths, chunksize=MAP_CHUNK_SIZE))
+
+    return {
+        "dry_run": dry_run,
+        "summary": summary,
+        "changed": changed,
+        "errors": errors,
+    }
+
+
+def main():
+    """CLI エントリポイント"""
+    parser = argparse.ArgumentParser(description="MIRRALISM Frontmatter 一括正規化")
+    parser.add_argument("vault", type=Path, help="対象 vault（markdown ディレクトリ）")
+    parser.add_argument("--apply", action="store_true", help="変更を書き込む（既定は dry-run）")
+    parser.add_argument("--workers", type=int, default=None, help="並列プロセス数")
+    parser.add_argument("--report", type=Path, default=None, help="JSON レポート出力先")
+    args = parser.parse_args()
+
+    report = normalize_vault(
+        args.vault, dry_run=not args.apply, max_workers=args.workers
+    )
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if report["dry_run"]:
+        for result in report["changed"]:
+            print(result["diff"])
+    for result in report["errors"]:
+        print(f"❌ {result['path']}: {result['error']}")
+
+    mode = "dry-run" if report["dry_run"] else "適用"
+    print(f"📊 Frontmatter 正規化（{mode}）: {report['summary']}")
+    return 0 if not report["errors"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
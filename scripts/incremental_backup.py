@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+MIRRALISM V2 増分スナップショットバックアップ
+============================================
+
+V1失敗教訓：
+- マイグレーション毎の copytree による完全複製
+- .mirralism/backups/ へのソースツリー重複蓄積
+
+V2改善：
+- SHA-256 キーのコンテンツアドレス型 blob ストア（同一内容は1回だけ保存）
+- バックアップ毎のマニフェスト（パス → ハッシュ・サイズ・mtime）
+- 前回マニフェストとサイズ・mtime が一致するファイルは再ハッシュせず参照のみ
+- 復元は現状と差分のあるファイルのみ書き戻し
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """ファイル内容の SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IncrementalBackupStore:
+    """コンテンツアドレス型増分バックアップストア
+
+    レイアウト:
+        <store_dir>/objects/<hash[:2]>/<hash[2:]>   内容 blob（読み取り専用）
+        <store_dir>/snapshots/<backup_id>.json      マニフェスト
+    """
+
+    def __init__(self, store_dir: Path):
+        self.store_dir = Path(store_dir)
+        self.objects_dir = self.store_dir / "objects"
+        self.snapshots_dir = self.store_dir / "snapshots"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # スナップショット作成
+    # ------------------------------------------------------------------
+    def create_snapshot(
+        self,
+        root_dir: Path,
+        targets: Iterable[str],
+        backup_id: Optional[str] = None,
+    ) -> Dict:
+        """対象パス（ディレクトリ・ファイル）の増分スナップショット作成
+
+        Returns:
+            マニフェスト（stats に新規 blob 数・再利用数を含む）
+        """
+        root_dir = Path(root_dir)
+        backup_id = backup_id or datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        previous = self.latest_manifest()
+        previous_files = previous["files"] if previous else {}
+
+        files: Dict[str, Dict] = {}
+        roots: List[str] = []
+        stats = {"files": 0, "new_blobs": 0, "reused": 0, "bytes_added": 0}
+
+        for target in targets:
+            source = root_dir / target
+            if not source.exists():
+                continue
+            roots.append(target)
+            for file_path in self._iter_files(source):
+                rel_path = file_path.relative_to(root_dir).as_posix()
+                st = file_path.stat()
+                prev = previous_files.get(rel_path)
+
+                if (
+                    prev
+                    and prev["size"] == st.st_size
+                    and prev["mtime_ns"] == st.st_mtime_ns
+                    and self._blob_path(prev["hash"]).exists()
+                ):
+                    digest = prev["hash"]
+                    stats["reused"] += 1
+                else:
+                    digest = hash_file(file_path)
+                    if self._store_blob(file_path, digest):
+                        stats["new_blobs"] += 1
+                        stats["bytes_added"] += st.st_size
+                    else:
+                        stats["reused"] += 1
+
+                files[rel_path] = {
+                    "hash": digest,
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "mode": st.st_mode & 0o777,
+                }
+                stats["files"] += 1
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "backup_id": backup_id,
+            "created_at": datetime.datetime.now().isoformat(),
+            "parent": previous["backup_id"] if previous else None,
+            "roots": roots,
+            "files": files,
+            "stats": stats,
+        }
+        self._write_json_atomic(self._manifest_path(backup_id), manifest)
+        return manifest
+
+    # ------------------------------------------------------------------
+    # 復元
+    # ------------------------------------------------------------------
+    def restore_snapshot(self, backup_id: str, root_dir: Path) -> Dict[str, int]:
+        """差分のあるファイルのみ復元し、スナップショット外のファイルは削除"""
+        manifest = self.load_manifest(backup_id)
+        if manifest is None:
+            raise FileNotFoundError(f"snapshot not found: {backup_id}")
+
+        root_dir = Path(root_dir)
+        files = manifest["files"]
+        results = {"restored": 0, "unchanged": 0, "removed": 0}
+
+        for rel_path, entry in files.items():
+            dest = root_dir / rel_path
+            if self._matches(dest, entry):
+                results["unchanged"] += 1
+                continue
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if dest.is_dir():
+                shutil.rmtree(dest)
+            tmp_path = dest.with_name(f".{dest.name}.restore_tmp")
+            shutil.copyfile(self._blob_path(entry["hash"]), tmp_path)
+            os.chmod(tmp_path, entry.get("mode", 0o644))
+            os.replace(tmp_path, dest)
+            os.utime(dest, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            results["restored"] += 1
+
+        # 旧 rmtree + copytree 相当：対象ルート内の余分なファイルを削除
+        for target in manifest["roots"]:
+            source = root_dir / target
+            if not source.exists():
+                continue
+            for file_path in self._iter_files(source):
+                rel_path = file_path.relative_to(root_dir).as_posix()
+                if rel_path not in files:
+                    file_path.unlink()
+                    results["removed"] += 1
+
+        return results
+
+    # ------------------------------------------------------------------
+    # マニフェスト管理
+    # ------------------------------------------------------------------
+    def list_snapshots(self) -> List[str]:
+        """バックアップID一覧（古い順）"""
+        return sorted(p.stem for p in self.snapshots_dir.glob("*.json"))
+
+    def load_manifest(self, backup_id: str) -> Optional[Dict]:
+        """マニフェスト読み込み"""
+        manifest_path = self._manifest_path(backup_id)
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def latest_manifest(self) -> Optional[Dict]:
+        """最新マニフェスト"""
+        snapshots = self.list_snapshots()
+        return self.load_manifest(snapshots[-1]) if snapshots else None
+
+    def prune(self, keep: int) -> Dict[str, int]:
+        """古いスナップショット削除と未参照 blob の回収"""
+        snapshots = self.list_snapshots()
+        removed_snapshots = 0
+        for backup_id in snapshots[: max(len(snapshots) - keep, 0)]:
+            self._manifest_path(backup_id).unlink()
+            removed_snapshots += 1
+
+        referenced = set()
+        for backup_id in self.list_snapshots():
+            manifest = self.load_manifest(backup_id)
+            referenced.update(entry["hash"] for entry in manifest["files"].values())
+
+        removed_blobs = 0
+        for blob in self.objects_dir.glob("*/*"):
+            if blob.parent.name + blob.name not in referenced:
+                os.chmod(blob, 0o644)
+                blob.unlink()
+                removed_blobs += 1
+
+        return {"snapshots": removed_snapshots, "blobs": removed_blobs}
+
+    # ------------------------------------------------------------------
+    # 内部処理
+    # ------------------------------------------------------------------
+    def _iter_files(self, source: Path):
+        """通常ファイルの再帰列挙（os.scandir ベース、シンボリックリンクは追跡しない）"""
+        if source.is_file():
+            yield source
+            return
+        stack = [source]
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _manifest_path(self, backup_id: str) -> Path:
+        return self.snapshots_dir / f"{backup_id}.json"
+
+    def _store_blob(self, source: Path, digest: str) -> bool:
+        """blob 保存（既存なら False）
+
+        shutil.copyfile は Linux では copy_file_range を使うため、
+        Btrfs/XFS 等ではファイルシステム側で reflink 共有される。
+        """
+        blob_path = self._blob_path(digest)
+        if blob_path.exists():
+            return False
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=blob_path.parent, prefix=".tmp_")
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_name)
+            os.chmod(tmp_name, 0o444)
+            os.replace(tmp_name, blob_path)
+        except Exception:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return True
+
+    def _matches(self, path: Path, entry: Dict) -> bool:
+        """現ファイルがマニフェストエントリと同一内容か"""
+        if not path.is_file():
+            return False
+        st = path.stat()
+        if st.st_size != entry["size"]:
+            return False
+        if st.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        return hash_file(path) == entry["hash"]
+
+    def _write_json_atomic(self, path: Path, data: Dict) -> None:
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
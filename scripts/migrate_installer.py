@@ -26,6 +26,8 @@ from typing import Tuple
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT / "scripts"))
 
+from incremental_backup import IncrementalBackupStore  # noqa: E402
+
 try:
     from auto_migrate_organizer import MigrationOrganizer
     from file_organizer import FlexibleFileOrganizer
@@ -45,6 +47,7 @@ class MirralismMigrationInstaller:
         # ログディレクトリ作成
         self.config_dir.mkdir(exist_ok=True)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self.backup_store = IncrementalBackupStore(self.backup_dir)
 
         # 設定読み込み
         self.config = self._load_config()
@@ -101,14 +104,17 @@ class MirralismMigrationInstaller:
         with open(self.log_file, "a", encoding="utf-8") as f:
             f.write(log_entry + "\n")
 
-    def create_backup(self) -> str:
-        """完全バックアップ作成"""
+    def create_backup(self) -> Optional[str]:
+        """増分スナップショットバックアップ作成
+
+        内容は .mirralism/backups/objects/ にハッシュキーで1回だけ保存され、
+        バックアップ毎には snapshots/<backup_id>.json のマニフェストのみ追加される。
+        """
         backup_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = self.backup_dir / f"pre_migration_{backup_id}"
 
         self._log(f"バックアップ作成開始: {backup_id}")
 
-        # 重要ディレクトリのバックアップ
+        # 重要ディレクトリ・設定ファイル
         critical_dirs = [
             "Core/PersonalityLearning",
             "Data",
@@ -116,20 +122,6 @@ class MirralismMigrationInstaller:
             "Documentation",
             "scripts",
         ]
-
-        backup_path.mkdir(parents=True, exist_ok=True)
-
-        for dir_name in critical_dirs:
-            source_dir = self.root_dir / dir_name
-            if source_dir.exists():
-                dest_dir = backup_path / dir_name
-                try:
-                    shutil.copytree(source_dir, dest_dir, dirs_exist_ok=True)
-                    self._log(f"バックアップ完了: {dir_name}")
-                except Exception as e:
-                    self._log(f"バックアップエラー {dir_name}: {e}", "error")
-
-        # 設定ファイルのバックアップ
         config_files = [
             ".gitignore",
             "CLAUDE.md",
@@ -138,16 +130,23 @@ class MirralismMigrationInstaller:
             "package.json",
         ]
 
-        for file_name in config_files:
-            source_file = self.root_dir / file_name
-            if source_file.exists():
-                try:
-                    shutil.copy2(source_file, backup_path / file_name)
-                    self._log(f"設定ファイルバックアップ: {file_name}")
-                except Exception as e:
-                    self._log(f"設定ファイルバックアップエラー {file_name}: {e}", "error")
+        try:
+            manifest = self.backup_store.create_snapshot(
+                self.root_dir, critical_dirs + config_files, backup_id
+            )
+        except Exception as e:
+            self._log(f"バックアップエラー: {e}", "error")
+            return None
 
-        self._log(f"バックアップ完了: {backup_path}")
+        for target in manifest["roots"]:
+            self._log(f"バックアップ完了: {target}")
+
+        stats = manifest["stats"]
+        self._log(
+            f"バックアップ完了: {backup_id} "
+            f"({stats['files']}ファイル, 新規{stats['new_blobs']}, "
+            f"再利用{stats['reused']}, +{stats['bytes_added']}バイト)"
+        )
         return backup_id
 
     def check_dependencies(self) -> bool:
@@ -417,7 +416,26 @@ class MirralismMigrationInstaller:
         return True
 
     def rollback(self, backup_id: str) -> bool:
-        """ロールバック実行"""
+        """ロールバック実行（差分ファイルのみ復元）"""
+        if self.backup_store.load_manifest(backup_id) is None:
+            return self._rollback_legacy(backup_id)
+
+        self._log(f"ロールバック開始: {backup_id}")
+
+        try:
+            results = self.backup_store.restore_snapshot(backup_id, self.root_dir)
+            self._log(
+                f"ロールバック完了: 復元{results['restored']}, "
+                f"変更なし{results['unchanged']}, 削除{results['removed']}"
+            )
+            return True
+
+        except Exception as e:
+            self._log(f"ロールバックエラー: {e}", "error")
+            return False
+
+    def _rollback_legacy(self, backup_id: str) -> bool:
+        """旧形式（pre_migration_<id> 完全コピー）からのロールバック"""
         backup_path = self.backup_dir / f"pre_migration_{backup_id}"
 
         if not backup_path.exists():
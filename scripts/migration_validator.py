@@ -7,11 +7,19 @@ MIRRALISM V2 マイグレーション検証・ロールバックシステム
 """
 
 import datetime
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pathlib import Path
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -19,6 +27,9 @@ from typing import Tuple
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# 未開始の検証の開始検出間隔（秒）
+START_POLL_INTERVAL = 0.05
+
 
 class MigrationValidator:
     """マイグレーション検証システム"""
@@ -33,6 +44,12 @@ class MigrationValidator:
             "errors": [],
             "warnings": [],
         }
+        self._results_lock = threading.Lock()
+        # パイプライン実行中は検証毎の記録をここへ溜め、完了後に登録順で反映
+        self._capture = threading.local()
+        self.dependency_cache_file = (
+            self.root_dir / ".mirralism" / "cache" / "dependency_resolution.json"
+        )
 
     def _load_validation_config(self) -> Dict:
         """検証設定読み込み"""
@@ -60,7 +77,61 @@ class MigrationValidator:
                 "max_calculation_time": 1.0,
                 "required_accuracy": 100.0,
             },
+            # 1プロセス内で一括インポート検証するコアモジュール
+            "core_modules": [
+                "Core.PersonalityLearning.database",
+                "Core.PersonalityLearning.unified_system",
+                "Core.PersonalityLearning.mirralism_personality_engine_basic",
+            ],
+            # 検証ごとのタイムアウト（秒）
+            "check_timeouts": {
+                "file_structure": 10.0,
+                "core_systems": 15.0,
+                "core_imports": 30.0,
+                "dependencies": 30.0,
+                "database_integrity": 15.0,
+                "configuration": 10.0,
+                "performance": 15.0,
+            },
+        }
+
+    def _record_check(
+        self, check_name: str, success: bool, errors: List[str], warnings: List[str]
+    ) -> bool:
+        """検証結果記録（並列実行対応）"""
+        record = {
+            "name": check_name,
+            "status": "passed" if success else "failed",
+            "errors": errors,
+            "warnings": warnings,
         }
+        buffer = getattr(self._capture, "records", None)
+        if buffer is not None:
+            buffer.append(record)
+        else:
+            self._merge_records([record])
+        return success
+
+    def _merge_records(self, records: List[Dict]):
+        with self._results_lock:
+            for record in records:
+                self.results["checks"].append(record)
+                self.results["errors"].extend(record["errors"])
+                self.results["warnings"].extend(record["warnings"])
+
+    def _captured(
+        self, func: Callable[[], bool], records: List[Dict]
+    ) -> Callable[[], bool]:
+        """検証関数の _record_check 呼び出しを records に溜めるラッパー"""
+
+        def run() -> bool:
+            self._capture.records = records
+            try:
+                return func()
+            finally:
+                self._capture.records = None
+
+        return run
 
     def validate_file_structure(self) -> bool:
         """ファイル構造検証"""
@@ -88,21 +159,7 @@ class MigrationValidator:
                             warnings.append(f"推奨ディレクトリが存在しません: {base_path}/{item}")
 
         success = len(errors) == 0
-        self.results["checks"].append(
-            {
-                "name": check_name,
-                "status": "passed" if success else "failed",
-                "errors": errors,
-                "warnings": warnings,
-            }
-        )
-
-        if errors:
-            self.results["errors"].extend(errors)
-        if warnings:
-            self.results["warnings"].extend(warnings)
-
-        return success
+        return self._record_check(check_name, success, errors, warnings)
 
     def validate_core_systems(self) -> bool:
         """コアシステム検証"""
@@ -158,21 +215,7 @@ class MigrationValidator:
             errors.append(f"日付システム検証エラー: {e}")
 
         success = len(errors) == 0
-        self.results["checks"].append(
-            {
-                "name": check_name,
-                "status": "passed" if success else "failed",
-                "errors": errors,
-                "warnings": warnings,
-            }
-        )
-
-        if errors:
-            self.results["errors"].extend(errors)
-        if warnings:
-            self.results["warnings"].extend(warnings)
-
-        return success
+        return self._record_check(check_name, success, errors, warnings)
 
     def validate_dependencies(self) -> bool:
         """依存関係検証"""
@@ -188,6 +231,14 @@ class MigrationValidator:
         except ImportError as e:
             errors.append(f"Python標準ライブラリインポートエラー: {e}")
 
+        # requirements.txt 解決（ハッシュキーでキャッシュ）
+        try:
+            missing = self.resolve_requirements()
+            for requirement in missing:
+                warnings.append(f"未インストールの依存パッケージ: {requirement}")
+        except Exception as e:
+            warnings.append(f"requirements.txt 解決警告: {e}")
+
         # Node.js 検証
         try:
             result = subprocess.run(
@@ -214,21 +265,99 @@ class MigrationValidator:
             warnings.append(f"Git 検証警告: {e}")
 
         success = len(errors) == 0
-        self.results["checks"].append(
-            {
-                "name": check_name,
-                "status": "passed" if success else "failed",
-                "errors": errors,
-                "warnings": warnings,
-            }
+        return self._record_check(check_name, success, errors, warnings)
+
+    def validate_core_imports(self) -> bool:
+        """コアモジュールのインポート検証（1インタープリタで一括実行）"""
+        check_name = "core_imports_validation"
+        errors = []
+        warnings = []
+
+        modules = self.validation_config["core_modules"]
+        max_import_time = self.validation_config["thresholds"]["max_import_time"]
+        script = (
+            "import importlib, json, sys, time\n"
+            "results = {}\n"
+            "for name in sys.argv[1:]:\n"
+            "    start = time.perf_counter()\n"
+            "    try:\n"
+            "        importlib.import_module(name)\n"
+            "        results[name] = [None, time.perf_counter() - start]\n"
+            "    except BaseException as e:\n"
+            "        results[name] = [repr(e), time.perf_counter() - start]\n"
+            "print(json.dumps(results))\n"
         )
 
-        if errors:
-            self.results["errors"].extend(errors)
-        if warnings:
-            self.results["warnings"].extend(warnings)
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", script, *modules],
+                cwd=self.root_dir,
+                capture_output=True,
+                text=True,
+                timeout=self.validation_config["check_timeouts"]["core_imports"],
+            )
+            if result.returncode != 0:
+                errors.append(f"インポート検証プロセスエラー: {result.stderr.strip()}")
+            else:
+                report = json.loads(result.stdout.strip().splitlines()[-1])
+                for name, (error, elapsed) in report.items():
+                    if error:
+                        errors.append(f"モジュールインポート失敗: {name}: {error}")
+                    elif elapsed > max_import_time:
+                        warnings.append(f"インポートが遅いです: {name} ({elapsed:.2f}秒)")
+
+        except subprocess.TimeoutExpired:
+            errors.append("インポート検証がタイムアウトしました")
+        except Exception as e:
+            errors.append(f"インポート検証エラー: {e}")
 
-        return success
+        success = len(errors) == 0
+        return self._record_check(check_name, success, errors, warnings)
+
+    def resolve_requirements(self) -> List[str]:
+        """requirements.txt の未インストールパッケージ一覧
+
+        pip サブプロセスは使わず importlib.metadata で解決し、
+        requirements.txt と Python 実行環境のハッシュをキーにキャッシュする。
+        """
+        requirements_file = self.root_dir / "requirements.txt"
+        if not requirements_file.exists():
+            return []
+
+        content = requirements_file.read_bytes()
+        cache_key = hashlib.sha256(
+            content + sys.executable.encode() + sys.version.encode()
+        ).hexdigest()
+
+        if self.dependency_cache_file.exists():
+            try:
+                with open(self.dependency_cache_file, "r", encoding="utf-8") as f:
+                    cached = json.load(f)
+                if cached.get("key") == cache_key:
+                    return cached["missing"]
+            except Exception:
+                pass
+
+        from importlib import metadata
+
+        missing = []
+        for line in content.decode("utf-8").splitlines():
+            requirement = line.split("#", 1)[0].strip()
+            if not requirement or requirement.startswith("-"):
+                continue
+            name = requirement
+            for separator in ("[", "=", "<", ">", "!", "~", ";", " "):
+                name = name.split(separator, 1)[0]
+            try:
+                metadata.version(name)
+            except metadata.PackageNotFoundError:
+                missing.append(requirement)
+
+        self.dependency_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.dependency_cache_file, "w", encoding="utf-8") as f:
+            json.dump({"key": cache_key, "missing": missing}, f, ensure_ascii=False)
+
+        return missing
 
     def validate_database_integrity(self) -> bool:
         """データベース整合性検証"""
@@ -284,21 +413,7 @@ class MigrationValidator:
             errors.append(f"データベース検証エラー: {e}")
             success = False
 
-        self.results["checks"].append(
-            {
-                "name": check_name,
-                "status": "passed" if success else "failed",
-                "errors": errors,
-                "warnings": warnings,
-            }
-        )
-
-        if errors:
-            self.results["errors"].extend(errors)
-        if warnings:
-            self.results["warnings"].extend(warnings)
-
-        return success
+        return self._record_check(check_name, success, errors, warnings)
 
     def validate_configuration(self) -> bool:
         """設定検証"""
@@ -336,21 +451,7 @@ class MigrationValidator:
                     warnings.append(f"migration_config.json 読み込みエラー: {e}")
 
         success = len(errors) == 0
-        self.results["checks"].append(
-            {
-                "name": check_name,
-                "status": "passed" if success else "failed",
-                "errors": errors,
-                "warnings": warnings,
-            }
-        )
-
-        if errors:
-            self.results["errors"].extend(errors)
-        if warnings:
-            self.results["warnings"].extend(warnings)
-
-        return success
+        return self._record_check(check_name, success, errors, warnings)
 
     def run_performance_tests(self) -> bool:
         """パフォーマンステスト実行"""
@@ -388,51 +489,84 @@ class MigrationValidator:
             errors.append(f"パフォーマンステストエラー: {e}")
 
         success = len(errors) == 0
-        self.results["checks"].append(
-            {
-                "name": check_name,
-                "status": "passed" if success else "failed",
-                "errors": errors,
-                "warnings": warnings,
-            }
-        )
-
-        if errors:
-            self.results["errors"].extend(errors)
-        if warnings:
-            self.results["warnings"].extend(warnings)
-
-        return success
+        return self._record_check(check_name, success, errors, warnings)
 
-    def run_full_validation(self) -> bool:
-        """完全検証実行"""
+    def run_full_validation(self, max_workers: int = 4) -> bool:
+        """完全検証実行（依存関係のない検証は並列実行）"""
         print("🔍 MIRRALISM V2 マイグレーション検証開始")
         print("=" * 50)
 
-        validation_functions = [
-            ("ファイル構造", self.validate_file_structure),
-            ("コアシステム", self.validate_core_systems),
-            ("依存関係", self.validate_dependencies),
-            ("データベース整合性", self.validate_database_integrity),
-            ("設定ファイル", self.validate_configuration),
-            ("パフォーマンス", self.run_performance_tests),
-        ]
+        timeouts = self.validation_config["check_timeouts"]
+        pipeline = ValidationPipeline(max_workers=max_workers)
+        records: Dict[str, List[Dict]] = {name: [] for name in timeouts}
+        pipeline.add(
+            "file_structure",
+            "ファイル構造",
+            self._captured(self.validate_file_structure, records["file_structure"]),
+            timeout=timeouts["file_structure"],
+        )
+        pipeline.add(
+            "core_systems",
+            "コアシステム",
+            self._captured(self.validate_core_systems, records["core_systems"]),
+            depends_on=["file_structure"],
+            timeout=timeouts["core_systems"],
+        )
+        pipeline.add(
+            "core_imports",
+            "コアモジュールインポート",
+            self._captured(self.validate_core_imports, records["core_imports"]),
+            depends_on=["file_structure"],
+            timeout=timeouts["core_imports"],
+        )
+        pipeline.add(
+            "dependencies",
+            "依存関係",
+            self._captured(self.validate_dependencies, records["dependencies"]),
+            timeout=timeouts["dependencies"],
+        )
+        pipeline.add(
+            "database_integrity",
+            "データベース整合性",
+            self._captured(
+                self.validate_database_integrity, records["database_integrity"]
+            ),
+            timeout=timeouts["database_integrity"],
+        )
+        pipeline.add(
+            "configuration",
+            "設定ファイル",
+            self._captured(self.validate_configuration, records["configuration"]),
+            timeout=timeouts["configuration"],
+        )
+        pipeline.add(
+            "performance",
+            "パフォーマンス",
+            self._captured(self.run_performance_tests, records["performance"]),
+            depends_on=["core_systems"],
+            timeout=timeouts["performance"],
+        )
 
         all_passed = True
-
-        for test_name, test_func in validation_functions:
-            print(f"\n🧪 {test_name}検証中...")
-            try:
-                passed = test_func()
-                status = "✅ 成功" if passed else "❌ 失敗"
-                print(f"   {status}")
-
-                if not passed:
-                    all_passed = False
-
-            except Exception as e:
-                print(f"   ❌ エラー: {e}")
-                self.results["errors"].append(f"{test_name}検証エラー: {e}")
+        for outcome in pipeline.run():
+            # 完了した検証の記録のみ反映（タイムアウト後の遅延記録は無視）
+            if outcome["status"] in ("passed", "failed"):
+                self._merge_records(records[outcome["name"]])
+            print(f"\n🧪 {outcome['label']}検証 ({outcome['elapsed']:.2f}秒)")
+            if outcome["status"] == "passed":
+                print("   ✅ 成功")
+            elif outcome["status"] == "failed":
+                print("   ❌ 失敗")
+                all_passed = False
+            elif outcome["status"] == "skipped":
+                print(f"   ⏭️ スキップ: {outcome['error']}")
+                all_passed = False
+            else:
+                print(f"   ❌ エラー: {outcome['error']}")
+                with self._results_lock:
+                    self.results["errors"].append(
+                        f"{outcome['label']}検証エラー: {outcome['error']}"
+                    )
                 all_passed = False
 
         self.results["overall_status"] = "passed" if all_passed else "failed"
@@ -473,6 +607,142 @@ class MigrationValidator:
         return output_file
 
 
+class ValidationPipeline:
+    """DAG ベース検証ランナー
+
+    依存先がすべて完了した検証から順にスレッドプールへ投入し、
+    検証ごとのタイムアウトを適用する。依存先が成功しなかった検証は skipped。
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.checks: Dict[str, Dict] = {}
+
+    def add(
+        self,
+        name: str,
+        label: str,
+        func: Callable[[], bool],
+        depends_on: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """検証登録"""
+        for dependency in depends_on or []:
+            if dependency not in self.checks:
+                raise ValueError(f"未登録の依存検証: {dependency}")
+        self.checks[name] = {
+            "label": label,
+            "func": func,
+            "depends_on": list(depends_on or []),
+            "timeout": timeout,
+        }
+
+    def run(self) -> List[Dict]:
+        """全検証実行（結果は登録順）
+
+        タイムアウトはワーカーで実際に開始した時点から計測する
+        （空きワーカー待ちの時間は含めない）。
+        """
+        outcomes: Dict[str, Dict] = {}
+        pending = dict(self.checks)
+        running: Dict[Future, str] = {}
+        started: Dict[str, float] = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                # 依存関係が解決済みの検証を投入
+                for name in list(pending):
+                    check = pending[name]
+                    dependencies = check["depends_on"]
+                    if any(dep not in outcomes for dep in dependencies):
+                        continue
+                    del pending[name]
+                    failed = [
+                        dep
+                        for dep in dependencies
+                        if outcomes[dep]["status"] != "passed"
+                    ]
+                    if failed:
+                        outcomes[name] = self._outcome(
+                            name, "skipped", 0.0, f"依存検証未成功: {', '.join(failed)}"
+                        )
+                        continue
+                    future = executor.submit(self._timed, name, check["func"], started)
+                    running[future] = name
+
+                if not running:
+                    continue
+
+                timed = [
+                    name
+                    for name in running.values()
+                    if self.checks[name]["timeout"] is not None
+                ]
+                deadlines = [
+                    started[name] + self.checks[name]["timeout"]
+                    for name in timed
+                    if name in started
+                ]
+                wait_time = (
+                    max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+                )
+                if any(name not in started for name in timed):
+                    # 未開始の検証は開始時刻を拾うため短い間隔で確認
+                    wait_time = (
+                        START_POLL_INTERVAL
+                        if wait_time is None
+                        else min(wait_time, START_POLL_INTERVAL)
+                    )
+                done, _ = wait(running, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        passed, elapsed = future.result()
+                        status = "passed" if passed else "failed"
+                        outcomes[name] = self._outcome(name, status, elapsed)
+                    except Exception as e:
+                        outcomes[name] = self._outcome(name, "error", 0.0, str(e))
+
+                now = time.monotonic()
+                for future, name in list(running.items()):
+                    timeout = self.checks[name]["timeout"]
+                    if timeout is None or name not in started:
+                        continue
+                    elapsed = now - started[name]
+                    if elapsed >= timeout:
+                        # 以降に完了しても結果は採用しない
+                        running.pop(future)
+                        outcomes[name] = self._outcome(
+                            name, "error", elapsed, f"タイムアウト ({timeout}秒)"
+                        )
+        finally:
+            # タイムアウトした検証スレッドの完了は待たない
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return [outcomes[name] for name in self.checks]
+
+    def _timed(
+        self, name: str, func: Callable[[], bool], started: Dict[str, float]
+    ) -> Tuple[bool, float]:
+        start = time.monotonic()
+        started[name] = start
+        passed = func()
+        return bool(passed), time.monotonic() - start
+
+    def _outcome(
+        self, name: str, status: str, elapsed: float, error: Optional[str] = None
+    ) -> Dict:
+        return {
+            "name": name,
+            "label": self.checks[name]["label"],
+            "status": status,
+            "elapsed": elapsed,
+            "error": error,
+        }
+
+
 class AutoRollbackSystem:
     """自動ロールバックシステム"""
 
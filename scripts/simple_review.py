@@ -7,19 +7,26 @@
 """
 
 import json
+import sys
 from pathlib import Path
 
-def show_first_file():
+sys.path.append(str(Path(__file__).parent))
+from superwhisper_corpus_index import SuperWhisperCorpusIndex
+
+def show_first_file(project_root=None):
     """最初のファイルを表示"""
-    project_root = Path("/Users/suetakeshuuhei/MIRRALISM_V2")
-    files = list(project_root.rglob("superwhisper_*.md"))
+    project_root = Path(project_root or Path(__file__).parent.parent)
+    index = SuperWhisperCorpusIndex(project_root)
+    index.refresh()
+    latest = index.latest()
+    index.close()
     
-    if not files:
+    if not latest:
         print("SuperWhisperファイルが見つかりません")
         return None
         
     # 最新ファイルを取得
-    latest_file = max(files, key=lambda x: x.stat().st_mtime)
+    latest_file = Path(latest["file_path"])
     
     try:
         with open(latest_file, 'r', encoding='utf-8') as f:
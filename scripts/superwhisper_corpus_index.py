@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+SuperWhisper コーパスインデックス
+===============================
+
+レビューツール共通の SQLite 永続インデックス
+- パス・mtime・サイズ・frontmatter・音声内容のバイトオフセットを保持
+- 変更のあったファイルのみ再解析（mtime/サイズ比較による増分更新）
+- ディレクトリの mtime を保持し、未変更ディレクトリは列挙しない
+- レビュー状態はレビューア単位で保持し、
+  「未レビューの次のN件（mtime順）」を1回のインデックス付きクエリで取得
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+AUDIO_SECTION_HEADER = "## 音声内容"
+FILE_PREFIX = "superwhisper_"
+FILE_SUFFIX = ".md"
+
+# 走査対象外ディレクトリ
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+# 走査開始からこの範囲内の mtime は信頼しない（同一 mtime での再変更対策）
+RACY_MTIME_NS = 2 * 10**9
+
+UPSERT_FILE_SQL = """
+    INSERT OR REPLACE INTO files
+    (path, name, mtime_ns, size, frontmatter, created, quality_score,
+     classification, audio_start, audio_end, text_length)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def parse_frontmatter(content: str) -> Tuple[Dict[str, str], str]:
+    """frontmatter（key: value 行）と本文を分離"""
+    metadata = {}
+    if content.startswith("---"):
+        yaml_end = content.find("---", 3)
+        if yaml_end > 0:
+            yaml_content = content[3:yaml_end]
+            for line in yaml_content.strip().split("\n"):
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    metadata[key.strip()] = value.strip()
+
+    if "---" in content:
+        parts = content.split("---", 2)
+        body = parts[2].strip() if len(parts) >= 3 else content
+    else:
+        body = content
+
+    return metadata, body
+
+
+def body_offset(content: str) -> int:
+    """parse_frontmatter が返す本文の開始文字オフセット"""
+    if "---" not in content:
+        return 0
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return 0
+    rest = parts[2]
+    return len(parts[0]) + len(parts[1]) + 6 + (len(rest) - len(rest.lstrip()))
+
+
+def locate_audio_content(content: str, start: int = 0) -> Optional[Tuple[int, int]]:
+    """「## 音声内容」セクションの文字オフセット（見出し直後〜次の見出し）"""
+    start = content.find(AUDIO_SECTION_HEADER, start)
+    if start == -1:
+        return None
+    end = content.find("##", start + 1)
+    if end == -1:
+        end = len(content)
+    return start + len(AUDIO_SECTION_HEADER), end
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class SuperWhisperCorpusIndex:
+    """SuperWhisper markdown コーパスの永続インデックス"""
+
+    def __init__(self, project_root: Path, db_path: Optional[Path] = None):
+        self.project_root = Path(project_root)
+        self.db_path = Path(
+            db_path or self.project_root / ".mirralism" / "superwhisper_index.db"
+        )
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        """スキーマ初期化"""
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                frontmatter TEXT NOT NULL,
+                created TEXT,
+                quality_score REAL,
+                classification TEXT,
+                audio_start INTEGER,
+                audio_end INTEGER,
+                text_length INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_files_mtime ON files(mtime_ns);
+            CREATE TABLE IF NOT EXISTS dirs (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                subdirs TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_files_name ON files(name);
+            CREATE TABLE IF NOT EXISTS review_state (
+                reviewer TEXT NOT NULL,
+                path TEXT NOT NULL,
+                decision TEXT,
+                reviewed_at TEXT,
+                PRIMARY KEY (reviewer, path)
+            );
+            """
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # インデックス更新
+    # ------------------------------------------------------------------
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """増分更新: mtime が変わったディレクトリのみ列挙し、変更ファイルを再解析
+
+        ディレクトリ毎に1回の stat で済ませ、未変更ディレクトリ配下のファイルは
+        stat しない（置換なしの上書き編集は read_audio_content 時に検出）。
+        full=True は全ディレクトリを列挙し直す。
+        """
+        scan_start_ns = time.time_ns()
+        known_dirs = {
+            row["path"]: (row["mtime_ns"], json.loads(row["subdirs"]))
+            for row in self.conn.execute("SELECT path, mtime_ns, subdirs FROM dirs")
+        }
+        seen_dirs = set()
+        dir_updates = []
+        updates = []
+        removed = []
+
+        stack = [str(self.project_root)]
+        while stack:
+            current = stack.pop()
+            seen_dirs.add(current)
+            try:
+                dir_mtime_ns = os.stat(current).st_mtime_ns
+            except OSError:
+                continue
+            previous = known_dirs.get(current)
+            if not full and previous is not None and previous[0] == dir_mtime_ns:
+                stack.extend(previous[1])
+                continue
+
+            subdirs, present = self._list_dir(current)
+            known = self._known_files(current)
+            for path, st in present.items():
+                if known.get(path) == (st.st_mtime_ns, st.st_size):
+                    continue
+                record = self._analyze(Path(path), st)
+                if record is not None:
+                    updates.append(record)
+            removed.extend(known.keys() - present.keys())
+            # 走査直前に変更されたディレクトリは同じ mtime のまま再変更されうるため
+            # mtime を記録せず次回も列挙する
+            trusted = dir_mtime_ns < scan_start_ns - RACY_MTIME_NS
+            dir_updates.append(
+                (current, dir_mtime_ns if trusted else None, json.dumps(subdirs))
+            )
+            stack.extend(subdirs)
+
+        vanished = known_dirs.keys() - seen_dirs
+        for directory in vanished:
+            removed.extend(self._known_files(directory))
+
+        with self.conn:
+            self.conn.executemany(UPSERT_FILE_SQL, updates)
+            self.conn.executemany(
+                "DELETE FROM files WHERE path = ?", [(path,) for path in removed]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO dirs (path, mtime_ns, subdirs) "
+                "VALUES (?, ?, ?)",
+                dir_updates,
+            )
+            self.conn.executemany(
+                "DELETE FROM dirs WHERE path = ?", [(path,) for path in vanished]
+            )
+
+        return {
+            "indexed": self.count(),
+            "updated": len(updates),
+            "removed": len(removed),
+        }
+
+    def _list_dir(self, directory: str) -> Tuple[List[str], Dict[str, os.stat_result]]:
+        """直下のサブディレクトリと superwhisper_*.md（os.scandir ベース）"""
+        subdirs = []
+        present = {}
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return subdirs, present
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif (
+                    entry.name.startswith(FILE_PREFIX)
+                    and entry.name.endswith(FILE_SUFFIX)
+                    and entry.is_file()
+                ):
+                    present[entry.path] = entry.stat()
+        return subdirs, present
+
+    def _known_files(self, directory: str) -> Dict[str, Tuple[int, int]]:
+        """索引済みの直下ファイル（主キーの範囲検索）"""
+        prefix = directory.rstrip(os.sep) + os.sep
+        rows = self.conn.execute(
+            "SELECT path, mtime_ns, size FROM files WHERE path >= ? AND path < ?",
+            (prefix, prefix + "\U0010ffff"),
+        )
+        return {
+            row["path"]: (row["mtime_ns"], row["size"])
+            for row in rows
+            if os.path.dirname(row["path"]) == prefix[:-1]
+        }
+
+    def _reindex(self, file_path: Path, st) -> Optional[Dict]:
+        """1ファイルのみ再解析して行を更新（解析不能なら行を削除し None）"""
+        record = self._analyze(file_path, st)
+        with self.conn:
+            if record is None:
+                self.conn.execute("DELETE FROM files WHERE path = ?", (str(file_path),))
+                return None
+            self.conn.execute(UPSERT_FILE_SQL, record)
+        row = self.conn.execute(
+            "SELECT * FROM files WHERE path = ?", (str(file_path),)
+        ).fetchone()
+        return self._row_to_entry(row)
+
+    def _analyze(self, file_path: Path, st) -> Optional[tuple]:
+        """1ファイル解析（frontmatter・音声内容オフセット）"""
+        try:
+            raw = file_path.read_bytes()
+            content = raw.decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        metadata, _ = parse_frontmatter(content)
+        audio_start = audio_end = None
+        text_length = 0
+        span = locate_audio_content(content, body_offset(content))
+        if span is not None:
+            # 文字オフセット → バイトオフセット（seek 読み込み用）
+            char_start, char_end = span
+            audio_start = len(content[:char_start].encode("utf-8"))
+            audio_end = audio_start + len(content[char_start:char_end].encode("utf-8"))
+            text_length = len(content[char_start:char_end].strip())
+
+        return (
+            str(file_path),
+            file_path.name,
+            st.st_mtime_ns,
+            st.st_size,
+            json.dumps(metadata, ensure_ascii=False),
+            metadata.get("created", "Unknown"),
+            _to_float(metadata.get("quality_score", 0.0)),
+            metadata.get("classification", "Unknown"),
+            audio_start,
+            audio_end,
+            text_length,
+        )
+
+    # ------------------------------------------------------------------
+    # 参照
+    # ------------------------------------------------------------------
+    def next_unreviewed(
+        self, reviewer: str, limit: int = 1, newest_first: bool = False
+    ) -> List[Dict]:
+        """未レビューの次のN件（mtime順）"""
+        order = "DESC" if newest_first else "ASC"
+        rows = self.conn.execute(
+            f"""
+            SELECT f.* FROM files f
+            LEFT JOIN review_state r ON r.reviewer = ? AND r.path = f.path
+            WHERE r.path IS NULL
+            ORDER BY f.mtime_ns {order}
+            LIMIT ?
+            """,
+            (reviewer, limit),
+        ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def latest(self) -> Optional[Dict]:
+        """最新ファイル"""
+        row = self.conn.execute(
+            "SELECT * FROM files ORDER BY mtime_ns DESC LIMIT 1"
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def paths(self, newest_first: bool = False) -> List[Path]:
+        """全ファイルパス（mtime順）"""
+        order = "DESC" if newest_first else "ASC"
+        rows = self.conn.execute(f"SELECT path FROM files ORDER BY mtime_ns {order}")
+        return [Path(row["path"]) for row in rows]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def read_audio_content(self, entry: Dict) -> Optional[str]:
+        """保存済みオフセットから音声内容のみ読み込み
+
+        mtime/サイズがインデックスと異なるファイルは再解析してから読み込み、
+        entry も更新する。削除済み・解析不能なファイルは索引から除き None を返す。
+        """
+        file_path = Path(entry["file_path"])
+        try:
+            with open(file_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if (st.st_mtime_ns, st.st_size) != (
+                    entry["mtime_ns"],
+                    entry["file_size"],
+                ):
+                    fresh = self._reindex(file_path, st)
+                    if fresh is None:
+                        return None
+                    entry.update(fresh)
+                if entry["audio_start"] is None:
+                    return ""
+                f.seek(entry["audio_start"])
+                data = f.read(entry["audio_end"] - entry["audio_start"])
+        except FileNotFoundError:
+            with self.conn:
+                self.conn.execute("DELETE FROM files WHERE path = ?", (str(file_path),))
+            return None
+        return data.decode("utf-8", errors="replace").strip()
+
+    def _row_to_entry(self, row: sqlite3.Row) -> Dict:
+        return {
+            "file_path": row["path"],
+            "file_name": row["name"],
+            "mtime_ns": row["mtime_ns"],
+            "file_size": row["size"],
+            "metadata": json.loads(row["frontmatter"]),
+            "created_time": row["created"],
+            "quality_score": row["quality_score"],
+            "classification": row["classification"],
+            "audio_start": row["audio_start"],
+            "audio_end": row["audio_end"],
+            "text_length": row["text_length"],
+        }
+
+    # ------------------------------------------------------------------
+    # レビュー状態
+    # ------------------------------------------------------------------
+    def mark_reviewed(
+        self,
+        reviewer: str,
+        path: str,
+        decision: str,
+        reviewed_at: Optional[str] = None,
+    ):
+        """レビュー結果記録"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO review_state VALUES (?, ?, ?, ?)",
+                (reviewer, str(path), decision, reviewed_at),
+            )
+
+    def sync_reviews(
+        self,
+        reviewer: str,
+        paths: Iterable[str] = (),
+        names: Iterable[str] = (),
+    ) -> Dict[str, int]:
+        """既存レビューログ（JSON）を正としてレビュー状態を差分同期
+
+        ログにない行のみ削除し、未登録の行のみ追加する（既存行の判定・日時は保持）。
+
+        Args:
+            paths: レビュー済みファイルパス
+            names: レビュー済みファイル名（パス不明のログ用）
+        """
+        with self.conn:
+            self.conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS review_sync (path TEXT PRIMARY KEY)"
+            )
+            self.conn.execute("DELETE FROM review_sync")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO review_sync VALUES (?)",
+                [(str(path),) for path in paths],
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO review_sync "
+                "SELECT path FROM files WHERE name = ?",
+                [(name,) for name in names],
+            )
+            removed = self.conn.execute(
+                "DELETE FROM review_state WHERE reviewer = ? "
+                "AND path NOT IN (SELECT path FROM review_sync)",
+                (reviewer,),
+            ).rowcount
+            added = self.conn.execute(
+                "INSERT OR IGNORE INTO review_state (reviewer, path, decision) "
+                "SELECT ?, path, 'reviewed' FROM review_sync",
+                (reviewer,),
+            ).rowcount
+        return {"added": added, "removed": removed}
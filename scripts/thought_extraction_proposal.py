@@ -6,9 +6,14 @@
 SuperWhisperデータから以下の3層で情報を抽出・学習する提案
 """
 
+import sys
+from pathlib import Path
 from typing import Dict, List
 import re
 
+sys.path.append(str(Path(__file__).parent.parent / "API" / "integrations" / "superwhisper"))
+from transcription_profile import profile_transcription
+
 class ThoughtExtractionProposal:
     
     def analyze_business_strategy_thought(self, audio_content: str) -> Dict:
@@ -18,6 +23,9 @@ class ThoughtExtractionProposal:
         対象データ: 「デジライズとの差別化...セカンドブレイン大事にしたい...」
         """
         
+        # 層0: 転写品質プロファイル（取り込み判断の前提）
+        transcription_profile = profile_transcription(audio_content).to_dict()
+
         # 層1: 直接的キーワード抽出
         keywords = self.extract_keywords(audio_content)
         
@@ -28,6 +36,7 @@ class ThoughtExtractionProposal:
         values_and_motivations = self.extract_values_motivations(audio_content)
         
         return {
+            "transcription_profile": transcription_profile,
             "layer_1_keywords": keywords,
             "layer_2_thinking_patterns": thinking_patterns, 
             "layer_3_values_motivations": values_and_motivations,
@@ -152,6 +161,10 @@ def main():
     print("🧠 思考取り込み提案: 具体例")
     print("=" * 80)
     
+    profile = result['transcription_profile']
+    print("\n🎙️ 層0: 転写品質")
+    print(f"品質スコア: {profile['quality_score']:.2f} / ノイズレベル: {profile['noise_level']:.2f} / 文字数: {profile['length']}")
+
     print("\n📊 層1: 直接的キーワード抽出")
     print(f"ビジネス概念: {result['layer_1_keywords']['business_concepts']}")
     print(f"個人プロジェクト: {result['layer_1_keywords']['personal_projects']}")
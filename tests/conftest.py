@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.fixture
+def count_calls(monkeypatch):
+    """メソッド呼び出しを記録するラッパーを差し込み、呼び出し引数のリストを返す"""
+
+    def install(obj, name):
+        calls = []
+        original = getattr(obj, name)
+
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(obj, name, wrapper)
+        return calls
+
+    return install
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+インポート時間回帰テスト
+========================
+
+`python -X importtime` でCLIエントリポイントの起動コストを計測し、
+重量級依存（yaml, matplotlib, numpy 等）がインポート時に読み込まれないことを確認
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 短時間実行される cron / CLI エントリポイント
+ENTRY_POINTS = [
+    "Interface.WebClip",
+    "Interface.components.enhanced_transparency_system",
+    "scripts.data_review_system",
+    "scripts.simple_review",
+    "scripts.enhanced_review_system",
+    "scripts.directory_audit",
+    "scripts.claude_completion_notifier",
+]
+
+# インポート時に読み込まれてはならない重量級モジュール
+HEAVY_MODULES = {"yaml", "matplotlib", "seaborn", "numpy", "pandas", "scipy"}
+
+# 累積インポート時間の上限（マイクロ秒）: CI のばらつきを考慮した値
+MAX_CUMULATIVE_US = 200_000
+
+
+def measure_import(module: str) -> dict:
+    """-X importtime の出力を {モジュール名: 累積マイクロ秒} に変換"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_import_is_light(module):
+    """エントリポイントのインポートが軽量であること"""
+    timings = measure_import(module)
+
+    loaded_heavy = {name.split(".")[0] for name in timings} & HEAVY_MODULES
+    assert not loaded_heavy, f"{module} が重量級依存を読み込みました: {loaded_heavy}"
+
+    cumulative = timings[module]
+    assert (
+        cumulative < MAX_CUMULATIVE_US
+    ), f"{module}: {cumulative / 1000:.1f}ms（上限 {MAX_CUMULATIVE_US / 1000:.0f}ms）"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
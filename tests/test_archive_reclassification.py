@@ -0,0 +1,158 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.append(
+    str(Path(__file__).parent.parent / "API" / "integrations" / "superwhisper")
+)
+
+from archive_reclassification import ArchiveReclassifier  # noqa: E402
+from archive_reclassification import classify_entry  # noqa: E402
+from archive_reclassification import extract_saved_text  # noqa: E402
+
+GOOD_TEXT = "今日は 新しい 設計方針について 考えた。 明日 チームに 共有する。"
+SHORT_TEXT = "短い メモ です。"
+
+
+def _saved_file(directory, name, text, classification, notion_id):
+    label = (
+        "💭 Personal Thoughts"
+        if classification == "personal_thoughts"
+        else "📥 Inbox Raw"
+    )
+    content = f"""---
+source: SuperWhisper
+created: 2025-06-01T10:00:00+09:00
+classification: {label}
+quality_score: 0.40
+noise_level: 0.00
+notion_id: {notion_id}
+personality_learning_ready: {classification == "personal_thoughts"}
+content_source: rich_text
+---
+
+# SuperWhisper 音声記録
+
+**記録日時**: 2025年06月01日 10:00:00
+**分類**: {label}
+**品質スコア**: 40.0%
+**本文取得元**: rich_text
+
+## 音声内容
+
+{text}
+
+## メタデータ
+
+- **転写品質**: 40.0%
+- **ノイズレベル**: 0.0%
+- **文字数**: {len(text)}文字
+- **PersonalityLearning投入対象**: ⚠️ 要確認
+- **本文取得元**: rich_text
+
+---
+*SuperWhisper-Notion統合システム自動生成*
+"""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _setup(tmp_path):
+    thoughts = tmp_path / "thoughts"
+    raw_dir = tmp_path / "raw" / "PersonalThoughts_20250601_000000"
+    db_path = tmp_path / "processed.db"
+    good = _saved_file(
+        raw_dir,
+        "superwhisper_raw_20250601_100000.md",
+        GOOD_TEXT,
+        "raw_archive",
+        "n-good",
+    )
+    short = _saved_file(
+        thoughts,
+        "superwhisper_20250601_110000.md",
+        SHORT_TEXT,
+        "personal_thoughts",
+        "n-short",
+    )
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE processed_entries (notion_id TEXT PRIMARY KEY,"
+        " processed_at TIMESTAMP, file_path TEXT, classification TEXT,"
+        " quality_score REAL)"
+    )
+    conn.executemany(
+        "INSERT INTO processed_entries"
+        " (notion_id, file_path, classification, quality_score) VALUES (?, ?, ?, ?)",
+        [
+            ("n-good", str(good), "raw_archive", 0.4),
+            ("n-short", str(short), "personal_thoughts", 0.4),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    new_raw_dir = tmp_path / "raw" / "PersonalThoughts_20250602_000000"
+    reclassifier = ArchiveReclassifier(
+        {"quality_threshold": 0.9, "min_text_length": 20, "max_noise_level": 0.3},
+        personal_thoughts_dir=thoughts,
+        raw_archive_dir=new_raw_dir,
+        processed_db=db_path,
+    )
+    return reclassifier, good, short
+
+
+def test_classify_entry_thresholds():
+    entry = {"quality_score": 0.9, "text_length": 20, "noise_level": 0.3}
+    assert classify_entry(entry, {}) == "personal_thoughts"
+    assert classify_entry(entry, {"quality_threshold": 0.95}) == "raw_archive"
+    assert classify_entry({}, {}) == "raw_archive"
+
+
+def test_dry_run_plans_without_moving(tmp_path):
+    reclassifier, good, short = _setup(tmp_path)
+
+    stats = reclassifier.run(dry_run=True)
+
+    assert stats["scanned"] == 2
+    assert stats["promoted"] == 1
+    assert stats["demoted"] == 1
+    assert good.exists() and short.exists()
+
+
+def test_run_moves_files_and_updates_db(tmp_path):
+    reclassifier, good, short = _setup(tmp_path)
+
+    stats = reclassifier.run()
+
+    promoted = tmp_path / "thoughts" / "superwhisper_20250601_100000.md"
+    demoted = reclassifier.raw_archive_dir / "superwhisper_raw_20250601_110000.md"
+    assert (stats["promoted"], stats["demoted"]) == (1, 1)
+    assert not good.exists() and not short.exists()
+    assert promoted.exists() and demoted.exists()
+
+    content = promoted.read_text(encoding="utf-8")
+    assert extract_saved_text(content) == GOOD_TEXT
+    assert "classification: 💭 Personal Thoughts" in content
+    assert "quality_score: 1.00" in content
+    assert "personality_learning_ready: True" in content
+    assert "- **PersonalityLearning投入対象**: ✅ Yes" in content
+    assert "**分類**: 📥 Raw Archive" in demoted.read_text(encoding="utf-8")
+
+    conn = sqlite3.connect(str(reclassifier.processed_db))
+    rows = dict(
+        (row[0], row[1:])
+        for row in conn.execute(
+            "SELECT notion_id, file_path, classification, quality_score"
+            " FROM processed_entries"
+        )
+    )
+    conn.close()
+    assert rows["n-good"] == (str(promoted.resolve()), "personal_thoughts", 1.0)
+    assert rows["n-short"][:2] == (str(demoted.resolve()), "raw_archive")
+
+    # 閾値を変えずに再実行しても移動は発生しない
+    assert reclassifier.run()["moves"] == []
@@ -0,0 +1,100 @@
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Core"))
+
+from assessment_snapshots import AssessmentSnapshotStore  # noqa: E402
+from competitive_advantage_guardian import CompetitiveAdvantageGuardian  # noqa: E402
+from strategic_quality_governance_system import (  # noqa: E402
+    StrategicQualityGovernanceSystem,
+)
+
+
+def test_store_versions_and_deltas(tmp_path):
+    store = AssessmentSnapshotStore(tmp_path / "snapshots.db")
+    assert store.latest("quality") is None
+    assert not store.is_current("quality")
+
+    store.record(
+        "quality", {"score": 0.80, "position": "follower"}, {"view": 1}, input_hash="a"
+    )
+    second = store.record(
+        "quality", {"score": 0.90, "position": "leader"}, {"view": 2}, input_hash="a"
+    )
+
+    assert second["version"] == 2
+    assert store.latest("quality")["payload"] == {"view": 2}
+    assert store.is_current("quality", "a", max_age=timedelta(hours=1))
+    assert not store.is_current("quality", "b")
+    assert not store.is_current("quality", "a", max_age=timedelta(0))
+    (delta,) = store.deltas("quality", ["score", "position"])
+    assert round(delta["score"], 6) == 0.1
+    assert delta["position"] == {"from": "follower", "to": "leader"}
+
+
+def test_competitive_dashboard_reads_snapshot_without_reassessing(
+    tmp_path, monkeypatch, count_calls
+):
+    guardian = CompetitiveAdvantageGuardian(
+        db_path=str(tmp_path / "competitive.db"),
+        market_data_path=str(tmp_path / "market.json"),
+    )
+    evaluations = count_calls(guardian, "_perform_competitive_analysis")
+
+    first = guardian.refresh_assessment_snapshot()
+    assert guardian.refresh_assessment_snapshot()["version"] == first["version"] == 1
+    assert len(evaluations) == 1
+
+    # 別インスタンスのダッシュボードも再評価なしで最新スナップショットを表示
+    viewer = CompetitiveAdvantageGuardian(
+        db_path=str(tmp_path / "competitive.db"),
+        market_data_path=str(tmp_path / "market.json"),
+    )
+    monkeypatch.setattr(viewer, "_perform_competitive_analysis", lambda: 1 / 0)
+    dashboard = viewer.generate_competitive_dashboard()
+    assert dashboard["snapshot"]["version"] == 1
+    assert (
+        dashboard["executive_summary"]
+        == first["payload"]["dashboard"]["executive_summary"]
+    )
+    assert dashboard["trend_analysis"] == {"trend": "insufficient_data"}
+
+    # 入力変更時のみ再評価、トレンドはスナップショット差分から構築
+    guardian.market_data["competitors"]["Gemini/Google"]["precision"] = 0.80
+    assert guardian.refresh_assessment_snapshot()["version"] == 2
+    assert len(evaluations) == 2
+    trends = viewer.generate_competitive_dashboard()["trend_analysis"]
+    assert trends["versions"] == {"current": 2, "previous": 1}
+    assert trends["precision_advantage"]["delta"] < 0
+    assert trends["precision_advantage"]["direction"] == "declining"
+
+
+def test_governance_dashboard_uses_latest_snapshot(tmp_path, monkeypatch, count_calls):
+    monkeypatch.chdir(tmp_path)
+    system = StrategicQualityGovernanceSystem(
+        db_path=str(tmp_path / "governance.db"),
+        config_path=str(tmp_path / "governance_config.json"),
+    )
+    empty = system.generate_governance_dashboard()
+    assert empty["snapshot"]["version"] is None
+    assert system.snapshots.latest("quality_governance") is None
+
+    assessment = system.execute_comprehensive_quality_assessment()
+    trend_queries = count_calls(system, "_analyze_quality_trend")
+    metric_queries = count_calls(system, "_get_current_quality_metrics")
+
+    dashboard = system.generate_governance_dashboard()
+    system.generate_governance_dashboard()
+
+    assert (len(trend_queries), len(metric_queries)) == (0, 0)
+    assert dashboard["snapshot"]["version"] == 1
+    assert (
+        dashboard["quality_metrics"]["overall_score"]
+        == assessment["overall_quality_score"]
+    )
+    assert (
+        dashboard["system_status"]["last_assessment"]
+        == assessment["assessment_timestamp"]
+    )
+    assert dashboard["quality_trend_deltas"] == []
@@ -0,0 +1,102 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / ".mirralism" / "scripts"))
+
+import ast_analysis_cache  # noqa: E402
+from ast_analysis_cache import ASTAnalysisCache  # noqa: E402
+from ast_analysis_cache import discover_python_files  # noqa: E402
+from dependency_integrity_system import DependencyIntegritySystem  # noqa: E402
+
+
+def _write_project(root: Path):
+    (root / "pkg").mkdir()
+    (root / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    (root / "pkg" / "util.py").write_text(
+        "import os\nimport json\n\n\ndef helper():\n    return os.getcwd()\n",
+        encoding="utf-8",
+    )
+    (root / "main.py").write_text(
+        "from pkg.util import helper\nfrom MyBrain.MIRRALISM.Core import x\n\nhelper()\n",
+        encoding="utf-8",
+    )
+    (root / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+    return sorted(root.rglob("*.py"))
+
+
+def test_analysis_is_reused_until_content_changes(tmp_path):
+    files = _write_project(tmp_path)
+    cache = ASTAnalysisCache(tmp_path, cache_path=tmp_path / "cache.db")
+
+    entries = cache.analyze(files)
+    assert len(cache.changed_files) == 4
+    util = entries["pkg/util.py"]
+    assert util["module"] == "pkg.util"
+    assert util["defined_names"] == ["helper"]
+    assert {b["name"] for b in util["bindings"]} == {"os", "json"}
+    assert "json" not in util["used_names"]
+    assert entries["broken.py"]["error"]["type"] == "syntax"
+    assert cache.resolve_module("pkg") == ["pkg/__init__.py"]
+    assert cache.resolve_module("pkg.util") == ["pkg/util.py"]
+    cache.close()
+
+    # 再オープン: 無変更ならキャッシュのみ
+    cache = ASTAnalysisCache(tmp_path, cache_path=tmp_path / "cache.db")
+    assert cache.analyze(files)["pkg/util.py"]["imports"] == util["imports"]
+    assert cache.changed_files == []
+
+    # mtime のみ変更 → 内容ハッシュ一致で未変更扱い
+    st = (tmp_path / "main.py").stat()
+    os.utime(tmp_path / "main.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    (tmp_path / "pkg" / "util.py").write_text("import json\n", encoding="utf-8")
+    (tmp_path / "broken.py").unlink()
+    files = sorted(tmp_path.rglob("*.py"))
+
+    entries = cache.analyze(files)
+    assert cache.changed_files == ["pkg/util.py"]
+    assert cache.removed_files == ["broken.py"]
+    assert entries["pkg/util.py"]["defined_names"] == []
+    cache.close()
+
+
+def test_subset_analysis_keeps_entries_of_other_files(tmp_path):
+    files = _write_project(tmp_path)
+    (tmp_path / "node_modules" / "x").mkdir(parents=True)
+    (tmp_path / "node_modules" / "x" / "b.py").write_text(
+        "import os\n", encoding="utf-8"
+    )
+    cache = ASTAnalysisCache(tmp_path, cache_path=tmp_path / "cache.db")
+
+    cache.analyze(sorted(tmp_path.rglob("*.py")))
+    cache.analyze(discover_python_files(tmp_path))
+    assert cache.removed_files == []
+    assert discover_python_files(tmp_path) == files
+
+    # 全体を再解析しても他の呼び出しが対象外としたファイルは変更扱いにならない
+    cache.analyze(sorted(tmp_path.rglob("*.py")))
+    assert cache.changed_files == []
+    cache.close()
+
+
+def test_parallel_analysis_matches_serial(tmp_path, monkeypatch):
+    files = _write_project(tmp_path)
+    serial = ASTAnalysisCache(tmp_path, cache_path=tmp_path / "serial.db").analyze(
+        files
+    )
+
+    monkeypatch.setattr(ast_analysis_cache, "PARALLEL_THRESHOLD", 1)
+    parallel = ASTAnalysisCache(
+        tmp_path, cache_path=tmp_path / "parallel.db", max_workers=2
+    ).analyze(files)
+
+    assert parallel == serial
+
+
+def test_integrity_system_reads_import_lines_from_cache(tmp_path):
+    files = _write_project(tmp_path)
+    system = DependencyIntegritySystem(str(tmp_path))
+
+    issues = system.analyze_python_imports(files)
+    assert {(i.file_path, i.line_number) for i in issues} == {("main.py", 2)}
+    assert (tmp_path / ".mirralism" / "cache" / "ast_analysis.db").exists()
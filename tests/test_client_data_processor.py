@@ -0,0 +1,74 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Core" / "PersonalityLearning"))
+
+from client_data_processor import ClientDataProcessor  # noqa: E402
+
+CLIENTS = {
+    "AGOグループ": {"事業概要": "技術 システム 開発", "経営理念": "誠実 品質"},
+    "黒澤工務店": {"事業概要": "住宅 建築", "主要担当者": [{"名前": "黒澤", "役職": "代表取締役", "特徴": "責任感"}]},
+    "久仁子": {"事業概要": "個人 相談", "現在の課題": ["効率", "成長"]},
+    "_template": {"事業概要": "テンプレート"},
+}
+
+
+def _project(tmp_path, clients=CLIENTS):
+    database = tmp_path / "Clients" / "Database"
+    database.mkdir(parents=True)
+    with open(database / "client_profiles.json", "w", encoding="utf-8") as f:
+        json.dump({"clients": clients}, f, ensure_ascii=False)
+    return tmp_path
+
+
+def test_checkpoints_each_client_and_resumes_interrupted_run(tmp_path, monkeypatch):
+    processor = ClientDataProcessor(_project(tmp_path))
+    calls = []
+    original = processor.process_client_with_personality_learning
+
+    def tracked(client):
+        calls.append(client["client_name"])
+        return original(client)
+
+    monkeypatch.setattr(processor, "process_client_with_personality_learning", tracked)
+
+    # 集約保存で停止 → 実行は未完了のまま、クライアント結果はチェックポイント済み
+    monkeypatch.setattr(processor, "save_integration_results", lambda results: 1 / 0)
+    assert processor.run_phase1_integration(max_workers=1)["success"] is False
+    run_dirs = list((tmp_path / "Data" / "client_integration" / "runs").iterdir())
+    assert len(run_dirs) == 1
+    assert len(list((run_dirs[0] / "clients").glob("*.json"))) == 3
+
+    monkeypatch.undo()
+    resumed = ClientDataProcessor(tmp_path)
+    result = resumed.run_phase1_integration(max_workers=1)
+
+    assert result["success"] is True
+    assert calls == ["AGOグループ", "黒澤工務店", "久仁子"]
+    assert result["processing_stats"]["clients_resumed"] == 3
+    assert [r["client_name"] for r in result["integration_results"]] == calls
+    assert result["save_result"]["run_dir"] == str(run_dirs[0])
+    with open(run_dirs[0] / "run.json", encoding="utf-8") as f:
+        assert json.load(f)["status"] == "completed"
+
+
+def test_parallel_run_matches_sequential_and_reprocesses_changed_clients(tmp_path):
+    project = _project(tmp_path)
+    sequential = ClientDataProcessor(project).run_phase1_integration(max_workers=1)
+    parallel = ClientDataProcessor(project).run_phase1_integration(max_workers=2)
+
+    assert parallel["processing_stats"]["clients_resumed"] == 0
+    assert [r["confidence"] for r in parallel["integration_results"]] == [
+        r["confidence"] for r in sequential["integration_results"]
+    ]
+    assert parallel["processing_stats"]["integration_success"] == 3
+
+    # 完了済み実行は再開対象外、未完了実行でも内容変更クライアントは再処理
+    processor = ClientDataProcessor(project)
+    run_dir = processor._start_run(resume=True)
+    clients = processor.extract_client_personalities({"clients": CLIENTS})
+    processor.process_clients(clients, run_dir, max_workers=1)
+    clients[0]["analysis_content"] += "\n追記"
+    processor.process_clients(clients, run_dir, max_workers=1)
+    assert processor.processing_stats["clients_resumed"] == 2
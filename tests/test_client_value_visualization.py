@@ -0,0 +1,60 @@
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from Interface.client_value_visualization import (  # noqa: E402
+    ClientValueVisualizationSystem,
+)
+
+
+def _append_measurement(project_root, precision_type, value):
+    journal = project_root / "Data" / "personality_learning_precision.jsonl"
+    record = {
+        "precision_type": precision_type,
+        "measured_value": value,
+        "measurement_context": {"client": "黒澤工務店"},
+        "timestamp": "2025-06-07T10:00:00",
+    }
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def test_dashboards_share_one_report_per_data_version(tmp_path, count_calls):
+    (tmp_path / "Data").mkdir()
+    _append_measurement(tmp_path, "client_understanding", 0.9)
+    system = ClientValueVisualizationSystem(tmp_path)
+    engine = system.value_engine
+    sections = count_calls(engine, "_build_precision_sections")
+    history = count_calls(engine, "_get_value_creation_history")
+
+    first = system.generate_all_dashboards()
+    assert all("error" not in dashboard for dashboard in first.values())
+    assert (len(sections), len(history)) == (1, 1)
+
+    # 同一データ版の再表示は再計算なし・同一内容
+    assert system.generate_all_dashboards() == first
+    assert (len(sections), len(history)) == (1, 1)
+
+    # 精度ジャーナル更新 → 精度由来セクションのみ再計算
+    _append_measurement(tmp_path, "client_understanding", 0.93)
+    refreshed = system.generate_executive_dashboard()
+    kpi = refreshed["key_performance_indicators"]["overall_system_precision"]
+    assert kpi["current_value"] == 0.93
+    assert (len(sections), len(history)) == (2, 1)
+
+    # 価値創造DB更新 → 履歴のみ再取得
+    with sqlite3.connect(engine.db_path) as conn:
+        conn.execute(
+            "INSERT INTO value_metrics (timestamp, client_name, metric_type,"
+            " current_value, target_value, improvement_rate, business_impact,"
+            " confidence_level, evidence) VALUES ('2025-06-07', '黒澤工務店',"
+            " 'client_understanding', 0.93, 0.95, 0.02, 'high', 0.9, '[]')"
+        )
+    system.generate_roi_analysis_dashboard()
+    assert (len(sections), len(history)) == (2, 2)
+    report = engine.generate_value_creation_report()
+    assert report["value_creation_history"][0]["current_value"] == 0.93
+    assert (len(sections), len(history)) == (2, 2)
@@ -0,0 +1,132 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Core"))
+
+from DataIntegration.content_store import ContentAddressedStore  # noqa: E402
+from DataIntegration.content_store import content_hash  # noqa: E402
+
+
+def test_duplicate_content_is_stored_once(tmp_path):
+    store = ContentAddressedStore(tmp_path / "store")
+    text = "今日の振り返り。\n設計を見直した。"
+
+    first = store.save_entry(
+        "voice", "entry_1", text, blobs={"transcript": text, "analysis": {"score": 1}}
+    )
+    assert not first["duplicate"]
+
+    # 改行コード・行末空白の違いは同一内容とみなす
+    variant = "今日の振り返り。  \r\n設計を見直した。\n"
+    assert store.find_duplicate("voice", variant)["entry_id"] == "entry_1"
+    second = store.save_entry(
+        "voice", "entry_2", variant, blobs={"transcript": variant}
+    )
+    assert second["duplicate"]
+    assert second["manifest"]["entry_id"] == "entry_1"
+    assert list((tmp_path / "store" / "manifests" / "voice").glob("entry_2*")) == []
+
+    assert store.read_text(first["manifest"], "transcript") == text
+    assert store.read_json(first["manifest"], "analysis") == {"score": 1}
+    assert store.get_statistics()["entries_by_namespace"] == {"voice": 1}
+
+
+def test_blobs_are_shared_across_namespaces(tmp_path):
+    store = ContentAddressedStore(tmp_path)
+    text = "同じ本文"
+
+    voice = store.save_entry("voice", "v1", text, blobs={"transcript": text})
+    clip = store.save_entry("webclip", "w1", text, blobs={"markdown": text})
+
+    assert not clip["duplicate"]
+    assert (
+        voice["manifest"]["blobs"]["transcript"]["hash"]
+        == clip["manifest"]["blobs"]["markdown"]["hash"]
+    )
+    assert store.get_statistics()["blob_count"] == 1
+    assert voice["manifest"]["content_hash"] == content_hash(text)
+
+
+def test_empty_content_is_never_deduplicated(tmp_path):
+    store = ContentAddressedStore(tmp_path)
+
+    assert store.find_duplicate("voice", "  ") is None
+    store.save_entry("voice", "e1", "", blobs={"transcript": ""})
+    assert not store.save_entry("voice", "e2", "", blobs={"transcript": ""})[
+        "duplicate"
+    ]
+
+
+def test_stale_index_row_is_replaced(tmp_path):
+    store = ContentAddressedStore(tmp_path)
+    first = store.save_entry("voice", "e1", "本文", blobs={"transcript": "本文"})
+    Path(first["manifest_path"]).unlink()
+
+    second = store.save_entry("voice", "e2", "本文", blobs={"transcript": "本文"})
+
+    assert not second["duplicate"]
+    assert store.find_duplicate("voice", "本文")["entry_id"] == "e2"
+
+
+def test_same_entry_id_with_different_content_keeps_both_manifests(tmp_path):
+    store = ContentAddressedStore(tmp_path)
+    first = store.save_entry("voice", "e1", "本文A", blobs={"transcript": "本文A"})
+    second = store.save_entry("voice", "e1", "本文B", blobs={"transcript": "本文B"})
+
+    assert first["manifest_path"] != second["manifest_path"]
+    assert Path(first["manifest_path"]).exists()
+    assert store.find_duplicate("voice", "本文A")["content_hash"] == content_hash("本文A")
+    assert store.find_duplicate("voice", "本文B")["content_hash"] == content_hash("本文B")
+
+
+def test_lost_race_with_same_entry_id_keeps_winner_manifest(tmp_path, monkeypatch):
+    store = ContentAddressedStore(tmp_path)
+    winner = store.save_entry("voice", "e1", "本文", blobs={"transcript": "本文"})
+
+    # 重複検出後に先行エントリが索引された並行保存を再現
+    lookup = store._find_indexed
+    calls = iter([None])
+    monkeypatch.setattr(
+        store, "_find_indexed", lambda *args: next(calls, None) or lookup(*args)
+    )
+    loser = store.save_entry("voice", "e1", "本文", blobs={"transcript": "本文"})
+
+    assert loser["duplicate"]
+    assert loser["manifest_path"] == winner["manifest_path"]
+    assert Path(winner["manifest_path"]).exists()
+
+
+def test_returned_manifest_paths_exist(tmp_path):
+    store = ContentAddressedStore(tmp_path)
+
+    saved = store.save_entry("voice", "e1", "本文", blobs={"transcript": "本文"})
+    duplicate = store.find_duplicate_entry("voice", "本文")
+    again = store.save_entry("voice", "e2", "本文", blobs={"transcript": "本文"})
+
+    assert Path(saved["manifest_path"]).exists()
+    assert duplicate == {
+        "duplicate": True,
+        "manifest": saved["manifest"],
+        "manifest_path": saved["manifest_path"],
+    }
+    assert again["manifest_path"] == saved["manifest_path"]
+
+
+def test_webclip_save_result_points_at_existing_manifest(tmp_path):
+    sys.path.append(str(Path(__file__).parent.parent))
+    from Interface.WebClip.webclip_integrated_system import WebClipIntegratedSystem
+
+    system = WebClipIntegratedSystem(tmp_path)
+    integrated = {
+        "processing_id": "clip_1",
+        "instant_display": {"article_summary": {"title": "t"}},
+        "structured_data": {"markdown": "# t"},
+    }
+
+    saved = asyncio.run(system._save_webclip_file(integrated, "記事本文"))
+    duplicate = system.content_store.find_duplicate_entry("webclip", "記事本文")
+    reused = system._build_duplicate_result(duplicate, "clip_2", 0.0)
+
+    assert Path(saved["manifest_file"]).exists()
+    assert reused["save_result"]["manifest_file"] == saved["manifest_file"]
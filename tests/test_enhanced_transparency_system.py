@@ -0,0 +1,83 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import Interface.components.enhanced_transparency_system as transparency  # noqa: E402
+from Interface.components.enhanced_transparency_system import (  # noqa: E402
+    EnhancedTransparencySystem,
+)
+
+ANALYSIS = {
+    "analysis": {
+        "suetake_likeness_index": 88.5,
+        "tech_keyword_count": 7,
+        "integrity_keyword_count": 4,
+        "confidence_score": 0.89,
+    },
+    "source": "journal_entry",
+    "processing_time": 150,
+}
+
+
+def _write_feedback(project_root, reviews):
+    log = project_root / ".mirralism" / "user_feedback_log.json"
+    log.parent.mkdir(exist_ok=True)
+    log.write_text(
+        json.dumps({"reviews": reviews, "learned_rules": {}}), encoding="utf-8"
+    )
+
+
+def test_feedback_index_is_shared_until_log_changes(tmp_path, count_calls):
+    _write_feedback(tmp_path, [{"decision": "APPROVED"}])
+    builds = count_calls(transparency, "_build_feedback_index")
+
+    first = EnhancedTransparencySystem(tmp_path)
+    second = EnhancedTransparencySystem(tmp_path)
+    assert len(builds) == 1
+    assert second.feedback_data is first.feedback_data
+
+    _write_feedback(tmp_path, [{"decision": "APPROVED"}, {"decision": "REJECTED"}])
+    first.generate_enhanced_explanation(ANALYSIS)
+    assert len(builds) == 2
+    assert len(first.feedback_data["reviews"]) == 2
+
+
+def test_explanations_are_memoized_per_analysis(tmp_path, count_calls):
+    _write_feedback(tmp_path, [])
+    system = EnhancedTransparencySystem(tmp_path)
+    rationale = count_calls(system, "_analyze_decision_rationale")
+
+    reports = system.generate_enhanced_explanations(
+        [ANALYSIS, dict(ANALYSIS), {"analysis": {}}]
+    )
+    assert len(rationale) == 2
+    assert reports[0].confidence_breakdown == reports[1].confidence_breakdown
+
+    # 返却値の変更はメモ化結果に影響しない
+    reports[0].evidence_trail.clear()
+    again = system.generate_enhanced_explanation(ANALYSIS)
+    assert again.evidence_trail == reports[1].evidence_trail != []
+    assert len(rationale) == 2
+
+    # フィードバック更新後は再生成
+    _write_feedback(tmp_path, [{"decision": "APPROVED"}])
+    system.generate_enhanced_explanation(ANALYSIS)
+    assert len(rationale) == 3
+
+    dashboard = system.create_transparency_dashboard(again)
+    assert dashboard["confidence_visualization"]["chart_type"] == "radar"
+
+
+def test_render_confidence_chart_writes_image(tmp_path):
+    pytest.importorskip("matplotlib")
+    system = EnhancedTransparencySystem(tmp_path)
+    report = system.generate_enhanced_explanation(ANALYSIS)
+
+    output = system.render_confidence_chart(
+        report.confidence_breakdown, tmp_path / "chart.png"
+    )
+    assert output.stat().st_size > 0
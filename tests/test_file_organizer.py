@@ -28,3 +28,38 @@ def test_clean_current_mess(tmp_path):
     assert results["moved"] == 2
     assert (tmp_path / "Data" / "temp" / file1.name).exists()
     assert (tmp_path / "Data" / "analytics" / file2.name).exists()
+
+
+def test_classify_first_match_wins(tmp_path):
+    organizer = FlexibleFileOrganizer(root_dir=tmp_path)
+    # analysis と temp(*.log) の両方に一致 → 先に定義された analysis が優先
+    assert organizer.classify_file("x_analysis_y.txt.log")[0] == "analysis"
+    assert organizer.classify_file("a_REDIRECT_b.md")[0] == "forbidden"
+    assert organizer.classify_file("readme.rst") == ("unknown", "Data/temp/")
+    for category, rules in organizer.config["file_rules"].items():
+        for pattern in rules["patterns"]:
+            name = pattern.replace("*", "x").replace("?", "x")
+            expected = next(
+                cat
+                for cat, r in organizer.config["file_rules"].items()
+                if any(organizer._match_pattern(name, p) for p in r["patterns"])
+            )
+            assert organizer.classify_file(name)[0] == expected
+
+
+def test_classify_rules_reload_on_config_change(tmp_path):
+    organizer = FlexibleFileOrganizer(root_dir=tmp_path)
+    assert organizer.classify_file("notes.xyz")[0] == "unknown"
+    rules = dict(organizer.config["file_rules"])
+    rules["custom"] = {"patterns": ["*.xyz"], "destination": "Data/custom/"}
+    organizer.config["file_rules"] = rules
+    assert organizer.classify_file("notes.xyz") == ("custom", "Data/custom/")
+
+
+def test_classify_directory(tmp_path):
+    organizer = FlexibleFileOrganizer(root_dir=tmp_path)
+    (tmp_path / "temp_a.txt").write_text("a")
+    (tmp_path / "plain.txt").write_text("b")
+    (tmp_path / ".hidden.log").write_text("c")
+    classified = organizer.classify_directory()
+    assert [(p.name, cat) for p, cat, _ in classified] == [("temp_a.txt", "temp")]
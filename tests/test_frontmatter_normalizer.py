@@ -0,0 +1,106 @@
+import yaml
+
+from scripts.frontmatter_normalizer import normalize_vault
+
+V1_CLIP = """---
+title: V1 clip
+url: https://example.com/a
+clipped_at: 2025-05-31 12:00:00
+type: webclip
+tags: 研究
+---
+
+本文 ---
+---
+末尾
+"""
+
+CLEAN_NOTE = """---
+title: note
+created_at: '2025-05-31T00:00:00+00:00'
+---
+本文
+"""
+
+
+def _vault(tmp_path):
+    vault = tmp_path / "vault"
+    (vault / "clips").mkdir(parents=True)
+    (vault / ".obsidian").mkdir()
+    (vault / "clips" / "v1.md").write_text(V1_CLIP, encoding="utf-8")
+    (vault / "note.md").write_text(CLEAN_NOTE, encoding="utf-8")
+    (vault / "plain.md").write_text("frontmatter なし\n", encoding="utf-8")
+    (vault / "broken.md").write_text('---\ntitle: "a "b" c"\n---\n', encoding="utf-8")
+    (vault / ".obsidian" / "ignored.md").write_text(V1_CLIP, encoding="utf-8")
+    return vault
+
+
+def test_dry_run_reports_diff_without_writing(tmp_path):
+    vault = _vault(tmp_path)
+
+    report = normalize_vault(vault, dry_run=True, max_workers=1)
+
+    assert report["summary"] == {
+        "scanned": 4,
+        "changed": 1,
+        "unchanged": 1,
+        "no_frontmatter": 1,
+        "error": 1,
+    }
+    [changed] = report["changed"]
+    assert changed["path"].endswith("v1.md")
+    assert "+clipped_at: '2025-05-31T12:00:00+00:00'" in changed["diff"]
+    assert "+- 研究" in changed["diff"]
+    assert report["errors"][0]["path"].endswith("broken.md")
+    assert (vault / "clips" / "v1.md").read_text(encoding="utf-8") == V1_CLIP
+
+
+def test_apply_rewrites_only_changed_files_and_is_idempotent(tmp_path):
+    vault = _vault(tmp_path)
+    note_mtime = (vault / "note.md").stat().st_mtime_ns
+
+    report = normalize_vault(vault, dry_run=False, max_workers=2)
+
+    assert report["summary"]["changed"] == 1
+    assert (vault / "clips" / "v1.md").read_text(encoding="utf-8") == (
+        "---\n"
+        "title: V1 clip\n"
+        "url: https://example.com/a\n"
+        "clipped_at: '2025-05-31T12:00:00+00:00'\n"
+        "type: webclip\n"
+        "tags:\n"
+        "- 研究\n"
+        "---\n"
+        "\n本文 ---\n---\n末尾\n"
+    )
+    assert (vault / "note.md").stat().st_mtime_ns == note_mtime
+    assert list(vault.rglob("*.tmp")) == []
+    assert (
+        normalize_vault(vault, dry_run=False, max_workers=1)["summary"]["changed"] == 0
+    )
+
+
+def test_apply_keeps_quotes_and_backslashes_intact(tmp_path):
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "quotes.md").write_text(
+        "---\n"
+        'title: "Don\'t say \\"hi\\""\n'
+        "path: 'C:\\Users\\note'\n"
+        "created_at: 2025-05-31\n"
+        "---\n"
+        "本文\n",
+        encoding="utf-8",
+    )
+
+    report = normalize_vault(vault, dry_run=False, max_workers=1)
+
+    assert report["summary"]["changed"] == 1
+    frontmatter = yaml.safe_load(
+        (vault / "quotes.md").read_text(encoding="utf-8").split("---")[1]
+    )
+    assert frontmatter == {
+        "title": 'Don\'t say "hi"',
+        "path": "C:\\Users\\note",
+        "created_at": "2025-05-31T00:00:00+00:00",
+    }
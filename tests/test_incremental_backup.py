@@ -0,0 +1,56 @@
+from scripts.incremental_backup import IncrementalBackupStore
+
+
+def _make_tree(root):
+    (root / "Data").mkdir()
+    (root / "Data" / "a.txt").write_text("alpha")
+    (root / "Data" / "b.txt").write_text("beta")
+    (root / "README.md").write_text("readme")
+
+
+def test_snapshot_deduplicates_unchanged_files(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    _make_tree(root)
+    store = IncrementalBackupStore(tmp_path / "backups")
+
+    first = store.create_snapshot(root, ["Data", "README.md"], "001")
+    assert first["stats"]["new_blobs"] == 3
+
+    (root / "Data" / "b.txt").write_text("beta v2")
+    second = store.create_snapshot(root, ["Data", "README.md"], "002")
+    assert second["parent"] == "001"
+    assert second["stats"]["new_blobs"] == 1
+    assert second["stats"]["reused"] == 2
+    assert len(list((tmp_path / "backups" / "objects").glob("*/*"))) == 4
+
+
+def test_restore_touches_only_changed_files(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    _make_tree(root)
+    store = IncrementalBackupStore(tmp_path / "backups")
+    store.create_snapshot(root, ["Data", "README.md"], "001")
+
+    (root / "Data" / "a.txt").write_text("modified")
+    (root / "Data" / "new.txt").write_text("extra")
+    (root / "README.md").unlink()
+
+    results = store.restore_snapshot("001", root)
+    assert results == {"restored": 2, "unchanged": 1, "removed": 1}
+    assert (root / "Data" / "a.txt").read_text() == "alpha"
+    assert (root / "README.md").read_text() == "readme"
+    assert not (root / "Data" / "new.txt").exists()
+
+
+def test_prune_removes_unreferenced_blobs(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    _make_tree(root)
+    store = IncrementalBackupStore(tmp_path / "backups")
+    store.create_snapshot(root, ["Data"], "001")
+    (root / "Data" / "a.txt").write_text("changed")
+    store.create_snapshot(root, ["Data"], "002")
+
+    assert store.prune(keep=1) == {"snapshots": 1, "blobs": 1}
+    assert store.list_snapshots() == ["002"]
@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / ".mirralism" / "scripts"))
+
+from incremental_dependency_graph import IncrementalDependencyGraph  # noqa: E402
+
+
+def _resolve(module_name):
+    return [module_name.replace(".", "/") + ".py"]
+
+
+def _graph(tmp_path):
+    return IncrementalDependencyGraph(tmp_path, graph_path=tmp_path / "graph.json")
+
+
+def test_cycles_follow_incremental_changes(tmp_path):
+    imports = {
+        "a.py": ["b"],
+        "b.py": ["c"],
+        "c.py": [],
+        "d.py": ["a"],
+        "tests/test_d.py": ["d"],
+    }
+    graph = _graph(tmp_path)
+    graph.update(imports, _resolve)
+    assert graph.circular_dependencies() == []
+    assert graph.longest_path_length() == 4
+
+    # c → a で循環 a→b→c→a
+    imports["c.py"] = ["a"]
+    stats = graph.update(imports, _resolve, changed=["c.py"])
+    assert stats["recomputed"] == 1
+    cycles = graph.circular_dependencies()
+    assert [c["files_involved"] for c in cycles] == [["a.py", "b.py", "c.py"]]
+    assert cycles[0]["cycle_path"] == ["a.py", "b.py", "c.py", "a.py"]
+    assert graph.longest_path_length() == -1
+    assert graph.number_of_components() == 3
+
+    # 永続化されたグラフから再開し、循環を解消
+    reopened = _graph(tmp_path)
+    assert reopened.circular_dependencies() == cycles
+    imports["b.py"] = []
+    reopened.update(imports, _resolve, changed=["b.py"])
+    assert reopened.circular_dependencies() == []
+
+
+def test_removed_file_breaks_cycle_and_unresolves_importers(tmp_path):
+    imports = {"a.py": ["b"], "b.py": ["a"], "c.py": ["b"]}
+    existing = set(imports)
+
+    def resolve(module_name):
+        return [path for path in _resolve(module_name) if path in existing]
+
+    graph = _graph(tmp_path)
+    graph.update(imports, resolve)
+    assert len(graph.circular_dependencies()) == 1
+
+    del imports["b.py"]
+    existing.discard("b.py")
+    graph.update(imports, resolve, changed=[])
+    assert graph.circular_dependencies() == []
+    assert graph.number_of_edges() == 0
+
+    imports["b.py"] = ["a"]
+    existing.add("b.py")
+    graph.update(imports, resolve, changed=[])
+    assert graph.successors["c.py"] == {"b.py"}
+    assert len(graph.circular_dependencies()) == 1
+
+
+def test_impact_query_selects_dependent_tests(tmp_path):
+    imports = {
+        "core/db.py": [],
+        "core/service.py": ["core.db"],
+        "api.py": ["core.service"],
+        "tests/test_api.py": ["api"],
+        "tests/test_other.py": ["other"],
+        "other.py": [],
+    }
+    graph = _graph(tmp_path)
+    graph.update(imports, _resolve)
+
+    assert graph.affected_by(["core/db.py"]) == {
+        "core/db.py",
+        "core/service.py",
+        "api.py",
+        "tests/test_api.py",
+    }
+    assert graph.select_tests(["core/db.py"]) == ["tests/test_api.py"]
+    assert graph.select_tests(["other.py"]) == ["tests/test_other.py"]
@@ -0,0 +1,61 @@
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / "Core" / "PersonalityLearning"))
+
+from keyword_matrix import KeywordMatcher  # noqa: E402
+from mirralism_personality_engine_basic import (  # noqa: E402
+    MirralismPersonalityEngineBasic,
+)
+
+
+def test_presence_matches_substring_checks_with_overlapping_keywords():
+    # 部分文字列・接尾辞/接頭辞の重なり・群間の共有・群内重複を含む
+    groups = {
+        "a": ["ab", "abc", "bcd", "c"],
+        "b": ["cd", "d", "abc", "abc"],
+        "c": ["x"],
+    }
+    matcher = KeywordMatcher(groups)
+    rng = random.Random(0)
+    documents = ["", "abcd"] + [
+        "".join(rng.choice("abcdx") for _ in range(rng.randint(0, 12)))
+        for _ in range(3000)
+    ]
+
+    counts = matcher.group_counts(documents)
+
+    expected = np.array(
+        [
+            [
+                sum(1 for keyword in keywords if keyword in document)
+                for keywords in groups.values()
+            ]
+            for document in documents
+        ]
+    )
+    assert np.array_equal(counts, expected)
+
+
+def test_batch_scores_are_identical_to_scalar_path(tmp_path):
+    engine = MirralismPersonalityEngineBasic(db_path=str(tmp_path / "batch.db"))
+    words = "技術 実装 品質 チーム 今日は 考えた。 安全 協力 問題 嬉しい CTO 確認".split()
+    rng = random.Random(1)
+    documents = [""] + [
+        "".join(rng.choice(words) for _ in range(rng.randint(1, 600)))
+        for _ in range(500)
+    ]
+
+    results = engine.analyze_batch(documents, {"source_type": "archive"})
+
+    for document, result in zip(documents, results):
+        scalar = engine.analyze_content(document)
+        assert result["personality_profile"] == scalar["personality_profile"]
+        assert result["accuracy"] == scalar["accuracy"]
+        assert result["emotional_analysis"] == scalar["emotional_analysis"]
+
+    summary = engine.get_accuracy_summary()
+    assert summary["by_source"]["archive"]["count"] == len(documents)
@@ -0,0 +1,179 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "Core" / "PersonalityLearning"))
+
+from measurement_journal import MeasurementJournal  # noqa: E402
+from precision_measurement_system import (  # noqa: E402
+    PersonalityLearningPrecisionSystem,
+)
+from simple_test_recorder import SimpleTestRecorder  # noqa: E402
+
+
+def _record(i, group="a", value=None):
+    return {
+        "timestamp": f"2025-06-10T00:00:{i:02d}",
+        "kind": group,
+        "value": float(i) if value is None else value,
+    }
+
+
+def test_append_updates_aggregates_incrementally(tmp_path):
+    journal = MeasurementJournal(tmp_path / "log.jsonl", "value", group_key="kind")
+    for i in range(1, 5):
+        journal.append(_record(i, group="a" if i % 2 else "b"))
+
+    assert journal.count() == 4
+    assert journal.latest()["timestamp"].endswith("04")
+    a = journal.aggregate("a")
+    assert a["count"] == 2
+    assert a["mean"] == pytest.approx(2.0)
+    assert a["stdev"] == pytest.approx(2**0.5)
+    assert a["min"] == 1.0 and a["max"] == 3.0
+    assert journal.aggregate("missing")["count"] == 0
+    total = journal.aggregate_all()
+    assert (total["count"], total["min"], total["max"]) == (4, 1.0, 4.0)
+    assert total["mean"] == pytest.approx(2.5)
+    assert total["latest"]["timestamp"].endswith("04")
+    assert [r["value"] for r in journal.records()] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_null_timestamp_does_not_break_latest(tmp_path):
+    journal = MeasurementJournal(tmp_path / "log.jsonl", "value")
+    journal.append({**_record(1), "timestamp": None})
+    journal.append(_record(2))
+    journal.append({**_record(3), "timestamp": None})
+
+    assert journal.count() == 3
+    assert journal.latest()["value"] == 2.0
+
+
+def test_reopen_replays_only_unapplied_tail(tmp_path):
+    path = tmp_path / "log.jsonl"
+    journal = MeasurementJournal(path, "value")
+    journal.append(_record(1))
+
+    # サイドカー更新前にクラッシュした追記 + 書き込み途中の行
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(_record(2)) + "\n")
+        f.write('{"timestamp": "2025-06-10T00:00:03", "val')
+
+    reopened = MeasurementJournal(path, "value")
+    assert reopened.count() == 2
+    assert reopened.aggregate()["sum"] == pytest.approx(3.0)
+
+    # 次の追記で壊れた末尾は切り詰められる
+    reopened.append(_record(4))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["value"] for line in lines] == [1.0, 2.0, 4.0]
+    assert MeasurementJournal(path, "value").count() == 3
+
+
+def test_legacy_json_is_migrated_once(tmp_path):
+    legacy = tmp_path / "results.json"
+    legacy.write_text(
+        json.dumps({"evaluations": [{"score": 4}, {"score": 5}]}), encoding="utf-8"
+    )
+
+    journal = MeasurementJournal(
+        tmp_path / "results.jsonl", "score", legacy_path=legacy
+    )
+    assert journal.count() == 2
+    assert journal.aggregate()["mean"] == pytest.approx(4.5)
+
+    journal.append({"score": 3})
+    again = MeasurementJournal(tmp_path / "results.jsonl", "score", legacy_path=legacy)
+    assert again.count() == 3
+
+
+def test_progress_counts_and_averages_every_test_type(tmp_path, capsys):
+    recorder = SimpleTestRecorder.__new__(SimpleTestRecorder)
+    recorder._open_journal(tmp_path / "results.jsonl", "score", group_key="test_type")
+    recorder.record_score(2)
+    recorder.journal.append(
+        {"evaluation_number": 2, "score": 4, "comment": "", "test_type": "manual"}
+    )
+
+    recorder.show_progress()
+
+    output = capsys.readouterr().out
+    assert "評価回数: 2/10回" in output
+    assert "現在の平均: 3.00点" in output
+    assert [e["score"] for e in recorder._evaluations()] == [2, 4]
+
+
+def test_precision_status_reads_aggregates(tmp_path):
+    system = PersonalityLearningPrecisionSystem(project_root=tmp_path)
+    for value in (0.9, 0.96, 1.0):
+        system.record_measurement(
+            "proposal_accuracy", value, 25, "suetake", {"client": "x"}
+        )
+
+    status = system.get_current_precision_status()
+    by_type = status["by_type"]["proposal_accuracy"]
+    assert status["summary"]["total_measurements"] == 3
+    assert by_type["measurement_count"] == 3
+    assert by_type["average_precision"] == pytest.approx(0.9533333)
+    assert by_type["latest_measurement"]["measured_value"] == 1.0
+    assert status["by_type"]["client_understanding"]["measurement_count"] == 0
+    assert len(system.generate_precision_report()["measurement_history"]) == 3
+
+
+def test_partition_index_tracks_latest_value_per_group(tmp_path):
+    path = tmp_path / "precision.jsonl"
+    journal = MeasurementJournal(path, "value", group_key="kind")
+    journal.append(_record(1))
+
+    # 索引なしの既存サイドカーは partition_key 指定時に再構築
+    indexed = MeasurementJournal(
+        path, "value", group_key="kind", partition_key="ctx.client"
+    )
+    assert indexed.partitions() == []
+
+    for i, (client, kind) in enumerate(
+        [("x", "a"), ("y", "a"), ("x", "b"), ("x", "a")], 2
+    ):
+        indexed.append({**_record(i, group=kind), "ctx": {"client": client}})
+    assert indexed.latest_values("x") == {"a": 5.0, "b": 4.0}
+    assert indexed.latest_values("missing") == {}
+
+    # 別インスタンスの追記は refresh で取り込む
+    writer = MeasurementJournal(
+        path, "value", group_key="kind", partition_key="ctx.client"
+    )
+    writer.append({**_record(6, group="b"), "ctx": {"client": "y"}})
+    indexed.refresh()
+    assert indexed.latest_values("y") == {"a": 3.0, "b": 6.0}
+    assert sorted(indexed.partitions()) == ["x", "y"]
+
+
+def test_value_engine_reads_precision_index_per_client(tmp_path):
+    from value_creation_engine import MIRRALISMValueCreationEngine
+
+    system = PersonalityLearningPrecisionSystem(project_root=tmp_path)
+    system.record_measurement(
+        "client_understanding", 0.9, 30, "suetake", {"client": "AGOグループ"}
+    )
+    system.record_measurement(
+        "client_understanding", 0.92, 30, "suetake", {"client": "黒澤工務店"}
+    )
+    system.record_measurement(
+        "proposal_accuracy", 0.88, 20, "suetake", {"client": "黒澤工務店"}
+    )
+
+    engine = MIRRALISMValueCreationEngine(tmp_path)
+    reports = engine.generate_multi_client_report()
+
+    assert sorted(reports) == ["AGOグループ", "黒澤工務店"]
+    kurosawa = reports["黒澤工務店"]["current_status"]["precision_levels"]
+    assert kurosawa["client_understanding"] == 0.92
+    assert kurosawa["overall_precision"] == pytest.approx(0.9)
+    assert engine.measure_current_precision("久仁子")["overall_precision"] == 0.85
+
+    system.record_measurement(
+        "client_understanding", 0.94, 30, "suetake", {"client": "AGOグループ"}
+    )
+    assert engine.measure_current_precision("AGOグループ")["client_understanding"] == 0.94
@@ -0,0 +1,106 @@
+import threading
+import time
+
+from scripts.migration_validator import MigrationValidator
+from scripts.migration_validator import ValidationPipeline
+
+
+def _interval_check(spans, name, duration):
+    def check():
+        start = time.monotonic()
+        time.sleep(duration)
+        spans[name] = (start, time.monotonic())
+        return True
+
+    return check
+
+
+def test_pipeline_runs_independent_checks_concurrently():
+    spans = {}
+    pipeline = ValidationPipeline(max_workers=3)
+    for name in ("a", "b", "c"):
+        pipeline.add(name, name, _interval_check(spans, name, 0.2))
+
+    outcomes = pipeline.run()
+
+    assert [o["status"] for o in outcomes] == ["passed"] * 3
+    # 全検証の実行区間が重なる（最後の開始 < 最初の終了）
+    assert max(start for start, _ in spans.values()) < min(
+        end for _, end in spans.values()
+    )
+
+
+def test_pipeline_dependencies_timeout_and_skip():
+    order = []
+    pipeline = ValidationPipeline(max_workers=2)
+    pipeline.add("first", "first", lambda: order.append("first") or True)
+    pipeline.add("second", "second", lambda: order.append("second") or True, ["first"])
+    pipeline.add("slow", "slow", lambda: time.sleep(1.0) or True, timeout=0.1)
+    pipeline.add("after_slow", "after_slow", lambda: True, ["slow"])
+
+    outcomes = {o["name"]: o for o in pipeline.run()}
+    assert order == ["first", "second"]
+    assert outcomes["slow"]["status"] == "error"
+    assert outcomes["after_slow"]["status"] == "skipped"
+
+
+def test_timeout_clock_starts_when_check_starts():
+    pipeline = ValidationPipeline(max_workers=1)
+    pipeline.add("a", "a", lambda: time.sleep(0.3) or True, timeout=0.5)
+    pipeline.add("b", "b", lambda: time.sleep(0.3) or True, timeout=0.5)
+
+    assert [o["status"] for o in pipeline.run()] == ["passed", "passed"]
+
+
+def test_records_follow_definition_order_and_ignore_timed_out_checks(tmp_path):
+    validator = MigrationValidator(tmp_path)
+    validator.validation_config["check_timeouts"]["dependencies"] = 0.1
+    release = threading.Event()
+    finished = threading.Event()
+
+    def fast(name, delay=0.0):
+        def check():
+            time.sleep(delay)
+            return validator._record_check(name, True, [], [])
+
+        return check
+
+    def slow_dependencies():
+        release.wait(5)
+        validator._record_check("dependency_validation", True, [], ["late"])
+        finished.set()
+        return True
+
+    validator.validate_file_structure = fast("file_structure_validation", 0.2)
+    validator.validate_core_systems = fast("core_systems_validation")
+    validator.validate_core_imports = fast("core_imports_validation")
+    validator.validate_dependencies = slow_dependencies
+    validator.validate_database_integrity = fast("database_integrity_validation")
+    validator.validate_configuration = fast("configuration_validation")
+    validator.run_performance_tests = fast("performance_validation")
+
+    assert validator.run_full_validation(max_workers=4) is False
+    release.set()
+    assert finished.wait(5)
+
+    assert [check["name"] for check in validator.results["checks"]] == [
+        "file_structure_validation",
+        "core_systems_validation",
+        "core_imports_validation",
+        "database_integrity_validation",
+        "configuration_validation",
+        "performance_validation",
+    ]
+    assert "late" not in validator.results["warnings"]
+
+
+def test_resolve_requirements_is_cached_by_hash(tmp_path):
+    (tmp_path / "requirements.txt").write_text(
+        "pytest\nsurely-not-installed-package==1.0\n"
+    )
+    validator = MigrationValidator(tmp_path)
+    assert validator.resolve_requirements() == ["surely-not-installed-package==1.0"]
+    assert validator.dependency_cache_file.exists()
+
+    (tmp_path / "requirements.txt").write_text("pytest\n")
+    assert validator.resolve_requirements() == []
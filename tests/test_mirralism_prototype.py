@@ -0,0 +1,73 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Prototype"))
+
+from mirralism_prototype import PIPELINE_PENDING_PER_WORKER  # noqa: E402
+from mirralism_prototype import MirralismLogger  # noqa: E402
+from mirralism_prototype import MirralismPrototype  # noqa: E402
+from mirralism_prototype import classify_stream  # noqa: E402
+
+SAMPLES = [
+    "会議でプロジェクトの打ち合わせ",
+    "個人的な日記",
+    "作業タスクの整理",
+    "学習と調査のメモ",
+]
+
+
+def _backlog(count):
+    for i in range(count):
+        yield f"{SAMPLES[i % len(SAMPLES)]} #{i}", {"index": i}
+
+
+def test_classify_stream_applies_backpressure_and_preserves_order():
+    pulled = []
+
+    def source():
+        for item in _backlog(200):
+            pulled.append(item)
+            yield item
+
+    stream = classify_stream(source(), max_workers=2, chunk_size=4)
+    first = next(stream)
+
+    assert first[1] == {"index": 0}
+    assert len(pulled) <= 2 * PIPELINE_PENDING_PER_WORKER * 4
+    rest = list(stream)
+    assert [metadata["index"] for _, metadata, _ in rest] == list(range(1, 200))
+    assert [
+        classification["category"] for _, _, classification in [first] + rest[:3]
+    ] == [
+        "meeting",
+        "personal",
+        "work",
+        "learning",
+    ]
+
+
+def test_backlog_keeps_top_files_and_index_follows_evictions():
+    prototype = MirralismPrototype(MirralismLogger(log_file=os.devnull))
+    prototype.file_manager.max_files = 3
+    items = [
+        ("作業メモ A", {}),
+        ("作業タスク B", {}),
+        ("会議 ミーティング 打ち合わせ C", {}),
+        ("日記 D", {}),
+        ("会議 打ち合わせ E", {}),
+        ("プロジェクト 作業 タスク 仕事 F", {}),
+    ]
+
+    result = prototype.process_backlog(iter(items), max_workers=1, log_every=2)
+
+    assert (result["processed"], result["discarded"], result["evicted"]) == (6, 2, 1)
+    # 同信頼度は先着を保持、信頼度の高い F が同信頼度で最後に保持した C を evict
+    kept = sorted(f["content"][-1] for f in result["kept_files"])
+    assert kept == ["A", "B", "F"]
+    files = result["kept_files"]
+    assert prototype.search_engine.search("仕事", files) == [
+        f for f in files if f["content"].endswith("F")
+    ]
+    # evict 済みファイルは索引からも除去
+    assert prototype.search_engine.index.search("ミーティング") == []
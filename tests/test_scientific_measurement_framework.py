@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+sys.path.append(str(Path(__file__).parent.parent / "Core" / "PersonalityLearning"))
+
+from scientific_measurement_framework import (  # noqa: E402
+    PluginableMeasurementFramework,
+)
+from scientific_measurement_framework import VectorizedEvaluationEngine  # noqa: E402
+
+
+def _records(n=60):
+    rng = np.random.default_rng(42)
+    return [
+        {"suetake_likeness_index": float(v), "source": f"src{i % 3}"}
+        for i, v in enumerate(rng.uniform(0.6, 0.95, n))
+    ]
+
+
+def test_repeated_stratified_kfold_balances_strata():
+    engine = VectorizedEvaluationEngine.from_records(_records(), "source", seed=0)
+    fold_means = engine.repeated_stratified_kfold_means(k=5, repeats=4)
+
+    assert fold_means.shape == (4, 5)
+    # 各反復で全 fold が同数 → fold 平均の平均は全体平均と一致
+    assert np.allclose(fold_means.mean(axis=1), engine.values.mean())
+
+
+def test_unshuffled_kfold_matches_contiguous_blocks():
+    engine = VectorizedEvaluationEngine.from_records(_records(23))
+    expected = [chunk.mean() for chunk in np.array_split(engine.values, 5)]
+    assert np.allclose(engine.kfold_means(k=5, shuffle=False), expected)
+
+
+def test_bootstrap_confidence_interval_contains_mean():
+    engine = VectorizedEvaluationEngine.from_records(_records(), seed=1)
+    lower, upper = engine.bootstrap_confidence_interval(n_resamples=2000)
+    assert lower < engine.values.mean() < upper
+
+
+def test_vectorized_plugin_is_registered(tmp_path):
+    framework = PluginableMeasurementFramework(str(tmp_path / "m.db"))
+    result = framework.measure_accuracy_scientifically(
+        _records(), method="vectorized_evaluation"
+    )
+    assert result.measurement_method == "vectorized_evaluation"
+    assert result.confidence_interval[0] < result.accuracy
+    assert framework.generate_scientific_report()["measurement_count"] == 1
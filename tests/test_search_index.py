@@ -0,0 +1,102 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Prototype"))
+
+from mirralism_prototype import MirralismLogger  # noqa: E402
+from mirralism_prototype import SearchEngine  # noqa: E402
+from search_index import SearchIndex  # noqa: E402
+from search_index import tokenize  # noqa: E402
+
+
+def _keys(hits):
+    return [hit.key for hit in hits]
+
+
+def test_tokenize_uses_bigrams_for_japanese_and_words_for_latin():
+    assert tokenize("会議ＡＩ Review") == [("会議", 0), ("議", 1), ("ai", 2), ("review", 3)]
+
+
+def test_japanese_phrase_single_char_and_bm25_ranking(tmp_path):
+    index = SearchIndex(tmp_path / "index")
+    index.add_document("meeting", "プロジェクト会議の議事録。プロジェクト進捗を確認")
+    index.add_document("split", "プロジェ 会議 クト")
+    index.add_document("other", "顧客への提案資料 プロジェクト")
+    index.flush()
+
+    # 語句は bigram の位置連続で一致（分断された「プロジェ」「クト」は不一致）
+    assert _keys(index.search("プロジェクト 会議")) == ["meeting"]
+    # 出現頻度の高い文書が上位
+    assert _keys(index.search("プロジェクト")) == ["meeting", "other"]
+    # 1文字は前方一致
+    assert set(_keys(index.search("顧"))) == {"other"}
+    assert set(_keys(index.search("会議 顧客", mode="or"))) == {"meeting", "split", "other"}
+
+
+def test_incremental_directory_index_persists_updates_and_deletions(tmp_path):
+    root = tmp_path / "notes"
+    root.mkdir()
+    (root / "a.md").write_text("SuperWhisper 書き起こし 営業会議", encoding="utf-8")
+    (root / "b.txt").write_text("WebClip リサーチ 市場分析", encoding="utf-8")
+
+    with SearchIndex(tmp_path / "index") as index:
+        assert index.index_directory(root) == {
+            "added": 2,
+            "updated": 0,
+            "unchanged": 0,
+            "removed": 0,
+        }
+
+    (root / "a.md").write_text("SuperWhisper 書き起こし 採用面談", encoding="utf-8")
+    os.utime(root / "a.md", ns=(1, 1))
+    (root / "b.txt").unlink()
+    (root / "c.md").write_text("クライアント資料 営業会議", encoding="utf-8")
+
+    index = SearchIndex(tmp_path / "index")
+    assert index.index_directory(root) == {
+        "added": 1,
+        "updated": 1,
+        "unchanged": 0,
+        "removed": 1,
+    }
+    assert len(index) == 2
+    assert _keys(index.search("営業会議")) == [str(root / "c.md")]
+    assert _keys(index.search("採用")) == [str(root / "a.md")]
+    assert index.search("市場") == []
+    assert index.index_directory(root)["unchanged"] == 2
+    index.close()
+
+
+def test_merge_drops_deleted_documents_and_keeps_results(tmp_path):
+    index = SearchIndex(tmp_path / "index", flush_threshold=2, max_segments=100)
+    for i in range(7):
+        index.add_document(f"doc{i}", f"品質レビュー 第{i}回 " + "改善 " * i)
+    index.flush()
+    index.delete_document("doc3")
+    index.flush()
+    before = [(hit.key, round(hit.score, 6)) for hit in index.search("改善", limit=10)]
+    assert index.segment_count == 4
+
+    index.merge_segments()
+
+    assert index.segment_count == 1
+    assert len(list((tmp_path / "index").glob("*.idx"))) == 1
+    assert [hit.key for hit in index.search("改善", limit=10)] == [
+        key for key, _ in before
+    ]
+    assert "doc3" not in _keys(index.search("品質レビュー", limit=10))
+    index.close()
+
+
+def test_prototype_search_engine_returns_ranked_files():
+    engine = SearchEngine(MirralismLogger(log_file=os.devnull))
+    files = [
+        {"content": "会議の議事録 プロジェクト進捗", "category": "meeting"},
+        {"content": "個人的なメモ", "category": "personal"},
+        {"content": "プロジェクト計画", "category": "work"},
+    ]
+    engine.build_index(files)
+
+    assert engine.search("会議 プロジェクト", files) == [files[0], files[2]]
+    assert engine.search("personal", files) == [files[1]]
@@ -0,0 +1,153 @@
+import os
+
+from scripts.superwhisper_corpus_index import SuperWhisperCorpusIndex
+
+TEMPLATE = """---
+created: 2025-06-0{day}
+quality_score: 0.{day}
+---
+
+## 音声内容
+今日は{day}日目の振り返りです。
+
+## メタ情報
+- source: superwhisper
+"""
+
+
+def _write(root, name, day):
+    path = root / "Data" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(TEMPLATE.format(day=day), encoding="utf-8")
+    os.utime(path, ns=(day * 10**9, day * 10**9))
+    return path
+
+
+def test_refresh_is_incremental(tmp_path):
+    _write(tmp_path, "superwhisper_a.md", 1)
+    _write(tmp_path, "superwhisper_raw_b.md", 2)
+    (tmp_path / "Data" / "other.md").write_text("ignored")
+    index = SuperWhisperCorpusIndex(tmp_path)
+
+    assert index.refresh() == {"indexed": 2, "updated": 2, "removed": 0}
+    assert index.refresh() == {"indexed": 2, "updated": 0, "removed": 0}
+
+    (tmp_path / "Data" / "superwhisper_a.md").unlink()
+    _write(tmp_path, "superwhisper_c.md", 3)
+    assert index.refresh() == {"indexed": 2, "updated": 1, "removed": 1}
+
+
+def test_next_unreviewed_and_audio_offsets(tmp_path):
+    for day in (1, 2, 3):
+        _write(tmp_path, f"superwhisper_{day}.md", day)
+    index = SuperWhisperCorpusIndex(tmp_path)
+    index.refresh()
+
+    entries = index.next_unreviewed("reviewer", limit=2)
+    assert [e["file_name"] for e in entries] == [
+        "superwhisper_1.md",
+        "superwhisper_2.md",
+    ]
+    assert entries[0]["quality_score"] == 0.1
+    assert index.read_audio_content(entries[0]) == "今日は1日目の振り返りです。"
+
+    index.mark_reviewed("reviewer", entries[0]["file_path"], "approved")
+    index.sync_reviews("other", names=["superwhisper_3.md"])
+    newest = index.next_unreviewed("reviewer", limit=5, newest_first=True)
+    assert [e["file_name"] for e in newest] == [
+        "superwhisper_3.md",
+        "superwhisper_2.md",
+    ]
+    assert (
+        index.next_unreviewed("other", limit=1)[0]["file_name"] == "superwhisper_1.md"
+    )
+
+
+def test_audio_read_revalidates_changed_and_deleted_files(tmp_path):
+    first = _write(tmp_path, "superwhisper_1.md", 1)
+    second = _write(tmp_path, "superwhisper_2.md", 2)
+    index = SuperWhisperCorpusIndex(tmp_path)
+    index.refresh()
+    entries = index.next_unreviewed("reviewer", limit=2)
+
+    first.write_text(
+        "---\ncreated: 2025-06-01\n---\n\n## 音声内容\n書き換え後の長い本文です。\n",
+        encoding="utf-8",
+    )
+    second.unlink()
+
+    assert index.read_audio_content(entries[0]) == "書き換え後の長い本文です。"
+    assert entries[0]["file_size"] == first.stat().st_size
+    assert index.read_audio_content(entries[1]) is None
+    assert index.count() == 1
+
+
+def _age_dirs(root, seconds=3600):
+    for directory in [root, *[p for p in root.rglob("*") if p.is_dir()]]:
+        stamp = directory.stat().st_mtime_ns - seconds * 10**9
+        os.utime(directory, ns=(stamp, stamp))
+
+
+def test_refresh_lists_only_changed_directories(tmp_path):
+    _write(tmp_path, "superwhisper_1.md", 1)
+    (tmp_path / "Data" / "nested").mkdir()
+    _age_dirs(tmp_path)
+    index = SuperWhisperCorpusIndex(tmp_path, db_path=tmp_path.parent / "index.db")
+    index.refresh()
+
+    # mtime を戻したディレクトリへの追加は列挙されない（ファイル単位の stat なし）
+    data_dir = tmp_path / "Data"
+    before = data_dir.stat().st_mtime_ns
+    _write(tmp_path, "superwhisper_2.md", 2)
+    os.utime(data_dir, ns=(before, before))
+    assert index.refresh() == {"indexed": 1, "updated": 0, "removed": 0}
+
+    # 変更されたディレクトリのみ再列挙
+    _write(tmp_path, "nested/superwhisper_3.md", 3)
+    assert index.refresh() == {"indexed": 2, "updated": 1, "removed": 0}
+    assert index.refresh(full=True) == {"indexed": 3, "updated": 1, "removed": 0}
+
+    for path in (data_dir / "nested").iterdir():
+        path.unlink()
+    (data_dir / "nested").rmdir()
+    assert index.refresh() == {"indexed": 2, "updated": 0, "removed": 1}
+
+
+def test_sync_reviews_applies_only_the_difference(tmp_path):
+    for day in (1, 2, 3):
+        _write(tmp_path, f"superwhisper_{day}.md", day)
+    index = SuperWhisperCorpusIndex(tmp_path)
+    index.refresh()
+    first = str(tmp_path / "Data" / "superwhisper_1.md")
+    index.mark_reviewed("reviewer", first, "approved", "2025-06-01")
+
+    assert index.sync_reviews(
+        "reviewer", paths=[first], names=["superwhisper_2.md"]
+    ) == {"added": 1, "removed": 0}
+    assert index.sync_reviews("reviewer", names=["superwhisper_2.md"]) == {
+        "added": 0,
+        "removed": 1,
+    }
+    index.mark_reviewed("reviewer", first, "approved", "2025-06-01")
+    assert index.sync_reviews("reviewer", paths=[first]) == {"added": 0, "removed": 1}
+    row = index.conn.execute(
+        "SELECT decision, reviewed_at FROM review_state WHERE path = ?", (first,)
+    ).fetchone()
+    assert tuple(row) == ("approved", "2025-06-01")
+
+
+def test_review_system_uses_indexed_frontmatter(tmp_path, monkeypatch):
+    import scripts.data_review_system as review_module
+
+    _write(tmp_path, "superwhisper_1.md", 1)
+    system = review_module.DataReviewSystem(tmp_path)
+    monkeypatch.setattr(
+        review_module, "parse_frontmatter", lambda content: 1 / 0  # 再解析しない
+    )
+
+    file_data = system.get_next_unreviewed_file()
+
+    assert file_data["audio_content"] == "今日は1日目の振り返りです。"
+    assert file_data["quality_score"] == 0.1
+    assert file_data["created_time"] == "2025-06-01"
+    assert not (tmp_path / ".mirralism" / "data_review.json").exists()
@@ -0,0 +1,107 @@
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / "Core" / "PersonalityLearning"))
+
+from mirralism_personality_engine_basic import (  # noqa: E402
+    MirralismPersonalityEngineBasic,
+)
+from trait_vector import TRAIT_NAMES  # noqa: E402
+from trait_vector import pack_traits  # noqa: E402
+from trait_vector import summarize_traits  # noqa: E402
+from trait_vector import traits_matrix  # noqa: E402
+from trait_vector import unpack_traits  # noqa: E402
+
+
+def test_pack_roundtrip_and_missing_traits():
+    scores = {name: i / 10 for i, name in enumerate(TRAIT_NAMES)}
+    blob = pack_traits(scores)
+
+    assert len(blob) == 4 * len(TRAIT_NAMES)
+    restored = unpack_traits(blob)
+    assert restored == {
+        name: float(np.float32(value)) for name, value in scores.items()
+    }
+
+    partial = unpack_traits(pack_traits({"openness": 0.5, "neuroticism": "n/a"}))
+    assert partial["openness"] == 0.5
+    assert np.isnan(partial["neuroticism"])
+
+
+def test_summary_matches_numpy_reference():
+    rng = np.random.default_rng(0)
+    values = rng.random((30, len(TRAIT_NAMES))).astype(np.float32)
+    values[3, 2] = np.nan
+    matrix = traits_matrix([pack_traits(dict(zip(TRAIT_NAMES, row))) for row in values])
+
+    summary = summarize_traits(matrix)
+
+    for index, name in enumerate(TRAIT_NAMES):
+        column = values[:, index].astype(np.float64)
+        mask = ~np.isnan(column)
+        positions = np.arange(len(column))[mask]
+        slope = np.polyfit(positions, column[mask], 1)[0]
+        assert np.isclose(summary[name]["mean"], column[mask].mean())
+        assert np.isclose(summary[name]["std"], column[mask].std())
+        assert np.isclose(summary[name]["slope"], slope)
+        assert summary[name]["count"] == mask.sum()
+        assert summary[name]["latest"] == column[mask][-1]
+
+
+def test_engine_migrates_legacy_json_rows(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    legacy_scores = {name: 0.25 for name in TRAIT_NAMES}
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE analysis_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content TEXT NOT NULL,
+            analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            personality_scores TEXT,
+            accuracy_score REAL,
+            session_context TEXT,
+            source_type TEXT DEFAULT 'text'
+        )
+        """
+    )
+    conn.execute(
+        "INSERT INTO analysis_results (content, personality_scores, accuracy_score)"
+        " VALUES (?, ?, ?)",
+        ("旧データ", json.dumps(legacy_scores), 62.0),
+    )
+    conn.execute(
+        "INSERT INTO analysis_results (content, personality_scores) VALUES (?, ?)",
+        ("破損データ", "{not json"),
+    )
+    conn.commit()
+    conn.close()
+
+    engine = MirralismPersonalityEngineBasic(db_path=str(db_path))
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT personality_scores, trait_vector FROM analysis_results ORDER BY id"
+        ).fetchall()
+    assert json.loads(rows[0][0]) == legacy_scores
+    assert unpack_traits(rows[0][1]) == legacy_scores
+    assert rows[1] == ("{not json", None)
+
+    # 再初期化でも既移行行は触らず、破損行は引き続きスキップ
+    engine = MirralismPersonalityEngineBasic(db_path=str(db_path))
+    assert engine.get_latest_profile() == legacy_scores
+
+    result = engine.analyze_content("技術的な実装と品質への責任", {"source_type": "voice"})
+    assert engine.get_latest_profile() == {
+        name: float(np.float32(value))
+        for name, value in result["personality_profile"].items()
+    }
+
+    trends = engine.get_trait_trends()
+    assert trends["openness"]["count"] == 2
+    summary = engine.get_accuracy_summary()
+    assert summary["count"] == 2
+    assert summary["by_source"]["voice"]["mean"] == result["accuracy"]["current"]
@@ -0,0 +1,63 @@
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(
+    str(Path(__file__).parent.parent / "API" / "integrations" / "superwhisper")
+)
+
+from transcription_profile import profile_transcription  # noqa: E402
+
+
+def _legacy_quality(text, min_text_length=20):
+    """旧 SuperWhisperNotionIntegration._estimate_transcription_quality"""
+    if not text:
+        return 0.0
+    indicators = 0
+    if len(text) >= min_text_length:
+        indicators += 1
+    if any(punct in text for punct in "。、．，"):
+        indicators += 1
+    unknown_chars = text.count("？") + text.count("〇") + text.count("※")
+    if unknown_chars / len(text) < 0.1:
+        indicators += 1
+    if not any(text[i] == text[i + 1] == text[i + 2] for i in range(len(text) - 2)):
+        indicators += 1
+    if len(text.split()) >= 3:
+        indicators += 1
+    return indicators / 5
+
+
+def _legacy_noise(text):
+    """旧 SuperWhisperNotionIntegration._estimate_noise_level"""
+    if not text:
+        return 1.0
+    noise_chars = text.count("あー") + text.count("えー") + text.count("うー")
+    return min(noise_chars / len(text) * 2, 1.0)
+
+
+def test_scores_match_legacy_estimators():
+    rng = random.Random(0)
+    alphabet = "あいうえおー。、 \n？※〇abc"
+    samples = ["", "ああああ", "えー、あー。うー"] + [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 40)))
+        for _ in range(2000)
+    ]
+    for text in samples:
+        profile = profile_transcription(text)
+        assert profile.quality_score() == _legacy_quality(text), text
+        assert profile.quality_score(5) == _legacy_quality(text, 5), text
+        assert profile.noise_level() == _legacy_noise(text), text
+
+
+def test_profile_fields():
+    profile = profile_transcription("えー、今日は ※ 考えた。ーーー あー")
+
+    assert profile.has_punctuation
+    assert profile.has_repetition
+    assert profile.unknown_chars == 1
+    assert profile.filler_count == 2
+    assert profile.word_count == 4
+    data = profile.to_dict()
+    assert data["filler_density"] == 2 / profile.length
+    assert data["quality_score"] == profile.quality_score()
@@ -0,0 +1,95 @@
+import sqlite3
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Core"))
+
+import v1_lessons_integration_system as lessons_module  # noqa: E402
+from v1_lessons_integration_system import COMPLIANT_STATUSES  # noqa: E402
+from v1_lessons_integration_system import LessonSeverity  # noqa: E402
+from v1_lessons_integration_system import V1LessonsIntegrationSystem  # noqa: E402
+
+
+def _system(tmp_path, extra_lessons=40):
+    system = V1LessonsIntegrationSystem(
+        db_path=str(tmp_path / "lessons.db"),
+        evidence_path=str(tmp_path / "evidence"),
+    )
+    template = next(iter(system.lessons.values()))
+    system.add_lessons(
+        [
+            replace(
+                template,
+                lesson_id=f"V2-LESSON-{i:03d}",
+                severity=list(LessonSeverity)[i % len(LessonSeverity)],
+                validation_results={},
+            )
+            for i in range(extra_lessons)
+        ]
+    )
+    return system
+
+
+def test_bulk_integration_commits_once(tmp_path, monkeypatch):
+    system = _system(tmp_path)
+    connects = []
+    original_connect = sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        connects.append(args)
+        return original_connect(*args, **kwargs)
+
+    monkeypatch.setattr(lessons_module.sqlite3, "connect", counting_connect)
+    results = system.integrate_all_lessons(max_workers=4)
+    monkeypatch.undo()
+
+    # 教訓数に関わらず一括コミット + 進捗集計の2接続のみ
+    assert len(connects) == 2
+    assert results["total_lessons"] == 45
+    with sqlite3.connect(tmp_path / "lessons.db") as conn:
+        (measures,) = conn.execute(
+            "SELECT COUNT(*) FROM preventive_measures"
+        ).fetchone()
+        (steps,) = conn.execute(
+            "SELECT COUNT(DISTINCT lesson_id) FROM integration_history"
+        ).fetchone()
+        statuses = dict(
+            conn.execute(
+                "SELECT lesson_id, integration_status FROM v1_lessons"
+            ).fetchall()
+        )
+    assert measures == len(system.preventive_measures)
+    assert steps == 45
+    assert statuses == {
+        lesson_id: lesson.integration_status.value
+        for lesson_id, lesson in system.lessons.items()
+    }
+
+
+def test_compliance_aggregates_match_lesson_state(tmp_path):
+    system = _system(tmp_path, extra_lessons=12)
+    system.integrate_lesson("V1-CRITICAL-001")
+    system.integrate_lesson("V2-LESSON-004")
+
+    compliance = system.evaluate_lesson_compliance()
+    breakdown = compliance["severity_breakdown"]
+
+    for severity in LessonSeverity:
+        lessons = [
+            lesson for lesson in system.lessons.values() if lesson.severity == severity
+        ]
+        integrated = [
+            lesson
+            for lesson in lessons
+            if lesson.integration_status in COMPLIANT_STATUSES
+        ]
+        assert breakdown[severity.value]["total"] == len(lessons)
+        assert breakdown[severity.value]["integrated"] == len(integrated)
+    critical = compliance["critical_lessons_status"]
+    assert critical["total_critical"] == breakdown["critical"]["total"]
+    assert critical["integrated_critical"] == breakdown["critical"]["integrated"]
+    assert compliance["overall_compliance"]["total_lessons"] == 17
+    assert compliance["prevention_effectiveness"]["total_preventive_measures"] == len(
+        system.preventive_measures
+    )
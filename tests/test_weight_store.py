@@ -0,0 +1,104 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent / "Core" / "PersonalityLearning"))
+
+from mirralism_personality_engine_basic import BASIC_ANALYSIS_WEIGHTS  # noqa: E402
+from mirralism_personality_engine_basic import (  # noqa: E402
+    MirralismPersonalityEngineBasic,
+)
+from weight_store import VersionedWeightStore  # noqa: E402
+
+
+def _add_delta(weights, event):
+    weights["w"] += event["delta"]
+
+
+def _store(db_path, batch_size=3, bounds=None):
+    return VersionedWeightStore(
+        db_path,
+        namespace="test",
+        initial_weights={"w": 1.0},
+        update_rule=_add_delta,
+        batch_size=batch_size,
+        bounds=bounds,
+    )
+
+
+def test_feedback_is_applied_in_mini_batches(tmp_path):
+    store = _store(tmp_path / "weights.db")
+    pinned = store.current()
+
+    assert store.enqueue({"delta": 0.5}) is None
+    assert store.enqueue({"delta": 0.5}) is None
+    assert store.current().version == 1
+    assert store.pending_count() == 2
+
+    updated = store.enqueue({"delta": 0.5})
+
+    assert updated.version == 2
+    assert updated.weights["w"] == pytest.approx(2.5)
+    assert store.pending_count() == 0
+    assert store.history()[0]["applied_events"] == 3
+    # 取得済みスナップショットは版固定のまま
+    assert pinned.version == 1
+    assert pinned.weights["w"] == 1.0
+    with pytest.raises(TypeError):
+        pinned.weights["w"] = 3.0
+
+
+def test_versions_persist_and_restore_appends(tmp_path):
+    db_path = tmp_path / "weights.db"
+    store = _store(db_path, batch_size=10, bounds=(0.1, 2.0))
+    store.enqueue({"delta": 5.0})
+    assert store.apply_pending().weights["w"] == 2.0
+    assert store.apply_pending() is None
+
+    reopened = _store(db_path)
+    assert reopened.current().version == 2
+    assert reopened.get_version(1).weights["w"] == 1.0
+
+    restored = reopened.restore(1)
+    assert restored.version == 3
+    assert restored.weights["w"] == 1.0
+    assert [entry["note"] for entry in reopened.history()] == [
+        "restore_v1",
+        "feedback_batch",
+        "initial",
+    ]
+    with pytest.raises(ValueError):
+        reopened.restore(99)
+
+
+def test_in_memory_store_keeps_one_database():
+    store = _store(":memory:", batch_size=2)
+
+    assert store.current().version == 1
+    store.enqueue({"delta": 0.5})
+    assert store.enqueue({"delta": 0.5}).weights["w"] == pytest.approx(2.0)
+    assert [entry["version"] for entry in store.history()] == [2, 1]
+    assert store.restore(1).version == 3
+
+
+def test_engine_feedback_queues_without_saving_analysis(tmp_path):
+    db_path = tmp_path / "engine.db"
+    engine = MirralismPersonalityEngineBasic(db_path, feedback_batch_size=2)
+
+    first = engine.learn_from_feedback("技術的な実装", 90.0, "低すぎる")
+    assert first["learning_applied"] and not first["weights_updated"]
+    assert engine.analysis_weights == BASIC_ANALYSIS_WEIGHTS
+
+    second = engine.learn_from_feedback("技術的な実装", 90.0, "低すぎる")
+    assert second["weights_updated"]
+    assert second["weight_version"] == 2
+    for key, value in BASIC_ANALYSIS_WEIGHTS.items():
+        assert engine.analysis_weights[key] == pytest.approx(value * 1.05**2)
+
+    with sqlite3.connect(db_path) as conn:
+        (analyses,) = conn.execute("SELECT COUNT(*) FROM analysis_results").fetchone()
+        (history,) = conn.execute("SELECT COUNT(*) FROM learning_history").fetchone()
+    assert analyses == 0
+    assert history == 2
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import yaml
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from Interface.WebClip.yaml_processor import YAMLFrontmatterProcessor  # noqa: E402
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("生成したYAMLを再解析しない")
+
+
+def test_frontmatter_is_validated_in_memory_and_round_trips(tmp_path, monkeypatch):
+    processor = YAMLFrontmatterProcessor(tmp_path)
+    monkeypatch.setattr(yaml, "load", _fail)
+    monkeypatch.setattr(yaml, "safe_load", _fail)
+
+    result = processor.process_webclip_frontmatter(
+        'Article with "quotes"',
+        "https://example.com/a",
+        "本文",
+        {"published_date": "2025-05-31", "tags": "研究", "description": "説明"},
+        {"user_type": "cto", "preferences": {"depth": 3}},
+    )
+
+    assert result["success"] is True
+    assert result["validation"]["valid"] is True
+    assert result["validation"]["v1_patterns_checked"] == 4
+    monkeypatch.undo()
+    assert yaml.safe_load(result["yaml_output"].strip("-\n")) == result["frontmatter"]
+    assert result["frontmatter"]["tags"] == ["研究"]
+    assert result["markdown_file"].endswith("\n本文")
+
+
+def test_unsupported_values_fail_like_text_validation(tmp_path):
+    processor = YAMLFrontmatterProcessor(tmp_path)
+
+    result = processor.process_webclip_frontmatter(
+        "Title",
+        "https://example.com/b",
+        "本文",
+        user_context={"preferences": {"at": object()}},
+    )
+
+    assert result["success"] is False
+    assert "user_context.preferences.at" in result["error"]
+
+    # 外部由来テキストは従来どおり解析して検証
+    external = "---\ntitle: t\nurl: u\nclipped_at: 31/05/2025\ntype: webclip\n---\n"
+    validation = processor._validate_yaml_output(external)
+    assert validation["valid"] is False
+    assert "不正なDateTime形式: clipped_at" in validation["errors"]